@@ -18,6 +18,7 @@ import functools
 import pandas as pd
 from fastapi import HTTPException, Query
 
+from backend.live_client.live_games import LIVE_GAMES
 from backend.ratings import coaching_eval
 from backend.ratings.refresh_player_projections import OUTPUT_FILE as PLAYER_PROJECTIONS_FILE
 from backend.ratings.refresh_player_ratings import MAX_N as PLAYER_RANKINGS_MAX_N
@@ -220,3 +221,20 @@ def get_team_shot_heatmap(
         "n_offense_shots": offense["n_shots"],
         "n_defense_shots": defense["n_shots"],
     }
+
+
+# ---- live games ----
+# The in-memory state backend/live_client/live_games.py's poller keeps
+# current (started from main.py's lifespan when LIVE_GAMES_POLLING is set).
+# Same "never call NBA.com on a request" rule as everything above — a read
+# here is a dict lookup on whatever the last poll produced.
+
+def get_live_games() -> list[dict]:
+    return LIVE_GAMES.game_views()
+
+
+def get_live_game(game_id: str) -> dict:
+    view = LIVE_GAMES.game_view(game_id)
+    if view is None:
+        raise HTTPException(status_code=404, detail=f"No live data for game {game_id} — not on today's scoreboard.")
+    return view
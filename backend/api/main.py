@@ -16,7 +16,11 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.api.routers import coaching, players, win_model
+from backend.api.routers import coaching, live, players, win_model
+from backend.live_client.cache import DiskCache, default_cache
+from backend.live_client.cache_bundle import import_bundle
+from backend.live_client.cache_policy import OFFLINE_ENV, offline_mode
+from backend.live_client.live_games import LiveGamePoller
 from backend.ratings import refresh_player_projections, refresh_player_ratings, refresh_team_style
 
 logger = logging.getLogger("basketball_predictions.api")
@@ -39,6 +43,36 @@ REFRESH_MAX_AGE_SECONDS = int(os.environ.get("PLAYER_RATINGS_MAX_AGE_SECONDS", r
 # Reusing the same check interval/max-age knobs rather than adding six new env
 # vars for what's the same tradeoff three times over.
 
+# Off by default: following live games means polling cdn.nba.com every few
+# seconds while games are on, which a deployment has to opt into (and be able
+# to reach cdn.nba.com for) — see backend/live_client/live_games.py.
+LIVE_GAMES_POLLING = os.environ.get("LIVE_GAMES_POLLING", "").lower() in {"1", "true", "yes"}
+
+# A live_client cache bundle (see backend/live_client/cache_bundle.py) to
+# seed the NBA.com response cache from at startup — how a host that can't
+# reach stats.nba.com gets its refresh jobs to run at all: they then find
+# everything in the cache and never go to the network. Such a host also sets
+# NBA_CACHE_OFFLINE, so the seeded entries don't expire out from under it.
+CACHE_BUNDLE = os.environ.get("NBA_CACHE_BUNDLE")
+
+
+def seed_cache_from_bundle() -> None:
+    """Imports CACHE_BUNDLE, if set. Never raises, like refresh_if_stale():
+    a bad bundle leaves the cache as it was and the API still starts."""
+    if not CACHE_BUNDLE:
+        return
+    try:
+        cache = default_cache()
+        if not isinstance(cache, DiskCache):
+            logger.warning("NBA_CACHE_BUNDLE needs the files cache backend; not imported")
+            return
+        n_entries = import_bundle(CACHE_BUNDLE, cache)
+        logger.info("seeded %d cache entries from %s", n_entries, CACHE_BUNDLE)
+        if not offline_mode():
+            logger.warning("%s isn't set: seeded entries expire on their normal cache-policy TTLs", OFFLINE_ENV)
+    except Exception:
+        logger.exception("cache bundle import from %s failed; continuing with the existing cache", CACHE_BUNDLE)
+
 
 async def refresh_if_stale() -> None:
     """One check-and-maybe-refresh attempt per data source. Never raises: a
@@ -46,27 +80,31 @@ async def refresh_if_stale() -> None:
     API or the background loop — the existing (stale) cache just keeps being
     served, and the next scheduled check retries. Each source is caught
     independently so one failing (e.g. team_style) never blocks the others
-    from refreshing. run_refresh() is synchronous/blocking (requests, not
-    httpx), so each is offloaded to a thread to avoid stalling the event loop
-    that's also serving requests.
+    from refreshing. Each source's arun_refresh() fetches through
+    live_client's AsyncNBAStatsClient, so its requests overlap on this same
+    event loop (the one also serving requests) instead of each refresh
+    blocking a worker thread on sequential network calls; the CPU-bound and
+    file work after the fetch (parsing, building the payload, writing the
+    output) is handed to a worker thread inside arun_refresh(), so it
+    doesn't stall request handling either.
     """
     try:
         if refresh_player_ratings.is_stale(REFRESH_MAX_AGE_SECONDS):
-            await asyncio.to_thread(refresh_player_ratings.run_refresh)
+            await refresh_player_ratings.arun_refresh()
             logger.info("player power rankings refreshed")
     except Exception:
         logger.exception("player power rankings refresh attempt failed; serving existing cache")
 
     try:
         if refresh_team_style.is_stale(REFRESH_MAX_AGE_SECONDS):
-            await asyncio.to_thread(refresh_team_style.run_refresh)
+            await refresh_team_style.arun_refresh()
             logger.info("team style refreshed")
     except Exception:
         logger.exception("team style refresh attempt failed; serving existing cache")
 
     try:
         if refresh_player_projections.is_stale(REFRESH_MAX_AGE_SECONDS):
-            await asyncio.to_thread(refresh_player_projections.run_refresh)
+            await refresh_player_projections.arun_refresh()
             logger.info("player projections refreshed")
     except Exception:
         logger.exception("player projections refresh attempt failed; serving existing cache")
@@ -80,11 +118,16 @@ async def _refresh_loop() -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    task = asyncio.create_task(_refresh_loop())
+    # Before the first refresh check, so that check already sees the bundle.
+    await asyncio.to_thread(seed_cache_from_bundle)
+    tasks = [asyncio.create_task(_refresh_loop())]
+    if LIVE_GAMES_POLLING:
+        tasks.append(asyncio.create_task(LiveGamePoller().run()))
     try:
         yield
     finally:
-        task.cancel()
+        for task in tasks:
+            task.cancel()
 
 
 app = FastAPI(
@@ -110,6 +153,7 @@ app.add_middleware(
 app.include_router(win_model.router)
 app.include_router(players.router)
 app.include_router(coaching.router)
+app.include_router(live.router)
 
 
 @app.get("/health")
@@ -0,0 +1,25 @@
+"""backend/api/routers/live.py — today's games, live.
+
+Reads the in-memory state backend/live_client/live_games.py's poller keeps
+current; never calls NBA.com on a request. Empty (not a 503) when polling is
+off or there are no games today — "no live games" is a normal answer here.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+
+from backend.api import schemas
+from backend.api.dependencies import get_live_game, get_live_games
+
+router = APIRouter(prefix="/api/live", tags=["live"])
+
+
+@router.get("/games", response_model=list[schemas.LiveGame])
+def live_games(games: list[dict] = Depends(get_live_games)):
+    return games
+
+
+@router.get("/games/{game_id}", response_model=schemas.LiveGame)
+def live_game(game: dict = Depends(get_live_game)):
+    return game
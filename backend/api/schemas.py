@@ -157,3 +157,47 @@ class CoachCareerSummary(BaseModel):
     avg_wins_above_expectation: float
     avg_actual_win_pct: float
     avg_implied_win_pct: float
+
+
+class LivePlayerLine(BaseModel):
+    """One player's current line in a live game — backend/live_client/live_games.py's
+    PlayerLine, with `seconds` played in place of the feed's ISO-8601 minutes."""
+    person_id: int
+    name: str
+    team_id: int
+    seconds: float
+    points: int
+    reboundsTotal: int
+    reboundsOffensive: int
+    assists: int
+    steals: int
+    blocks: int
+    turnovers: int
+    foulsPersonal: int
+    fieldGoalsMade: int
+    fieldGoalsAttempted: int
+    threePointersMade: int
+    threePointersAttempted: int
+    freeThrowsMade: int
+    freeThrowsAttempted: int
+    plusMinusPoints: float
+
+
+class LiveGame(BaseModel):
+    """One of today's games as of its last poll. `deltas` holds only what
+    changed in the last box-score poll ({person_id: {stat: change}}), and
+    `version` only moves when something did — a client polling this can
+    skip work whenever it's unchanged."""
+    game_id: str
+    status: int
+    status_text: str
+    period: int
+    clock_seconds: float | None = None
+    home_team_id: int
+    away_team_id: int
+    home_score: int
+    away_score: int
+    version: int
+    updated_at: float
+    players: list[LivePlayerLine]
+    deltas: dict[str, dict[str, float]]
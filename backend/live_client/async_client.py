@@ -0,0 +1,231 @@
+"""backend/live_client/async_client.py
+
+asyncio-native sibling of client.NBAStatsClient, for callers that already run
+on an event loop (backend/api/main.py's background refresh loop) and want many
+requests in flight at once without a thread per request.
+
+Same contract as the sync client, deliberately: same DEFAULT_HEADERS, same
+retry policy (max_retries total attempts, linear backoff), same exception
+(NBAClientError) once retries are exhausted, the same optional per-host
+HostRateLimiter budget, and the same per-host circuit breaker
+(CircuitOpenError; see circuit_breaker.py). Built on one pooled httpx.AsyncClient, so connections
+to stats.nba.com/cdn.nba.com stay alive across calls instead of paying a TLS
+handshake per request.
+
+nba_api's HTTP layer is blocking `requests`, so `get_via_nba_api()` here does
+not call `endpoint.get_request()` the way the sync client does. It sends the
+same request nba_api would have — `<stats base URL>/<endpoint.endpoint>` with
+nba_api's own `endpoint.parameters`, sorted by key exactly as nba_api's
+NBAHTTP.send_api_request sorts them — and then hands the body back to the
+nba_api endpoint object (`nba_response` + `load_response()`), so anything
+that reads nba_api's parsed datasets afterwards (an Endpoint's
+_on_nba_api_response hook) works identically whichever client fired the
+request. `get_bytes_via_nba_api()` sends the same request and skips that
+parse entirely (see streaming.py).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+from nba_api.stats.library.http import NBAStatsHTTP, NBAStatsResponse
+
+from .circuit_breaker import CLOSED, HostCircuitBreakers
+from .client import (
+    DEFAULT_HEADERS,
+    BaseURLs,
+    ConditionalResponse,
+    NBAClientError,
+    check_circuit,
+    conditional_headers,
+    json_body,
+    response_validators,
+)
+from .rate_limit import HostRateLimiter, host_of, is_throttle, parse_retry_after
+
+# httpx's counterparts of client.UNREACHABLE_ERRORS / THROTTLE_TIMEOUT_ERRORS.
+UNREACHABLE_ERRORS = (httpx.ConnectError, httpx.TimeoutException)
+THROTTLE_TIMEOUT_ERRORS = (httpx.ReadTimeout,)
+
+# httpx's own default pool (100) is sized for general clients; this is one
+# API under a rate limit, so keep the pool to roughly what a rate-limited
+# batch can actually use at once.
+DEFAULT_MAX_CONNECTIONS = 20
+
+
+class AsyncNBAStatsClient:
+    """Pooled async HTTP client for NBA.com's stats and live JSON endpoints.
+
+    Parameters mirror NBAStatsClient's (see its docstring), plus:
+
+    max_connections : int
+        Upper bound on concurrently open connections in the pool; also the
+        keep-alive pool size.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 40.0,
+        max_retries: int = 4,
+        backoff_seconds: float = 1.0,
+        proxy: str | None = None,
+        extra_headers: dict | None = None,
+        rate_limiter: HostRateLimiter | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        circuit_breakers: HostCircuitBreakers | None = None,
+        stats_base_url: str | None = None,
+        live_base_url: str | None = None,
+    ):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else HostCircuitBreakers()
+        self.base_urls = BaseURLs(stats_base_url, live_base_url)
+
+        headers = dict(DEFAULT_HEADERS)
+        if extra_headers:
+            headers.update(extra_headers)
+        self.session = httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            proxy=proxy,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    async def _get(self, url: str, params=None, headers: dict | None = None) -> httpx.Response:
+        breaker = check_circuit(self.circuit_breakers, url)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire(host_of(url))
+        try:
+            resp = await self.session.get(url, params=params, headers=headers)
+        except UNREACHABLE_ERRORS as exc:
+            breaker.record_failure(exc)
+            raise
+        except BaseException:
+            # RemoteProtocolError/ReadError, or the CancelledError afetch_all
+            # raises in its siblings on a first error.
+            breaker.release_probe()
+            raise
+        breaker.record_success()
+        # httpx treats every non-2xx as an error, 304 included; for a
+        # conditional request (If-None-Match/If-Modified-Since sent) a 304 is
+        # the answer we were hoping for.
+        if resp.status_code == 304 and headers and ("If-None-Match" in headers or "If-Modified-Since" in headers):
+            return resp
+        resp.raise_for_status()
+        return resp
+
+    def _report_pacing(self, url: str, error: Exception | None = None, resp: httpx.Response | None = None) -> None:
+        """NBAStatsClient._report_pacing, reading status/Retry-After off the
+        httpx response (or the HTTPStatusError carrying it)."""
+        if self.rate_limiter is None:
+            return
+        if error is None:
+            self.rate_limiter.record_success(url)
+            return
+        if resp is None and isinstance(error, httpx.HTTPStatusError):
+            resp = error.response
+        status_code = resp.status_code if resp is not None else None
+        if is_throttle(status_code, error, THROTTLE_TIMEOUT_ERRORS):
+            retry_after = resp.headers.get("Retry-After") if resp is not None else None
+            self.rate_limiter.record_throttle(url, parse_retry_after(retry_after))
+
+    async def _backoff(self, url: str, attempt: int) -> None:
+        # Skip the sleep when the circuit just opened: the next attempt
+        # would raise CircuitOpenError immediately anyway.
+        if attempt < self.max_retries and self.circuit_breakers.breaker(host_of(url)).state == CLOSED:
+            await asyncio.sleep(self.backoff_seconds * attempt)
+
+    def circuit_state(self) -> dict[str, dict]:
+        """Per-host breaker state and timings, for logging."""
+        return self.circuit_breakers.snapshot()
+
+    async def get_json(self, url: str, params: dict | None = None, headers: dict | None = None) -> dict:
+        """Async NBAStatsClient.get_json: same retries, same NBAClientError."""
+        return await self._get_with_retries(url, params, headers, lambda resp: resp.json())
+
+    async def get_json_if_changed(
+        self, url: str, validators: dict | None = None, params: dict | None = None
+    ) -> ConditionalResponse:
+        """Async NBAStatsClient.get_json_if_changed."""
+
+        def _parse(resp: httpx.Response) -> ConditionalResponse:
+            if resp.status_code == 304:
+                return ConditionalResponse(None, {**(validators or {}), **response_validators(resp.headers)})
+            return ConditionalResponse(resp.json(), response_validators(resp.headers))
+
+        return await self._get_with_retries(url, params, conditional_headers(validators) or None, _parse)
+
+    async def _get_with_retries(self, url: str, params, headers, parse):
+        url = self.base_urls.rewrite(url)
+        last_error: Exception | None = None
+        for attempt in range(1, self.max_retries + 1):
+            resp = None
+            try:
+                resp = await self._get(url, params=params, headers=headers)
+                data = parse(resp)
+            except (httpx.HTTPError, ValueError) as exc:
+                last_error = exc
+                self._report_pacing(url, exc, resp)
+                await self._backoff(url, attempt)
+            else:
+                self._report_pacing(url)
+                return data
+        raise NBAClientError(f"GET {url} failed after {self.max_retries} attempts: {last_error}") from last_error
+
+    async def get_via_nba_api(self, endpoint) -> dict:
+        """Async NBAStatsClient.get_via_nba_api — fires an unfired nba_api
+        endpoint instance's request over this client's pool (see module
+        docstring) and returns its raw parsed JSON dict."""
+
+        def _load(resp: httpx.Response) -> dict:
+            endpoint.nba_response = NBAStatsResponse(
+                response=NBAStatsHTTP().clean_contents(resp.text),
+                status_code=resp.status_code,
+                url=str(resp.url),
+            )
+            endpoint.load_response()
+            return endpoint.get_dict()
+
+        return await self._nba_api_attempts(endpoint, _load)
+
+    async def get_bytes_via_nba_api(self, endpoint) -> bytes:
+        """Async NBAStatsClient.get_bytes_via_nba_api: the same request as
+        get_via_nba_api(), body returned unparsed."""
+        return await self._nba_api_attempts(
+            endpoint, lambda resp: json_body(NBAStatsHTTP().clean_contents(resp.text))
+        )
+
+    async def _nba_api_attempts(self, endpoint, load):
+        url = f"{self.base_urls.stats}/{endpoint.endpoint}"
+        params = sorted(
+            ((k, v) for k, v in endpoint.parameters.items() if v is not None), key=lambda kv: kv[0]
+        )
+        last_error: Exception | None = None
+        for attempt in range(1, self.max_retries + 1):
+            resp = None
+            try:
+                resp = await self._get(url, params=params)
+                data = load(resp)
+            except (httpx.HTTPError, ValueError, KeyError) as exc:
+                last_error = exc
+                self._report_pacing(url, exc, resp)
+                await self._backoff(url, attempt)
+            else:
+                self._report_pacing(url)
+                return data
+        raise NBAClientError(
+            f"nba_api request via {type(endpoint).__name__} failed after "
+            f"{self.max_retries} attempts: {last_error}"
+        ) from last_error
+
+    async def aclose(self) -> None:
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncNBAStatsClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,121 @@
+"""backend/live_client/batch.py
+
+Batch fetch on top of Endpoint.fetch(): submit many endpoint instances, get
+one BatchResult back per instance, in the same order. `fetch_many()` uses a
+thread pool over the sync client; `afetch_many()` is the same thing on an
+event loop over AsyncNBAStatsClient (see async_client.py).
+
+Concurrency is bounded (`max_workers` threads), and request *rate* is bounded
+separately by whatever HostRateLimiter the endpoints' client carries (see
+rate_limit.py) — the two are deliberately different knobs. Workers let one
+request's network latency overlap another's; the shared token bucket keeps
+the combined request rate under NBA.com's limit no matter how many workers
+there are. Cache hits return straight from Endpoint.fetch() without ever
+reaching the client, so they don't spend rate budget.
+
+Errors are captured per item rather than raised: a refresh job fetching 600
+team-season-sides should get 599 results and one error back, not lose all
+600 to one bad response — the same "partial coverage beats none" principle
+the refresh jobs already follow.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable
+
+from .async_client import AsyncNBAStatsClient
+from .endpoints.base import Endpoint
+from .response import NBAResponse
+
+# Enough to overlap stats.nba.com's ~1-2s response latency at the request
+# rates the refresh jobs use (~1-2 req/s) — more workers than that just sit
+# waiting on the token bucket.
+DEFAULT_MAX_WORKERS = 4
+# The async path has no thread per request, so it can afford far more in
+# flight at once; the rate limiter (not this) is still what bounds the
+# request rate.
+DEFAULT_MAX_CONCURRENCY = 32
+
+
+@dataclass
+class BatchResult:
+    """One endpoint's outcome: exactly one of `response`/`error` is set."""
+
+    endpoint: Endpoint
+    response: NBAResponse | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> NBAResponse:
+        """The response, or re-raise the captured error — for callers where a
+        single failure should still be fatal."""
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+def _fetch_one(endpoint: Endpoint, force_refresh: bool) -> BatchResult:
+    try:
+        return BatchResult(endpoint, response=endpoint.fetch(force_refresh=force_refresh))
+    except Exception as exc:
+        return BatchResult(endpoint, error=exc)
+
+
+def fetch_many(
+    endpoints: Iterable[Endpoint],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    force_refresh: bool = False,
+) -> list[BatchResult]:
+    """Fetch every endpoint with up to `max_workers` in flight at once.
+
+    Returns results in input order. Never raises for a per-endpoint failure
+    (network, schema validation, anything else) — check `BatchResult.ok` or
+    call `unwrap()`.
+    """
+    endpoints = list(endpoints)
+    if not endpoints:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(endpoints)))) as pool:
+        return list(pool.map(lambda e: _fetch_one(e, force_refresh), endpoints))
+
+
+async def afetch_many(
+    endpoints: Iterable[Endpoint],
+    client: AsyncNBAStatsClient | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    force_refresh: bool = False,
+) -> list[BatchResult]:
+    """fetch_many() on the event loop: every endpoint goes through
+    `Endpoint.afetch(client)` (each endpoint's own client if `client` is
+    None), at most `max_concurrency` at once. Same per-item error capture,
+    same input-order results."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _afetch_one(endpoint: Endpoint) -> BatchResult:
+        async with semaphore:
+            try:
+                return BatchResult(endpoint, response=await endpoint.afetch(client, force_refresh=force_refresh))
+            except Exception as exc:
+                return BatchResult(endpoint, error=exc)
+
+    return list(await asyncio.gather(*(_afetch_one(e) for e in endpoints)))
+
+
+async def afetch_all(endpoints: Iterable[Endpoint], client: AsyncNBAStatsClient | None = None) -> list[NBAResponse]:
+    """All-or-nothing counterpart to afetch_many(), for callers where any one
+    failure makes the whole batch useless: the first error cancels every
+    fetch still in flight (so a dead host fails the batch in one request's
+    retry budget, not N of them) and is raised as-is. Returns responses in
+    input order."""
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(e.afetch(client)) for e in endpoints]
+    except BaseExceptionGroup as group_error:
+        raise group_error.exceptions[0] from None
+    return [task.result() for task in tasks]
@@ -3,16 +3,157 @@
 Disk cache for raw NBA.com responses, keyed by endpoint name + sorted params.
 Development convenience so repeated runs don't re-hit the network — not a
 production data store (see backend/AGENTS.md: DB choice is a Phase 6 decision).
+
+Two interchangeable backends with the same get/set/ttl_seconds/force_refresh
+contract (Endpoint only ever calls get()/set(), plus get_bytes()/set_bytes()
+for endpoints that keep their response body unparsed — see streaming.py):
+  - DiskCache: one JSON file per entry. Simple and inspectable; the default.
+  - SQLiteCache: every entry as a zlib-compressed blob in one indexed SQLite
+    file, with a byte budget enforced by least-recently-used eviction. Built
+    for full historical refreshes, which leave thousands of entries behind —
+    one file, no per-entry stat(), and it stops growing at `max_bytes`.
+`default_cache()` picks one from the NBA_CACHE_BACKEND env var, so a host
+can switch backends without touching any endpoint or refresh code. Reads take
+an optional per-call `ttl_seconds`, overriding the instance's: that's how
+Endpoint applies its per-request freshness policy (see cache_policy.py) to
+one shared cache.
+
+Entries can also carry HTTP validators (ETag / Last-Modified;
+get_validators()/set_validators()) for conditional requests: when the server
+answers 304 Not Modified, touch() marks the existing entry fresh again
+without rewriting it — see Endpoint.conditional_requests.
+
+Both also keep a second, columnar tier next to each raw entry: the
+endpoint's *validated* dataframe as an uncompressed Arrow/Feather table
+(get_frame()/set_frame()). On a cache hit, Endpoint.fetch() reads that table
+straight into a DataFrame (memory-mapped, for DiskCache) instead of
+json.loads()-ing the whole raw payload and rebuilding the frame from rowSet
+lists — for a league-wide shot chart or a play-by-play log, that rebuild
+costs more than the network call the cache saved. The raw JSON is then only
+read if a caller actually asks for to_dict()/to_json(). A frame is only ever
+served alongside a live raw entry (same TTL, same key; any set() drops the
+old frame), so the two tiers can't disagree. pyarrow is optional: without
+it, the frame tier is silently off and every hit takes the raw-JSON path.
+
+Both are safe to share between processes — the API and refresh jobs, or a
+pool of refresh workers. SQLiteCache gets that from SQLite itself; DiskCache
+writes every file to a private temp file and renames it into place, so a
+reader in another process sees the old entry or the new one, never half of
+either, and takes a short per-key write lock (separate from Endpoint's
+fetch lock, `lock()`) so two writers' files can't interleave. The frame is
+written lazily, possibly long after its raw entry was read or stored, so
+set_frame() also takes the raw_version() the frame was built from and
+writes nothing once that raw entry has been replaced — one process's frame
+never ends up beside another's raw entry. A file that's unreadable anyway
+(cut short by a crash, say) is a miss, never an exception.
+
+In front of both sits MemoryCache, a process-wide L1 tier (`MEMORY_CACHE`)
+holding already-built NBAResponse objects under the same cache_key(). Endpoint
+instances are cheap and short-lived (a fresh one per season/team/player), so
+without it every repeat read in one process — the API serving the same
+PlayerAdvancedStats season twice, a refresh job revisiting a roster — went
+back to disk and re-parsed.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
+import sqlite3
+import tempfile
+import threading
 import time
+import zlib
+from collections import OrderedDict
+from functools import partial
 from pathlib import Path
+from typing import Any, Callable
+
+from .single_flight import FileLock
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    from pyarrow import feather
+except ImportError:  # optional — see module docstring
+    pa = None
+    feather = None
 
 DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+DEFAULT_SQLITE_PATH = DEFAULT_CACHE_DIR / "cache.sqlite3"
+# Comfortably more than a full 10-season historical refresh (compressed),
+# small enough to be unremarkable on a free-tier host's disk.
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# The L1 tier holds parsed responses, which are far larger in memory than
+# their compressed on-disk form (a league-wide shot chart frame is tens of
+# MB) — bounded by count and by bytes, and short-lived: it exists to absorb
+# repeat reads within one refresh pass or a burst of API requests, not to
+# replace the disk tier. The byte budget is what actually binds on a
+# free-tier host; the count only stops thousands of tiny entries piling up.
+DEFAULT_MEMORY_MAX_ENTRIES = 256
+DEFAULT_MEMORY_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MEMORY_TTL_SECONDS = 10 * 60
+
+# Default for the per-call `ttl_seconds` on cache reads: use the instance's.
+# (None can't be the default — it already means "never expires".)
+OWN_TTL = object()
+
+
+def cache_key(endpoint_name: str, params: dict) -> str:
+    """Stable key for one (endpoint, params) pair — param order never matters.
+    Shared by every cache backend, so an entry means the same thing in each."""
+    normalized = json.dumps(params or {}, sort_keys=True, default=str)
+    digest = hashlib.sha256(f"{endpoint_name}:{normalized}".encode()).hexdigest()[:24]
+    return f"{endpoint_name}__{digest}"
+
+
+def _is_expired(written_at: float, ttl_seconds: float | None) -> bool:
+    return ttl_seconds is not None and (time.time() - written_at) > ttl_seconds
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Writes `data` to `path` by way of a temp file in the same directory
+    and a rename, so readers only ever see a complete file. The temp name is
+    unique per write — two writers never share one. No fsync: a file a crash
+    cuts short is read back as a miss (see DiskCache.get()), which costs a
+    refetch, not a wrong answer."""
+    _atomic_write_with(path, lambda f: f.write(data) is not None)
+
+
+def _atomic_write_with(path: Path, write: Callable[[Any], bool]) -> bool:
+    """_atomic_write(), with `write(fileobj)` streaming the content into the
+    temp file itself (no in-memory copy of it first). The rename only
+    happens if `write` returns True; returns whether it did."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            committed = write(f)
+        if committed:
+            os.replace(tmp, path)
+        return committed
+    finally:
+        Path(tmp).unlink(missing_ok=True)  # already gone once renamed
+
+
+def _looks_complete(payload: bytes) -> bool:
+    # Every cached body is a JSON object; one that doesn't end like one was
+    # cut short. (A full parse would cost exactly what get_bytes() avoids.)
+    stripped = payload.strip()
+    return stripped.startswith(b"{") and stripped.endswith(b"}")
+
+
+def _frame_to_arrow(df: pd.DataFrame, sink) -> bool:
+    """Writes `df` to `sink` as an uncompressed Feather (Arrow IPC) table.
+    Returns False, writing nothing useful, for a frame Arrow can't represent
+    (e.g. an object column mixing types) — the frame tier is an
+    optimization, never a reason to fail a fetch."""
+    try:
+        feather.write_feather(df, sink, compression="uncompressed")
+    except (pa.ArrowException, TypeError, ValueError):
+        return False
+    return True
 
 
 class DiskCache:
@@ -32,22 +173,564 @@ class DiskCache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.corrupt = 0
 
     def _key_path(self, endpoint_name: str, params: dict) -> Path:
-        normalized = json.dumps(params or {}, sort_keys=True, default=str)
-        digest = hashlib.sha256(f"{endpoint_name}:{normalized}".encode()).hexdigest()[:24]
-        return self.cache_dir / f"{endpoint_name}__{digest}.json"
+        return self.cache_dir / f"{cache_key(endpoint_name, params)}.json"
 
-    def get(self, endpoint_name: str, params: dict, force_refresh: bool = False) -> dict | None:
-        """Returns the cached raw response, or None on a miss / forced refresh."""
+    def get(self, endpoint_name: str, params: dict, force_refresh: bool = False, ttl_seconds=OWN_TTL) -> dict | None:
+        """Returns the cached raw response, or None on a miss / forced refresh
+        — including an entry that doesn't parse."""
+        payload = self.get_bytes(endpoint_name, params, force_refresh=force_refresh, ttl_seconds=ttl_seconds)
+        if payload is None:
+            return None
+        try:
+            return json.loads(payload)
+        except ValueError:  # JSONDecodeError, or bytes that aren't UTF-8
+            self._corrupt_entry()
+            return None
+
+    def get_bytes(self, endpoint_name: str, params: dict, force_refresh: bool = False, ttl_seconds=OWN_TTL) -> bytes | None:
+        """get(), but the stored JSON text as-is, undecoded. An entry that
+        visibly isn't a whole JSON object is a miss."""
         if force_refresh:
             return None
         path = self._key_path(endpoint_name, params)
-        if not path.exists():
+        try:
+            if _is_expired(path.stat().st_mtime, self._ttl(ttl_seconds)):
+                self.misses += 1
+                return None
+            payload = path.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if not _looks_complete(payload):
+            self._corrupt_entry()
+            return None
+        return payload
+
+    def _corrupt_entry(self) -> None:
+        # Left in place rather than deleted: by now a writer may have renamed
+        # a good entry over it, and the next set() replaces it regardless.
+        self.hits -= 1
+        self.misses += 1
+        self.corrupt += 1
+
+    def set(self, endpoint_name: str, params: dict, raw: dict) -> str:
+        return self.set_bytes(endpoint_name, params, json.dumps(raw).encode())
+
+    def set_bytes(self, endpoint_name: str, params: dict, payload: bytes) -> str:
+        """set() for a response body that's already JSON text — written
+        straight through, never decoded. Returns the new entry's
+        raw_version()."""
+        path = self._key_path(endpoint_name, params)
+        with self._write_lock(endpoint_name, params):
+            path.with_suffix(".feather").unlink(missing_ok=True)
+            path.with_suffix(".validators").unlink(missing_ok=True)
+            _atomic_write(path, payload)
+            return self._file_version(path)
+
+    def set_file(self, file_name: str, payload: bytes, written_at: float | None = None) -> str:
+        """set_bytes() for an entry known only by its file name in this cache
+        (what a cache bundle carries — see cache_bundle.py), under the same
+        write lock, optionally dated `written_at` instead of now. Returns the
+        new entry's raw_version()."""
+        path = self.cache_dir / file_name
+        if path.name != file_name or path.suffix != ".json":
+            raise ValueError(f"Not a cache entry file name: {file_name!r}")
+        with self._key_write_lock(path.stem):
+            path.with_suffix(".feather").unlink(missing_ok=True)
+            path.with_suffix(".validators").unlink(missing_ok=True)
+            _atomic_write(path, payload)
+            if written_at is not None:
+                os.utime(path, (written_at, written_at))
+            return self._file_version(path)
+
+    def raw_version(self, endpoint_name: str, params: dict) -> str | None:
+        """Identifies the raw entry currently stored (None if there isn't
+        one): every set() writes a new file, so a new inode, and a replaced
+        entry never matches an older version — see set_frame()."""
+        return self._file_version(self._key_path(endpoint_name, params))
+
+    @staticmethod
+    def _file_version(path: Path) -> str | None:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+    def get_validators(self, endpoint_name: str, params: dict) -> dict:
+        """The validators stored with an entry — regardless of its age, since
+        revalidating a stale entry is what they're for. {} if none."""
+        try:
+            return json.loads(self._key_path(endpoint_name, params).with_suffix(".validators").read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def set_validators(self, endpoint_name: str, params: dict, validators: dict) -> None:
+        path = self._key_path(endpoint_name, params).with_suffix(".validators")
+        with self._write_lock(endpoint_name, params):
+            _atomic_write(path, json.dumps(validators).encode())
+
+    def touch(self, endpoint_name: str, params: dict) -> bool:
+        """Restarts an existing entry's TTL clock (a 304 said it's still
+        current). False if there's no entry to touch."""
+        path = self._key_path(endpoint_name, params)
+        with self._write_lock(endpoint_name, params):
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                return False
+            # The frame tier is only trusted when it's at least as new as the raw.
+            frame_path = path.with_suffix(".feather")
+            if frame_path.exists():
+                os.utime(frame_path)
+        return True
+
+    def get_frame(
+        self, endpoint_name: str, params: dict, force_refresh: bool = False, ttl_seconds=OWN_TTL
+    ) -> pd.DataFrame | None:
+        """The validated dataframe stored by set_frame(), memory-mapped — or
+        None if there isn't one, or its raw entry is missing/expired."""
+        if force_refresh or feather is None:
+            return None
+        raw_path = self._key_path(endpoint_name, params)
+        frame_path = raw_path.with_suffix(".feather")
+        try:
+            raw_mtime = raw_path.stat().st_mtime
+            frame_mtime = frame_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if frame_mtime < raw_mtime:
+            return None
+        if _is_expired(raw_mtime, self._ttl(ttl_seconds)):
+            return None
+        try:
+            table = feather.read_table(frame_path, memory_map=True)
+        except (OSError, pa.ArrowException):
+            # Unreadable (or replaced and removed under us): the raw tier
+            # still answers.
+            return None
+        self.hits += 1
+        return table.to_pandas()
+
+    def set_frame(self, endpoint_name: str, params: dict, df: pd.DataFrame, raw_version: str | None = None) -> None:
+        """Stores `df` as the frame of the current raw entry. With
+        `raw_version` (what raw_version() returned for the raw `df` was built
+        from), nothing is written if that entry has since been replaced: the
+        frame is built lazily, so another process may well have stored a
+        newer raw entry by then, and this frame would otherwise pass as its."""
+        if feather is None:
+            return
+        raw_path = self._key_path(endpoint_name, params)
+        frame_path = raw_path.with_suffix(".feather")
+        with self._write_lock(endpoint_name, params):
+            if raw_version is not None and self._file_version(raw_path) != raw_version:
+                return
+            if not _atomic_write_with(frame_path, lambda f: _frame_to_arrow(df, f)):
+                frame_path.unlink(missing_ok=True)
+
+    def _ttl(self, ttl_seconds) -> float | None:
+        return self.ttl_seconds if ttl_seconds is OWN_TTL else ttl_seconds
+
+    def lock(self, endpoint_name: str, params: dict) -> FileLock:
+        """Cross-process advisory lock for one key — held by Endpoint.fetch()
+        around a fetch-and-store (see single_flight.py)."""
+        return FileLock(self.cache_dir / "locks" / f"{cache_key(endpoint_name, params)}.lock")
+
+    def _write_lock(self, endpoint_name: str, params: dict) -> FileLock:
+        # Its own file: a writer is often already inside lock() for the same
+        # key, and flock() doesn't nest across file descriptors.
+        return self._key_write_lock(cache_key(endpoint_name, params))
+
+    def _key_write_lock(self, key: str) -> FileLock:
+        return FileLock(self.cache_dir / "locks" / f"{key}.write.lock")
+
+    def stats(self) -> dict:
+        return {"backend": "files", "hits": self.hits, "misses": self.misses, "corrupt": self.corrupt}
+
+
+class SQLiteCache:
+    """Compressed single-file cache with a byte budget and LRU eviction.
+
+    Parameters
+    ----------
+    path : Path | str
+        The SQLite database file (created on first use).
+    ttl_seconds : float | None
+        Same meaning as DiskCache's: entries older than this (by write time)
+        are misses; `None` never expires.
+    max_bytes : int
+        Budget for the sum of stored (compressed) entry sizes. Every set()
+        that pushes the total over it evicts least-recently-*read* entries
+        until it fits again — the newest write itself is never evicted.
+
+    Safe to share between processes (the API and a refresh job running at
+    the same time): the database runs in WAL mode, so readers never block on
+    a writer, and writers wait up to `BUSY_TIMEOUT_SECONDS` for each other
+    instead of failing. Each set() + eviction pass is one transaction.
+    Connections are per-thread, so one instance is also safe across the
+    worker threads of live_client.batch.fetch_many.
+
+    hit/miss counts are per-instance (this process's view), via stats().
+    """
+
+    BUSY_TIMEOUT_SECONDS = 30.0
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_SQLITE_PATH,
+        ttl_seconds: float | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " endpoint TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " blob BLOB NOT NULL,"
+                " frame BLOB,"
+                " validators TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+            if "frame" not in columns:  # database created before the frame tier existed
+                conn.execute("ALTER TABLE entries ADD COLUMN frame BLOB")
+            if "validators" not in columns:  # ...or before conditional requests
+                conn.execute("ALTER TABLE entries ADD COLUMN validators TEXT")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.BUSY_TIMEOUT_SECONDS)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, endpoint_name: str, params: dict, force_refresh: bool = False, ttl_seconds=OWN_TTL) -> dict | None:
+        """Returns the cached raw response, or None on a miss / forced refresh."""
+        payload = self.get_bytes(endpoint_name, params, force_refresh=force_refresh, ttl_seconds=ttl_seconds)
+        return json.loads(payload) if payload is not None else None
+
+    def get_bytes(self, endpoint_name: str, params: dict, force_refresh: bool = False, ttl_seconds=OWN_TTL) -> bytes | None:
+        """get(), but the stored JSON text (decompressed), undecoded."""
+        if force_refresh:
             return None
-        if self.ttl_seconds is not None and (time.time() - path.stat().st_mtime) > self.ttl_seconds:
+        key = cache_key(endpoint_name, params)
+        conn = self._connection()
+        row = conn.execute("SELECT created_at, blob FROM entries WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None or _is_expired(row[0], self._ttl(ttl_seconds)):
+            self.misses += 1
+            return None
+        with conn:
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        return zlib.decompress(row[1])
+
+    def set(self, endpoint_name: str, params: dict, raw: dict) -> str:
+        return self.set_bytes(endpoint_name, params, json.dumps(raw).encode())
+
+    def set_bytes(self, endpoint_name: str, params: dict, payload: bytes) -> str:
+        """set() for a response body that's already JSON text. Returns the
+        new entry's raw_version()."""
+        blob = zlib.compress(payload)
+        key = cache_key(endpoint_name, params)
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, endpoint, created_at, accessed_at, size, blob, frame, validators)"
+                " VALUES (?, ?, ?, ?, ?, ?, NULL, NULL)",
+                (key, endpoint_name, now, now, len(blob), blob),
+            )
+            self._evict(conn, keep=key)
+        return self._row_version(now, len(blob))
+
+    def raw_version(self, endpoint_name: str, params: dict) -> str | None:
+        """See DiskCache.raw_version: the entry's write time and size."""
+        row = self._connection().execute(
+            "SELECT created_at, LENGTH(blob) FROM entries WHERE key = ?", (cache_key(endpoint_name, params),)
+        ).fetchone()
+        return self._row_version(*row) if row is not None else None
+
+    @staticmethod
+    def _row_version(created_at: float, blob_size: int) -> str:
+        return f"{created_at!r}:{blob_size}"
+
+    def get_frame(
+        self, endpoint_name: str, params: dict, force_refresh: bool = False, ttl_seconds=OWN_TTL
+    ) -> pd.DataFrame | None:
+        """The validated dataframe stored by set_frame() — read zero-copy out
+        of the row's Arrow buffer — or None if there isn't one or the raw
+        entry is missing/expired."""
+        if force_refresh or feather is None:
+            return None
+        key = cache_key(endpoint_name, params)
+        conn = self._connection()
+        row = conn.execute("SELECT created_at, frame FROM entries WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None or row[1] is None or _is_expired(row[0], self._ttl(ttl_seconds)):
+            return None
+        with conn:
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        return feather.read_table(pa.BufferReader(row[1])).to_pandas()
+
+    def set_frame(self, endpoint_name: str, params: dict, df: pd.DataFrame, raw_version: str | None = None) -> None:
+        """See DiskCache.set_frame; the version check and the write are one
+        UPDATE, so they can't be split by another writer."""
+        if feather is None:
+            return
+        sink = pa.BufferOutputStream()
+        if not _frame_to_arrow(df, sink):
+            return
+        frame = sink.getvalue()  # bound straight from Arrow's buffer, not copied into bytes
+        key = cache_key(endpoint_name, params)
+        sql, args = "UPDATE entries SET frame = ?, size = LENGTH(blob) + ? WHERE key = ?", [key]
+        if raw_version is not None:
+            created_at, blob_size = raw_version.rsplit(":", 1)
+            sql += " AND created_at = ? AND LENGTH(blob) = ?"
+            args += [float(created_at), int(blob_size)]
+        conn = self._connection()
+        with conn:
+            # The frame counts against the same byte budget as the raw blob.
+            updated = conn.execute(sql, (memoryview(frame), frame.size, *args))
+            if updated.rowcount:
+                self._evict(conn, keep=key)
+
+    def _ttl(self, ttl_seconds) -> float | None:
+        return self.ttl_seconds if ttl_seconds is OWN_TTL else ttl_seconds
+
+    def get_validators(self, endpoint_name: str, params: dict) -> dict:
+        """See DiskCache.get_validators."""
+        row = self._connection().execute(
+            "SELECT validators FROM entries WHERE key = ?", (cache_key(endpoint_name, params),)
+        ).fetchone()
+        if row is None or not row[0]:
+            return {}
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return {}
+
+    def set_validators(self, endpoint_name: str, params: dict, validators: dict) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "UPDATE entries SET validators = ? WHERE key = ?",
+                (json.dumps(validators), cache_key(endpoint_name, params)),
+            )
+
+    def touch(self, endpoint_name: str, params: dict) -> bool:
+        """See DiskCache.touch."""
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            updated = conn.execute(
+                "UPDATE entries SET created_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, cache_key(endpoint_name, params)),
+            )
+        return bool(updated.rowcount)
+
+    def lock(self, endpoint_name: str, params: dict) -> FileLock:
+        """Cross-process advisory lock for one key (see DiskCache.lock). Lock
+        files live beside the database, not in it: holding a SQLite write
+        transaction open for a whole network round-trip would block every
+        other writer."""
+        return FileLock(self.path.parent / f"{self.path.name}.locks" / f"{cache_key(endpoint_name, params)}.lock")
+
+    def _evict(self, conn: sqlite3.Connection, keep: str) -> None:
+        # Keep the most recently read entries whose running size total fits
+        # the budget; drop everything older than that in one statement.
+        conn.execute(
+            "DELETE FROM entries WHERE key != ? AND key IN ("
+            " SELECT key FROM ("
+            "  SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS running FROM entries"
+            " ) WHERE running > ?)",
+            (keep, self.max_bytes),
+        )
+
+    def stats(self) -> dict:
+        n_entries, total_bytes = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        return {
+            "backend": "sqlite",
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": n_entries,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU + TTL cache of arbitrary values (in
+    practice: validated NBAResponse objects), keyed by cache_key().
+
+    Parameters
+    ----------
+    max_entries : int
+        Least-recently-used entries are dropped once there are more than this.
+    max_bytes : int | None
+        ...or once their sizes add up to more than this (`None`: no byte
+        budget). A value's size is its `nbytes()` if it has one
+        (NBAResponse.nbytes()), else 0; it's re-measured on every hit,
+        since a response that was stored unparsed grows when its frame is
+        built. An entry bigger than the whole budget is never kept.
+    ttl_seconds : float | None
+        Default lifetime of an entry; set() can pass a shorter one per entry.
+        Endpoint passes its cache policy's TTL, so an entry is never held
+        longer than a freshly written disk entry would stay fresh — but the
+        clock starts when the entry is stored here, so one read from an
+        older disk entry can outlive it by up to that TTL (at most this
+        default). `None` never expires.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MEMORY_MAX_ENTRIES,
+        ttl_seconds: float | None = DEFAULT_MEMORY_TTL_SECONDS,
+        max_bytes: int | None = DEFAULT_MEMORY_MAX_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float | None, Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, endpoint_name: str, params: dict, force_refresh: bool = False) -> Any | None:
+        if force_refresh:
             return None
-        return json.loads(path.read_text())
+        key = cache_key(endpoint_name, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and time.monotonic() >= entry[0]:
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            expires_at, value, size = entry
+            self._entries[key] = (expires_at, value, _nbytes(value))
+            self._bytes += self._entries[key][2] - size
+            self._entries.move_to_end(key)
+            self._evict(keep=key)
+            return value
+
+    def set(self, endpoint_name: str, params: dict, value: Any, ttl_seconds: float | None = None) -> None:
+        ttls = [t for t in (self.ttl_seconds, ttl_seconds) if t is not None]
+        expires_at = time.monotonic() + min(ttls) if ttls else None
+        key = cache_key(endpoint_name, params)
+        size = _nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                self.evictions += 1
+                return
+            self._entries[key] = (expires_at, value, size)
+            self._bytes += size
+            self._evict(keep=key)
+
+    def _evict(self, keep: str) -> None:
+        # Oldest first, never the entry just stored or read.
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes and len(self._entries) > 1
+        ):
+            key = next(iter(self._entries))
+            if key == keep:
+                break
+            self._drop(key)
+            self.evictions += 1
+
+    def _drop(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key)[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def _nbytes(value: Any) -> int:
+    nbytes = getattr(value, "nbytes", None)
+    return int(nbytes()) if callable(nbytes) else 0
+
+
+# The process-wide L1 tier every Endpoint built with the default cache shares.
+MEMORY_CACHE = MemoryCache(
+    max_entries=int(os.environ.get("NBA_MEMORY_CACHE_MAX_ENTRIES", DEFAULT_MEMORY_MAX_ENTRIES)),
+    max_bytes=int(os.environ.get("NBA_MEMORY_CACHE_MAX_BYTES", DEFAULT_MEMORY_MAX_BYTES)),
+)
+
+
+# default_cache() instances, one per configuration for the whole process.
+_DEFAULT_CACHES: dict[tuple, DiskCache | SQLiteCache] = {}
+_DEFAULT_CACHES_LOCK = threading.Lock()
+
+
+def default_cache(ttl_seconds: float | None = None) -> DiskCache | SQLiteCache:
+    """The cache an Endpoint gets when none is passed in. NBA_CACHE_BACKEND
+    selects the backend: "files" (default, DiskCache) or "sqlite"
+    (SQLiteCache, budget from NBA_CACHE_MAX_BYTES if set). NBA_CACHE_DIR
+    moves either one off live_client/.cache — e.g. to a scratch directory
+    for a cold-cache benchmark run (see ratings/benchmark_refreshes.py).
 
-    def set(self, endpoint_name: str, params: dict, raw: dict) -> None:
-        self._key_path(endpoint_name, params).write_text(json.dumps(raw))
+    One instance per configuration (backend, location, ttl, budget) for the
+    process, not one per call: Endpoints are built by the hundred in a batch
+    refresh and twice per live poll, and a SQLiteCache per Endpoint would
+    re-run its schema setup and leave its per-thread connections open every
+    time. It also makes stats() the process's hit/miss counts."""
+    backend = os.environ.get("NBA_CACHE_BACKEND", "files").lower()
+    cache_dir = os.environ.get("NBA_CACHE_DIR")
+    if backend == "sqlite":
+        max_bytes = int(os.environ.get("NBA_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        path = Path(cache_dir) / DEFAULT_SQLITE_PATH.name if cache_dir else DEFAULT_SQLITE_PATH
+        key = (backend, str(path), ttl_seconds, max_bytes)
+        build = partial(SQLiteCache, path, ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+    elif backend == "files":
+        cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        key = (backend, str(cache_dir), ttl_seconds)
+        build = partial(DiskCache, cache_dir, ttl_seconds=ttl_seconds)
+    else:
+        raise ValueError(f"Unknown NBA_CACHE_BACKEND {backend!r} (expected 'files' or 'sqlite')")
+    with _DEFAULT_CACHES_LOCK:
+        cache = _DEFAULT_CACHES.get(key)
+        if cache is None:
+            cache = _DEFAULT_CACHES[key] = build()
+        return cache
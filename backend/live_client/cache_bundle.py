@@ -0,0 +1,224 @@
+"""backend/live_client/cache_bundle.py
+
+Offline cache bundles: pack a DiskCache (or part of it) into one compressed
+file on a machine that can reach NBA.com, unpack it on one that can't.
+
+The API host can't reach stats.nba.com at all (see backend/api/main.py), so
+every refresh there fails and its outputs stay empty. Seeded with a bundle
+instead, the host's refresh jobs find every response they ask for already
+in the cache and never touch the network — the cache is the one place all
+of them read from, so seeding it is enough; no refresh module needs to know
+bundles exist.
+
+Format: a gzip'd tar of
+
+  manifest.json     one entry per cached response: its cache file name,
+                    endpoint, season (where one can be told — see
+                    `entry_season`), byte size and sha256
+  objects/<sha256>  each distinct payload once, named by its content hash
+
+Content addressing makes a bundle verifiable (import checks every payload
+against its hash before anything lands in the cache) and deduplicated (the
+same body cached under two keys is stored once). The bundle's own file name
+carries a hash of its manifest, so two exports of the same cache state
+produce the same name and a host can tell it already has one.
+
+Only the raw JSON tier travels: the columnar frames (cache.py) are derived
+data and rebuild on first read. Imported entries are stamped fresh as of
+import time — seeding is a deliberate "treat this as current" — so each
+then lasts its normal cache-policy TTL from the moment it's imported;
+`keep_timestamps=True` keeps the exporter's times instead. A host that
+can't reach NBA.com at all should also set NBA_CACHE_OFFLINE (see
+cache_policy.py), or the current season's daily entries expire a day after
+import and every fetch of them fails from then on.
+
+CLI (from repo root):
+  python -m backend.live_client.cache_bundle export bundles/ --endpoint LeagueShotChart --season 2024-25
+  python -m backend.live_client.cache_bundle import bundles/nba-cache-<hash>.tar.gz
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import logging
+import os
+import tarfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable
+
+from .cache import DEFAULT_CACHE_DIR, DiskCache
+from .cache_policy import game_season_start_year, season_start_year
+from .streaming import read_member
+
+logger = logging.getLogger("basketball_predictions.live_client.cache_bundle")
+
+MANIFEST_NAME = "manifest.json"
+BUNDLE_FORMAT_VERSION = 1
+
+
+@dataclass
+class BundleEntry:
+    """One cached response in a bundle's manifest."""
+
+    file: str
+    endpoint: str
+    season: int | None
+    sha256: str
+    size: int
+    written_at: float
+
+
+def entry_season(payload: bytes) -> int | None:
+    """The season start year a cached payload belongs to, read from the
+    payload itself (cache file names are hashes): stats.nba.com echoes its
+    request `parameters` (Season / SeasonYear, or a GameID, which embeds
+    the season), and cdn.nba.com game feeds carry `game.gameId`. None for a
+    payload that says neither."""
+    text = payload.decode()
+    try:
+        parameters = read_member(text, "parameters")
+        if isinstance(parameters, dict):
+            for name in ("Season", "SeasonYear", "SeasonNullable"):
+                if parameters.get(name):
+                    return season_start_year(parameters[name])
+            for name in ("GameID", "GameId", "game_id"):
+                if parameters.get(name):
+                    return game_season_start_year(parameters[name])
+        game = read_member(text, "game")
+        if isinstance(game, dict) and game.get("gameId"):
+            return game_season_start_year(game["gameId"])
+    except ValueError:
+        pass
+    return None
+
+
+def _endpoint_of(path: Path) -> str:
+    # cache.cache_key(): "<EndpointName>__<digest>"
+    return path.stem.rsplit("__", 1)[0]
+
+
+def export_bundle(
+    out: Path | str,
+    cache: DiskCache | None = None,
+    endpoints: Iterable[str] | None = None,
+    seasons: Iterable[str | int] | None = None,
+) -> Path:
+    """Packs `cache`'s raw entries — only those of `endpoints` and/or
+    `seasons` ("2024-25" or 2024), if given — into a bundle. `out` is a
+    directory (the bundle is named for its content) or a file path. Returns
+    the bundle's path."""
+    cache = cache or DiskCache(DEFAULT_CACHE_DIR)
+    endpoints = set(endpoints) if endpoints else None
+    season_years = {season_start_year(s) if isinstance(s, str) else int(s) for s in seasons} if seasons else None
+
+    entries: list[BundleEntry] = []
+    objects: dict[str, bytes] = {}
+    for path in sorted(cache.cache_dir.glob("*.json")):
+        endpoint = _endpoint_of(path)
+        if endpoints is not None and endpoint not in endpoints:
+            continue
+        payload = path.read_bytes()
+        season = entry_season(payload)
+        if season_years is not None and season not in season_years:
+            continue
+        digest = hashlib.sha256(payload).hexdigest()
+        objects.setdefault(digest, payload)
+        entries.append(BundleEntry(path.name, endpoint, season, digest, len(payload), path.stat().st_mtime))
+
+    manifest = json.dumps(
+        {"format": BUNDLE_FORMAT_VERSION, "entries": [asdict(e) for e in entries]}, sort_keys=True
+    ).encode()
+    out = Path(out)
+    if out.suffix != ".gz":
+        out.mkdir(parents=True, exist_ok=True)
+        out = out / f"nba-cache-{hashlib.sha256(manifest).hexdigest()[:16]}.tar.gz"
+    else:
+        out.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp = out.with_name(out.name + ".tmp")
+    # mtime=0 on every member keeps the archive's bytes a function of its
+    # contents alone.
+    with tarfile.open(tmp, "w:gz") as tar:
+        _add_member(tar, MANIFEST_NAME, manifest)
+        for digest, payload in objects.items():
+            _add_member(tar, f"objects/{digest}", payload)
+    os.replace(tmp, out)
+    logger.info("exported %d cache entries (%d distinct payloads) to %s", len(entries), len(objects), out)
+    return out
+
+
+def _add_member(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = 0
+    tar.addfile(info, io.BytesIO(data))
+
+
+def import_bundle(bundle: Path | str, cache: DiskCache | None = None, keep_timestamps: bool = False) -> int:
+    """Unpacks a bundle into `cache`, verifying every payload against its
+    hash first. Existing entries for the same keys are replaced. Returns the
+    number of entries written. Raises ValueError for a corrupt or
+    unrecognized bundle, before writing anything."""
+    cache = cache or DiskCache(DEFAULT_CACHE_DIR)
+    with tarfile.open(bundle, "r:gz") as tar:
+        manifest = json.loads(_read_member(tar, MANIFEST_NAME))
+        if manifest.get("format") != BUNDLE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported cache bundle format: {manifest.get('format')!r}")
+        entries = [BundleEntry(**e) for e in manifest["entries"]]
+        objects = {}
+        for digest in {e.sha256 for e in entries}:
+            payload = _read_member(tar, f"objects/{digest}")
+            if hashlib.sha256(payload).hexdigest() != digest:
+                raise ValueError(f"Cache bundle object {digest} doesn't match its hash")
+            objects[digest] = payload
+    for entry in entries:
+        if Path(entry.file).name != entry.file or not entry.file.endswith(".json"):
+            raise ValueError(f"Unexpected cache file name in bundle: {entry.file!r}")
+
+    for entry in entries:
+        # Same lock and atomic write as a fetch storing the entry, so a
+        # reader never sees a partial file and a concurrent writer never
+        # interleaves with the import.
+        cache.set_file(entry.file, objects[entry.sha256], entry.written_at if keep_timestamps else None)
+    logger.info("imported %d cache entries from %s", len(entries), bundle)
+    return len(entries)
+
+
+def _read_member(tar: tarfile.TarFile, name: str) -> bytes:
+    try:
+        member = tar.extractfile(name)
+    except KeyError:
+        member = None
+    if member is None:
+        raise ValueError(f"Cache bundle is missing {name}")
+    return member.read()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m backend.live_client.cache_bundle", description=__doc__.split("\n\n")[1])
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="DiskCache directory (default: live_client/.cache)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="pack the cache into a bundle")
+    export.add_argument("out", help="directory for a content-named bundle, or a .tar.gz path")
+    export.add_argument("--endpoint", action="append", help="only this endpoint class (repeatable)")
+    export.add_argument("--season", action="append", help='only this season, e.g. "2024-25" (repeatable)')
+
+    load = commands.add_parser("import", help="unpack a bundle into the cache")
+    load.add_argument("bundle")
+    load.add_argument("--keep-timestamps", action="store_true", help="keep the exporter's entry times")
+
+    args = parser.parse_args(argv)
+    cache = DiskCache(args.cache_dir)
+    if args.command == "export":
+        print(f"Wrote {export_bundle(args.out, cache, args.endpoint, args.season)}")
+    else:
+        print(f"Imported {import_bundle(args.bundle, cache, args.keep_timestamps)} cache entries")
+
+
+if __name__ == "__main__":
+    main()
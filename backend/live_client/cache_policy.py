@@ -0,0 +1,171 @@
+"""backend/live_client/cache_policy.py
+
+How long a cached response stays fresh, per endpoint and request — instead
+of one `ttl_seconds` for the whole cache.
+
+NBA.com data falls into a few freshness classes, and which one a request is
+in follows from the endpoint and its season:
+
+  immutable  a completed season's stats, shot charts, rosters and games.
+             Never re-fetched once cached -- as long as the entry was
+             cached after the season completed. One written while the
+             season was still current (a mid-season pull) holds only the
+             games played by then, so it's expired once, on its first
+             read after the season completes; its replacement then never
+             expires.
+  daily      the current season's stats: they change once a night, after
+             the day's games, so re-pulling more often than that only spends
+             rate budget on identical data.
+  roster     the current (or upcoming) season's rosters, which move through
+             trades, signings and waivers at any hour — 6 hours (see
+             endpoints/stats/team_roster.py).
+  live       cdn.nba.com's in-game feeds (scoreboard, live box score):
+             seconds.
+
+`policy_for(endpoint_name, params)` picks one. Endpoint classes with a
+special rule are registered by name in `_RULES` (names rather than classes,
+so anything holding only a cache key's endpoint name — e.g. a cache export —
+can ask too); everything else follows the generic season rule on its
+`Season` param, and an endpoint with no season at all is treated as
+immutable, which is what every such endpoint here was before.
+
+Endpoint applies the policy to its default cache (see endpoints/base.py).
+A cache passed in explicitly keeps its own `ttl_seconds`.
+
+Offline mode ($NBA_CACHE_OFFLINE) overrides all of the above: every request
+is `offline`, i.e. never expires. It's for a host that can't reach NBA.com
+at all and runs off a seeded cache (see cache_bundle.py) — there a stale
+entry is the only answer it can give, and expiring it just turns every
+fetch into a network error a day after the import.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from typing import Callable
+
+# cdn.nba.com regenerates its live feeds every few seconds during a game;
+# 15s keeps a burst of API requests on one upstream fetch without ever
+# showing a score more than a possession or two old.
+LIVE_TTL_SECONDS = 15
+# A roster can move through trades/signings/waivers at any point in the
+# offseason, so a stale roster is a real correctness risk, not just a missed
+# optimization. 6 hours balances "don't hammer NBA.com on every request"
+# against "don't serve a week-old roster deep into free agency." Callers that
+# need the absolute latest can still pass fetch(force_refresh=True).
+ROSTER_TTL_SECONDS = 6 * 60 * 60
+DAILY_TTL_SECONDS = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """A named freshness class; `ttl_seconds=None` never expires.
+
+    `complete_since` (epoch seconds; not part of the class's identity) is
+    when the request's season completed, for an immutable policy: entries
+    written before then are stale regardless (see module docstring)."""
+
+    name: str
+    ttl_seconds: float | None
+    complete_since: float | None = field(default=None, compare=False)
+
+    def read_ttl_seconds(self, now: float) -> float | None:
+        """The `ttl_seconds` to read a cache entry with at `now`: the
+        policy's own, or for a completed season, exactly old enough to
+        expire whatever was written before it completed."""
+        if self.complete_since is None:
+            return self.ttl_seconds
+        return max(0.0, now - self.complete_since)
+
+
+IMMUTABLE = CachePolicy("immutable", None)
+DAILY = CachePolicy("daily", DAILY_TTL_SECONDS)
+ROSTER = CachePolicy("roster", ROSTER_TTL_SECONDS)
+LIVE = CachePolicy("live", LIVE_TTL_SECONDS)
+OFFLINE = CachePolicy("offline", None)
+
+OFFLINE_ENV = "NBA_CACHE_OFFLINE"
+
+
+def offline_mode() -> bool:
+    """Whether $NBA_CACHE_OFFLINE is set (read per call, not at import)."""
+    return os.environ.get(OFFLINE_ENV, "").lower() in {"1", "true", "yes"}
+
+
+def current_season_start_year(now: datetime | None = None) -> int:
+    """The start year of the season whose data can still change — the same
+    October cutoff as ratings/refresh_player_ratings.current_nba_season()
+    (which live_client can't import). Until opening night, last season is
+    "current", so a season that ended in June is still re-pulled daily
+    through the summer; harmless, and it catches late stat corrections."""
+    now = now or datetime.now(timezone.utc)
+    return now.year if now.month >= 10 else now.year - 1
+
+
+def season_start_year(season: str) -> int | None:
+    """"2023-24" -> 2023; None for anything that isn't a season string."""
+    try:
+        return int(str(season)[:4])
+    except ValueError:
+        return None
+
+
+def game_season_start_year(game_id: str) -> int | None:
+    """NBA.com game IDs embed the season: "0022300001" -> 2023."""
+    game_id = str(game_id)
+    if len(game_id) != 10 or not game_id.isdigit():
+        return None
+    return 2000 + int(game_id[3:5])
+
+
+def season_completed_at(start_year: int) -> datetime:
+    """When a season stops being current_season_start_year(): the next
+    season's October cutoff."""
+    return datetime(start_year + 1, 10, 1, tzinfo=timezone.utc)
+
+
+def _by_season(start_year: int | None, current: CachePolicy, now: datetime | None) -> CachePolicy:
+    if start_year is not None and start_year < current_season_start_year(now):
+        return replace(IMMUTABLE, complete_since=season_completed_at(start_year).timestamp())
+    # Current, upcoming, or unparseable: assume it can still change.
+    return current
+
+
+def _season_rule(current: CachePolicy) -> Callable[[dict, datetime | None], CachePolicy]:
+    def _rule(params: dict, now: datetime | None) -> CachePolicy:
+        if "Season" not in params:
+            return IMMUTABLE
+        return _by_season(season_start_year(params["Season"]), current, now)
+
+    return _rule
+
+
+def _game_rule(params: dict, now: datetime | None) -> CachePolicy:
+    return _by_season(game_season_start_year(params.get("GameID", "")), DAILY, now)
+
+
+def _live_rule(params: dict, now: datetime | None) -> CachePolicy:
+    return LIVE
+
+
+_DEFAULT_RULE = _season_rule(DAILY)
+
+_RULES: dict[str, Callable[[dict, datetime | None], CachePolicy]] = {
+    "TeamRoster": _season_rule(ROSTER),
+    # One response spans every season a player has played, current one
+    # included, so it's only as stable as its newest row.
+    "PlayerCareerStats": lambda params, now: DAILY,
+    "GameBoxScore": _game_rule,
+    "GamePlayByPlay": _game_rule,
+    "TodaysScoreboard": _live_rule,
+    "LiveBoxScore": _live_rule,
+}
+
+
+def policy_for(endpoint_name: str, params: dict, now: datetime | None = None) -> CachePolicy:
+    """The freshness class for one request — see module docstring."""
+    if offline_mode():
+        return OFFLINE
+    return _RULES.get(endpoint_name, _DEFAULT_RULE)(params or {}, now)
@@ -0,0 +1,178 @@
+"""backend/live_client/circuit_breaker.py
+
+Per-host health tracking for NBAStatsClient / AsyncNBAStatsClient, so a host
+that can't reach NBA.com at all fails fast instead of slowly.
+
+Without this, every call against an unreachable stats.nba.com spends its full
+retry budget — up to `max_retries` attempts × `timeout` seconds plus backoff
+— before raising NBAClientError, and a refresh job making hundreds of calls
+pays that once per call (the Render situation backend/api/dependencies.py
+describes). A circuit breaker remembers that the host is down:
+
+  closed     normal operation. Each connect/timeout failure bumps a
+             consecutive-failure count; any response from the host (even a
+             4xx/5xx — the host is *reachable*) resets it.
+  open       `failure_threshold` consecutive failures in a row trip it. Every
+             call now fails immediately with CircuitOpenError, no network
+             attempt, for `cooldown_seconds`.
+  half_open  after the cooldown, exactly one call is let through as a probe
+             (concurrent callers still fail fast). Success closes the
+             circuit; failure re-opens it for another cooldown; any other
+             outcome (cancelled, unexpected error) frees the slot for the
+             next call to probe.
+
+Only connect errors and timeouts count, deliberately: those are what "this
+host is unreachable from here" looks like. An HTML error page or a 500 is
+NBA.com being flaky, which the client's ordinary retries already handle.
+
+State is per host (stats.nba.com and cdn.nba.com fail independently) and is
+exposed via `snapshot()` for logging; transitions are logged as they happen.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger("basketball_predictions.live_client.circuit_breaker")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# A healthy stats.nba.com essentially never drops three connections in a row;
+# a host that can't reach it fails every one. Three keeps one unlucky blip
+# from tripping the breaker while still stopping a dead host inside a single
+# call's retry budget.
+DEFAULT_FAILURE_THRESHOLD = 3
+# Long enough that a dead host costs one probe per minute rather than one
+# timeout per call; short enough that a transient outage heals itself within
+# one refresh pass.
+DEFAULT_COOLDOWN_SECONDS = 60.0
+
+
+class CircuitBreaker:
+    """One host's breaker. Thread-safe; all methods are non-blocking, so the
+    async client uses it as-is."""
+
+    def __init__(
+        self,
+        host: str = "",
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self.opened_at: float | None = None
+        self.last_failure: str | None = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """True if a call may go out now. In the open state, the first call
+        after the cooldown becomes the half-open probe."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.cooldown_seconds:
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+                logger.info("circuit for %s half-open: probing", self.host)
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(
+                    "circuit for %s closed after %.1fs open", self.host, time.monotonic() - self.opened_at
+                )
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """A call ended without telling us anything about reachability (a
+        protocol error, a cancelled task, an unexpected exception). Frees the
+        half-open probe slot so the next call probes instead, rather than
+        leaving the circuit half-open and refusing every call for good."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record_failure(self, error: BaseException | None = None) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if error is not None:
+                self.last_failure = f"{type(error).__name__}: {error}"
+            if self.state == HALF_OPEN or (
+                self.state == CLOSED and self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.times_opened += 1
+                self._probe_in_flight = False
+                logger.warning(
+                    "circuit for %s opened after %d consecutive failures (last: %s); failing fast for %.0fs",
+                    self.host, self.consecutive_failures, self.last_failure, self.cooldown_seconds,
+                )
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through (0 otherwise)."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.cooldown_seconds - (time.monotonic() - self.opened_at))
+
+    def snapshot(self) -> dict:
+        retry_in = self.retry_in()
+        with self._lock:
+            return {
+                "host": self.host,
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "times_opened": self.times_opened,
+                "open_for_seconds": (
+                    round(time.monotonic() - self.opened_at, 3) if self.opened_at is not None else None
+                ),
+                "retry_in_seconds": round(retry_in, 3),
+                "last_failure": self.last_failure,
+            }
+
+
+class HostCircuitBreakers:
+    """One CircuitBreaker per host, created on first use with the same
+    settings — the breaker counterpart of rate_limit.HostRateLimiter."""
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(host, self.failure_threshold, self.cooldown_seconds)
+                self._breakers[host] = breaker
+            return breaker
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {b.host: b.snapshot() for b in breakers}
@@ -9,6 +9,12 @@ different domains with different header requirements, so `get_json` takes a full
 URL rather than assuming one base — endpoint classes each know which host they
 need. This still keeps a single client class/Session, just not a single base_url.
 
+Both base URLs can be pointed elsewhere — per client (`stats_base_url` /
+`live_base_url`) or per process (NBA_STATS_BASE_URL / NBA_LIVE_BASE_URL) —
+for a local stand-in that replays recorded responses (replay_server.py).
+Endpoints keep building real NBA.com URLs; the client rewrites the prefix on
+the way out, so nothing above it knows the difference.
+
 `endpoints/stats/*.py` build their requests via `nba_api` (see get_via_nba_api()
 below) rather than hand-rolled URLs/params — nba_api's maintainers track NBA.com's
 frequent param/endpoint churn so we don't have to duplicate that. What stays ours:
@@ -22,12 +28,21 @@ migration; see backend/AGENTS.md.
 
 from __future__ import annotations
 
+import os
 import time
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
 
 import requests
+from nba_api.stats.library.http import NBAStatsHTTP
+
+from .circuit_breaker import CLOSED, CircuitBreaker, HostCircuitBreakers
+from .rate_limit import HostRateLimiter, host_of, is_throttle, parse_retry_after
 
 STATS_BASE_URL = "https://stats.nba.com/stats"
 LIVE_BASE_URL = "https://cdn.nba.com/static/json/liveData"
+STATS_BASE_URL_ENV = "NBA_STATS_BASE_URL"
+LIVE_BASE_URL_ENV = "NBA_LIVE_BASE_URL"
 
 # stats.nba.com returns 403 (or hangs to a read timeout — confirmed both, see
 # backend/AGENTS.md) for requests that don't look like a real browser hitting
@@ -55,10 +70,103 @@ DEFAULT_HEADERS = {
 }
 
 
+# What an unreachable host looks like — the only failures that count toward
+# opening a circuit (see circuit_breaker.py). requests.ConnectTimeout is both.
+UNREACHABLE_ERRORS = (requests.ConnectionError, requests.Timeout)
+# A read timeout means the host accepted the connection and then sat on the
+# request — NBA.com's other way of throttling (see rate_limit.is_throttle).
+THROTTLE_TIMEOUT_ERRORS = (requests.ReadTimeout,)
+
+
 class NBAClientError(RuntimeError):
     """Raised when a request fails after exhausting all retries."""
 
 
+class CircuitOpenError(NBAClientError):
+    """Raised without any network attempt while a host's circuit is open —
+    it has failed to connect too many times in a row recently (see
+    circuit_breaker.py). Subclasses NBAClientError, so callers already
+    handling "this fetch failed" need no changes."""
+
+
+def check_circuit(breakers: HostCircuitBreakers, url: str) -> CircuitBreaker:
+    """The breaker for `url`'s host, or CircuitOpenError if it's refusing
+    calls right now. Shared by the sync and async clients."""
+    breaker = breakers.breaker(host_of(url))
+    if not breaker.allow_request():
+        raise CircuitOpenError(
+            f"{breaker.host} circuit open after {breaker.consecutive_failures} consecutive "
+            f"connect/timeout failures (last: {breaker.last_failure}); failing fast for "
+            f"another {breaker.retry_in():.0f}s"
+        )
+    return breaker
+
+
+@dataclass
+class ConditionalResponse:
+    """What get_json_if_changed() got back: the parsed body and its new
+    validators, or — on a 304 — no body and the validators that were sent."""
+
+    data: dict | None
+    validators: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def not_modified(self) -> bool:
+        return self.data is None
+
+
+def conditional_headers(validators: dict | None) -> dict:
+    """Request headers that make a GET conditional on stored validators
+    (ETag / Last-Modified, as returned by response_validators())."""
+    headers = {}
+    if validators and validators.get("ETag"):
+        headers["If-None-Match"] = validators["ETag"]
+    if validators and validators.get("Last-Modified"):
+        headers["If-Modified-Since"] = validators["Last-Modified"]
+    return headers
+
+
+def response_validators(headers) -> dict[str, str]:
+    """The cache validators a response carries, if any."""
+    return {name: headers[name] for name in ("ETag", "Last-Modified") if headers.get(name)}
+
+
+class BaseURLs:
+    """Where a client actually sends requests for each NBA.com base URL.
+    Explicit overrides win, then the NBA_*_BASE_URL env vars, then NBA.com
+    itself."""
+
+    def __init__(self, stats_base_url: str | None = None, live_base_url: str | None = None):
+        self.stats = (stats_base_url or os.environ.get(STATS_BASE_URL_ENV) or STATS_BASE_URL).rstrip("/")
+        self.live = (live_base_url or os.environ.get(LIVE_BASE_URL_ENV) or LIVE_BASE_URL).rstrip("/")
+
+    @property
+    def overridden(self) -> bool:
+        return self.stats != STATS_BASE_URL or self.live != LIVE_BASE_URL
+
+    def rewrite(self, url: str) -> str:
+        """`url` (built against the real NBA.com bases) retargeted."""
+        for default, override in ((STATS_BASE_URL, self.stats), (LIVE_BASE_URL, self.live)):
+            if url.startswith(default) and override != default:
+                return override + url[len(default):]
+        return url
+
+
+def json_body(text: str, status_code: int | None = None) -> bytes:
+    """A response body as bytes, for callers that keep it unparsed (see
+    get_bytes_via_nba_api()). Raises what a full parse would have surfaced
+    for NBA.com's usual failure shapes — an error status, an HTML error page
+    or nba_api's cleaned-up error XML, a body cut off mid-transfer — so the
+    retry loop treats them exactly as before and a broken body never reaches
+    the cache."""
+    if status_code is not None and status_code >= 400:
+        raise requests.HTTPError(f"{status_code} response from stats.nba.com")
+    stripped = text.strip()
+    if not (stripped.startswith("{") and stripped.endswith("}")):
+        raise ValueError(f"Response body is not a JSON object: {stripped[:80]!r}")
+    return stripped.encode()
+
+
 class NBAStatsClient:
     """Persistent-session HTTP client for NBA.com's stats and live JSON endpoints.
 
@@ -76,6 +184,21 @@ class NBAStatsClient:
         Optional "http(s)://host:port" proxy applied to both schemes.
     extra_headers : dict | None
         Merged on top of DEFAULT_HEADERS for every request from this client.
+    rate_limiter : HostRateLimiter | None
+        Shared per-host request budget (see rate_limit.py). Every network
+        attempt — retries included — takes a token from the target host's
+        bucket first, and each attempt's outcome is reported back to it (an
+        AdaptiveRateLimiter learns its rate from those reports). `None`
+        (default) means no client-side pacing at all.
+    circuit_breakers : HostCircuitBreakers | None
+        Per-host health tracking (see circuit_breaker.py): after a run of
+        connect/timeout failures, calls to that host raise CircuitOpenError
+        immediately instead of spending their retries. `None` (default) gives
+        this client its own; pass one instance to several clients to share
+        what they learn. `circuit_state()` reports it for logging.
+    stats_base_url, live_base_url : str | None
+        Send requests for stats.nba.com / cdn.nba.com's live feeds here
+        instead (see BaseURLs) — e.g. a replay_server.ReplayServer.
     """
 
     def __init__(
@@ -85,10 +208,17 @@ class NBAStatsClient:
         backoff_seconds: float = 1.0,
         proxy: str | None = None,
         extra_headers: dict | None = None,
+        rate_limiter: HostRateLimiter | None = None,
+        circuit_breakers: HostCircuitBreakers | None = None,
+        stats_base_url: str | None = None,
+        live_base_url: str | None = None,
     ):
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_seconds = backoff_seconds
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else HostCircuitBreakers()
+        self.base_urls = BaseURLs(stats_base_url, live_base_url)
 
         self.session = requests.Session()
         self.session.headers.update(DEFAULT_HEADERS)
@@ -102,18 +232,56 @@ class NBAStatsClient:
 
         Retries on network errors, non-2xx responses, and unparseable JSON bodies
         (NBA.com occasionally returns an HTML error page with a 200 status).
-        Raises NBAClientError once `max_retries` is exhausted.
+        Raises NBAClientError once `max_retries` is exhausted, or
+        CircuitOpenError as soon as the host's circuit is open.
         """
+        return self._get_with_retries(url, params, headers, lambda resp: resp.json())
+
+    def get_json_if_changed(
+        self, url: str, validators: dict | None = None, params: dict | None = None
+    ) -> ConditionalResponse:
+        """get_json(), conditional on `validators` from an earlier response
+        (ETag / Last-Modified — cdn.nba.com's live feeds send both). A 304
+        comes back as `not_modified` with no body downloaded or parsed;
+        otherwise the parsed body plus its new validators, to store for next
+        time. Same retries, same exceptions."""
+
+        def _parse(resp) -> ConditionalResponse:
+            if resp.status_code == 304:
+                return ConditionalResponse(None, {**(validators or {}), **response_validators(resp.headers)})
+            return ConditionalResponse(resp.json(), response_validators(resp.headers))
+
+        return self._get_with_retries(url, params, conditional_headers(validators) or None, _parse)
+
+    def _get_with_retries(self, url: str, params, headers, parse):
+        url = self.base_urls.rewrite(url)
         last_error: Exception | None = None
         for attempt in range(1, self.max_retries + 1):
+            breaker = check_circuit(self.circuit_breakers, url)
+            self._wait_for_rate_budget(url)
+            resp = None
             try:
                 resp = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+                breaker.record_success()
                 resp.raise_for_status()
-                return resp.json()
+                data = parse(resp)
             except (requests.RequestException, ValueError) as exc:
                 last_error = exc
-                if attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
+                self._report_pacing(
+                    url,
+                    getattr(resp, "status_code", None),
+                    exc,
+                    resp.headers.get("Retry-After") if resp is not None else None,
+                )
+                self._after_failed_attempt(breaker, exc, attempt)
+            except BaseException:
+                # Not a reachability signal either way, but a half-open
+                # probe still has to give its slot back.
+                breaker.release_probe()
+                raise
+            else:
+                self._report_pacing(url)
+                return data
         raise NBAClientError(f"GET {url} failed after {self.max_retries} attempts: {last_error}") from last_error
 
     def get_via_nba_api(self, endpoint) -> dict:
@@ -125,20 +293,106 @@ class NBAStatsClient:
         JSON dict (`endpoint.get_dict()`) for response.py to wrap/validate;
         nba_api itself does no schema checking.
         """
+
+        def _attempt() -> dict:
+            if not self.base_urls.overridden:
+                endpoint.get_request()
+            else:
+                # get_request() always goes to nba_api's hard-coded base.
+                endpoint.nba_response = self._send_via_nba_api(endpoint)
+                endpoint.load_response()
+            return endpoint.get_dict()
+
+        return self._nba_api_attempts(endpoint, _attempt)
+
+    def get_bytes_via_nba_api(self, endpoint) -> bytes:
+        """get_via_nba_api() for endpoints that stream their response (see
+        streaming.py): sends the identical request, with the same retries,
+        but returns the body as bytes without nba_api ever parsing it — no
+        `load_response()`, so the endpoint's own datasets stay empty. Bodies
+        that aren't a complete JSON object are retried like a parse failure
+        (see json_body())."""
+
+        def _attempt() -> bytes:
+            endpoint.nba_response = self._send_via_nba_api(endpoint)
+            return json_body(endpoint.nba_response.get_response(), endpoint.nba_response._status_code)
+
+        return self._nba_api_attempts(endpoint, _attempt)
+
+    def _send_via_nba_api(self, endpoint):
+        """The request endpoint.get_request() would send, through nba_api's
+        HTTP layer, but to this client's stats base URL."""
+        http = NBAStatsHTTP()
+        if self.base_urls.stats != STATS_BASE_URL:
+            http.base_url = f"{self.base_urls.stats}/{{endpoint}}"
+        return http.send_api_request(
+            endpoint=endpoint.endpoint,
+            parameters=endpoint.parameters,
+            proxy=endpoint.proxy,
+            headers=endpoint.headers,
+            timeout=endpoint.timeout,
+        )
+
+    def _nba_api_attempts(self, endpoint, attempt_fn):
+        stats_url = self.base_urls.stats
         last_error: Exception | None = None
         for attempt in range(1, self.max_retries + 1):
+            breaker = check_circuit(self.circuit_breakers, stats_url)
+            self._wait_for_rate_budget(stats_url)
             try:
-                endpoint.get_request()
-                return endpoint.get_dict()
+                data = attempt_fn()
+                breaker.record_success()
             except (requests.RequestException, ValueError, KeyError) as exc:
                 last_error = exc
-                if attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
+                # nba_api keeps the status code but not the headers, so no
+                # Retry-After on this path — the multiplicative backoff alone
+                # has to do.
+                nba_response = getattr(endpoint, "nba_response", None)
+                self._report_pacing(stats_url, getattr(nba_response, "_status_code", None), exc)
+                self._after_failed_attempt(breaker, exc, attempt)
+            except BaseException:
+                breaker.release_probe()
+                raise
+            else:
+                self._report_pacing(stats_url)
+                return data
         raise NBAClientError(
             f"nba_api request via {type(endpoint).__name__} failed after "
             f"{self.max_retries} attempts: {last_error}"
         ) from last_error
 
+    def _after_failed_attempt(self, breaker: CircuitBreaker, exc: Exception, attempt: int) -> None:
+        # Anything but a connect/timeout failure means the host answered.
+        if isinstance(exc, UNREACHABLE_ERRORS):
+            breaker.record_failure(exc)
+        else:
+            breaker.record_success()
+        # No point backing off before an attempt the now-open circuit will
+        # refuse anyway (the next loop iteration raises CircuitOpenError).
+        if attempt < self.max_retries and breaker.state == CLOSED:
+            time.sleep(self.backoff_seconds * attempt)
+
+    def circuit_state(self) -> dict[str, dict]:
+        """Per-host breaker state and timings, for logging."""
+        return self.circuit_breakers.snapshot()
+
+    def _report_pacing(
+        self, url: str, status_code=None, error: Exception | None = None, retry_after: str | None = None
+    ) -> None:
+        """Tells the rate limiter how an attempt went (see rate_limit.py):
+        a clean response, a throttle signal, or — for anything else, e.g. a
+        connection error — nothing at all."""
+        if self.rate_limiter is None:
+            return
+        if error is None:
+            self.rate_limiter.record_success(url)
+        elif is_throttle(status_code, error, THROTTLE_TIMEOUT_ERRORS):
+            self.rate_limiter.record_throttle(url, parse_retry_after(retry_after))
+
+    def _wait_for_rate_budget(self, url: str) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(urlparse(url).netloc)
+
     def close(self) -> None:
         self.session.close()
 
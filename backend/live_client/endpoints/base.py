@@ -1,27 +1,39 @@
 """backend/live_client/endpoints/base.py
 
 Base class for every endpoint in this package — one subclass per NBA.com data
-source. Subclasses declare `expected_columns` and implement `_request()`;
-`fetch()` handles caching and schema validation identically for all of them, so
+source. Subclasses declare `expected_columns` and say how to make their request
+(see Endpoint's docstring); `fetch()`/`afetch()` handle caching and schema
+validation identically for all of them, so
 an upstream field rename/removal raises loudly instead of silently producing a
 dataframe with a missing/NaN column three layers downstream.
 """
 
 from __future__ import annotations
 
+import json
+import time
 from abc import ABC, abstractmethod
 
 import pandas as pd
 
-from ..cache import DiskCache
-from ..client import NBAStatsClient
+from ..async_client import AsyncNBAStatsClient
+from ..cache import MEMORY_CACHE, DiskCache, MemoryCache, SQLiteCache, default_cache
+from ..cache_policy import CachePolicy, policy_for
+from ..client import ConditionalResponse, NBAStatsClient
 from ..response import NBAResponse
+from ..single_flight import SINGLE_FLIGHT, FileLock
 
 
 class SchemaValidationError(RuntimeError):
     """Raised when an NBA.com response doesn't contain an endpoint's expected columns."""
 
 
+class CachedRawUnavailableError(RuntimeError):
+    """Raised by to_dict()/to_json() on a response served from the columnar
+    cache tier when the raw entry its frame was built from has since been
+    evicted or replaced. Fetch again for a response with both."""
+
+
 class Endpoint(ABC):
     """One subclass per data source.
 
@@ -29,27 +41,90 @@ class Endpoint(ABC):
       - `expected_columns`: columns `fetch()` guarantees are present, or raises.
       - `self.params` (in `__init__`): the query params sent to NBA.com; also used
         as the cache key alongside the class name.
-    And implement `_request()`, returning raw parsed JSON, and `_build_response()`
-    if the endpoint isn't a standard stats.nba.com `resultSets` shape (live/
-    endpoints override this — see endpoints/live/*.py).
+    And say how to make the request, one of two ways:
+      - stats/ endpoints subclass NBAApiEndpoint and implement
+        `_nba_api_endpoint()`, returning an unfired nba_api endpoint instance
+        (`get_request=False`); its `_request()`/`_arequest()` send it through
+        the sync/async client.
+      - live/ endpoints (plain cdn.nba.com JSON, no nba_api) implement
+        `_request()` and `_arequest()` directly.
+    Either way a subclass missing its request hook can't be instantiated.
+    Optionally `dtypes` (column -> dtype) for columns worth storing tighter
+    than pandas' defaults — small ints, flags, repeated strings as
+    categories; the resultSets parse builds those columns at that dtype
+    directly (see response.frame_from_rows()).
+    Optionally `stream_response = True` for endpoints whose responses are
+    large (league-wide shot charts, play-by-play): the body then travels as
+    bytes from the client to the cache to NBAResponse without ever becoming
+    a Python dict, and is parsed incrementally into the dataframe (see
+    streaming.py). Its `_nba_api_endpoint()` is sent with
+    `client.get_bytes_via_nba_api()`, so `_on_nba_api_response()` isn't
+    called for it — nba_api never parses the body.
+    Optionally `conditional_requests = True` for endpoints whose server
+    sends validators (cdn.nba.com's live feeds send ETag/Last-Modified):
+    implement `_request_if_changed()`/`_arequest_if_changed()` and a fetch
+    past the TTL revalidates instead of re-downloading — the stored
+    validators go out as If-None-Match/If-Modified-Since, and a 304 just
+    restarts the cached entry's clock (cache.touch()), no body downloaded,
+    nothing re-parsed.
+    Plus `_build_response()` if the endpoint isn't a standard stats.nba.com
+    `resultSets` shape (live/ endpoints override this — see endpoints/live/*.py).
+
+    Caching: with no `cache` passed, an endpoint uses default_cache() *and*
+    the process-wide in-memory tier (cache.MEMORY_CACHE), so repeat fetches
+    across endpoint instances in one process skip the disk entirely. How
+    long an entry stays fresh is decided per request by `cache_policy()`
+    (see cache_policy.py): a completed season never expires once it's been
+    cached after completing, the current one daily, live feeds within
+    seconds. Passing an explicit `cache` opts out
+    of both the memory tier (`self.memory_cache` is None; assign a
+    MemoryCache to opt back in) and the policy — that cache's own
+    `ttl_seconds` applies — so tests and one-off scripts with their own
+    cache don't see (or leave behind) shared process state.
     """
 
     expected_columns: tuple[str, ...] = ()
     result_set_name: str | None = None
+    dtypes: dict[str, str] = {}
+    stream_response: bool = False
+    conditional_requests: bool = False
 
-    def __init__(self, client: NBAStatsClient | None = None, cache: DiskCache | None = None):
+    def __init__(
+        self,
+        client: NBAStatsClient | AsyncNBAStatsClient | None = None,
+        cache: DiskCache | SQLiteCache | None = None,
+    ):
         self.client = client or NBAStatsClient()
-        self.cache = cache if cache is not None else DiskCache()
+        self.memory_cache: MemoryCache | None = None
+        self._uses_cache_policy = cache is None
+        if cache is None:
+            cache = default_cache()
+            self.memory_cache = MEMORY_CACHE
+        self.cache = cache
         self.params: dict = {}
 
     @abstractmethod
-    def _request(self) -> dict:
-        """Make the HTTP call via self.client and return raw parsed JSON."""
+    def _request(self) -> dict | bytes:
+        """Make the HTTP call via self.client and return raw parsed JSON (the
+        unparsed body, for `stream_response` endpoints)."""
+
+    @abstractmethod
+    async def _arequest(self, client: AsyncNBAStatsClient) -> dict | bytes:
+        """`_request()` over an AsyncNBAStatsClient."""
+
+    def _request_if_changed(self, validators: dict) -> ConditionalResponse:
+        """For `conditional_requests` endpoints: `_request()` sent with the
+        cached entry's validators (see client.get_json_if_changed())."""
+        raise NotImplementedError(f"{type(self).__name__} sets conditional_requests but not _request_if_changed()")
 
-    def _build_response(self, raw: dict) -> NBAResponse:
+    async def _arequest_if_changed(self, client: AsyncNBAStatsClient, validators: dict) -> ConditionalResponse:
+        """`_request_if_changed()` over an AsyncNBAStatsClient."""
+        raise NotImplementedError(f"{type(self).__name__} sets conditional_requests but not _arequest_if_changed()")
+
+    def _build_response(self, raw: dict | bytes) -> NBAResponse:
         """Default: a standard stats.nba.com resultSets response. Live endpoints
         (nested JSON, no resultSets) override this to build their own dataframe."""
-        return NBAResponse(raw, result_set_name=self.result_set_name)
+        return NBAResponse(raw, result_set_name=self.result_set_name, dtypes=self.dtypes)
 
     def cache_key_params(self) -> dict:
         """Params used for the cache key. Defaults to the request params; override
@@ -57,29 +132,281 @@ class Endpoint(ABC):
         embedded in a live/ endpoint's path rather than passed as a query param)."""
         return self.params
 
+    def cache_policy(self) -> CachePolicy:
+        """This request's freshness class (see cache_policy.py)."""
+        return policy_for(type(self).__name__, self.cache_key_params())
+
+    def _cache_ttl_seconds(self) -> float | None:
+        if self._uses_cache_policy:
+            return self.cache_policy().ttl_seconds
+        return getattr(self.cache, "ttl_seconds", None)
+
+    def _ttl_kwargs(self) -> dict:
+        # Only a default cache gets a per-read TTL; an explicit one (or a
+        # test double without the parameter) is read exactly as before.
+        if not self._uses_cache_policy:
+            return {}
+        return {"ttl_seconds": self.cache_policy().read_ttl_seconds(time.time())}
+
     def validate_schema(self, df: pd.DataFrame) -> None:
-        missing = [c for c in self.expected_columns if c not in df.columns]
+        self.validate_columns(df.columns)
+
+    def validate_columns(self, columns) -> None:
+        """validate_schema() against a bare column list — what fetch() uses,
+        via NBAResponse.columns(), so validation never forces a parse."""
+        missing = [c for c in self.expected_columns if c not in columns]
         if missing:
             raise SchemaValidationError(
                 f"{type(self).__name__}: response is missing expected columns {missing} "
-                f"— NBA.com may have changed this endpoint's schema. Got: {list(df.columns)}"
+                f"— NBA.com may have changed this endpoint's schema. Got: {list(columns)}"
             )
 
+    def _cached_response(self, force_refresh: bool) -> NBAResponse | None:
+        """A validated response from the memory tier, else the disk cache
+        (promoted into the memory tier), else None on a miss."""
+        name, key_params = type(self).__name__, self.cache_key_params()
+        if self.memory_cache is not None:
+            response = self.memory_cache.get(name, key_params, force_refresh=force_refresh)
+            if response is not None:
+                return response
+        response = self._disk_cached_response(force_refresh)
+        if response is not None:
+            self._remember(response)
+        return response
+
+    def _remember(self, response: NBAResponse) -> None:
+        # Stored as-is: callers only ever get copy() views of it (see fetch()).
+        if self.memory_cache is not None:
+            self.memory_cache.set(
+                type(self).__name__,
+                self.cache_key_params(),
+                response,
+                ttl_seconds=self._cache_ttl_seconds(),
+            )
+
+    def _disk_cached_response(self, force_refresh: bool) -> NBAResponse | None:
+        """A validated response from the cache backend, or None on a miss.
+        Prefers the columnar tier (cache.get_frame — see cache.py) when the
+        backend has one; the raw JSON is then only loaded if the caller asks
+        for it."""
+        name, key_params = type(self).__name__, self.cache_key_params()
+        # Taken before the read: if the entry is replaced in between, this
+        # no longer matches it -- a frame built from it isn't stored, and a
+        # frame served beside it won't be paired with the replacement.
+        raw_version = self._raw_version()
+        get_frame = getattr(self.cache, "get_frame", None)
+        if get_frame is not None:
+            df = get_frame(name, key_params, force_refresh=force_refresh, **self._ttl_kwargs())
+            if df is not None:
+                self.validate_schema(df)
+                return NBAResponse(dataframe=df, raw_loader=lambda: self._load_cached_raw(raw_version))
+        get_bytes = getattr(self.cache, "get_bytes", None)
+        if self.stream_response and get_bytes is not None:
+            raw = get_bytes(name, key_params, force_refresh=force_refresh, **self._ttl_kwargs())
+        else:
+            raw = self.cache.get(name, key_params, force_refresh=force_refresh, **self._ttl_kwargs())
+        if raw is None:
+            return None
+        return self._validated(raw, raw_version)
+
+    def _raw_version(self) -> str | None:
+        raw_version = getattr(self.cache, "raw_version", None)
+        return raw_version(type(self).__name__, self.cache_key_params()) if raw_version is not None else None
+
+    def _load_cached_raw(self, raw_version: str | None) -> dict:
+        """The raw entry a frame-tier hit was served beside, for to_dict().
+        Never refetches: this runs inside to_dict(), outside fetch()'s lock
+        and coalescing, and possibly on an event loop through an async
+        client. Read without the policy TTL -- the entry was fresh when its
+        frame was served -- but if it's gone or has been replaced since,
+        that's CachedRawUnavailableError."""
+        ttl_kwargs = {"ttl_seconds": None} if self._uses_cache_policy else {}
+        raw = self.cache.get(type(self).__name__, self.cache_key_params(), **ttl_kwargs)
+        if raw is None or (raw_version is not None and self._raw_version() != raw_version):
+            raise CachedRawUnavailableError(
+                f"{type(self).__name__}: the cached raw response this frame was read beside has been "
+                "evicted or replaced; fetch() again"
+            )
+        return json.loads(raw) if isinstance(raw, bytes) else raw
+
+    def _store(self, raw: dict | bytes) -> str | None:
+        """Stores `raw`; returns the backend's version of the new entry (see
+        cache.DiskCache.raw_version), if it reports one."""
+        name, key_params = type(self).__name__, self.cache_key_params()
+        set_bytes = getattr(self.cache, "set_bytes", None)
+        if isinstance(raw, bytes) and set_bytes is not None:
+            return set_bytes(name, key_params, raw)
+        return self.cache.set(name, key_params, json.loads(raw) if isinstance(raw, bytes) else raw)
+
+    def _validated(self, raw: dict | bytes, raw_version: str | None = None) -> NBAResponse:
+        """Builds the response and validates its column names (header-only —
+        see NBAResponse.columns()). The dataframe goes into the cache's
+        columnar tier, if it has one, whenever something first parses it —
+        as long as `raw_version`, the stored entry `raw` came from, is still
+        the current one by then."""
+        response = self._build_response(raw)
+        self.validate_columns(response.columns())
+        set_frame = getattr(self.cache, "set_frame", None)
+        if set_frame is not None:
+            name, key_params = type(self).__name__, self.cache_key_params()
+            if raw_version is not None:
+                response.on_dataframe(lambda df: set_frame(name, key_params, df, raw_version=raw_version))
+            elif getattr(self.cache, "raw_version", None) is None:
+                response.on_dataframe(lambda df: set_frame(name, key_params, df))
+        return response
+
+    def _stored_validators(self) -> dict:
+        get_validators = getattr(self.cache, "get_validators", None)
+        if get_validators is None:
+            return {}
+        return get_validators(type(self).__name__, self.cache_key_params())
+
+    def _revalidated(self, result: ConditionalResponse) -> NBAResponse | None:
+        """The response for a conditional request's result: on a 304, the
+        cached entry (clock restarted) — or None if it's gone after all, so
+        the caller refetches unconditionally; otherwise the new body, stored
+        along with its validators."""
+        name, key_params = type(self).__name__, self.cache_key_params()
+        if result.not_modified:
+            touch = getattr(self.cache, "touch", None)
+            if touch is None or not touch(name, key_params):
+                return None
+            response = self._disk_cached_response(False)
+            if response is not None:
+                self._remember(response)
+            return response
+        raw_version = self._store(result.data)
+        set_validators = getattr(self.cache, "set_validators", None)
+        if set_validators is not None and result.validators:
+            set_validators(name, key_params, result.validators)
+        response = self._validated(result.data, raw_version)
+        self._remember(response)
+        return response
+
+    def _fetch_fresh(self) -> NBAResponse:
+        if self.conditional_requests:
+            validators = self._stored_validators()
+            response = self._revalidated(self._request_if_changed(validators))
+            if response is None and validators:
+                response = self._revalidated(self._request_if_changed({}))
+            return response
+        raw = self._request()
+        response = self._validated(raw, self._store(raw))
+        self._remember(response)
+        return response
+
+    async def _afetch_fresh(self, client: AsyncNBAStatsClient) -> NBAResponse:
+        if self.conditional_requests:
+            validators = self._stored_validators()
+            response = self._revalidated(await self._arequest_if_changed(client, validators))
+            if response is None and validators:
+                response = self._revalidated(await self._arequest_if_changed(client, {}))
+            return response
+        raw = await self._arequest(client)
+        response = self._validated(raw, self._store(raw))
+        self._remember(response)
+        return response
+
+    def _cache_lock(self) -> FileLock | None:
+        """The backend's cross-process lock for this key, or None for a cache
+        that doesn't offer one (test doubles) — which also opts out of
+        coalescing, since there's then no way to tell two caches apart."""
+        lock = getattr(self.cache, "lock", None)
+        return lock(type(self).__name__, self.cache_key_params()) if lock is not None else None
+
+    def _recheck_after_lock(self, force_refresh: bool) -> NBAResponse | None:
+        # Whoever held the lock before us (another process, usually) may have
+        # just stored this exact entry.
+        if force_refresh:
+            return None
+        response = self._disk_cached_response(False)
+        if response is not None:
+            self._remember(response)
+        return response
+
     def fetch(self, force_refresh: bool = False) -> NBAResponse:
         """Fetch (cache-first unless force_refresh), wrap, and validate.
 
+        Concurrent cache misses for the same key are coalesced (see
+        single_flight.py): one caller makes the request, the rest share its
+        result — or its exception. Every caller gets its own copy() view of
+        the response, so the shared original (also what the memory tier
+        holds) is parsed at most once and never mutated.
+
         Raises SchemaValidationError if the response doesn't match
         `expected_columns` — callers should let this propagate rather than catch
         it silently, per backend/AGENTS.md.
         """
-        name = type(self).__name__
-        key_params = self.cache_key_params()
+        response = self._cached_response(force_refresh)
+        if response is None:
+            lock = self._cache_lock()
+            if lock is None:
+                response = self._fetch_fresh()
+            else:
+                def _locked_fetch() -> NBAResponse:
+                    with lock:
+                        return self._recheck_after_lock(force_refresh) or self._fetch_fresh()
 
-        raw = self.cache.get(name, key_params, force_refresh=force_refresh)
-        if raw is None:
-            raw = self._request()
-            self.cache.set(name, key_params, raw)
+                response = SINGLE_FLIGHT.do(str(lock.path), _locked_fetch)
+        return response.copy()
 
-        response = self._build_response(raw)
-        self.validate_schema(response.to_dataframe())
-        return response
+    async def afetch(self, client: AsyncNBAStatsClient | None = None, force_refresh: bool = False) -> NBAResponse:
+        """fetch() with the network call made through an AsyncNBAStatsClient —
+        `client`, or `self.client` if the endpoint was built with an async
+        one. Same cache, same validation, same coalescing, same exceptions.
+        The cache itself is local disk and stays synchronous."""
+        response = self._cached_response(force_refresh)
+        if response is None:
+            client = client or self.client
+            if not isinstance(client, AsyncNBAStatsClient):
+                raise TypeError(
+                    f"afetch() needs an AsyncNBAStatsClient, got {type(client).__name__}; "
+                    "pass one, or build the endpoint with one"
+                )
+            lock = self._cache_lock()
+            if lock is None:
+                response = await self._afetch_fresh(client)
+            else:
+                async def _locked_afetch() -> NBAResponse:
+                    await lock.alock()
+                    try:
+                        return self._recheck_after_lock(force_refresh) or await self._afetch_fresh(client)
+                    finally:
+                        lock.release()
+
+                response = await SINGLE_FLIGHT.ado(str(lock.path), _locked_afetch)
+        return response.copy()
+
+
+class NBAApiEndpoint(Endpoint):
+    """An Endpoint whose request is an nba_api endpoint (every stats/ one):
+    subclasses implement `_nba_api_endpoint()`, and the request goes out
+    through the client's nba_api path (see Endpoint for the rest)."""
+
+    @abstractmethod
+    def _nba_api_endpoint(self):
+        """Build the not-yet-fired nba_api endpoint for this request."""
+
+    def _on_nba_api_response(self, nba_api_endpoint) -> None:
+        """Hook called with the nba_api endpoint once it has been fired, for
+        subclasses that read nba_api's own parsed datasets. Default:
+        nothing."""
+
+    def _request(self) -> dict | bytes:
+        """Make the HTTP call via self.client and return raw parsed JSON (the
+        unparsed body, for `stream_response` endpoints)."""
+        nba_api_endpoint = self._nba_api_endpoint()
+        if self.stream_response:
+            return self.client.get_bytes_via_nba_api(nba_api_endpoint)
+        raw = self.client.get_via_nba_api(nba_api_endpoint)
+        self._on_nba_api_response(nba_api_endpoint)
+        return raw
+
+    async def _arequest(self, client: AsyncNBAStatsClient) -> dict | bytes:
+        """`_request()` over an AsyncNBAStatsClient."""
+        nba_api_endpoint = self._nba_api_endpoint()
+        if self.stream_response:
+            return await client.get_bytes_via_nba_api(nba_api_endpoint)
+        raw = await client.get_via_nba_api(nba_api_endpoint)
+        self._on_nba_api_response(nba_api_endpoint)
+        return raw
@@ -4,6 +4,9 @@ In-progress (or just-finished) box score for one game — cdn.nba.com's live box
 score feed. For a completed historical game, use endpoints/stats/boxscore.py
 instead — that one is the stable, backfilled source; this one is only useful
 while (or shortly after) a game is being played.
+
+Revalidated with ETag/Last-Modified like the scoreboard (see
+endpoints/live/scoreboard.py).
 """
 
 from __future__ import annotations
@@ -11,7 +14,7 @@ from __future__ import annotations
 import pandas as pd
 
 from ...client import LIVE_BASE_URL
-from ...response import NBAResponse
+from ...response import NBAResponse, json_normalize_columns
 from ..base import Endpoint
 
 URL_TEMPLATE = f"{LIVE_BASE_URL}/boxscore/boxscore_{{game_id}}.json"
@@ -29,6 +32,7 @@ class LiveBoxScore(Endpoint):
         "personId", "name", "teamId", "teamTricode",
         "statistics.points", "statistics.reboundsTotal", "statistics.assists",
     )
+    conditional_requests = True
 
     def __init__(self, game_id: str, client=None, cache=None):
         """
@@ -45,6 +49,15 @@ class LiveBoxScore(Endpoint):
     def _request(self) -> dict:
         return self.client.get_json(self._url)
 
+    async def _arequest(self, client) -> dict:
+        return await client.get_json(self._url)
+
+    def _request_if_changed(self, validators: dict):
+        return self.client.get_json_if_changed(self._url, validators)
+
+    async def _arequest_if_changed(self, client, validators: dict):
+        return await client.get_json_if_changed(self._url, validators)
+
     def cache_key_params(self) -> dict:
         return {"game_id": self.game_id}
 
@@ -59,5 +72,8 @@ class LiveBoxScore(Endpoint):
                     "teamId": team.get("teamId"),
                     "teamTricode": team.get("teamTricode"),
                 })
-        df = pd.json_normalize(players, sep=".")
-        return NBAResponse(raw, dataframe=df)
+        return NBAResponse(
+            raw,
+            dataframe_builder=lambda: pd.json_normalize(players, sep="."),
+            columns=lambda: json_normalize_columns(players, sep="."),
+        )
@@ -3,6 +3,10 @@
 Today's games and live scores — cdn.nba.com's live scoreboard feed. In-game data:
 different host, different freshness (seconds-old, not season-stable), and a nested
 JSON shape with no resultSets, unlike everything in endpoints/stats/.
+
+cdn.nba.com sends ETag/Last-Modified on it, so past its few-second TTL the
+feed is revalidated rather than re-downloaded (`conditional_requests`, see
+endpoints/base.py) — between plays, most refreshes come back 304.
 """
 
 from __future__ import annotations
@@ -10,7 +14,7 @@ from __future__ import annotations
 import pandas as pd
 
 from ...client import LIVE_BASE_URL
-from ...response import NBAResponse
+from ...response import NBAResponse, json_normalize_columns
 from ..base import Endpoint
 
 URL = f"{LIVE_BASE_URL}/scoreboard/todaysScoreboard_00.json"
@@ -29,20 +33,32 @@ class TodaysScoreboard(Endpoint):
         "homeTeam.teamId", "homeTeam.teamTricode", "homeTeam.score",
         "awayTeam.teamId", "awayTeam.teamTricode", "awayTeam.score",
     )
+    conditional_requests = True
 
     def __init__(self, client=None, cache=None):
         super().__init__(client, cache)
-        self.params = {}  # no query params — always "today", per NBA.com's own feed
+        # No query params — always "today", per NBA.com's own feed. One cache
+        # key for every day; the "live" cache policy (seconds) is what keeps
+        # it current, so yesterday's board can't outlive today's first
+        # refresh (see cache_policy.py).
+        self.params = {}
 
     def _request(self) -> dict:
         return self.client.get_json(URL)
 
-    def cache_key_params(self) -> dict:
-        # Cache key still needs to vary by day, even though the request itself
-        # takes no params — otherwise a cached "today" from yesterday would stick.
-        return {"date": pd.Timestamp.utcnow().strftime("%Y-%m-%d")}
+    async def _arequest(self, client) -> dict:
+        return await client.get_json(URL)
+
+    def _request_if_changed(self, validators: dict):
+        return self.client.get_json_if_changed(URL, validators)
+
+    async def _arequest_if_changed(self, client, validators: dict):
+        return await client.get_json_if_changed(URL, validators)
 
     def _build_response(self, raw: dict) -> NBAResponse:
         games = raw.get("scoreboard", {}).get("games", [])
-        df = pd.json_normalize(games, sep=".")
-        return NBAResponse(raw, dataframe=df)
+        return NBAResponse(
+            raw,
+            dataframe_builder=lambda: pd.json_normalize(games, sep="."),
+            columns=lambda: json_normalize_columns(games, sep="."),
+        )
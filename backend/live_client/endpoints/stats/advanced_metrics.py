@@ -12,10 +12,10 @@ from __future__ import annotations
 
 from nba_api.stats.endpoints import LeagueDashPlayerStats
 
-from ..base import Endpoint
+from ..base import NBAApiEndpoint
 
 
-class PlayerAdvancedStats(Endpoint):
+class PlayerAdvancedStats(NBAApiEndpoint):
     """League-wide advanced metrics for the given season.
 
     Expected schema (subset): PLAYER_ID, PLAYER_NAME, TEAM_ID, OFF_RATING,
@@ -52,8 +52,8 @@ class PlayerAdvancedStats(Endpoint):
         self.season = season
         self.params = {"Season": season, "SeasonType": season_type, "PerMode": per_mode}
 
-    def _request(self) -> dict:
-        endpoint = LeagueDashPlayerStats(
+    def _nba_api_endpoint(self):
+        return LeagueDashPlayerStats(
             season=self.params["Season"],
             season_type_all_star=self.params["SeasonType"],
             per_mode_detailed=self.params["PerMode"],
@@ -61,4 +61,3 @@ class PlayerAdvancedStats(Endpoint):
             timeout=self.client.timeout,
             get_request=False,
         )
-        return self.client.get_via_nba_api(endpoint)
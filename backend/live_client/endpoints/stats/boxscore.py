@@ -7,7 +7,10 @@ live — V2 comes back empty). V3 uses a nested JSON shape (camelCase, a
 `statistics` sub-object per player) rather than the classic resultSets/rowSet
 table, so this overrides _build_response to use nba_api's own dataframe
 flattening instead of response.py's generic resultSets parser — same pattern
-endpoints/live/*.py already uses for other nested-shaped responses.
+endpoints/live/*.py already uses for other nested-shaped responses. The
+flattening runs from the raw JSON on first to_dataframe() (nba_api re-loads
+it offline), so a response served from the raw cache — where no request was
+ever sent and nba_api never saw the body — builds its frame the same way.
 
 For the currently-in-progress game, see endpoints/live/live_boxscore.py instead —
 different endpoint, different freshness, different (though similarly nested) schema.
@@ -15,13 +18,17 @@ different endpoint, different freshness, different (though similarly nested) sch
 
 from __future__ import annotations
 
+import json
+
+import pandas as pd
 from nba_api.stats.endpoints import BoxScoreTraditionalV3
+from nba_api.stats.library.http import NBAStatsResponse
 
 from ...response import NBAResponse
-from ..base import Endpoint
+from ..base import NBAApiEndpoint
 
 
-class GameBoxScore(Endpoint):
+class GameBoxScore(NBAApiEndpoint):
     """Player-level traditional box score for one completed game.
 
     Expected schema (subset): gameId, teamId, personId, nameI, minutes, points,
@@ -45,19 +52,21 @@ class GameBoxScore(Endpoint):
         super().__init__(client, cache)
         self.game_id = game_id
         self.params = {"GameID": game_id}
-        self._dataframe = None
 
-    def _request(self) -> dict:
-        endpoint = BoxScoreTraditionalV3(
+    def _nba_api_endpoint(self):
+        return BoxScoreTraditionalV3(
             game_id=self.params["GameID"],
             timeout=self.client.timeout,
             get_request=False,
         )
-        raw = self.client.get_via_nba_api(endpoint)
-        # endpoint is already fired at this point (get_via_nba_api called
-        # .get_request()) — pulling the dataframe here is free, no extra call.
-        self._dataframe = endpoint.player_stats.get_data_frame()
-        return raw
 
     def _build_response(self, raw: dict) -> NBAResponse:
-        return NBAResponse(raw, dataframe=self._dataframe)
+        return NBAResponse(raw, dataframe_builder=lambda: self._player_stats_frame(raw))
+
+    def _player_stats_frame(self, raw: dict) -> pd.DataFrame:
+        # A box score is small (~30 players); the round-trip through
+        # nba_api's parser is cheap next to owning a copy of its flattening.
+        nba_api_endpoint = self._nba_api_endpoint()
+        nba_api_endpoint.nba_response = NBAStatsResponse(response=json.dumps(raw), status_code=200, url=None)
+        nba_api_endpoint.load_response()
+        return nba_api_endpoint.player_stats.get_data_frame()
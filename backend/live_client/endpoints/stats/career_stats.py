@@ -8,10 +8,10 @@ from __future__ import annotations
 
 from nba_api.stats.endpoints import PlayerCareerStats as _NbaApiPlayerCareerStats
 
-from ..base import Endpoint
+from ..base import NBAApiEndpoint
 
 
-class PlayerCareerStats(Endpoint):
+class PlayerCareerStats(NBAApiEndpoint):
     """One player's regular-season stats for every season of their career.
 
     Expected schema (subset): PLAYER_ID, SEASON_ID, TEAM_ID, TEAM_ABBREVIATION,
@@ -30,11 +30,10 @@ class PlayerCareerStats(Endpoint):
         self.player_id = player_id
         self.params = {"PlayerID": player_id, "PerMode": per_mode}
 
-    def _request(self) -> dict:
-        endpoint = _NbaApiPlayerCareerStats(
+    def _nba_api_endpoint(self):
+        return _NbaApiPlayerCareerStats(
             player_id=self.params["PlayerID"],
             per_mode36=self.params["PerMode"],
             timeout=self.client.timeout,
             get_request=False,
         )
-        return self.client.get_via_nba_api(endpoint)
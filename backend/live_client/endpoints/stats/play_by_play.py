@@ -3,19 +3,43 @@
 Historical (completed-game) play-by-play log — built via nba_api's PlayByPlayV3.
 NOT V2: nba_api's own source flags PlayByPlayV2 as deprecated — "The NBA API no
 longer returns data for PlayByPlayV2 (returns empty JSON)," confirmed by reading
-nba_api's source (github.com/swar/nba_api issue #591). See boxscore.py's
-docstring for why this overrides _build_response the same way.
+nba_api's source (github.com/swar/nba_api issue #591).
+
+V3 is nested JSON (`game.actions`: one object per event), not resultSets, so
+this overrides _build_response. It used to take nba_api's own parsed
+dataframe, which meant three copies of every game in memory at once — the
+raw dict, nba_api's frame, and the response's — and no frame at all on a raw
+cache hit, where nba_api never ran. Now it's a `stream_response` endpoint
+(see endpoints/base.py): the body stays bytes and the action objects are
+streamed one at a time into column buffers (streaming.py), the same
+whichever way the body arrived.
+
+`start_period` and `actions_frame(raw, after_action_number=...)` are the two
+halves of an incremental read — request from the period the caller already
+has, then columnize only the actions it doesn't — used by
+live_client/play_by_play_store.py.
 """
 
 from __future__ import annotations
 
+import pandas as pd
 from nba_api.stats.endpoints import PlayByPlayV3
 
-from ...response import NBAResponse
-from ..base import Endpoint
+from ...response import NBAResponse, frame_from_columns
+from ...streaming import iter_array, read_record_columns
+from ..base import NBAApiEndpoint
 
+# nba_api's PlayByPlay dataset columns — what this endpoint's frame had when
+# it came from nba_api, and the columns an empty game (no actions yet) gets.
+PLAY_BY_PLAY_COLUMNS = (
+    "gameId", "actionNumber", "clock", "period", "teamId", "teamTricode", "personId",
+    "playerName", "playerNameI", "xLegacy", "yLegacy", "shotDistance", "shotResult",
+    "isFieldGoal", "scoreHome", "scoreAway", "pointsTotal", "location", "description",
+    "actionType", "subType", "videoAvailable", "shotValue", "actionId",
+)
 
-class GamePlayByPlay(Endpoint):
+
+class GamePlayByPlay(NBAApiEndpoint):
     """Full play-by-play event log for one completed game.
 
     Expected schema (subset): gameId, actionNumber, clock, period, teamId,
@@ -28,22 +52,81 @@ class GamePlayByPlay(Endpoint):
         "gameId", "actionNumber", "clock", "period", "teamId",
         "personId", "description", "actionType", "scoreHome", "scoreAway",
     )
+    # ~500 actions per game, most columns drawn from a handful of values.
+    # scoreHome/scoreAway stay strings: NBA.com sends them as such.
+    dtypes = {
+        "actionNumber": "int32",
+        "period": "int8",
+        "teamTricode": "category",
+        "xLegacy": "int16",
+        "yLegacy": "int16",
+        "shotDistance": "int16",
+        "shotResult": "category",
+        "isFieldGoal": "int8",
+        "pointsTotal": "int16",
+        "location": "category",
+        "actionType": "category",
+        "subType": "category",
+        "videoAvailable": "int8",
+        "shotValue": "int8",
+        "actionId": "int32",
+    }
+    stream_response = True
 
-    def __init__(self, game_id: str, client=None, cache=None):
+    def __init__(self, game_id: str, start_period: int = 0, client=None, cache=None):
+        """
+        Parameters
+        ----------
+        game_id : str
+            NBA.com 10-digit game ID, e.g. "0022300001".
+        start_period : int
+            Only request actions from this period on (NBA.com's StartPeriod);
+            0, the default, is the whole game. Only part of the params (and
+            so the cache key) when set, so whole-game entries keep their keys.
+        """
         super().__init__(client, cache)
         self.game_id = game_id
         self.params = {"GameID": game_id}
-        self._dataframe = None
+        if start_period:
+            self.params["StartPeriod"] = int(start_period)
 
-    def _request(self) -> dict:
-        endpoint = PlayByPlayV3(
+    def _nba_api_endpoint(self):
+        return PlayByPlayV3(
             game_id=self.params["GameID"],
+            start_period=str(self.params.get("StartPeriod", 0)),
             timeout=self.client.timeout,
             get_request=False,
         )
-        raw = self.client.get_via_nba_api(endpoint)
-        self._dataframe = endpoint.play_by_play.get_data_frame()
-        return raw
 
-    def _build_response(self, raw: dict) -> NBAResponse:
-        return NBAResponse(raw, dataframe=self._dataframe)
+    def _build_response(self, raw: dict | bytes) -> NBAResponse:
+        return NBAResponse(raw, dataframe_builder=lambda: self._actions_frame(raw), columns=lambda: self._columns(raw))
+
+    def actions_frame(self, raw: dict | bytes, after_action_number: int = 0) -> pd.DataFrame:
+        """The response's frame, restricted to actions numbered above
+        `after_action_number`. Earlier actions are still read past one at a
+        time, but never make it into a column buffer."""
+        return self._actions_frame(raw, after_action_number)
+
+    def _actions(self, raw: dict | bytes):
+        if isinstance(raw, dict):
+            return iter(raw.get("game", {}).get("actions", []))
+        return iter_array(raw.decode(), ("game", "actions"))
+
+    def _columns(self, raw: dict | bytes) -> list[str]:
+        # The first action's keys: enough to validate against without
+        # decoding the rest.
+        first = next(self._actions(raw), None)
+        if first is None:
+            return list(PLAY_BY_PLAY_COLUMNS)
+        return ["gameId", *(key for key in first if key != "gameId")]
+
+    def _actions_frame(self, raw: dict | bytes, after_action_number: int = 0) -> pd.DataFrame:
+        actions = self._actions(raw)
+        if after_action_number:
+            actions = (a for a in actions if (a.get("actionNumber") or 0) > after_action_number)
+        columns = read_record_columns(actions)
+        if not columns:
+            return frame_from_columns(PLAY_BY_PLAY_COLUMNS, [[] for _ in PLAY_BY_PLAY_COLUMNS], self.dtypes)
+        n_actions = len(next(iter(columns.values())))
+        columns = {"gameId": [self.game_id] * n_actions, **{k: v for k, v in columns.items() if k != "gameId"}}
+        return frame_from_columns(list(columns), list(columns.values()), self.dtypes)
@@ -23,13 +23,13 @@ from __future__ import annotations
 import pandas as pd
 from nba_api.stats.endpoints import scheduleleaguev2
 
-from ...response import NBAResponse
-from ..base import Endpoint
+from ...response import NBAResponse, json_normalize_columns
+from ..base import NBAApiEndpoint
 
 REGULAR_SEASON_GAME_ID_PREFIX = "002"
 
 
-class LeagueSchedule(Endpoint):
+class LeagueSchedule(NBAApiEndpoint):
     """Every regular-season game on the schedule for `season` (e.g. "2026-27").
 
     Expected schema (subset): gameId, gameDateEst, homeTeam_teamId,
@@ -51,20 +51,23 @@ class LeagueSchedule(Endpoint):
         self.season = season
         self.params = {"Season": season}
 
-    def _request(self) -> dict:
-        endpoint = scheduleleaguev2.ScheduleLeagueV2(
+    def _nba_api_endpoint(self):
+        return scheduleleaguev2.ScheduleLeagueV2(
             season=self.params["Season"],
             timeout=self.client.timeout,
             get_request=False,
         )
-        return self.client.get_via_nba_api(endpoint)
 
     def _build_response(self, raw: dict) -> NBAResponse:
         games = []
         for game_date in raw.get("leagueSchedule", {}).get("gameDates", []):
             games.extend(game_date.get("games", []))
-        df = pd.json_normalize(games, sep="_")
-        if not df.empty:
-            df = df[df["gameId"].str.startswith(REGULAR_SEASON_GAME_ID_PREFIX)]
-            df = df[(df["homeTeam_teamId"] > 0) & (df["awayTeam_teamId"] > 0)]
-        return NBAResponse(raw, dataframe=df.reset_index(drop=True))
+
+        def _build() -> pd.DataFrame:
+            df = pd.json_normalize(games, sep="_")
+            if not df.empty:
+                df = df[df["gameId"].str.startswith(REGULAR_SEASON_GAME_ID_PREFIX)]
+                df = df[(df["homeTeam_teamId"] > 0) & (df["awayTeam_teamId"] > 0)]
+            return df.reset_index(drop=True)
+
+        return NBAResponse(raw, dataframe_builder=_build, columns=lambda: json_normalize_columns(games, sep="_"))
@@ -11,10 +11,10 @@ from __future__ import annotations
 
 from nba_api.stats.endpoints import LeagueDashPlayerStats
 
-from ..base import Endpoint
+from ..base import NBAApiEndpoint
 
 
-class PlayerSeasonTotals(Endpoint):
+class PlayerSeasonTotals(NBAApiEndpoint):
     """Season totals for every player who logged minutes in `season`.
 
     Expected schema (subset): PLAYER_ID, PLAYER_NAME, TEAM_ID, TEAM_ABBREVIATION,
@@ -51,11 +51,11 @@ class PlayerSeasonTotals(Endpoint):
         self.season = season
         # Kept minimal (just the identifying params) for the cache key — nba_api
         # fills in the other ~40 NBA.com params with its own current defaults,
-        # see _request().
+        # see _nba_api_endpoint().
         self.params = {"Season": season, "SeasonType": season_type, "PerMode": per_mode}
 
-    def _request(self) -> dict:
-        endpoint = LeagueDashPlayerStats(
+    def _nba_api_endpoint(self):
+        return LeagueDashPlayerStats(
             season=self.params["Season"],
             season_type_all_star=self.params["SeasonType"],
             per_mode_detailed=self.params["PerMode"],
@@ -63,4 +63,3 @@ class PlayerSeasonTotals(Endpoint):
             timeout=self.client.timeout,
             get_request=False,
         )
-        return self.client.get_via_nba_api(endpoint)
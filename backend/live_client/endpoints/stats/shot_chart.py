@@ -2,16 +2,54 @@
 
 Shot-location detail for a player (optionally scoped to one season) — built via
 nba_api's ShotChartDetail.
+
+Also the bulk path: LeagueShotChart pulls every shot in the league for one
+season in a single call (`team_id=0, player_id=0`), and
+`partition_by_team()` splits that frame into each team's offense (its own
+shots) and defense (shots taken against it) locally — the same two slices
+TeamShotChart fetches one request at a time, for 1 request per season
+instead of 60.
+
+All three are `stream_response` endpoints (see endpoints/base.py): a season
+of shots is the largest response this package fetches, so its body goes to
+the cache as bytes and into the dataframe row by row, never as a dict.
 """
 
 from __future__ import annotations
 
+import pandas as pd
 from nba_api.stats.endpoints import ShotChartDetail as _NbaApiShotChartDetail
 
-from ..base import Endpoint
-
-
-class PlayerShotChart(Endpoint):
+from ..base import NBAApiEndpoint
+
+# ShotChartDetail's column dtypes, shared by every class below (one response
+# shape). Coordinates are tenths of a foot within ±250 x / -50..900 y, so
+# int16; the flags are 0/1; the strings repeat a few dozen distinct values
+# across ~200k rows of a league-wide season. IDs stay int64: partition_by_team
+# sums two TEAM_IDs, which would overflow int32.
+SHOT_CHART_DTYPES = {
+    "PERIOD": "int8",
+    "MINUTES_REMAINING": "int8",
+    "SECONDS_REMAINING": "int8",
+    "LOC_X": "int16",
+    "LOC_Y": "int16",
+    "SHOT_DISTANCE": "int16",
+    "SHOT_ATTEMPTED_FLAG": "bool",
+    "SHOT_MADE_FLAG": "bool",
+    "GRID_TYPE": "category",
+    "TEAM_NAME": "category",
+    "EVENT_TYPE": "category",
+    "ACTION_TYPE": "category",
+    "SHOT_TYPE": "category",
+    "SHOT_ZONE_BASIC": "category",
+    "SHOT_ZONE_AREA": "category",
+    "SHOT_ZONE_RANGE": "category",
+    "HTM": "category",
+    "VTM": "category",
+}
+
+
+class PlayerShotChart(NBAApiEndpoint):
     """Every logged shot attempt for one player in one season.
 
     Expected schema (subset): GAME_ID, PLAYER_ID, TEAM_ID, PERIOD, LOC_X, LOC_Y,
@@ -24,6 +62,8 @@ class PlayerShotChart(Endpoint):
         "GAME_ID", "PLAYER_ID", "TEAM_ID", "PERIOD", "LOC_X", "LOC_Y",
         "SHOT_DISTANCE", "SHOT_MADE_FLAG", "SHOT_TYPE", "ACTION_TYPE",
     )
+    dtypes = SHOT_CHART_DTYPES
+    stream_response = True
 
     def __init__(
         self,
@@ -51,8 +91,8 @@ class PlayerShotChart(Endpoint):
             "PlayerID": player_id, "TeamID": team_id, "Season": season, "SeasonType": season_type,
         }
 
-    def _request(self) -> dict:
-        endpoint = _NbaApiShotChartDetail(
+    def _nba_api_endpoint(self):
+        return _NbaApiShotChartDetail(
             team_id=self.params["TeamID"],
             player_id=self.params["PlayerID"],
             season_nullable=self.params["Season"],
@@ -61,10 +101,9 @@ class PlayerShotChart(Endpoint):
             timeout=self.client.timeout,
             get_request=False,
         )
-        return self.client.get_via_nba_api(endpoint)
 
 
-class TeamShotChart(Endpoint):
+class TeamShotChart(NBAApiEndpoint):
     """Every logged shot attempt for one team in one season — either the
     team's own offense, or (via `opponent_team_id`) every shot taken
     *against* that team, a real defensive-shape proxy (e.g. "allows a lot of
@@ -83,6 +122,8 @@ class TeamShotChart(Endpoint):
 
     result_set_name = "Shot_Chart_Detail"
     expected_columns = ("GAME_ID", "TEAM_ID", "TEAM_NAME", "LOC_X", "LOC_Y", "SHOT_ZONE_BASIC", "SHOT_MADE_FLAG")
+    dtypes = SHOT_CHART_DTYPES
+    stream_response = True
 
     def __init__(
         self,
@@ -117,8 +158,8 @@ class TeamShotChart(Endpoint):
             "Season": season, "SeasonType": season_type,
         }
 
-    def _request(self) -> dict:
-        endpoint = _NbaApiShotChartDetail(
+    def _nba_api_endpoint(self):
+        return _NbaApiShotChartDetail(
             team_id=self.params["TeamID"],
             player_id=0,
             opponent_team_id=self.params["OpponentTeamID"],
@@ -128,4 +169,66 @@ class TeamShotChart(Endpoint):
             timeout=self.client.timeout,
             get_request=False,
         )
-        return self.client.get_via_nba_api(endpoint)
+
+
+class LeagueShotChart(NBAApiEndpoint):
+    """Every logged shot attempt in the league for one season — the bulk
+    counterpart of TeamShotChart (see module docstring). One response is the
+    whole season (~200k rows for a regular season), so this is meant to be
+    fetched once and split with `partition_by_team()`.
+
+    Expected schema (subset): GAME_ID, PLAYER_ID, TEAM_ID, TEAM_NAME, LOC_X,
+    LOC_Y, SHOT_ZONE_BASIC, SHOT_MADE_FLAG.
+    """
+
+    result_set_name = "Shot_Chart_Detail"
+    expected_columns = (
+        "GAME_ID", "PLAYER_ID", "TEAM_ID", "TEAM_NAME", "LOC_X", "LOC_Y", "SHOT_ZONE_BASIC", "SHOT_MADE_FLAG",
+    )
+    dtypes = SHOT_CHART_DTYPES
+    stream_response = True
+
+    def __init__(self, season: str, season_type: str = "Regular Season", client=None, cache=None):
+        super().__init__(client, cache)
+        self.season = season
+        self.params = {"TeamID": 0, "PlayerID": 0, "Season": season, "SeasonType": season_type}
+
+    def _nba_api_endpoint(self):
+        return _NbaApiShotChartDetail(
+            team_id=0,
+            player_id=0,
+            season_nullable=self.params["Season"],
+            season_type_all_star=self.params["SeasonType"],
+            context_measure_simple="FGA",
+            timeout=self.client.timeout,
+            get_request=False,
+        )
+
+
+def partition_by_team(shots: pd.DataFrame) -> dict[int, dict[str, pd.DataFrame]]:
+    """Splits a league-wide shot frame (LeagueShotChart) into
+    `{team_id: {"offense": ..., "defense": ...}}` — the same rows
+    TeamShotChart(team_id=X) and TeamShotChart(opponent_team_id=X) return.
+
+    The opponent isn't a column, so it's derived per game: every game in the
+    frame has exactly two TEAM_IDs taking shots, and a shot's opponent is the
+    other one (game min + game max - own id, vectorized). A game where only
+    one team shows up (a truncated/partial response) has no knowable
+    opponent, so its rows count toward that team's offense but nobody's
+    defense.
+    """
+    # Positional arrays throughout, so a frame with a non-unique index (e.g.
+    # several seasons concatenated) partitions the same as a fresh one.
+    team_ids = shots["TEAM_ID"].to_numpy()
+    by_game = shots["TEAM_ID"].groupby(shots["GAME_ID"].to_numpy())
+    game_min = by_game.transform("min").to_numpy()
+    game_max = by_game.transform("max").to_numpy()
+    has_opponent = game_min != game_max
+    opponent = (game_min + game_max - team_ids)[has_opponent]
+
+    partitions: dict[int, dict[str, pd.DataFrame]] = {}
+    for team_id, offense in shots.groupby(team_ids, sort=True):
+        partitions[int(team_id)] = {"offense": offense, "defense": shots.iloc[:0]}
+    for team_id, defense in shots[has_opponent].groupby(opponent, sort=True):
+        partitions.setdefault(int(team_id), {"offense": shots.iloc[:0]})["defense"] = defense
+    return partitions
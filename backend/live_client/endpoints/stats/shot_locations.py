@@ -39,10 +39,10 @@ import pandas as pd
 from nba_api.stats.endpoints import LeagueDashPlayerShotLocations as _NbaApiLeagueDashPlayerShotLocations
 
 from ...response import NBAResponse
-from ..base import Endpoint
+from ..base import NBAApiEndpoint
 
 
-class PlayerShotLocations(Endpoint):
+class PlayerShotLocations(NBAApiEndpoint):
     """Every qualifying player's shot attempts for `season`, by zone.
 
     Expected schema (subset): PLAYER_ID, PLAYER_NAME, TEAM_ID, and, per zone,
@@ -58,15 +58,14 @@ class PlayerShotLocations(Endpoint):
         self.season = season
         self.params = {"Season": season, "PerMode": per_mode}
 
-    def _request(self) -> dict:
-        endpoint = _NbaApiLeagueDashPlayerShotLocations(
+    def _nba_api_endpoint(self):
+        return _NbaApiLeagueDashPlayerShotLocations(
             season=self.params["Season"],
             per_mode_detailed=self.params["PerMode"],
             distance_range="By Zone",
             timeout=self.client.timeout,
             get_request=False,
         )
-        return self.client.get_via_nba_api(endpoint)
 
     def _build_response(self, raw: dict) -> NBAResponse:
         result_sets = raw["resultSets"]
@@ -81,7 +80,10 @@ class PlayerShotLocations(Endpoint):
             start = n_skip + i * zone_span
             columns.extend(f"{zone}_{sub}" for sub in flat_names[start:start + zone_span])
 
-        df = pd.DataFrame(result_sets["rowSet"], columns=columns)
-        for col in columns[n_skip:]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-        return NBAResponse(raw, dataframe=df)
+        def _build() -> pd.DataFrame:
+            df = pd.DataFrame(result_sets["rowSet"], columns=columns)
+            for col in columns[n_skip:]:
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+            return df
+
+        return NBAResponse(raw, dataframe_builder=_build, columns=columns)
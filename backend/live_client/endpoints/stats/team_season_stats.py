@@ -13,10 +13,10 @@ from __future__ import annotations
 
 from nba_api.stats.endpoints import LeagueDashTeamStats
 
-from ..base import Endpoint
+from ..base import NBAApiEndpoint
 
 
-class TeamSeasonStats(Endpoint):
+class TeamSeasonStats(NBAApiEndpoint):
     """League-wide team season totals (Base measure type) for `season`.
 
     Expected schema (subset): TEAM_ID, TEAM_NAME, GP, FGA, FG3A, PTS.
@@ -32,8 +32,8 @@ class TeamSeasonStats(Endpoint):
         self.season = season
         self.params = {"Season": season, "SeasonType": season_type, "PerMode": per_mode}
 
-    def _request(self) -> dict:
-        endpoint = LeagueDashTeamStats(
+    def _nba_api_endpoint(self):
+        return LeagueDashTeamStats(
             season=self.params["Season"],
             season_type_all_star=self.params["SeasonType"],
             per_mode_detailed=self.params["PerMode"],
@@ -41,10 +41,9 @@ class TeamSeasonStats(Endpoint):
             timeout=self.client.timeout,
             get_request=False,
         )
-        return self.client.get_via_nba_api(endpoint)
 
 
-class TeamAdvancedStats(Endpoint):
+class TeamAdvancedStats(NBAApiEndpoint):
     """League-wide team advanced metrics (pace, ratings, AST%) for `season`.
 
     Expected schema (subset): TEAM_ID, TEAM_NAME, PACE, AST_PCT, TM_TOV_PCT,
@@ -60,8 +59,8 @@ class TeamAdvancedStats(Endpoint):
         self.season = season
         self.params = {"Season": season, "SeasonType": season_type, "PerMode": per_mode}
 
-    def _request(self) -> dict:
-        endpoint = LeagueDashTeamStats(
+    def _nba_api_endpoint(self):
+        return LeagueDashTeamStats(
             season=self.params["Season"],
             season_type_all_star=self.params["SeasonType"],
             per_mode_detailed=self.params["PerMode"],
@@ -69,4 +68,3 @@ class TeamAdvancedStats(Endpoint):
             timeout=self.client.timeout,
             get_request=False,
         )
-        return self.client.get_via_nba_api(endpoint)
@@ -0,0 +1,385 @@
+"""backend/live_client/live_games.py
+
+Follows today's games while they're being played: polls the live scoreboard,
+then each in-progress game's live box score on its own adaptive interval,
+and keeps one compact, always-current state per game that readers (the API)
+look up by game ID without touching NBA.com or a DataFrame.
+
+Why not just fetch LiveBoxScore on demand: its response flattens both teams'
+player lists into a new frame on every fetch, and the box score of a game in
+progress changes a few stats at a time. Here each poll is diffed against the
+previous snapshot of the same game — players are keyed by personId, their
+stats held as one fixed-order tuple (`STAT_FIELDS`) — so a poll produces the
+per-player deltas since the last one, and the state a reader gets is the
+finished product of that work, not an input to it.
+
+How often a game is polled follows what's happening in it (`poll_interval`):
+fastest in a close fourth quarter or overtime, the live feed's own cadence
+otherwise, slow at halftime and between quarters, and not at all before tip
+or after the final (the scoreboard poll notices both transitions).
+Polls go through Endpoint.afetch(force_refresh=True), so with a conditional-
+request cache (see endpoints/base.py) an unchanged box score costs a 304,
+not a download.
+
+Readers never block on a poll: every update builds a new GameSnapshot and
+swaps it into `LiveGamesState` in one assignment, so a reader sees either
+the previous snapshot or the next one, never a half-applied poll.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Callable, Mapping
+
+from .async_client import AsyncNBAStatsClient
+from .endpoints.live.live_boxscore import LiveBoxScore
+from .endpoints.live.scoreboard import TodaysScoreboard
+from .rate_limit import default_pacer
+
+logger = logging.getLogger("basketball_predictions.live_client.live_games")
+
+# cdn.nba.com's gameStatus values.
+SCHEDULED, IN_PROGRESS, FINAL = 1, 2, 3
+
+# Per-player counting stats tracked for deltas, in tuple order. `seconds` is
+# derived from the feed's ISO-8601 `minutes` ("PT31M12.00S"); everything
+# else is read from `statistics` as-is.
+STAT_FIELDS = (
+    "seconds", "points", "reboundsTotal", "reboundsOffensive", "assists", "steals", "blocks",
+    "turnovers", "foulsPersonal", "fieldGoalsMade", "fieldGoalsAttempted",
+    "threePointersMade", "threePointersAttempted", "freeThrowsMade", "freeThrowsAttempted",
+    "plusMinusPoints",
+)
+
+# Seconds between box-score polls of one game. CLOSE_GAME is under the
+# live cache policy's 15s TTL on purpose: that's where a stale score is
+# most noticeable, and polls are conditional so an unchanged feed is cheap.
+CLOSE_GAME_INTERVAL_SECONDS = 5
+IN_PLAY_INTERVAL_SECONDS = 15
+PERIOD_BREAK_INTERVAL_SECONDS = 45
+HALFTIME_INTERVAL_SECONDS = 180
+SCOREBOARD_INTERVAL_SECONDS = 30
+# "Close" = a two-possession-plus game in the last five minutes of the 4th,
+# or any overtime.
+CLOSE_GAME_MARGIN = 8
+CLOSE_GAME_CLOCK_SECONDS = 5 * 60
+
+_ISO_DURATION = re.compile(r"PT(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?")
+
+
+def clock_seconds(duration: str | None) -> float | None:
+    """"PT05M12.00S" -> 312.0; None for a missing or unparseable clock."""
+    match = _ISO_DURATION.fullmatch(duration or "")
+    if match is None or not any(match.groups()):
+        return None
+    minutes, seconds = match.groups()
+    return int(minutes or 0) * 60 + float(seconds or 0)
+
+
+def poll_interval(status: int, period: int, clock: float | None, margin: int, status_text: str = "") -> float | None:
+    """Seconds until a game's next box-score poll, or None when it shouldn't
+    be polled at all (not started, or over) — see module docstring."""
+    if status != IN_PROGRESS:
+        return None
+    if status_text.strip().lower().startswith("half"):
+        return HALFTIME_INTERVAL_SECONDS
+    if clock == 0:
+        return HALFTIME_INTERVAL_SECONDS if period == 2 else PERIOD_BREAK_INTERVAL_SECONDS
+    if period > 4 or (period == 4 and clock is not None and clock <= CLOSE_GAME_CLOCK_SECONDS
+                      and abs(margin) <= CLOSE_GAME_MARGIN):
+        return CLOSE_GAME_INTERVAL_SECONDS
+    return IN_PLAY_INTERVAL_SECONDS
+
+
+@dataclass(frozen=True)
+class PlayerLine:
+    """One player's current box-score line; `stats` follows STAT_FIELDS."""
+
+    person_id: int
+    name: str
+    team_id: int
+    stats: tuple
+
+    def as_dict(self) -> dict:
+        return {"person_id": self.person_id, "name": self.name, "team_id": self.team_id,
+                **dict(zip(STAT_FIELDS, self.stats))}
+
+
+@dataclass(frozen=True)
+class GameSnapshot:
+    """Everything known about one game as of its last poll.
+
+    `deltas` is what changed in the last box-score poll: {person_id: {stat:
+    change}} with only the stats that moved (a player's first appearance
+    counts in full). Scoreboard polls update the header fields only.
+    `version` counts polls that changed anything, so a client can tell
+    "nothing new" from "new data" without comparing payloads.
+    """
+
+    game_id: str
+    status: int
+    status_text: str
+    period: int
+    clock: float | None
+    home_team_id: int
+    away_team_id: int
+    home_score: int
+    away_score: int
+    players: Mapping[int, PlayerLine] = field(default_factory=dict)
+    deltas: Mapping[int, Mapping[str, float]] = field(default_factory=dict)
+    version: int = 0
+    updated_at: float = 0.0
+
+    @property
+    def margin(self) -> int:
+        return self.home_score - self.away_score
+
+    def next_interval(self) -> float | None:
+        return poll_interval(self.status, self.period, self.clock, self.margin, self.status_text)
+
+    def as_dict(self) -> dict:
+        return {
+            "game_id": self.game_id, "status": self.status, "status_text": self.status_text,
+            "period": self.period, "clock_seconds": self.clock,
+            "home_team_id": self.home_team_id, "away_team_id": self.away_team_id,
+            "home_score": self.home_score, "away_score": self.away_score,
+            "version": self.version, "updated_at": self.updated_at,
+            "players": [line.as_dict() for line in self.players.values()],
+            "deltas": {str(pid): dict(changes) for pid, changes in self.deltas.items()},
+        }
+
+
+class LiveGamesState:
+    """Today's games by game ID. Reads are dict lookups on the current
+    mapping; `replace()` swaps one game's snapshot atomically (see module
+    docstring). `as_dict()` views are built once per update, not per read."""
+
+    def __init__(self):
+        self._games: dict[str, GameSnapshot] = {}
+        self._views: dict[str, dict] = {}
+
+    def game(self, game_id: str) -> GameSnapshot | None:
+        return self._games.get(game_id)
+
+    def game_view(self, game_id: str) -> dict | None:
+        """The JSON-ready form of game(game_id)."""
+        return self._views.get(game_id)
+
+    def games(self) -> Mapping[str, GameSnapshot]:
+        return MappingProxyType(self._games)
+
+    def game_views(self) -> list[dict]:
+        return list(self._views.values())
+
+    def replace(self, snapshot: GameSnapshot) -> None:
+        self._views = {**self._views, snapshot.game_id: snapshot.as_dict()}
+        self._games = {**self._games, snapshot.game_id: snapshot}
+
+    def retain(self, game_ids) -> None:
+        """Drops games no longer on the scoreboard (yesterday's, once the
+        feed rolls over)."""
+        keep = set(game_ids)
+        self._games = {gid: game for gid, game in self._games.items() if gid in keep}
+        self._views = {gid: view for gid, view in self._views.items() if gid in keep}
+
+
+# The process-wide state the API reads (like cache.MEMORY_CACHE).
+LIVE_GAMES = LiveGamesState()
+
+
+def _player_lines(team: dict) -> dict[int, PlayerLine]:
+    team_id = int(team.get("teamId") or 0)
+    lines = {}
+    for player in team.get("players", []):
+        stats = player.get("statistics", {})
+        values = [clock_seconds(stats.get("minutes")) or 0.0]
+        values.extend(stats.get(name) or 0 for name in STAT_FIELDS[1:])
+        person_id = int(player["personId"])
+        lines[person_id] = PlayerLine(person_id, player.get("name", ""), team_id, tuple(values))
+    return lines
+
+
+def _deltas(previous: Mapping[int, PlayerLine], current: Mapping[int, PlayerLine]) -> dict[int, dict]:
+    deltas = {}
+    for person_id, line in current.items():
+        before = previous.get(person_id)
+        if before is not None and before.stats == line.stats:
+            continue
+        old = before.stats if before is not None else (0,) * len(STAT_FIELDS)
+        changed = {name: new - prior for name, new, prior in zip(STAT_FIELDS, line.stats, old) if new != prior}
+        if changed:
+            deltas[person_id] = MappingProxyType(changed)
+    return deltas
+
+
+def apply_boxscore(previous: GameSnapshot | None, raw: dict, now: float | None = None) -> GameSnapshot:
+    """The next snapshot of a game from its raw live box score (the
+    cdn.nba.com JSON dict, never flattened to a frame), with deltas
+    against `previous`."""
+    game = raw.get("game", {})
+    home, away = game.get("homeTeam", {}), game.get("awayTeam", {})
+    players = {**_player_lines(home), **_player_lines(away)}
+    deltas = _deltas(previous.players if previous is not None else {}, players)
+    snapshot = GameSnapshot(
+        game_id=str(game.get("gameId") or (previous.game_id if previous is not None else "")),
+        status=int(game.get("gameStatus") or 0),
+        status_text=game.get("gameStatusText", ""),
+        period=int(game.get("period") or 0),
+        clock=clock_seconds(game.get("gameClock")),
+        home_team_id=int(home.get("teamId") or 0),
+        away_team_id=int(away.get("teamId") or 0),
+        home_score=int(home.get("score") or 0),
+        away_score=int(away.get("score") or 0),
+        players=MappingProxyType(players),
+        deltas=MappingProxyType(deltas),
+        version=(previous.version if previous is not None else 0),
+        updated_at=now if now is not None else time.time(),
+    )
+    if previous is None or deltas or _header(snapshot) != _header(previous):
+        snapshot = replace(snapshot, version=snapshot.version + 1)
+    return snapshot
+
+
+def apply_scoreboard_game(previous: GameSnapshot | None, game: dict, now: float | None = None) -> GameSnapshot:
+    """A game's status/score from its scoreboard entry; keeps whatever
+    box-score state `previous` already has.
+
+    Once a game has a box score, the box-score poll is its primary feed and
+    the scoreboard lags it (the scoreboard is polled less often, and the
+    two are cached separately), so the scoreboard header is only taken when
+    it's further along in the game -- a later status, period, or game
+    clock. Otherwise `previous` comes back as-is, version unchanged."""
+    home, away = game.get("homeTeam", {}), game.get("awayTeam", {})
+    snapshot = GameSnapshot(
+        game_id=str(game["gameId"]),
+        status=int(game.get("gameStatus") or 0),
+        status_text=game.get("gameStatusText", ""),
+        period=int(game.get("period") or 0),
+        clock=clock_seconds(game.get("gameClock")),
+        home_team_id=int(home.get("teamId") or 0),
+        away_team_id=int(away.get("teamId") or 0),
+        home_score=int(home.get("score") or 0),
+        away_score=int(away.get("score") or 0),
+        players=previous.players if previous is not None else MappingProxyType({}),
+        deltas=previous.deltas if previous is not None else MappingProxyType({}),
+        version=previous.version if previous is not None else 0,
+        updated_at=now if now is not None else time.time(),
+    )
+    if previous is not None and previous.players and _progress(snapshot) <= _progress(previous):
+        return previous
+    if previous is None or _header(snapshot) != _header(previous):
+        snapshot = replace(snapshot, version=snapshot.version + 1)
+    return snapshot
+
+
+def _progress(snapshot: GameSnapshot) -> tuple:
+    """How far into the game a header is, comparable across feeds; the
+    clock counts down, and an empty one (between periods) is at 0."""
+    return (snapshot.status, snapshot.period, -(snapshot.clock or 0.0))
+
+
+def _header(snapshot: GameSnapshot) -> tuple:
+    return (snapshot.status, snapshot.status_text, snapshot.period, snapshot.clock,
+            snapshot.home_score, snapshot.away_score)
+
+
+class LiveGamePoller:
+    """Keeps a LiveGamesState current for every game on today's scoreboard.
+
+    `poll_once()` does whatever is due right now and returns how long until
+    something is due again; `run()` loops on it. Endpoint errors are logged
+    and retried on the game's next interval — one bad feed never stops the
+    others (the same "partial coverage beats none" rule as batch.py).
+    """
+
+    def __init__(
+        self,
+        client: AsyncNBAStatsClient | None = None,
+        state: LiveGamesState | None = None,
+        cache=None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        # A client the poller builds itself is paced with every other job
+        # and closed when run() returns; a caller's client is the caller's.
+        self._owns_client = client is None
+        self.client = client if client is not None else AsyncNBAStatsClient(rate_limiter=default_pacer())
+        self.state = state if state is not None else LIVE_GAMES
+        self.cache = cache
+        self.clock = clock
+        self._next_scoreboard = 0.0
+        self._next_boxscore: dict[str, float] = {}
+
+    async def poll_once(self) -> float:
+        now = self.clock()
+        if now >= self._next_scoreboard:
+            await self._poll_scoreboard(now)
+            self._next_scoreboard = now + SCOREBOARD_INTERVAL_SECONDS
+        due = [gid for gid, at in self._next_boxscore.items() if at <= now]
+        if due:
+            await asyncio.gather(*(self._poll_boxscore(gid, now) for gid in due))
+        next_due = min([self._next_scoreboard, *self._next_boxscore.values()])
+        return max(0.0, next_due - self.clock())
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        stop = stop or asyncio.Event()
+        try:
+            while not stop.is_set():
+                delay = await self.poll_once()
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if self._owns_client:
+                await self.client.aclose()
+
+    async def _poll_scoreboard(self, now: float) -> None:
+        endpoint = TodaysScoreboard(client=self.client, cache=self.cache)
+        try:
+            raw = (await endpoint.afetch(self.client, force_refresh=True)).to_dict()
+        except Exception:
+            logger.exception("live scoreboard poll failed; keeping previous state")
+            return
+        games = raw.get("scoreboard", {}).get("games", [])
+        on_board = {str(game["gameId"]) for game in games}
+        self.state.retain(on_board)
+        self._next_boxscore = {gid: at for gid, at in self._next_boxscore.items() if gid in on_board}
+        for game in games:
+            game_id = str(game["gameId"])
+            previous = self.state.game(game_id)
+            snapshot = apply_scoreboard_game(previous, game, time.time())
+            if previous is None or snapshot.version != previous.version:
+                self.state.replace(snapshot)
+            self._schedule(game_id, snapshot, now)
+
+    def _schedule(self, game_id: str, snapshot: GameSnapshot, now: float) -> None:
+        if snapshot.next_interval() is not None:
+            self._next_boxscore.setdefault(game_id, now)
+        elif snapshot.status == FINAL and game_id in self._next_boxscore:
+            # One last poll for the final box score, then stop.
+            self._next_boxscore[game_id] = now
+        else:
+            self._next_boxscore.pop(game_id, None)
+
+    async def _poll_boxscore(self, game_id: str, now: float) -> None:
+        endpoint = LiveBoxScore(game_id, client=self.client, cache=self.cache)
+        try:
+            raw = (await endpoint.afetch(self.client, force_refresh=True)).to_dict()
+        except Exception:
+            logger.exception("live box score poll for %s failed; retrying next interval", game_id)
+            self._next_boxscore[game_id] = now + IN_PLAY_INTERVAL_SECONDS
+            return
+        previous = self.state.game(game_id)
+        snapshot = apply_boxscore(previous, raw, time.time())
+        if previous is None or snapshot.version != previous.version:
+            self.state.replace(snapshot)
+        interval = snapshot.next_interval()
+        if interval is None:
+            self._next_boxscore.pop(game_id, None)
+        else:
+            self._next_boxscore[game_id] = now + interval
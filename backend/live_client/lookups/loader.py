@@ -15,10 +15,24 @@ Note: nba_api's static player records do NOT include team_id (a player's team
 affiliation isn't a "static" fact — it's a roster/season fact, which is a
 separate, not-yet-built unit of work — see backend/AGENTS.md). Only team_id,
 abbreviation, full_name, and player_id, full_name, is_active are covered here.
+
+Single lookups (`team_name_for_id` & co.) go through one process-wide index —
+plain dicts by team id, abbreviation, player name and normalized player name,
+built on first use — rather than a fresh DataFrame and a boolean-mask scan
+per call: `fetch_regular_season_schedule` resolves ~2,460 team ids per
+schedule, and a name lookup used to rebuild the 5,100-row player frame each
+time. The bulk helpers (`team_names_for_ids` & co.) map a whole Series
+through a pandas Index in one vectorized `get_indexer`, no Python call per
+row.
 """
 
 from __future__ import annotations
 
+import functools
+import unicodedata
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 from nba_api.stats.static import players as _nba_api_players
 from nba_api.stats.static import teams as _nba_api_teams
@@ -45,25 +59,119 @@ def load_players() -> pd.DataFrame:
     })
 
 
+def normalize_name(name: str) -> str:
+    """Accent-, case- and punctuation-insensitive form of a player name
+    ('Nikola Jokić' -> 'nikola jokic'). win_model/roster_change_features.py
+    imports this one to match Basketball-Reference spellings with."""
+    nfkd = unicodedata.normalize("NFKD", str(name))
+    ascii_name = "".join(c for c in nfkd if not unicodedata.combining(c))
+    return ascii_name.strip().lower().replace(".", "").replace("'", "")
+
+
+@dataclass(frozen=True)
+class LookupIndex:
+    """Every static lookup, keyed every way it's looked up. Where nba_api
+    lists two players under one name (a few dozen do, e.g. 'Mike
+    Dunleavy'), the first listed wins, as the old `.iloc[0]` scans did."""
+
+    team_name_by_id: dict[int, str]
+    team_id_by_abbreviation: dict[str, int]
+    player_id_by_name: dict[str, int]
+    player_id_by_normalized_name: dict[str, int]
+
+
+@functools.lru_cache(maxsize=1)
+def lookup_index() -> LookupIndex:
+    """The process-wide LookupIndex, built from nba_api's bundled lists on
+    first call. Static data, so it never needs invalidating."""
+    teams = _nba_api_teams.get_teams()
+    player_id_by_name: dict[str, int] = {}
+    player_id_by_normalized_name: dict[str, int] = {}
+    for player in _nba_api_players.get_players():
+        player_id_by_name.setdefault(player["full_name"], player["id"])
+        player_id_by_normalized_name.setdefault(normalize_name(player["full_name"]), player["id"])
+    return LookupIndex(
+        team_name_by_id={t["id"]: t["full_name"] for t in teams},
+        team_id_by_abbreviation={t["abbreviation"]: t["id"] for t in teams},
+        player_id_by_name=player_id_by_name,
+        player_id_by_normalized_name=player_id_by_normalized_name,
+    )
+
+
 def team_id_for_abbreviation(abbreviation: str) -> int:
-    teams = load_teams()
-    match = teams.loc[teams["abbreviation"] == abbreviation, "team_id"]
-    if match.empty:
-        raise KeyError(f"Unknown team abbreviation: {abbreviation!r}")
-    return int(match.iloc[0])
+    try:
+        return lookup_index().team_id_by_abbreviation[abbreviation]
+    except KeyError:
+        raise KeyError(f"Unknown team abbreviation: {abbreviation!r}") from None
 
 
 def team_name_for_id(team_id: int) -> str:
-    teams = load_teams()
-    match = teams.loc[teams["team_id"] == team_id, "full_name"]
-    if match.empty:
-        raise KeyError(f"Unknown team_id: {team_id!r}")
-    return match.iloc[0]
+    try:
+        return lookup_index().team_name_by_id[int(team_id)]
+    except (KeyError, TypeError, ValueError):
+        raise KeyError(f"Unknown team_id: {team_id!r}") from None
 
 
 def player_id_for_name(full_name: str) -> int:
-    players = load_players()
-    match = players.loc[players["full_name"] == full_name, "player_id"]
-    if match.empty:
+    """Exact name first; failing that, the normalized name (so 'Nikola
+    Jokic' finds 'Nikola Jokić')."""
+    index = lookup_index()
+    player_id = index.player_id_by_name.get(full_name)
+    if player_id is None:
+        player_id = index.player_id_by_normalized_name.get(normalize_name(full_name))
+    if player_id is None:
         raise KeyError(f"Unknown player full_name: {full_name!r}")
-    return int(match.iloc[0])
+    return player_id
+
+
+@functools.lru_cache(maxsize=None)
+def _bulk_index(mapping_name: str) -> tuple[pd.Index, np.ndarray]:
+    """One LookupIndex dict as (keys Index, values array), built once."""
+    mapping = getattr(lookup_index(), mapping_name)
+    return pd.Index(list(mapping)), np.array(list(mapping.values()), dtype=object)
+
+
+def _bulk_lookup(values, mapping_name: str) -> tuple[np.ndarray, np.ndarray]:
+    """(mapped values, found mask) for every element of `values`; where not
+    found, the mapped value is meaningless."""
+    keys, targets = _bulk_index(mapping_name)
+    positions = keys.get_indexer(values)
+    found = positions >= 0
+    if not len(targets):
+        return np.empty(len(positions), dtype=object), found
+    return targets[np.where(found, positions, 0)], found
+
+
+def _bulk_series(values: pd.Series, mapped: np.ndarray, found: np.ndarray, what: str, dtype) -> pd.Series:
+    if not found.all():
+        unknown = pd.unique(np.asarray(values, dtype=object)[~found])
+        raise KeyError(f"Unknown {what}: {list(unknown)[:10]!r}")
+    return pd.Series(mapped, index=values.index, name=values.name, dtype=dtype)
+
+
+def team_names_for_ids(team_ids: pd.Series) -> pd.Series:
+    """team_name_for_id() over a whole Series in one vectorized lookup.
+    Raises KeyError naming the unknown ids (`.map(team_name_for_id)` raised
+    for the first one)."""
+    names, found = _bulk_lookup(team_ids, "team_name_by_id")
+    return _bulk_series(team_ids, names, found, "team_id", "str")
+
+
+def team_ids_for_abbreviations(abbreviations: pd.Series) -> pd.Series:
+    """team_id_for_abbreviation() over a whole Series."""
+    ids, found = _bulk_lookup(abbreviations, "team_id_by_abbreviation")
+    return _bulk_series(abbreviations, ids, found, "team abbreviation", "int64")
+
+
+def player_ids_for_names(full_names: pd.Series) -> pd.Series:
+    """player_id_for_name() over a whole Series: one vectorized exact-name
+    lookup, then the normalized-name fallback for just the names that
+    missed (normalizing is per-name Python work, so it's kept to those)."""
+    ids, found = _bulk_lookup(full_names, "player_id_by_name")
+    if not found.all():
+        misses = np.flatnonzero(~found)
+        normalized = [normalize_name(name) for name in np.asarray(full_names, dtype=object)[misses]]
+        fallback, fallback_found = _bulk_lookup(normalized, "player_id_by_normalized_name")
+        ids[misses[fallback_found]] = fallback[fallback_found]
+        found[misses[fallback_found]] = True
+    return _bulk_series(full_names, ids, found, "player full_name", "int64")
@@ -0,0 +1,183 @@
+"""backend/live_client/play_by_play_store.py
+
+Append-only play-by-play: one Arrow file per game, holding every action
+ingested so far, plus the highest `actionNumber` in it (and that action's
+period) in the file's schema metadata.
+
+GamePlayByPlay on its own refetches and re-parses a game's whole action list
+every time — ~500 actions for a finished game, all of them again on every
+poll of a live one, and once per game (×1,230) for a season backfill that
+mostly re-reads games it already has. `update(game_id)` instead asks only
+from the stored high-water mark's period on (`start_period`), columnizes
+only actions numbered past it (GamePlayByPlay.actions_frame), and appends
+those. A game with nothing new costs a request and a scan, and writes
+nothing.
+
+Reads are memory-mapped: `events(game_id)` is an Arrow table whose buffers
+point straight into the file, and `column()` a zero-copy numpy view of one
+column, so downstream consumers can sweep a season of games without each
+one being loaded into the heap.
+
+The file is one record batch (that's what makes column() zero-copy), so an
+append rewrites it: old rows are copied out of the mapping, never re-read
+from JSON, and the new file replaces the old with an atomic rename — a
+reader holding the previous mapping keeps a consistent (if one poll stale)
+view. Append-only also means an upstream correction to an action already
+stored isn't picked up; `update(game_id, rebuild=True)` re-ingests a game
+from scratch for that.
+
+Needs pyarrow (a live_client optional dependency — see cache.py).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from .cache import DEFAULT_CACHE_DIR
+from .endpoints.stats.play_by_play import GamePlayByPlay
+from .single_flight import FileLock
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import ipc
+except ImportError:  # optional — see module docstring
+    pa = None
+    pc = None
+    ipc = None
+
+logger = logging.getLogger("basketball_predictions.live_client.play_by_play_store")
+
+DEFAULT_STORE_DIR = DEFAULT_CACHE_DIR / "play_by_play"
+
+_MAX_ACTION_KEY = b"max_action_number"
+_LAST_PERIOD_KEY = b"last_period"
+
+
+class PlayByPlayStore:
+    """Per-game play-by-play files under `root` (see module docstring).
+
+    Parameters
+    ----------
+    root : Path | str
+        Directory holding one `<game_id>.arrow` per game.
+    client, cache
+        Passed to every GamePlayByPlay this store fetches with.
+    """
+
+    def __init__(self, root: Path | str = DEFAULT_STORE_DIR, client=None, cache=None):
+        if pa is None:
+            raise ImportError("PlayByPlayStore needs pyarrow")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.client = client
+        self.cache = cache
+
+    def path(self, game_id: str) -> Path:
+        return self.root / f"{game_id}.arrow"
+
+    def _metadata(self, game_id: str) -> dict[bytes, bytes]:
+        # Only the schema (and footer) is read here, not the batches.
+        try:
+            with pa.memory_map(str(self.path(game_id))) as source:
+                return ipc.open_file(source).schema.metadata or {}
+        except FileNotFoundError:
+            return {}
+
+    def max_action_number(self, game_id: str) -> int:
+        """The high-water mark: 0 for a game with nothing stored yet."""
+        return int(self._metadata(game_id).get(_MAX_ACTION_KEY, 0))
+
+    def events(self, game_id: str) -> pa.Table | None:
+        """Every stored action for the game, memory-mapped (zero-copy); None
+        if nothing has been ingested for it. The file itself is closed before
+        returning — the mapping lives on as long as the table's buffers do —
+        so repeated reads and update()s don't each leave a descriptor open."""
+        try:
+            with pa.memory_map(str(self.path(game_id))) as source:
+                return ipc.open_file(source).read_all()
+        except FileNotFoundError:
+            return None
+
+    def column(self, game_id: str, name: str) -> np.ndarray | None:
+        """One column as a numpy array — a view straight into the mapped file
+        for numeric columns without nulls, a copy otherwise."""
+        table = self.events(game_id)
+        if table is None:
+            return None
+        return table.column(name).to_numpy()
+
+    def frame(self, game_id: str) -> pd.DataFrame | None:
+        """events() as a DataFrame (copies out of the mapping)."""
+        table = self.events(game_id)
+        return table.to_pandas() if table is not None else None
+
+    def update(self, game_id: str, rebuild: bool = False) -> int:
+        """Fetches and appends the game's actions past the stored high-water
+        mark. Returns how many were appended."""
+        with FileLock(self.root / "locks" / f"{game_id}.lock"):
+            metadata = {} if rebuild else self._metadata(game_id)
+            after = int(metadata.get(_MAX_ACTION_KEY, 0))
+            last_period = int(metadata.get(_LAST_PERIOD_KEY, 0))
+
+            endpoint = GamePlayByPlay(game_id, start_period=last_period, client=self.client, cache=self.cache)
+            # A game already in the store (or being rebuilt) is by definition
+            # being re-checked upstream, so a cached body would only hide
+            # what changed.
+            response = endpoint.fetch(force_refresh=rebuild or bool(after))
+            new = endpoint.actions_frame(response.to_bytes(), after_action_number=after)
+            if new.empty:
+                return 0
+            self._append(game_id, None if rebuild else self.events(game_id), new)
+            return len(new)
+
+    def update_many(self, game_ids: Iterable[str]) -> dict[str, int | Exception]:
+        """update() per game, for a backfill: new-action counts by game ID,
+        or the exception for a game that failed (the rest still run — same
+        partial-coverage rule as batch.py)."""
+        results: dict[str, int | Exception] = {}
+        for game_id in game_ids:
+            try:
+                results[game_id] = self.update(game_id)
+            except Exception as exc:
+                logger.warning("play-by-play update for %s failed: %s", game_id, exc)
+                results[game_id] = exc
+        return results
+
+    def _append(self, game_id: str, existing: pa.Table | None, new: pd.DataFrame) -> None:
+        table = _to_arrow(new)
+        if existing is not None:
+            table = pa.concat_tables(
+                [existing.replace_schema_metadata(None), table], promote_options="permissive"
+            )
+        table = table.combine_chunks()
+        numbers = table.column("actionNumber")
+        last = pc.index(numbers, pc.max(numbers)).as_py()
+        table = table.replace_schema_metadata({
+            _MAX_ACTION_KEY: str(numbers[last].as_py()).encode(),
+            _LAST_PERIOD_KEY: str(table.column("period")[last].as_py()).encode(),
+        })
+
+        path = self.path(game_id)
+        tmp = path.with_suffix(".arrow.tmp")
+        with pa.OSFile(str(tmp), "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=None)
+        os.replace(tmp, path)
+
+
+def _to_arrow(frame: pd.DataFrame) -> pa.Table:
+    """`frame` as an Arrow table with categorical columns stored as plain
+    strings: an IPC file can't carry a different dictionary per batch, and
+    successive appends each build their own categories."""
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    fields = [
+        pa.field(f.name, f.type.value_type) if pa.types.is_dictionary(f.type) else f
+        for f in table.schema
+    ]
+    return table.cast(pa.schema(fields))
@@ -0,0 +1,324 @@
+"""backend/live_client/rate_limit.py
+
+Shared request-rate budget for NBAStatsClient — a token bucket per host
+(stats.nba.com and cdn.nba.com are rate-limited independently upstream, so
+they get independent budgets here too).
+
+Replaces the per-call `time.sleep(REQUEST_PACING_SECONDS)` the refresh jobs
+used to do between requests. A fixed sleep paces *callers*; a token bucket
+paces *requests*, which is what NBA.com actually limits on — so several
+workers can share one budget (see batch.py) without any of them sleeping
+while another one's request is in flight. Only actual network attempts spend
+a token: the bucket is consulted inside the client, so a cache hit (which
+never reaches the client) never waits on it.
+
+AdaptiveRateLimiter goes one step further and learns the rate instead of
+taking a fixed one: AIMD (additive increase, multiplicative decrease, as in
+TCP congestion control). Each clean response nudges a host's rate up a
+little; each throttle signal — a 429, a 403, a read timeout, or a 200 whose
+body is NBA.com's HTML error page rather than JSON — halves it, and a
+Retry-After header pauses the host outright for as long as it asks. The
+client reports these outcomes (see client.py / async_client.py); plain
+HostRateLimiter accepts the same reports and ignores them. Learned rates
+persist to a small JSON file between runs, so a refresh job starts at
+whatever rate the last one settled on instead of re-learning it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+# Status codes NBA.com answers with when it's throttling a client: 429 where
+# it's honest about it, 403 (with an Akamai HTML page) more often.
+THROTTLE_STATUS_CODES = frozenset({403, 429})
+
+# The fixed pace every refresh job used before AdaptiveRateLimiter (one
+# request per 0.6s) — still the starting point on a first run.
+DEFAULT_RATE_PER_SECOND = 1 / 0.6
+DEFAULT_MIN_RATE_PER_SECOND = 0.2
+DEFAULT_MAX_RATE_PER_SECOND = 5.0
+# Per clean response. From the default start that's ~150 clean responses in
+# a row to reach the ceiling — slow enough that one good minute doesn't
+# undo a throttle, fast enough that a 600-call refresh gets the benefit.
+DEFAULT_INCREASE_PER_SUCCESS = 0.02
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_STATE_PATH = Path(__file__).resolve().parent / ".cache" / "pacing.json"
+# Successes between state-file writes (throttles always write immediately).
+SAVE_EVERY_SUCCESSES = 50
+
+
+class TokenBucket:
+    """Classic token bucket: refills at `rate_per_second`, holds at most
+    `burst` tokens. `acquire()` blocks until a token is available.
+
+    Thread-safe. Waiters *reserve* their token up front (the bucket may go
+    negative) and then sleep off the debt outside the lock, so N concurrent
+    callers are spaced 1/rate apart instead of all waking at once and racing.
+    """
+
+    def __init__(self, rate_per_second: float, burst: float = 1.0):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._not_before = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_second)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """Takes one token and returns how long the caller must wait before
+        using it (0.0 if one was already available)."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = max(0.0, -self._tokens / self.rate_per_second)
+            return max(wait, self._not_before - now)
+
+    def set_rate(self, rate_per_second: float) -> None:
+        """Changes the refill rate from now on; tokens already accrued at the
+        old rate are kept."""
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate_per_second = rate_per_second
+
+    def pause(self, seconds: float) -> None:
+        """No token is handed out for the next `seconds` (a Retry-After)."""
+        with self._lock:
+            self._not_before = max(self._not_before, time.monotonic() + seconds)
+
+    def acquire(self) -> float:
+        """Blocks until a token is available. Returns the seconds waited."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self) -> float:
+        """acquire() for async callers — awaits instead of blocking the loop."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """One TokenBucket per host, created on first use with the same rate.
+
+    Parameters
+    ----------
+    rate_per_second : float
+        Sustained requests/second allowed per host.
+    burst : float
+        How many requests may go out back-to-back after an idle period.
+        Defaults to 1 — NBA.com's limiter is undocumented, so no bursting
+        beyond the sustained rate unless a caller opts in.
+    """
+
+    def __init__(self, rate_per_second: float, burst: float = 1.0):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self._initial_rate(host), self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _initial_rate(self, host: str) -> float:
+        return self.rate_per_second
+
+    def acquire(self, url_or_host: str) -> float:
+        return self.bucket(host_of(url_or_host)).acquire()
+
+    async def aacquire(self, url_or_host: str) -> float:
+        return await self.bucket(host_of(url_or_host)).aacquire()
+
+    # Outcome reports from the client. A fixed-rate limiter has nothing to
+    # learn from them; AdaptiveRateLimiter overrides both.
+
+    def record_success(self, url_or_host: str) -> None:
+        pass
+
+    def record_throttle(self, url_or_host: str, retry_after: float | None = None) -> None:
+        pass
+
+
+class AdaptiveRateLimiter(HostRateLimiter):
+    """HostRateLimiter whose per-host rate is learned by AIMD (see module
+    docstring).
+
+    Parameters
+    ----------
+    rate_per_second : float
+        Starting rate for a host with no persisted state.
+    min_rate_per_second, max_rate_per_second : float
+        Bounds the learned rate never leaves.
+    increase_per_success : float
+        Added to a host's rate (requests/second) per clean response.
+    decrease_factor : float
+        A host's rate is multiplied by this on a throttle signal. Repeated
+        signals within one request interval count once — a burst of
+        in-flight requests all hitting the same throttle is one event.
+    state_path : Path | str | None
+        JSON file learned rates are loaded from and saved to; `None` keeps
+        them in memory only.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: float = 1.0,
+        min_rate_per_second: float = DEFAULT_MIN_RATE_PER_SECOND,
+        max_rate_per_second: float = DEFAULT_MAX_RATE_PER_SECOND,
+        increase_per_success: float = DEFAULT_INCREASE_PER_SUCCESS,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        state_path: Path | str | None = DEFAULT_STATE_PATH,
+    ):
+        super().__init__(rate_per_second, burst)
+        self.min_rate_per_second = min_rate_per_second
+        self.max_rate_per_second = max_rate_per_second
+        self.increase_per_success = increase_per_success
+        self.decrease_factor = decrease_factor
+        self.state_path = Path(state_path) if state_path is not None else None
+        self.throttles = 0
+        self._learned = self._load()
+        self._last_decrease: dict[str, float] = {}
+        self._unsaved_successes = 0
+
+    def _clamp(self, rate: float) -> float:
+        return min(self.max_rate_per_second, max(self.min_rate_per_second, rate))
+
+    def _initial_rate(self, host: str) -> float:
+        return self._clamp(self._learned.get(host, self.rate_per_second))
+
+    def rate(self, url_or_host: str) -> float:
+        return self.bucket(host_of(url_or_host)).rate_per_second
+
+    def rates(self) -> dict[str, float]:
+        with self._lock:
+            return {host: bucket.rate_per_second for host, bucket in self._buckets.items()}
+
+    def record_success(self, url_or_host: str) -> None:
+        bucket = self.bucket(host_of(url_or_host))
+        bucket.set_rate(self._clamp(bucket.rate_per_second + self.increase_per_success))
+        with self._lock:
+            self._unsaved_successes += 1
+            due = self._unsaved_successes >= SAVE_EVERY_SUCCESSES
+        if due:
+            self.save()
+
+    def record_throttle(self, url_or_host: str, retry_after: float | None = None) -> None:
+        host = host_of(url_or_host)
+        bucket = self.bucket(host)
+        if retry_after:
+            bucket.pause(retry_after)
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_decrease.get(host, float("-inf")) < 1 / bucket.rate_per_second:
+                return
+            self._last_decrease[host] = now
+            self.throttles += 1
+        bucket.set_rate(self._clamp(bucket.rate_per_second * self.decrease_factor))
+        self.save()
+
+    def _load(self) -> dict[str, float]:
+        if self.state_path is None:
+            return {}
+        try:
+            state = json.loads(self.state_path.read_text())
+            return {host: float(rate) for host, rate in state.get("rates", {}).items()}
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError, TypeError, ValueError):
+            return {}
+
+    def save(self) -> None:
+        """Writes the current per-host rates to `state_path` (atomically —
+        a crash mid-write leaves the previous file, never a torn one)."""
+        with self._lock:
+            self._unsaved_successes = 0
+            self._learned.update({host: b.rate_per_second for host, b in self._buckets.items()})
+            learned = dict(self._learned)
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps({"rates": learned, "saved_at": time.time()}, indent=2))
+        os.replace(tmp, self.state_path)
+
+
+_DEFAULT_PACER: AdaptiveRateLimiter | None = None
+_DEFAULT_PACER_LOCK = threading.Lock()
+
+
+def default_pacer() -> AdaptiveRateLimiter:
+    """The process-wide AdaptiveRateLimiter every refresh job paces through,
+    so jobs running in one process (the API's background loop) share one
+    view of how hard NBA.com can be pushed right now."""
+    global _DEFAULT_PACER
+    with _DEFAULT_PACER_LOCK:
+        if _DEFAULT_PACER is None:
+            _DEFAULT_PACER = AdaptiveRateLimiter()
+        return _DEFAULT_PACER
+
+
+def set_default_pacer(pacer: AdaptiveRateLimiter | None) -> AdaptiveRateLimiter | None:
+    """Swaps the limiter default_pacer() hands out (None: build a fresh one
+    from DEFAULT_STATE_PATH on next use) and returns the previous one, for
+    harnesses that must not learn into, or from, the production state file
+    (see ratings/benchmark_refreshes.py)."""
+    global _DEFAULT_PACER
+    with _DEFAULT_PACER_LOCK:
+        previous, _DEFAULT_PACER = _DEFAULT_PACER, pacer
+        return previous
+
+
+def parse_retry_after(value) -> float | None:
+    """A Retry-After header value (delta-seconds or an HTTP-date) as seconds
+    from now, or None if absent/unparseable."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_throttle(status_code, error: BaseException | None, timeout_errors: tuple) -> bool:
+    """Whether one attempt's outcome says NBA.com wants us to slow down: a
+    throttle status, a read timeout, or a 200 whose body didn't parse (the
+    HTML error page). Shared by the sync and async clients, each passing its
+    own HTTP library's timeout exception types."""
+    if status_code in THROTTLE_STATUS_CODES:
+        return True
+    if error is not None and isinstance(error, timeout_errors):
+        return True
+    return status_code == 200 and isinstance(error, (ValueError, KeyError))
+
+
+def host_of(url_or_host: str) -> str:
+    """"https://stats.nba.com/stats/x" -> "stats.nba.com"; a bare host passes
+    through unchanged."""
+    return urlparse(url_or_host).netloc or url_or_host
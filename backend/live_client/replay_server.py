@@ -0,0 +1,343 @@
+"""backend/live_client/replay_server.py
+
+A local stand-in for stats.nba.com and cdn.nba.com that replays responses
+recorded in a DiskCache, with injectable latency and failures — for
+load-testing the client (concurrency, pacing, caching) repeatably and
+without spending NBA.com's patience on it.
+
+Point a client at it with the base-URL overrides (client.BaseURLs):
+
+  NBA_STATS_BASE_URL=http://127.0.0.1:<port>/stats
+  NBA_LIVE_BASE_URL=http://127.0.0.1:<port>/static/json/liveData
+
+Nothing else changes: endpoints build the same requests, nba_api's HTTP
+layer included, and the client's retries, rate limiter and circuit breaker
+all see real HTTP.
+
+Matching a request to a recording: cache file names are hashes (cache.
+cache_key), so, as in cache_bundle.py, the payload itself says what it
+answers. stats.nba.com echoes its `resource` and request `parameters`; a
+request matches the recording of that resource whose parameters agree with
+its query string (case-insensitively, ignoring parameters the request didn't
+send), preferring the one agreeing on the most. The V3/live feeds carry no
+echo, so they're routed by root key (`_ROOT_ROUTES`) and matched on the game
+ID or season inside. No match is a 404 — which the client retries like any
+other error status, so a recording gap shows up in the retry counts.
+
+Faults (FaultConfig), drawn per request from one seeded RNG so a run can be
+replayed exactly:
+  - latency (+ uniform jitter) before every answer
+  - throttle: 429 with a Retry-After header, NBA.com's explicit "slow down"
+  - error: a 500
+  - hang: hold the connection for `hang_seconds`, then drop it unanswered —
+    NBA.com's other way of throttling (a read timeout, once hang_seconds
+    exceeds the client's timeout)
+
+Served bodies carry an ETag and honor If-None-Match, so conditional live
+polling (Endpoint.conditional_requests) behaves as against cdn.nba.com.
+
+stdlib only (http.server); one thread per connection, plenty for a client
+pool of DEFAULT_MAX_CONNECTIONS.
+
+CLI (from repo root):
+  python -m backend.live_client.replay_server --port 8765 --latency 0.05 --throttle-rate 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from .cache import DEFAULT_CACHE_DIR
+
+logger = logging.getLogger("basketball_predictions.live_client.replay_server")
+
+STATS_PREFIX = "/stats/"
+LIVE_PREFIX = "/static/json/liveData/"
+
+# Recordings without a stats.nba.com `resource` echo: root key -> the route
+# (lowercased nba_api endpoint name, or live feed name) they answer, and the
+# request parameter their identifying field stands for.
+_ROOT_ROUTES = {
+    "boxScoreTraditional": ("boxscoretraditionalv3", "gameId", "GameID"),
+    "leagueSchedule": ("scheduleleaguev2", "seasonYear", "Season"),
+    "scoreboard": ("todaysscoreboard", None, None),
+}
+_GAME_ID_IN_PATH = re.compile(r"(\d{10})")
+
+
+@dataclass
+class FaultConfig:
+    """What to inject, per request. Rates are probabilities in [0, 1],
+    drawn independently in the order throttle, error, hang."""
+
+    latency_seconds: float = 0.0
+    jitter_seconds: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    error_rate: float = 0.0
+    hang_rate: float = 0.0
+    hang_seconds: float = 5.0
+    seed: int | None = None
+
+
+def _normalized(params: dict) -> dict[str, str]:
+    return {str(k).lower(): str(v).lower() for k, v in params.items() if v not in (None, "")}
+
+
+class ReplayIndex:
+    """Recorded payloads from a DiskCache directory, by route."""
+
+    def __init__(self, cache_dir: Path | str = DEFAULT_CACHE_DIR):
+        self._routes: dict[str, list[tuple[dict[str, str], bytes]]] = defaultdict(list)
+        for path in sorted(Path(cache_dir).glob("*.json")):
+            try:
+                payload = path.read_bytes()
+                route, identity = self._identify(json.loads(payload))
+            except (OSError, ValueError):
+                continue
+            if route is not None:
+                self._routes[route].append((_normalized(identity), payload))
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._routes.values())
+
+    @staticmethod
+    def _identify(data) -> tuple[str | None, dict]:
+        if not isinstance(data, dict):
+            return None, {}
+        if isinstance(data.get("resource"), str):
+            return data["resource"].lower(), data.get("parameters") or {}
+        game = data.get("game")
+        if isinstance(game, dict):
+            # PlayByPlayV3 and the live box score share a root key.
+            route = "playbyplayv3" if "actions" in game else "boxscore"
+            return route, {"GameID": game.get("gameId")}
+        for root, (route, field, param) in _ROOT_ROUTES.items():
+            if isinstance(data.get(root), dict):
+                return route, {param: data[root].get(field)} if field else {}
+        return None, {}
+
+    def lookup(self, path: str, query: dict) -> bytes | None:
+        """The recorded body answering a GET of `path` with `query`, or None."""
+        if path.startswith(STATS_PREFIX):
+            route = path[len(STATS_PREFIX):].strip("/").lower()
+        elif path.startswith(LIVE_PREFIX):
+            # .../boxscore/boxscore_<gameId>.json, .../scoreboard/todaysScoreboard_00.json
+            name = path.rsplit("/", 1)[-1].lower()
+            route = "todaysscoreboard" if name.startswith("todaysscoreboard") else name.split("_", 1)[0]
+        else:
+            return None
+        wanted = _normalized(query)
+        if "gameid" not in wanted and (match := _GAME_ID_IN_PATH.search(path)):
+            wanted["gameid"] = match.group(1)
+
+        best, best_score = None, -1
+        for identity, payload in self._routes.get(route, ()):
+            shared = identity.keys() & wanted.keys()
+            if any(identity[k] != wanted[k] for k in shared):
+                continue
+            if len(shared) > best_score:
+                best, best_score = payload, len(shared)
+        return best
+
+
+class ReplayServer:
+    """Serves a ReplayIndex over HTTP on a background thread; a context
+    manager. `port=0` picks a free port — read it back from `port`."""
+
+    def __init__(
+        self,
+        cache_dir: Path | str = DEFAULT_CACHE_DIR,
+        faults: FaultConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.index = ReplayIndex(cache_dir)
+        self.faults = faults or FaultConfig()
+        self._rng = random.Random(self.faults.seed)
+        self._lock = threading.Lock()
+        self._closing = threading.Event()
+        self._counts: Counter = Counter()
+        self._urls: set[str] = set()
+        self._httpd = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self._httpd.server_address[0]}:{self.port}"
+
+    @property
+    def stats_base_url(self) -> str:
+        return self.base_url + STATS_PREFIX.rstrip("/")
+
+    @property
+    def live_base_url(self) -> str:
+        return self.base_url + LIVE_PREFIX.rstrip("/")
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        logger.info("replaying %d recorded responses at %s", len(self.index), self.base_url)
+        return self
+
+    def stop(self) -> None:
+        self._closing.set()  # releases any hung connections
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def stats(self) -> dict:
+        """Request counts so far: `requests` received; how each was answered
+        (`served`, `not_modified`, `misses`, `throttles`, `errors`, `hangs`);
+        and `distinct_urls` — so requests − distinct_urls is how many were
+        repeats of an earlier request, i.e. client retries on a cold cache."""
+        with self._lock:
+            counts = {name: self._counts[name] for name in
+                      ("requests", "served", "not_modified", "misses", "throttles", "errors", "hangs")}
+            counts["distinct_urls"] = len(self._urls)
+        return counts
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._urls.clear()
+
+    def _record_request(self, url: str) -> None:
+        with self._lock:
+            self._counts["requests"] += 1
+            self._urls.add(url)
+
+    def _record(self, outcome: str) -> None:
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def _draw_fault(self) -> tuple[str | None, float]:
+        f = self.faults
+        with self._lock:
+            delay = f.latency_seconds + (self._rng.uniform(0, f.jitter_seconds) if f.jitter_seconds else 0.0)
+            for name, rate in (("throttle", f.throttle_rate), ("error", f.error_rate), ("hang", f.hang_rate)):
+                if rate and self._rng.random() < rate:
+                    return name, delay
+        return None, delay
+
+
+def _handler_for(server: ReplayServer) -> type[BaseHTTPRequestHandler]:
+    class _ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real hosts
+
+        def do_GET(self):
+            server._record_request(self.path)
+            fault, delay = server._draw_fault()
+            if delay:
+                server._closing.wait(delay)
+            if fault == "hang":
+                server._record("hangs")
+                server._closing.wait(server.faults.hang_seconds)
+                self.close_connection = True
+                return
+            if fault == "throttle":
+                server._record("throttles")
+                return self._reply(429, b"Too Many Requests", {"Retry-After": str(server.faults.retry_after)})
+            if fault == "error":
+                server._record("errors")
+                return self._reply(500, b"Internal Server Error")
+
+            parts = urlsplit(self.path)
+            body = server.index.lookup(parts.path, dict(parse_qsl(parts.query, keep_blank_values=True)))
+            if body is None:
+                server._record("misses")
+                return self._reply(404, b"No recorded response")
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            if self.headers.get("If-None-Match") == etag:
+                server._record("not_modified")
+                return self._reply(304, b"", {"ETag": etag})
+            server._record("served")
+            self._reply(200, body, {"Content-Type": "application/json", "ETag": etag})
+
+        def _reply(self, status: int, body: bytes, headers: dict | None = None):
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(format, *args)
+
+    return _ReplayHandler
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m backend.live_client.replay_server", description=__doc__.split("\n\n")[1])
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="DiskCache directory to replay")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    server = ReplayServer(args.cache_dir, fault_config(args), args.host, args.port)
+    print(f"Replaying {len(server.index)} recorded responses. Point clients at it with:")
+    print(f"  NBA_STATS_BASE_URL={server.stats_base_url}")
+    print(f"  NBA_LIVE_BASE_URL={server.live_base_url}")
+    with server:
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    print(json.dumps(server.stats()))
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    """FaultConfig's fields as CLI flags (shared with the benchmark)."""
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds, uniform")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction answered 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on a 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction answered 500")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="fraction held open, then dropped")
+    parser.add_argument("--hang-seconds", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=None, help="fault RNG seed, for a repeatable run")
+
+
+def fault_config(args: argparse.Namespace) -> FaultConfig:
+    return FaultConfig(
+        latency_seconds=args.latency,
+        jitter_seconds=args.jitter,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
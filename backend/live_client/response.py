@@ -8,49 +8,189 @@ backend/AGENTS.md).
 from __future__ import annotations
 
 import json
+from typing import Callable, Mapping, Sequence
 
 import pandas as pd
 
+from .streaming import read_columns, stream_result_set
+
 
 class NBAResponse:
     """Wraps one endpoint's raw JSON response.
 
-    Two ways to build the dataframe view:
-      - `result_set_name` (stats.nba.com endpoints): parsed lazily via the
-        generic `resultSets: [{name, headers, rowSet}]` shape shared by every
-        endpoints/stats/ class.
-      - `dataframe` (live/ endpoints): passed in pre-built, since cdn.nba.com's
-        nested-object JSON shape has no generic tabular form — each live
-        endpoint knows how to flatten its own response.
+    Three ways to get the dataframe view, all lazy except the first:
+      - `dataframe`: passed in pre-built (a columnar cache hit, or an
+        endpoint that builds its frame some other way up front).
+      - `result_set_name` (stats.nba.com endpoints): parsed on first
+        to_dataframe() via the generic `resultSets: [{name, headers,
+        rowSet}]` shape shared by every endpoints/stats/ class.
+      - `dataframe_builder` (live/ endpoints and other nested-JSON shapes):
+        a no-arg callable run on first to_dataframe(), since cdn.nba.com's
+        nested-object JSON has no generic tabular form — each such endpoint
+        knows how to flatten its own response.
+
+    `columns()` answers "which columns will the frame have?" without
+    building it wherever the answer is already in the payload: the
+    resultSets header list, or a `columns` list (or callable) the endpoint
+    declares. That's what Endpoint.fetch() validates against, so a caller
+    that only wants to_dict() never pays for a full parse.
+
+    The raw JSON itself can be deferred too: pass `raw_loader` (a no-arg
+    callable returning the raw dict) instead of `raw`, and it's only called
+    the first time to_dict()/to_json() needs it. Endpoint.fetch() does this
+    on a columnar cache hit (see cache.py), where the dataframe is already
+    in hand and most callers never look at the raw payload at all.
+
+    `on_dataframe(callback)` registers a callback for the frame once it
+    exists (Endpoint uses it to fill the columnar cache tier only when
+    someone actually parsed the response).
+
+    `raw` may also be the response body as bytes, exactly as it came off
+    the wire or out of the cache (Endpoint does this for `stream_response`
+    endpoints). Nothing is then decoded up front: columns() reads just the
+    header list, the resultSets parse streams rowSet rows straight into
+    column buffers (see streaming.py), and the dict only exists if someone
+    calls to_dict(). `to_bytes()` hands that body back as-is, for callers
+    that stream it themselves (see play_by_play_store.py).
+
+    `dtypes` (column -> dtype, from the endpoint's declaration) types the
+    resultSets parse — see frame_from_rows().
     """
 
     def __init__(
         self,
-        raw: dict,
+        raw: dict | bytes | None = None,
         dataframe: pd.DataFrame | None = None,
         result_set_name: str | None = None,
+        raw_loader: Callable[[], dict] | None = None,
+        dataframe_builder: Callable[[], pd.DataFrame] | None = None,
+        columns: Sequence[str] | Callable[[], Sequence[str]] | None = None,
+        dtypes: Mapping[str, str] | None = None,
+        bytes_loader: Callable[[], bytes] | None = None,
     ):
-        if dataframe is None and result_set_name is None:
-            raise ValueError("NBAResponse needs either dataframe= or result_set_name=")
-        self._raw = raw
+        if dataframe is None and result_set_name is None and dataframe_builder is None:
+            raise ValueError("NBAResponse needs one of dataframe=, result_set_name= or dataframe_builder=")
+        if raw is None and raw_loader is None:
+            raise ValueError("NBAResponse needs either raw or raw_loader=")
+        self._raw_bytes = raw if isinstance(raw, (bytes, bytearray)) else None
+        self._raw_text: str | None = None
+        self._raw = None if self._raw_bytes is not None else raw
+        self._raw_loader = raw_loader
         self._dataframe = dataframe
         self._result_set_name = result_set_name
+        self._dataframe_builder = dataframe_builder
+        self._columns = columns
+        self._dtypes = dtypes
+        self._bytes_loader = bytes_loader
+        self._on_dataframe: Callable[[pd.DataFrame], None] | None = None
 
     def to_dict(self) -> dict:
+        if self._raw is None:
+            if self._raw_bytes is not None:
+                self._raw = json.loads(self._raw_text if self._raw_text is not None else self._raw_bytes)
+                self._raw_text = None  # nothing streams from the text once the dict exists
+            else:
+                self._raw = self._raw_loader()
         return self._raw
 
     def to_json(self, **kwargs) -> str:
-        return json.dumps(self._raw, **kwargs)
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_bytes(self) -> bytes:
+        """The body as JSON bytes: exactly as received when this response
+        holds bytes (never decoded here), otherwise to_json() encoded."""
+        if self._raw_bytes is not None:
+            return bytes(self._raw_bytes)
+        if self._bytes_loader is not None:
+            return self._bytes_loader()
+        return self.to_json().encode()
+
+    def copy(self) -> "NBAResponse":
+        """A lazy view of this response for handing to one caller: it shares
+        this one's raw payload and parses (at most once) through it, but
+        gets its own shallow, copy-on-write dataframe — so one caller adding
+        a column can't leak into the next caller's frame. What the in-memory
+        cache and request coalescing hand out."""
+        return NBAResponse(
+            raw_loader=self.to_dict,
+            dataframe_builder=lambda: self.to_dataframe().copy(deep=False),
+            columns=self.columns,
+            bytes_loader=self.to_bytes,
+        )
+
+    def nbytes(self) -> int:
+        """Roughly how much memory this response holds right now: the body
+        if it's held as bytes, plus its decoded text while columns() has it
+        held for the parse, plus the dataframe's buffers once built (object
+        columns count their pointers, not the strings — a floor, cheap
+        enough to take on every memory-cache hit). A decoded dict isn't
+        counted."""
+        total = len(self._raw_bytes) if self._raw_bytes is not None else 0
+        if self._raw_text is not None:
+            total += len(self._raw_text)
+        if self._dataframe is not None:
+            total += int(self._dataframe.memory_usage(index=True, deep=False).sum())
+        return total
+
+    def on_dataframe(self, callback: Callable[[pd.DataFrame], None]) -> None:
+        """Calls `callback(frame)` once the dataframe exists — right away if
+        it already does, otherwise on the first to_dataframe()."""
+        if self._dataframe is not None:
+            callback(self._dataframe)
+        else:
+            self._on_dataframe = callback
+
+    def columns(self) -> list[str]:
+        """The dataframe's column names — from the already-built frame, the
+        declared `columns`, or the resultSets header list, building the
+        frame only when none of those is available."""
+        if self._dataframe is not None:
+            return list(self._dataframe.columns)
+        if self._columns is not None:
+            return list(self._columns() if callable(self._columns) else self._columns)
+        if self._result_set_name is not None:
+            if self._streamable():
+                return stream_result_set(self._text(), self._result_set_name)[0]
+            return list(self._find_result_set(self._result_set_name)["headers"])
+        return list(self.to_dataframe().columns)
 
     def to_dataframe(self) -> pd.DataFrame:
         if self._dataframe is None:
-            self._dataframe = self._parse_result_sets(self._result_set_name)
+            if self._dataframe_builder is not None:
+                self._dataframe = self._dataframe_builder()
+            else:
+                self._dataframe = self._parse_result_sets(self._result_set_name)
+            if self._on_dataframe is not None:
+                self._on_dataframe(self._dataframe)
         return self._dataframe
 
+    def _streamable(self) -> bool:
+        # Once to_dict() has decoded the body, reading the dict is cheaper
+        # than re-scanning the text.
+        return self._raw is None and self._raw_bytes is not None
+
+    def _text(self) -> str:
+        # Decoded once: columns() (at validation) and the parse both scan it.
+        if self._raw_text is None:
+            self._raw_text = self._raw_bytes.decode()
+        return self._raw_text
+
     def _parse_result_sets(self, name: str) -> pd.DataFrame:
-        result_sets = self._raw.get("resultSets")
+        if self._streamable():
+            headers, rows = stream_result_set(self._text(), name)
+            frame = frame_from_columns(headers, read_columns(rows, len(headers)), self._dtypes)
+            # The frame answers columns() from here on, and to_dict() can
+            # decode the bytes itself — don't keep a second copy of the body.
+            self._raw_text = None
+            return frame
+        chosen = self._find_result_set(name)
+        return frame_from_rows(chosen["rowSet"], chosen["headers"], self._dtypes)
+
+    def _find_result_set(self, name: str) -> dict:
+        raw = self.to_dict()
+        result_sets = raw.get("resultSets")
         if result_sets is None:
-            single = self._raw.get("resultSet")
+            single = raw.get("resultSet")
             result_sets = [single] if single else None
         if not result_sets:
             raise ValueError(
@@ -63,5 +203,84 @@ class NBAResponse:
             available = [rs.get("name") for rs in result_sets]
             raise ValueError(f"No resultSet named {name!r} in response; available: {available}")
 
-        chosen = matches[0]
-        return pd.DataFrame(chosen["rowSet"], columns=chosen["headers"])
+        return matches[0]
+
+
+# Dtypes a null can't be stored in: a None in a column declared as one of
+# these leaves that column to pandas' inference instead (bool would
+# otherwise turn None into False without complaint).
+_NULL_INTOLERANT_KINDS = frozenset("biu")
+
+
+def frame_from_rows(
+    rows: Sequence[Sequence],
+    headers: Sequence[str],
+    dtypes: Mapping[str, str] | None = None,
+) -> pd.DataFrame:
+    """A stats.nba.com resultSet (`rowSet` rows under `headers`) as a
+    DataFrame, built column by column from the transposed rows so each
+    column is constructed once at its final dtype.
+
+    `pd.DataFrame(rows, columns=headers)` goes through one object array for
+    the whole table and leaves every column int64/float64/Python-string; a
+    league shot chart is ~200k rows, where int16 coordinates and categorical
+    zone names are several times smaller and group faster. Columns missing
+    from `dtypes` are inferred exactly as before. A declared dtype the data
+    doesn't fit (a null in an integer column, a value out of range) falls
+    back to inference for that column rather than failing the parse — the
+    declaration is an optimization, schema enforcement is expected_columns'
+    job. A row that isn't one cell per header is a ValueError, as it is
+    from pd.DataFrame() and the streaming parse (streaming.read_columns()).
+    """
+    headers = list(headers)
+    if not dtypes or len(set(headers)) != len(headers):
+        return pd.DataFrame(rows, columns=headers)
+    return frame_from_columns(headers, read_columns(iter(rows), len(headers)), dtypes)
+
+
+def frame_from_columns(
+    headers: Sequence[str],
+    columns: Sequence[Sequence],
+    dtypes: Mapping[str, str] | None = None,
+) -> pd.DataFrame:
+    """frame_from_rows() for data that's already column-major (one sequence
+    per header, e.g. the streaming parser's column buffers)."""
+    headers = list(headers)
+    if len(set(headers)) != len(headers):
+        return pd.DataFrame(list(zip(*columns)), columns=headers)
+    dtypes = dtypes or {}
+    return pd.DataFrame(
+        {name: _typed_column(values, dtypes.get(name)) for name, values in zip(headers, columns)},
+        columns=headers,
+    )
+
+
+def _typed_column(values: Sequence, dtype: str | None):
+    if dtype is None:
+        return pd.Series(values, dtype=None if values else object)
+    if pd.api.types.pandas_dtype(dtype).kind in _NULL_INTOLERANT_KINDS and any(v is None for v in values):
+        return pd.Series(values)
+    try:
+        return pd.Series(values, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        return pd.Series(values)
+
+
+def json_normalize_columns(records: list[dict], sep: str = ".") -> list[str]:
+    """The column names `pd.json_normalize(records, sep=sep)` would produce
+    (nested dicts flattened to "a.b" paths, an empty dict dropped, everything
+    else a leaf), in first-seen order — without building the frame. Lets nested-JSON
+    endpoints declare their columns for header-only validation."""
+    seen: dict[str, None] = {}
+
+    def _walk(record: dict, prefix: str) -> None:
+        for key, value in record.items():
+            name = f"{prefix}{key}"
+            if isinstance(value, dict):
+                _walk(value, f"{name}{sep}")
+            else:
+                seen.setdefault(name, None)
+
+    for record in records:
+        _walk(record, "")
+    return list(seen)
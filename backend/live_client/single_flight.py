@@ -0,0 +1,159 @@
+"""backend/live_client/single_flight.py
+
+Request coalescing ("single-flight") for Endpoint.fetch()/afetch(): when
+several callers miss the cache for the same endpoint + params at once, only
+the first one goes to NBA.com; the rest wait for its result instead of each
+spending a rate-limit token (see rate_limit.py) on an identical request. The
+usual way this happens is the API's background refresh loop running two jobs
+that share inputs (player projections and roster projection both read every
+team's roster), or batch.fetch_many workers handed overlapping endpoints.
+
+Two layers, because callers overlap at two levels:
+  - `SingleFlight` coalesces within one process — threads via `do()`,
+    coroutines on one event loop via `ado()`.
+  - `FileLock` coalesces across processes (the API and a cron refresh job
+    sharing one cache directory): the cache backend hands out a per-key
+    advisory lock, and whoever gets it second re-checks the cache before
+    fetching, finding the first process's freshly written entry instead.
+    POSIX-only (fcntl); elsewhere the lock is a no-op and only the
+    in-process layer applies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+try:
+    import fcntl
+except ImportError:  # Windows — see module docstring
+    fcntl = None
+
+# How often a FileLock waiter on the event loop re-tries a non-blocking
+# acquire; sleeping in flock() itself would stall every other coroutine.
+ASYNC_LOCK_POLL_SECONDS = 0.05
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers with the
+    same key share its outcome — the very same value object, or the same
+    exception re-raised. Callers handing out mutable results should copy
+    them (Endpoint returns NBAResponse.copy()). `shared_calls` counts the
+    callers that waited instead of running the call themselves.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._async_calls: dict[tuple[int, str], asyncio.Future] = {}
+        self.shared_calls = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared_calls += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+        try:
+            call.value = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        # Keyed per event loop: an asyncio.Future can only be awaited from
+        # the loop that created it.
+        loop_key = (id(asyncio.get_running_loop()), key)
+        future = self._async_calls.get(loop_key)
+        if future is not None:
+            self.shared_calls += 1
+            # shield(): one waiter being cancelled must not cancel the
+            # leader's fetch out from under everyone else.
+            return await asyncio.shield(future)
+        future = asyncio.get_running_loop().create_future()
+        self._async_calls[loop_key] = future
+        try:
+            value = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved, so a flight nobody else joined doesn't log
+            # "exception was never retrieved".
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            del self._async_calls[loop_key]
+        return value
+
+
+class FileLock:
+    """Exclusive advisory lock on `path` (created if missing), held for the
+    duration of a `with` block. Sync callers block in flock(); async callers
+    use `await alock()`, which polls without blocking the event loop."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._fd: int | None = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        if fcntl is None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+    async def alock(self) -> "FileLock":
+        while not self.acquire(blocking=False):
+            await asyncio.sleep(ASYNC_LOCK_POLL_SECONDS)
+        return self
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
+# Shared by every Endpoint in the process (see endpoints/base.py).
+SINGLE_FLIGHT = SingleFlight()
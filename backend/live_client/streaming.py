@@ -0,0 +1,213 @@
+"""backend/live_client/streaming.py
+
+Incremental reads out of a raw NBA.com response body, for the endpoints whose
+responses are big enough that parsing them whole is the expensive part — a
+league-wide shot chart (~200k rowSet rows), a play-by-play log (~500 action
+objects per game, thousands across a multi-game pull).
+
+`json.loads()` on such a body builds a Python list/dict/str/int object for
+every cell before anything else can happen, and response.py used to keep
+that whole tree alive next to the DataFrame built from it. Here the body
+stays a string; a cursor walks its structure and decodes only the values it
+is asked for, one at a time (each via the stdlib's C scanner, `raw_decode`),
+so rowSet rows can go straight into per-column buffers and be dropped.
+Values the caller skips (a response's "parameters" block, other resultSets)
+are decoded and thrown away individually — they're small.
+
+Only the structure NBA.com actually sends is supported: objects and arrays
+nested the usual way. Anything malformed raises ValueError, the same error
+json.loads() would have raised for it.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Iterator, Sequence
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _Cursor:
+    """A read position in one JSON document. `members()`/`items()` walk an
+    object's keys / an array's elements; the caller consumes each member's
+    value (`value()`, or by descending into it) before asking for the next."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def peek(self) -> str:
+        self.pos = _WHITESPACE.match(self.text, self.pos).end()
+        return self.text[self.pos:self.pos + 1]
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} of response body")
+        self.pos += 1
+
+    def _next_or_end(self, end: str) -> bool:
+        char = self.peek()
+        self.pos += 1
+        if char == end:
+            return False
+        if char != ",":
+            raise ValueError(f"Expected ',' or {end!r} at offset {self.pos - 1} of response body")
+        return True
+
+    def value(self) -> Any:
+        self.peek()
+        value, self.pos = _DECODER.raw_decode(self.text, self.pos)
+        return value
+
+    def members(self) -> Iterator[str]:
+        self._expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self._expect(":")
+            yield key
+            if not self._next_or_end("}"):
+                return
+
+    def items(self) -> Iterator[None]:
+        self._expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield None
+            if not self._next_or_end("]"):
+                return
+
+    def is_object(self) -> bool:
+        return self.peek() == "{"
+
+
+def iter_array(text: str, path: Sequence[str]) -> Iterator[Any]:
+    """Yields the elements of the array at `path` (a sequence of object
+    keys from the document root), decoding one element at a time. Yields
+    nothing if the path isn't there."""
+    cursor = _Cursor(text)
+    for key in path:
+        if not cursor.is_object():
+            return
+        for member in cursor.members():
+            if member == key:
+                break
+            cursor.value()
+        else:
+            return
+    if cursor.peek() != "[":
+        return
+    for _ in cursor.items():
+        yield cursor.value()
+
+
+def read_member(text: str, key: str) -> Any:
+    """The value of the document root's `key`, decoding only the members
+    before it (and it); None if the root has no such key or isn't an
+    object."""
+    cursor = _Cursor(text)
+    if not cursor.is_object():
+        return None
+    for member in cursor.members():
+        if member == key:
+            return cursor.value()
+        cursor.value()
+    return None
+
+
+def stream_result_set(text: str, name: str) -> tuple[list[str], Iterator[list]]:
+    """The `headers` of the stats.nba.com resultSet called `name`, and an
+    iterator over its `rowSet` rows that decodes them one at a time.
+
+    Reads only as far into the document as it has to: the headers come
+    back before a single row has been decoded, so this is also how
+    NBAResponse.columns() answers without parsing the rows. (NBA.com always
+    sends `name`, `headers`, `rowSet` in that order; a result set that
+    doesn't is decoded whole instead of streamed.)
+
+    Raises ValueError, with the same messages as NBAResponse's dict-based
+    lookup, for a body that isn't resultSets-shaped or has no such set.
+    """
+    cursor = _Cursor(text)
+    available: list | None = None
+    for key in cursor.members():
+        if key == "resultSets":
+            available = []
+            for _ in cursor.items():
+                found = _read_result_set(cursor, name, available)
+                if found is not None:
+                    return found
+        elif key == "resultSet" and cursor.is_object():
+            available = []
+            found = _read_result_set(cursor, name, available)
+            if found is not None:
+                return found
+        else:
+            cursor.value()
+    if available is None:
+        raise ValueError(
+            "Response has neither 'resultSets' nor 'resultSet' — not a "
+            "stats.nba.com-shaped response. Pass dataframe= explicitly instead."
+        )
+    raise ValueError(f"No resultSet named {name!r} in response; available: {available}")
+
+
+def _read_result_set(cursor: _Cursor, name: str, available: list) -> tuple[list[str], Iterator[list]] | None:
+    """Reads one resultSet object. Returns (headers, rows) if it's `name` —
+    leaving the cursor mid-rowSet for the rows iterator to continue from —
+    otherwise consumes the whole object and returns None."""
+    seen: dict[str, Any] = {}
+    for key in cursor.members():
+        if key == "rowSet" and seen.get("name") == name and "headers" in seen:
+            return list(seen["headers"]), _rows(cursor)
+        seen[key] = cursor.value()
+    available.append(seen.get("name"))
+    if seen.get("name") == name:
+        return list(seen.get("headers", [])), iter(seen.get("rowSet", []))
+    return None
+
+
+def _rows(cursor: _Cursor) -> Iterator[list]:
+    for _ in cursor.items():
+        yield cursor.value()
+
+
+def read_columns(rows: Iterator[Sequence], n_columns: int) -> list[list]:
+    """Drains `rows` into one list per column, so each row can be freed as
+    soon as it's been read. A row that isn't `n_columns` long is a
+    ValueError, as pd.DataFrame(rows, columns=headers) would raise — rather
+    than silently misaligned columns."""
+    columns: list[list] = [[] for _ in range(n_columns)]
+    appends = [column.append for column in columns]
+    for i, row in enumerate(rows):
+        if len(row) != n_columns:
+            raise ValueError(f"rowSet row {i} has {len(row)} values for {n_columns} headers")
+        for append, cell in zip(appends, row):
+            append(cell)
+    return columns
+
+
+def read_record_columns(records: Iterator[dict]) -> dict[str, list]:
+    """Drains `records` (flat JSON objects, e.g. from iter_array()) into one
+    list per key, keys in first-seen order. A record missing a key gets a
+    None in that column, as it would from pd.DataFrame(records)."""
+    columns: dict[str, list] = {}
+    n_records = 0
+    for record in records:
+        for key, value in record.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * n_records
+            column.append(value)
+        n_records += 1
+        if len(record) != len(columns):
+            for column in columns.values():
+                if len(column) < n_records:
+                    column.append(None)
+    return columns
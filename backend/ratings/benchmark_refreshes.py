@@ -0,0 +1,155 @@
+"""backend/ratings/benchmark_refreshes.py
+
+Load-test harness: runs the refresh_* jobs end to end against a local
+replay of NBA.com (live_client/replay_server.py) and reports, per job, wall
+time, requests/sec and how many requests were retries.
+
+Each job runs exactly as in production — its own clients, the shared
+default_pacer(), batch fetches, retries — with three things swapped out:
+NBA_STATS_BASE_URL / NBA_LIVE_BASE_URL point every client at the replay
+server, NBA_CACHE_DIR points every Endpoint at an empty scratch cache
+(the process-wide MEMORY_CACHE is cleared too), so each job's requests
+really go over HTTP instead of being answered by the very cache the server
+is replaying, and default_pacer() is a fresh in-memory AdaptiveRateLimiter
+per job — every job starts from the same rate, and nothing the replay
+teaches it lands in the production pacing state (rate_limit.py). Outputs
+aren't written (`write_output=False`).
+
+The numbers come from the server's side (ReplayServer.stats()): on a cold
+cache a job asks for each URL once, so every request beyond the distinct
+URLs is a retry — of an injected 429/500/hang, or of a 404 for a response
+that was never recorded (`misses`; record it by running the job for real
+first, or import a cache bundle).
+
+Run (from repo root):
+  python -m backend.ratings.benchmark_refreshes --jobs player_ratings team_style --latency 0.05 --throttle-rate 0.02 --seed 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from importlib import import_module
+
+from backend.live_client.cache import DEFAULT_CACHE_DIR, MEMORY_CACHE
+from backend.live_client.client import LIVE_BASE_URL_ENV, STATS_BASE_URL_ENV
+from backend.live_client.rate_limit import AdaptiveRateLimiter, set_default_pacer
+from backend.live_client.replay_server import FaultConfig, ReplayServer, add_fault_arguments, fault_config
+
+# Job name -> module; the API's background loop runs the async variant of
+# the first three (see api/main.py), so that's what gets measured by default.
+JOBS = {
+    "player_ratings": "backend.ratings.refresh_player_ratings",
+    "team_style": "backend.ratings.refresh_team_style",
+    "player_projections": "backend.ratings.refresh_player_projections",
+    "shot_heatmaps": "backend.ratings.refresh_shot_heatmaps",
+    "roster_projection": "backend.ratings.refresh_roster_projection",
+}
+
+
+@contextmanager
+def _environ(**values: str):
+    saved = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+@contextmanager
+def _scratch_pacer():
+    previous = set_default_pacer(AdaptiveRateLimiter(state_path=None))
+    try:
+        yield
+    finally:
+        set_default_pacer(previous)
+
+
+def _run_job(name: str, use_async: bool) -> None:
+    module = import_module(JOBS[name])
+    if use_async and hasattr(module, "arun_refresh"):
+        asyncio.run(module.arun_refresh(write_output=False))
+    else:
+        module.run_refresh(write_output=False)
+
+
+def run_benchmark(
+    jobs: list[str] | None = None,
+    recordings=DEFAULT_CACHE_DIR,
+    faults: FaultConfig | None = None,
+    use_async: bool = True,
+) -> list[dict]:
+    """Runs each of `jobs` (default: all of JOBS) once against a replay of
+    `recordings`; returns one result row per job."""
+    results = []
+    with ReplayServer(recordings, faults) as server:
+        for name in jobs or list(JOBS):
+            server.reset_stats()
+            MEMORY_CACHE.clear()
+            error = None
+            with tempfile.TemporaryDirectory(prefix="nba-bench-") as scratch, _environ(**{
+                STATS_BASE_URL_ENV: server.stats_base_url,
+                LIVE_BASE_URL_ENV: server.live_base_url,
+                "NBA_CACHE_DIR": scratch,
+                "NBA_CACHE_BACKEND": "files",
+            }), _scratch_pacer():
+                started = time.perf_counter()
+                try:
+                    _run_job(name, use_async)
+                except Exception as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+                wall = time.perf_counter() - started
+            stats = server.stats()
+            results.append({
+                "job": name,
+                "wall_seconds": round(wall, 3),
+                "requests_per_second": round(stats["requests"] / wall, 2) if wall else None,
+                "retries": stats["requests"] - stats["distinct_urls"],
+                **stats,
+                "error": error,
+            })
+    return results
+
+
+def _print_table(results: list[dict]) -> None:
+    columns = ["job", "wall_seconds", "requests", "requests_per_second", "retries",
+               "throttles", "errors", "hangs", "misses"]
+    widths = [max(len(c), *(len(str(r[c])) for r in results)) for c in columns]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    for row in results:
+        print("  ".join(str(row[c]).ljust(w) for c, w in zip(columns, widths)))
+    for row in results:
+        if row["error"]:
+            print(f"{row['job']} failed: {row['error']}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.ratings.benchmark_refreshes", description=__doc__.split("\n\n")[1]
+    )
+    parser.add_argument("--jobs", nargs="+", choices=list(JOBS), help="default: all")
+    parser.add_argument("--recordings", default=str(DEFAULT_CACHE_DIR), help="DiskCache directory to replay")
+    parser.add_argument("--sync", action="store_true", help="run_refresh() even where arun_refresh() exists")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.jobs, args.recordings, fault_config(args), use_async=not args.sync)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -27,19 +27,22 @@ Run manually: python -m backend.ratings.refresh_player_projections
 
 from __future__ import annotations
 
+import asyncio
 import json
-import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pandas as pd
 
+from backend.live_client.async_client import AsyncNBAStatsClient
+from backend.live_client.batch import afetch_all
 from backend.live_client.client import NBAStatsClient
 from backend.live_client.endpoints.stats.advanced_metrics import PlayerAdvancedStats
 from backend.live_client.endpoints.stats.season_totals import PlayerSeasonTotals
 from backend.live_client.endpoints.stats.shot_locations import PlayerShotLocations
 from backend.live_client.endpoints.stats.team_roster import TeamRoster
 from backend.live_client.lookups.loader import load_teams
+from backend.live_client.rate_limit import default_pacer
 from backend.ratings.player_development import (
     MULTISTAT_RATE_COLUMNS,
     build_archetype_curves,
@@ -61,7 +64,6 @@ DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
 # chosen specifically to build an archetype x age curve without the request
 # volume that already caused real rate-limiting once (see backend/AGENTS.md).
 N_HISTORICAL_SEASONS = 6
-REQUEST_PACING_SECONDS = 0.6
 
 PROJECTED_LEADERS_NOTE = (
     "PRESEASON PROJECTION -- there's no in-season ranking yet, because the season hasn't "
@@ -89,14 +91,26 @@ def _season_string(start_year: int) -> str:
     return f"{start_year}-{str(start_year + 1)[-2:]}"
 
 
+def _season_panel_endpoints(season: str, client) -> list:
+    """The three league-wide endpoints one season's panel is built from —
+    totals, advanced, shot locations, in the order _build_season_panel takes
+    them. Not per-player."""
+    return [
+        PlayerSeasonTotals(season=season, per_mode="PerGame", client=client),
+        PlayerAdvancedStats(season=season, client=client),
+        PlayerShotLocations(season=season, per_mode="PerGame", client=client),
+    ]
+
+
 def _fetch_season_panel(season: str, client: NBAStatsClient) -> pd.DataFrame:
     """One season's merged panel: PLAYER_ID, SEASON_ID, PLAYER_AGE, GP, ARCHETYPE,
     + every column in MULTISTAT_RATE_COLUMNS. League-wide (three calls total),
     not per-player."""
-    totals = PlayerSeasonTotals(season=season, per_mode="PerGame", client=client).fetch().to_dataframe()
-    advanced = PlayerAdvancedStats(season=season, client=client).fetch().to_dataframe()
-    shots = PlayerShotLocations(season=season, per_mode="PerGame", client=client).fetch().to_dataframe()
+    totals, advanced, shots = (e.fetch().to_dataframe() for e in _season_panel_endpoints(season, client))
+    return _build_season_panel(season, totals, advanced, shots)
 
+
+def _build_season_panel(season: str, totals: pd.DataFrame, advanced: pd.DataFrame, shots: pd.DataFrame) -> pd.DataFrame:
     three_pt_zones = ["Left Corner 3_FGA", "Right Corner 3_FGA", "Above the Break 3_FGA"]
     shots = shots.copy()
     shots["_total_fga"] = shots[[c for c in shots.columns if c.endswith("_FGA")]].sum(axis=1)
@@ -132,22 +146,65 @@ def run_refresh(target_season_start_year: int | None = None, write_output: bool
 
     teams = load_teams()
 
-    with NBAStatsClient() as client:
-        panels = []
-        for i, season in enumerate(historical_seasons):
-            if i > 0:
-                time.sleep(REQUEST_PACING_SECONDS)
-            panels.append(_fetch_season_panel(season, client))
+    with NBAStatsClient(rate_limiter=default_pacer()) as client:
+        panels = [_fetch_season_panel(season, client) for season in historical_seasons]
         full_panel = pd.concat(panels, ignore_index=True)
 
         rosters = {}
-        for i, (_, row) in enumerate(teams.iterrows()):
-            if i > 0:
-                time.sleep(REQUEST_PACING_SECONDS)
+        for _, row in teams.iterrows():
             rosters[row["full_name"]] = TeamRoster(
                 team_id=int(row["team_id"]), season=roster_season, client=client,
             ).fetch().to_dataframe()
 
+    return _build_payload(start_year, historical_seasons, full_panel, rosters, write_output)
+
+
+async def arun_refresh(target_season_start_year: int | None = None, write_output: bool = True) -> dict:
+    """run_refresh() on the event loop: the 3 x N_HISTORICAL_SEASONS panel
+    calls and the 30 roster calls all go out through one
+    AsyncNBAStatsClient, paced by the same shared adaptive pacer as the
+    sync path. Any failed fetch still raises, as in
+    run_refresh() -- a projection missing a season or a team isn't one --
+    and cancels the rest of the batch (see live_client.batch.afetch_all).
+    Everything after the fetch (parsing, the panel, the payload and its
+    file) runs in a worker thread, off the loop."""
+    start_year = target_season_start_year or current_roster_season_start_year()
+    roster_season = _season_string(start_year)
+    historical_seasons = [_season_string(start_year - 1 - i) for i in range(N_HISTORICAL_SEASONS)]
+
+    teams = load_teams()
+
+    async with AsyncNBAStatsClient(rate_limiter=default_pacer()) as client:
+        panel_endpoints = [e for season in historical_seasons for e in _season_panel_endpoints(season, client)]
+        roster_endpoints = [
+            TeamRoster(team_id=int(row["team_id"]), season=roster_season, client=client)
+            for _, row in teams.iterrows()
+        ]
+        responses = await afetch_all(panel_endpoints + roster_endpoints)
+
+    def _finish() -> dict:
+        frames = [r.to_dataframe() for r in responses]
+        panel_frames, roster_frames = frames[:len(panel_endpoints)], frames[len(panel_endpoints):]
+        full_panel = pd.concat(
+            [
+                _build_season_panel(season, *panel_frames[3 * i:3 * i + 3])
+                for i, season in enumerate(historical_seasons)
+            ],
+            ignore_index=True,
+        )
+        rosters = dict(zip(teams["full_name"], roster_frames))
+        return _build_payload(start_year, historical_seasons, full_panel, rosters, write_output)
+
+    return await asyncio.to_thread(_finish)
+
+
+def _build_payload(
+    start_year: int,
+    historical_seasons: list[str],
+    full_panel: pd.DataFrame,
+    rosters: dict[str, pd.DataFrame],
+    write_output: bool,
+) -> dict:
     curves = build_archetype_curves(full_panel)
 
     projections = []
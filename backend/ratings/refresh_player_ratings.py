@@ -18,13 +18,17 @@ Run manually:  python -m backend.ratings.refresh_player_ratings
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+from backend.live_client.async_client import AsyncNBAStatsClient
+from backend.live_client.batch import afetch_all
 from backend.live_client.client import NBAStatsClient
 from backend.live_client.endpoints.stats.advanced_metrics import PlayerAdvancedStats
 from backend.live_client.endpoints.stats.season_totals import PlayerSeasonTotals
+from backend.live_client.rate_limit import default_pacer
 
 from .player_power_rankings import build_player_table, top_defensive_players, top_offensive_players
 
@@ -81,10 +85,35 @@ def run_refresh(season: str | None = None, top_n: int = MAX_N, write_output: boo
     """
     season = season or current_nba_season()
 
-    with NBAStatsClient() as client:
+    with NBAStatsClient(rate_limiter=default_pacer()) as client:
         season_totals = PlayerSeasonTotals(season=season, per_mode="PerGame", client=client).fetch().to_dataframe()
         advanced_stats = PlayerAdvancedStats(season=season, client=client).fetch().to_dataframe()
 
+    return _build_payload(season, season_totals, advanced_stats, top_n, write_output)
+
+
+async def arun_refresh(season: str | None = None, top_n: int = MAX_N, write_output: bool = True) -> dict:
+    """run_refresh() on the event loop (AsyncNBAStatsClient) — both league-wide
+    calls go out concurrently. Same payload, same output file. Only the
+    fetch runs on the loop: parsing, building the payload and writing it
+    happen in a worker thread, so an API sharing the loop isn't stalled."""
+    season = season or current_nba_season()
+
+    async with AsyncNBAStatsClient(rate_limiter=default_pacer()) as client:
+        totals_response, advanced_response = await afetch_all([
+            PlayerSeasonTotals(season=season, per_mode="PerGame", client=client),
+            PlayerAdvancedStats(season=season, client=client),
+        ])
+
+    def _finish() -> dict:
+        return _build_payload(
+            season, totals_response.to_dataframe(), advanced_response.to_dataframe(), top_n, write_output,
+        )
+
+    return await asyncio.to_thread(_finish)
+
+
+def _build_payload(season: str, season_totals, advanced_stats, top_n: int, write_output: bool) -> dict:
     player_table = build_player_table(season_totals, advanced_stats)
     offense = [b.to_dict() for b in top_offensive_players(player_table, n=top_n)]
     defense = [b.to_dict() for b in top_defensive_players(player_table, n=top_n)]
@@ -34,16 +34,17 @@ from __future__ import annotations
 
 import json
 import logging
-import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pandas as pd
 
+from backend.live_client.batch import fetch_many
 from backend.live_client.client import NBAStatsClient
 from backend.live_client.endpoints.stats.career_stats import PlayerCareerStats
 from backend.live_client.endpoints.stats.team_roster import TeamRoster
 from backend.live_client.lookups.loader import load_teams
+from backend.live_client.rate_limit import default_pacer
 
 from .player_development import build_aging_curve, project_player_next_season, project_team_talent_features
 
@@ -59,9 +60,14 @@ DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
 # that count (observed directly while building this). Even with this client's
 # existing per-request retry/backoff (see live_client/client.py), that's
 # request *volume* hitting a rate limit, not transient network flakiness --
-# retrying the same request faster doesn't fix it. This delay is the fix;
-# 0.6s keeps a full refresh under ~6 minutes, acceptable for an offline job.
-REQUEST_PACING_SECONDS = 0.6
+# retrying the same request faster doesn't fix it. Pacing is the fix,
+# enforced by live_client's shared adaptive pacer (rate_limit.default_pacer():
+# starts at one request per 0.6s and backs off on its own the moment those
+# read timeouts start) so MAX_WORKERS concurrent fetches overlap their
+# latency without raising the request rate -- a full refresh is then bounded
+# by the rate alone (~5 minutes at the starting rate), not rate + per-request
+# latency.
+MAX_WORKERS = 4
 
 
 def current_roster_season_start_year() -> int:
@@ -82,7 +88,7 @@ def is_stale(max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS) -> bool:
     """Same contract as refresh_player_ratings.is_stale() -- see that
     docstring. Note the *file's* staleness threshold (default 24h) is
     separate from TeamRoster's own cache TTL (6h, see
-    live_client/endpoints/stats/team_roster.py) -- this one governs how often
+    live_client/cache_policy.py) -- this one governs how often
     the whole projection pipeline re-runs; that one governs how long a single
     team's cached roster response is trusted within a run.
     """
@@ -116,37 +122,44 @@ def run_refresh(target_season_start_year: int | None = None, write_output: bool
     season = _season_string(start_year)
     teams = load_teams()  # team_id, abbreviation, full_name
 
-    with NBAStatsClient() as client:
-        rosters: dict[str, pd.DataFrame] = {}
-        for i, (_, row) in enumerate(teams.iterrows()):
-            if i > 0:
-                time.sleep(REQUEST_PACING_SECONDS)
-            roster = TeamRoster(team_id=int(row["team_id"]), season=season, client=client).fetch().to_dataframe()
-            rosters[row["full_name"]] = roster
+    with NBAStatsClient(rate_limiter=default_pacer()) as client:
+        roster_results = fetch_many(
+            [TeamRoster(team_id=int(row["team_id"]), season=season, client=client) for _, row in teams.iterrows()],
+            max_workers=MAX_WORKERS,
+        )
+        # unwrap(): a missing roster is still fatal here, same as before
+        # batching -- the whole projection is per-team.
+        rosters: dict[str, pd.DataFrame] = {
+            name: result.unwrap().to_dataframe() for name, result in zip(teams["full_name"], roster_results)
+        }
 
         # One PlayerCareerStats call per unique roster player, reused for both
         # "most recent season" (the projection base) and the pooled
         # league-wide aging curve -- see module docstring's "reachable
-        # history" note. Paced (see REQUEST_PACING_SECONDS) -- this is ~400-500
-        # calls for a full 30-team refresh.
+        # history" note. Paced by the client's default_pacer()
+        # AdaptiveRateLimiter (see the note above MAX_WORKERS) -- this is
+        # ~400-500 calls for a full 30-team refresh.
         all_player_ids = sorted({int(pid) for roster in rosters.values() for pid in roster["PLAYER_ID"]})
-        careers: dict[int, pd.DataFrame] = {}
-        for i, player_id in enumerate(all_player_ids):
-            if i > 0:
-                time.sleep(REQUEST_PACING_SECONDS)
-            try:
-                careers[player_id] = PlayerCareerStats(player_id=player_id, client=client).fetch().to_dataframe()
-            except Exception as exc:
-                # A malformed/empty response for one player (nba_api itself
-                # raises KeyError on some no-career-data players, not just a
-                # network failure) must not take down the whole 400+ player
-                # batch. Leaving this player out of `careers` makes the
-                # downstream `career is None` check (below) exclude them the
-                # same way an empty dataframe already does -- "no data,
-                # excluded" is the existing, correct behavior; this just
-                # makes a fetch-time exception reach that path too instead of
-                # crashing before ever getting there.
-                logger.warning("PlayerCareerStats failed for player_id=%s: %s", player_id, exc)
+        career_results = fetch_many(
+            [PlayerCareerStats(player_id=player_id, client=client) for player_id in all_player_ids],
+            max_workers=MAX_WORKERS,
+        )
+
+    careers: dict[int, pd.DataFrame] = {}
+    for player_id, result in zip(all_player_ids, career_results):
+        if not result.ok:
+            # A malformed/empty response for one player (nba_api itself
+            # raises KeyError on some no-career-data players, not just a
+            # network failure) must not take down the whole 400+ player
+            # batch. Leaving this player out of `careers` makes the
+            # downstream `career is None` check (below) exclude them the
+            # same way an empty dataframe already does -- "no data,
+            # excluded" is the existing, correct behavior; this just
+            # makes a fetch-time exception reach that path too instead of
+            # crashing before ever getting there.
+            logger.warning("PlayerCareerStats failed for player_id=%s: %s", player_id, result.error)
+            continue
+        careers[player_id] = result.response.to_dataframe()
 
     aging_curve = build_aging_curve(list(careers.values()))
 
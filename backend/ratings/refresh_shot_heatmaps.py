@@ -16,13 +16,16 @@ but on a host that can't reach stats.nba.com at all (Render — see
 backend/AGENTS.md's "Player ratings: refresh strategy"), that same call
 just hangs for minutes per request instead. This cache is the fix.
 
-30 teams x 10 seasons x 2 sides (offense/defense) = 600 TeamShotChart calls
-— a genuinely bigger job than refresh_team_style.py's 20 (2 calls/season),
-paced the same way (REQUEST_PACING_SECONDS between every call, matching the
-documented reason in backend/AGENTS.md's "Request pacing" note — volume
-against a rate limit, not per-request flakiness). Expect ~20-25 minutes for
-a full run, same order of magnitude as refresh_team_style.py's historical
-pass.
+30 teams x 10 seasons x 2 sides (offense/defense) = 600 team-season-side
+heatmaps, but only 10 upstream calls: one league-wide LeagueShotChart per
+season, split locally into every team's offense and defense by
+live_client's `partition_by_team()` (TEAM_ID, and each game's other team
+as the opponent) — the same rows the old 600 per-team TeamShotChart calls
+returned one at a time. Still paced (the documented reason is
+backend/AGENTS.md's "Request pacing" note) by live_client's shared adaptive
+pacer, with the season calls overlapping their network latency through
+live_client.batch.fetch_many; each call is a big response (~200k shots),
+so a full run is bounded by transfer time rather than the rate limit.
 
 Run manually: python -m backend.ratings.refresh_shot_heatmaps
 """
@@ -30,19 +33,21 @@ Run manually: python -m backend.ratings.refresh_shot_heatmaps
 from __future__ import annotations
 
 import json
-import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+from backend.live_client.batch import fetch_many
 from backend.live_client.client import NBAStatsClient
-from backend.live_client.endpoints.stats.shot_chart import TeamShotChart
+from backend.live_client.endpoints.stats.shot_chart import LeagueShotChart, partition_by_team
 from backend.live_client.lookups.loader import load_teams
+from backend.live_client.rate_limit import default_pacer
 from backend.ratings.team_style import DEFAULT_GRID_CELLS, bin_shots_to_heatmap
 
 OUTPUT_DIR = Path(__file__).resolve().parents[1] / "outputs"
 OUTPUT_FILE = OUTPUT_DIR / "shot_heatmaps.json"
 DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
-REQUEST_PACING_SECONDS = 0.6
+MAX_WORKERS = 4
+SIDES = ("offense", "defense")
 
 # Matches refresh_team_style.py's historical range exactly — same
 # season-start-year convention, same reason (win_model's feature_seasons_used).
@@ -77,40 +82,33 @@ def run_refresh(
     teams = load_teams()
     by_key: dict[str, dict] = {}
 
-    with NBAStatsClient() as client:
-        first_call = True
-        for start_year in start_years:
-            season = _season_string(start_year)
-            for _, team_row in teams.iterrows():
-                team_name = team_row["full_name"]
-                team_id = int(team_row["team_id"])
-                for side, fetch_kwargs in (
-                    ("offense", {"team_id": team_id}),
-                    ("defense", {"opponent_team_id": team_id}),
-                ):
-                    if not first_call:
-                        time.sleep(REQUEST_PACING_SECONDS)
-                    first_call = False
-                    try:
-                        shots = (
-                            TeamShotChart(season=season, client=client, **fetch_kwargs)
-                            .fetch()
-                            .to_dataframe()
-                        )
-                    except Exception:
-                        # A single missing/unreachable team-season-side
-                        # shouldn't blank out everything else already
-                        # fetched — same "partial coverage beats none"
-                        # principle as refresh_team_style.py.
-                        continue
-                    cells = bin_shots_to_heatmap(shots, grid_cells=grid_cells)
-                    by_key[_cache_key(start_year, team_name, side)] = {
-                        "season": start_year,
-                        "team": team_name,
-                        "side": side,
-                        "cells": cells,
-                        "n_shots": int(len(shots)),
-                    }
+    with NBAStatsClient(rate_limiter=default_pacer()) as client:
+        endpoints = [LeagueShotChart(season=_season_string(y), client=client) for y in start_years]
+        results = fetch_many(endpoints, max_workers=MAX_WORKERS)
+
+    for start_year, result in zip(start_years, results):
+        if not result.ok:
+            # A single missing/unreachable season shouldn't blank out
+            # everything else already fetched — same "partial coverage beats
+            # none" principle as refresh_team_style.py.
+            continue
+        shots_df = result.response.to_dataframe()
+        partitions = partition_by_team(shots_df)
+        # A team with no shots in the season still gets its 0-shot entries,
+        # as it did when each team-side was its own TeamShotChart call.
+        no_shots = {side: shots_df.iloc[:0] for side in SIDES}
+        for _, team_row in teams.iterrows():
+            team_name = team_row["full_name"]
+            team_partitions = partitions.get(int(team_row["team_id"]), no_shots)
+            for side in SIDES:
+                shots = team_partitions[side]
+                by_key[_cache_key(start_year, team_name, side)] = {
+                    "season": start_year,
+                    "team": team_name,
+                    "side": side,
+                    "cells": bin_shots_to_heatmap(shots, grid_cells=grid_cells),
+                    "n_shots": int(len(shots)),
+                }
 
     payload = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -18,19 +18,21 @@ Run manually: python -m backend.ratings.refresh_team_style
 
 from __future__ import annotations
 
+import asyncio
 import json
-import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+from backend.live_client.async_client import AsyncNBAStatsClient
+from backend.live_client.batch import afetch_many
 from backend.live_client.client import NBAStatsClient
 from backend.live_client.endpoints.stats.team_season_stats import TeamAdvancedStats, TeamSeasonStats
+from backend.live_client.rate_limit import default_pacer
 from backend.ratings.team_style import build_style_fingerprint
 
 OUTPUT_DIR = Path(__file__).resolve().parents[1] / "outputs"
 OUTPUT_FILE = OUTPUT_DIR / "team_style.json"
 DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
-REQUEST_PACING_SECONDS = 0.6
 
 # Matches win_model's historical feature_seasons_used range (2016-2025) —
 # see backend/win_model/data_loader.py. Season-start-year convention: 2016
@@ -54,12 +56,10 @@ def _season_string(start_year: int) -> str:
 
 
 def run_refresh(start_years: list[int] = HISTORICAL_SEASON_START_YEARS, write_output: bool = True) -> dict:
-    by_season_team: dict[str, dict] = {}
+    frames_by_year: dict[int, tuple] = {}
 
-    with NBAStatsClient() as client:
-        for i, start_year in enumerate(start_years):
-            if i > 0:
-                time.sleep(REQUEST_PACING_SECONDS)
+    with NBAStatsClient(rate_limiter=default_pacer()) as client:
+        for start_year in start_years:
             season = _season_string(start_year)
             try:
                 totals = TeamSeasonStats(season=season, client=client).fetch().to_dataframe()
@@ -70,15 +70,47 @@ def run_refresh(start_years: list[int] = HISTORICAL_SEASON_START_YEARS, write_ou
                 # "partial coverage beats none" principle as
                 # refresh_roster_projection.py's per-team fallback.
                 continue
-            fingerprint = build_style_fingerprint(totals, advanced)
-            for _, row in fingerprint.iterrows():
-                by_season_team[f"{start_year}|{row['Team']}"] = {
-                    "season": start_year,
-                    "team": row["Team"],
-                    "pace": float(row["Pace"]),
-                    "ast_pct": float(row["AstPct"]),
-                    "three_pa_rate": float(row["ThreePARate"]),
-                }
+            frames_by_year[start_year] = (totals, advanced)
+
+    return _build_payload(frames_by_year, write_output)
+
+
+async def arun_refresh(start_years: list[int] = HISTORICAL_SEASON_START_YEARS, write_output: bool = True) -> dict:
+    """run_refresh() on the event loop: all 2 x len(start_years) calls go out
+    through one AsyncNBAStatsClient, paced by the same shared adaptive pacer
+    as the sync path instead of one at a time. The parsing and payload
+    work after the fetch runs in a worker thread, off the loop."""
+    async with AsyncNBAStatsClient(rate_limiter=default_pacer()) as client:
+        endpoints = []
+        for start_year in start_years:
+            season = _season_string(start_year)
+            endpoints += [TeamSeasonStats(season=season, client=client), TeamAdvancedStats(season=season, client=client)]
+        results = await afetch_many(endpoints)
+
+    def _finish() -> dict:
+        frames_by_year: dict[int, tuple] = {}
+        for i, start_year in enumerate(start_years):
+            totals, advanced = results[2 * i], results[2 * i + 1]
+            # Same per-season "partial coverage beats none" skip as run_refresh().
+            if totals.ok and advanced.ok:
+                frames_by_year[start_year] = (totals.response.to_dataframe(), advanced.response.to_dataframe())
+        return _build_payload(frames_by_year, write_output)
+
+    return await asyncio.to_thread(_finish)
+
+
+def _build_payload(frames_by_year: dict[int, tuple], write_output: bool) -> dict:
+    by_season_team: dict[str, dict] = {}
+    for start_year, (totals, advanced) in frames_by_year.items():
+        fingerprint = build_style_fingerprint(totals, advanced)
+        for _, row in fingerprint.iterrows():
+            by_season_team[f"{start_year}|{row['Team']}"] = {
+                "season": start_year,
+                "team": row["Team"],
+                "pace": float(row["Pace"]),
+                "ast_pct": float(row["AstPct"]),
+                "three_pa_rate": float(row["ThreePARate"]),
+            }
 
     payload = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -0,0 +1,32 @@
+from backend.api import dependencies
+from backend.live_client.live_games import LiveGamesState, apply_boxscore
+
+BOXSCORE = {"game": {
+    "gameId": "0022500001", "gameStatus": 2, "gameStatusText": "Q4 2:10", "period": 4,
+    "gameClock": "PT02M10.00S",
+    "homeTeam": {"teamId": 10, "score": 99, "players": [
+        {"personId": 1, "name": "Player One", "statistics": {"minutes": "PT30M00.00S", "points": 25}},
+    ]},
+    "awayTeam": {"teamId": 20, "score": 97, "players": []},
+}}
+
+
+def test_live_games_reads_the_pollers_state(client, monkeypatch):
+    state = LiveGamesState()
+    state.replace(apply_boxscore(None, BOXSCORE))
+    monkeypatch.setattr(dependencies, "LIVE_GAMES", state)
+
+    resp = client.get("/api/live/games")
+    assert resp.status_code == 200
+    [game] = resp.json()
+    assert (game["home_score"], game["clock_seconds"]) == (99, 130.0)
+    assert game["players"][0]["points"] == 25
+    assert game["deltas"] == {"1": {"seconds": 1800.0, "points": 25.0}}
+
+    assert client.get("/api/live/games/0022500001").json()["version"] == 1
+    assert client.get("/api/live/games/0022500999").status_code == 404
+
+
+def test_live_games_is_empty_without_a_poller(client, monkeypatch):
+    monkeypatch.setattr(dependencies, "LIVE_GAMES", LiveGamesState())
+    assert client.get("/api/live/games").json() == []
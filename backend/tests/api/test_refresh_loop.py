@@ -8,10 +8,20 @@ import pytest
 from backend.api import main as api_main
 
 
+@pytest.fixture(autouse=True)
+def other_sources_fresh(tmp_path, monkeypatch):
+    """These tests are about player_ratings. The other two sources must never
+    really refresh: that would hit the network, write into the real default
+    cache (live_client/.cache/) and rewrite outputs/."""
+    monkeypatch.setenv("NBA_CACHE_DIR", str(tmp_path / "cache"))
+    for module in (api_main.refresh_team_style, api_main.refresh_player_projections):
+        monkeypatch.setattr(module, "is_stale", lambda *args, **kwargs: False)
+
+
 @pytest.mark.asyncio
 async def test_refresh_if_stale_skips_when_fresh():
     with patch("backend.api.main.refresh_player_ratings.is_stale", return_value=False), \
-         patch("backend.api.main.refresh_player_ratings.run_refresh") as mock_run:
+         patch("backend.api.main.refresh_player_ratings.arun_refresh") as mock_run:
         await api_main.refresh_if_stale()
     mock_run.assert_not_called()
 
@@ -19,7 +29,7 @@ async def test_refresh_if_stale_skips_when_fresh():
 @pytest.mark.asyncio
 async def test_refresh_if_stale_refreshes_when_stale():
     with patch("backend.api.main.refresh_player_ratings.is_stale", return_value=True), \
-         patch("backend.api.main.refresh_player_ratings.run_refresh") as mock_run:
+         patch("backend.api.main.refresh_player_ratings.arun_refresh") as mock_run:
         await api_main.refresh_if_stale()
     mock_run.assert_called_once()
 
@@ -30,5 +40,21 @@ async def test_refresh_if_stale_swallows_exceptions():
     the API or kill the background loop — this is the whole point of the
     try/except in refresh_if_stale()."""
     with patch("backend.api.main.refresh_player_ratings.is_stale", return_value=True), \
-         patch("backend.api.main.refresh_player_ratings.run_refresh", side_effect=ConnectionError("no network")):
+         patch("backend.api.main.refresh_player_ratings.arun_refresh", side_effect=ConnectionError("no network")):
         await api_main.refresh_if_stale()  # must not raise
+
+
+def test_seed_cache_from_bundle_swallows_a_bad_bundle(tmp_path, monkeypatch):
+    """Same never-raise rule as refresh_if_stale(): a missing or corrupt
+    bundle must not stop the API from starting."""
+    monkeypatch.setattr(api_main, "CACHE_BUNDLE", str(tmp_path / "missing.tar.gz"))
+    with patch("backend.api.main.import_bundle", side_effect=ValueError("corrupt")) as mock_import:
+        api_main.seed_cache_from_bundle()  # must not raise
+    mock_import.assert_called_once()
+
+
+def test_seed_cache_from_bundle_is_a_no_op_when_unset(monkeypatch):
+    monkeypatch.setattr(api_main, "CACHE_BUNDLE", None)
+    with patch("backend.api.main.import_bundle") as mock_import:
+        api_main.seed_cache_from_bundle()
+    mock_import.assert_not_called()
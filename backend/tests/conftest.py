@@ -1,6 +1,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 REPO_ROOT = BACKEND_DIR.parent
 
@@ -16,3 +18,19 @@ sys.path.insert(0, str(BACKEND_DIR))
 # Imports section. Add repo root too, so tests can import them the same way
 # uvicorn/the cron job does, without affecting the backend/-root imports above.
 sys.path.insert(0, str(REPO_ROOT))
+
+
+class _NullCache:
+    """A cache that always misses and discards writes — isolates a test from disk
+    state without needing a real DiskCache + tmp_path in every test."""
+
+    def get(self, *a, **k):
+        return None
+
+    def set(self, *a, **k):
+        pass
+
+
+@pytest.fixture
+def null_cache():
+    return _NullCache()
@@ -0,0 +1,152 @@
+import json
+
+import httpx
+import pytest
+from nba_api.stats.endpoints import LeagueDashPlayerStats
+
+from live_client.async_client import AsyncNBAStatsClient
+from live_client.batch import afetch_all, afetch_many
+from live_client.client import DEFAULT_HEADERS, NBAClientError, NBAStatsClient
+from live_client.endpoints.stats.season_totals import PlayerSeasonTotals
+from live_client.rate_limit import AdaptiveRateLimiter
+
+SEASON_TOTALS_PAYLOAD = {
+    "resultSets": [{
+        "name": "LeagueDashPlayerStats",
+        "headers": [
+            "PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION",
+            "GP", "MIN", "PTS", "REB", "AST", "STL", "BLK", "TOV",
+            "FG_PCT", "FG3_PCT", "FT_PCT",
+        ],
+        "rowSet": [
+            [1, "Player One", 1610612738, "BOS", 82, 2500, 1800, 400, 300, 80, 40, 150, 0.48, 0.38, 0.85],
+        ],
+    }]
+}
+
+
+
+def _client_with_transport(handler, **kwargs) -> AsyncNBAStatsClient:
+    """Swaps the real pooled httpx client for one backed by a MockTransport —
+    same headers, no network."""
+    client = AsyncNBAStatsClient(backoff_seconds=0, **kwargs)
+    client.session = httpx.AsyncClient(headers=client.session.headers, transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_json_retries_then_succeeds():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(500)
+        return httpx.Response(200, json={"ok": True})
+
+    async with _client_with_transport(handler, max_retries=3) as client:
+        assert await client.get_json("https://cdn.nba.com/x.json") == {"ok": True}
+    assert len(calls) == 3
+    assert calls[0].headers["Referer"] == DEFAULT_HEADERS["Referer"]
+
+
+@pytest.mark.asyncio
+async def test_get_json_retries_on_html_error_page_then_raises():
+    def handler(request):
+        return httpx.Response(200, text="<html>error</html>")
+
+    async with _client_with_transport(handler, max_retries=2) as client:
+        with pytest.raises(NBAClientError):
+            await client.get_json("https://cdn.nba.com/x.json")
+
+
+@pytest.mark.asyncio
+async def test_get_json_if_changed_treats_304_as_not_modified():
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"ok": True}, headers={"ETag": '"v1"'})
+
+    async with _client_with_transport(handler, max_retries=1) as client:
+        first = await client.get_json_if_changed("https://cdn.nba.com/x.json")
+        second = await client.get_json_if_changed("https://cdn.nba.com/x.json", first.validators)
+    assert first.data == {"ok": True} and first.validators == {"ETag": '"v1"'}
+    assert second.not_modified
+
+
+@pytest.mark.asyncio
+async def test_get_via_nba_api_sends_nba_api_params_and_loads_the_endpoint():
+    seen = {}
+
+    def handler(request):
+        seen["url"] = request.url
+        return httpx.Response(200, json=SEASON_TOTALS_PAYLOAD)
+
+    endpoint = LeagueDashPlayerStats(season="2023-24", get_request=False)
+    async with _client_with_transport(handler) as client:
+        raw = await client.get_via_nba_api(endpoint)
+    assert raw == SEASON_TOTALS_PAYLOAD
+    assert seen["url"].path == "/stats/leaguedashplayerstats"
+    assert seen["url"].params["Season"] == "2023-24"
+    # nba_api's own parsed datasets are populated, same as after get_request().
+    assert len(endpoint.league_dash_player_stats.get_data_frame()) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_bytes_via_nba_api_returns_the_body_unparsed():
+    responses = iter([httpx.Response(200, text="<html>error</html>"), httpx.Response(200, json=SEASON_TOTALS_PAYLOAD)])
+
+    def handler(request):
+        return next(responses)
+
+    endpoint = LeagueDashPlayerStats(season="2023-24", get_request=False)
+    async with _client_with_transport(handler, max_retries=2) as client:
+        body = await client.get_bytes_via_nba_api(endpoint)
+    assert json.loads(body) == SEASON_TOTALS_PAYLOAD
+    assert not hasattr(endpoint, "league_dash_player_stats")  # nba_api never parsed it
+
+
+@pytest.mark.asyncio
+async def test_afetch_many_validates_through_the_async_client(null_cache):
+    def handler(request):
+        return httpx.Response(200, json=SEASON_TOTALS_PAYLOAD)
+
+    async with _client_with_transport(handler) as client:
+        endpoints = [PlayerSeasonTotals(season=s, client=client, cache=null_cache) for s in ("2022-23", "2023-24")]
+        results = await afetch_many(endpoints)
+    assert all(r.ok for r in results)
+    assert results[1].response.to_dataframe().iloc[0]["PLAYER_NAME"] == "Player One"
+
+
+@pytest.mark.asyncio
+async def test_afetch_all_raises_the_first_error_instead_of_a_group(null_cache):
+    def handler(request):
+        return httpx.Response(503)
+
+    async with _client_with_transport(handler, max_retries=1) as client:
+        endpoints = [PlayerSeasonTotals(season=s, client=client, cache=null_cache) for s in ("2022-23", "2023-24")]
+        with pytest.raises(NBAClientError):
+            await afetch_all(endpoints)
+
+
+@pytest.mark.asyncio
+async def test_afetch_with_a_sync_client_is_a_type_error(null_cache):
+    endpoint = PlayerSeasonTotals(season="2023-24", client=NBAStatsClient(), cache=null_cache)
+    with pytest.raises(TypeError, match="AsyncNBAStatsClient"):
+        await endpoint.afetch()
+
+
+@pytest.mark.asyncio
+async def test_throttle_responses_slow_the_adaptive_rate(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(403, text="<html>Access Denied</html>")
+        return httpx.Response(200, json={"ok": True})
+
+    limiter = AdaptiveRateLimiter(rate_per_second=50.0, max_rate_per_second=100.0, increase_per_success=0, state_path=tmp_path / "p.json")
+    async with _client_with_transport(handler, max_retries=2, rate_limiter=limiter) as client:
+        assert await client.get_json("https://cdn.nba.com/x.json") == {"ok": True}
+    assert limiter.rate("cdn.nba.com") == pytest.approx(25.0)
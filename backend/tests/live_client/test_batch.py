@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from live_client.batch import fetch_many
+from live_client.endpoints.base import SchemaValidationError
+from live_client.endpoints.stats.season_totals import PlayerSeasonTotals
+
+GOOD_SEASON_TOTALS_PAYLOAD = {
+    "resultSets": [{
+        "name": "LeagueDashPlayerStats",
+        "headers": [
+            "PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION",
+            "GP", "MIN", "PTS", "REB", "AST", "STL", "BLK", "TOV",
+            "FG_PCT", "FG3_PCT", "FT_PCT",
+        ],
+        "rowSet": [
+            [1, "Player One", 1610612738, "BOS", 82, 2500, 1800, 400, 300, 80, 40, 150, 0.48, 0.38, 0.85],
+        ],
+    }]
+}
+
+BROKEN_SEASON_TOTALS_PAYLOAD = {
+    "resultSets": [{
+        "name": "LeagueDashPlayerStats",
+        "headers": ["PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION", "GP", "MIN", "POINTS"],
+        "rowSet": [[1, "Player One", 1610612738, "BOS", 82, 2500, 1800]],
+    }]
+}
+
+
+
+def _client_returning(*payloads):
+    client = MagicMock()
+    client.get_via_nba_api.side_effect = list(payloads)
+    return client
+
+
+def test_results_come_back_in_input_order_with_per_item_errors(null_cache):
+    seasons = ["2021-22", "2022-23", "2023-24"]
+    endpoints = [
+        PlayerSeasonTotals(season=s, client=_client_returning(p), cache=null_cache)
+        for s, p in zip(seasons, [GOOD_SEASON_TOTALS_PAYLOAD, BROKEN_SEASON_TOTALS_PAYLOAD, GOOD_SEASON_TOTALS_PAYLOAD])
+    ]
+    results = fetch_many(endpoints, max_workers=3)
+
+    assert [r.endpoint for r in results] == endpoints
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, SchemaValidationError)
+    assert len(results[0].response.to_dataframe()) == 1
+
+
+def test_unwrap_reraises_captured_error(null_cache):
+    endpoint = PlayerSeasonTotals(season="2023-24", client=_client_returning(ConnectionError("down")), cache=null_cache)
+    (result,) = fetch_many([endpoint])
+    with pytest.raises(ConnectionError):
+        result.unwrap()
+
+
+def test_cache_hits_never_reach_the_client():
+    class _AlwaysHitCache:
+        def get(self, *a, **k):
+            return GOOD_SEASON_TOTALS_PAYLOAD
+
+        def set(self, *a, **k):
+            pass
+
+    client = MagicMock()
+    results = fetch_many([PlayerSeasonTotals(season="2023-24", client=client, cache=_AlwaysHitCache())])
+    assert results[0].ok
+    client.get_via_nba_api.assert_not_called()
+
+
+def test_empty_input():
+    assert fetch_many([]) == []
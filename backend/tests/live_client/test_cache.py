@@ -1,6 +1,11 @@
+import multiprocessing
 import time
 
-from live_client.cache import DiskCache
+import pandas as pd
+import pytest
+
+from live_client import cache as cache_module
+from live_client.cache import DiskCache, MemoryCache, SQLiteCache, default_cache
 
 
 def test_set_then_get_roundtrip(tmp_path):
@@ -42,8 +47,277 @@ def test_ttl_expiry(tmp_path):
     assert cache.get("EndpointA", {}) is None
 
 
+@pytest.mark.parametrize("make_cache", [
+    lambda tmp_path: DiskCache(cache_dir=tmp_path),
+    lambda tmp_path: SQLiteCache(path=tmp_path / "c.sqlite3"),
+])
+def test_per_read_ttl_overrides_the_instance_ttl(tmp_path, make_cache):
+    cache = make_cache(tmp_path)
+    cache.set("EndpointA", {}, {"data": 1})
+    time.sleep(0.05)
+    assert cache.get("EndpointA", {}, ttl_seconds=0.01) is None
+    assert cache.get("EndpointA", {}, ttl_seconds=None) == {"data": 1}
+    assert cache.get("EndpointA", {}) == {"data": 1}
+
+
 def test_no_ttl_never_expires(tmp_path):
     cache = DiskCache(cache_dir=tmp_path, ttl_seconds=None)
     cache.set("EndpointA", {}, {"data": 1})
     time.sleep(0.05)
     assert cache.get("EndpointA", {}) == {"data": 1}
+
+
+def test_disk_cache_counts_hits_and_misses(tmp_path):
+    cache = DiskCache(cache_dir=tmp_path)
+    cache.get("EndpointA", {})
+    cache.set("EndpointA", {}, {"data": 1})
+    cache.get("EndpointA", {})
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_disk_cache_treats_a_truncated_entry_as_a_miss(tmp_path):
+    cache = DiskCache(cache_dir=tmp_path)
+    cache.set("EndpointA", {}, {"data": list(range(100))})
+    path = next(tmp_path.glob("*.json"))
+    path.write_bytes(path.read_bytes()[:50])
+    assert cache.get("EndpointA", {}) is None
+    assert cache.get_bytes("EndpointA", {}) is None
+    assert cache.stats() == {"backend": "files", "hits": 0, "misses": 2, "corrupt": 2}
+    cache.set("EndpointA", {}, {"data": 1})
+    assert cache.get("EndpointA", {}) == {"data": 1}
+
+
+def _write_repeatedly(cache_dir, value, times):
+    cache = DiskCache(cache_dir=cache_dir)
+    for _ in range(times):
+        cache.set("EndpointA", {}, {"data": [value] * 50_000})
+
+
+def test_disk_cache_readers_never_see_a_partial_write_from_another_process(tmp_path):
+    writers = [
+        multiprocessing.get_context("fork").Process(target=_write_repeatedly, args=(tmp_path, value, 40))
+        for value in ("a", "b")
+    ]
+    for writer in writers:
+        writer.start()
+    cache = DiskCache(cache_dir=tmp_path)
+    while any(writer.is_alive() for writer in writers):
+        got = cache.get("EndpointA", {})
+        assert got is None or got["data"] in (["a"] * 50_000, ["b"] * 50_000)
+    assert all(writer.exitcode == 0 for writer in writers)
+    assert cache.stats()["corrupt"] == 0
+    assert not list(tmp_path.glob("*.tmp"))  # every temp file was renamed into place
+
+
+# ---- SQLiteCache: same contract as DiskCache, plus a byte budget ----
+
+def test_sqlite_set_then_get_roundtrip(tmp_path):
+    cache = SQLiteCache(path=tmp_path / "c.sqlite3")
+    cache.set("EndpointA", {"Season": "2023-24"}, {"data": [1, 2, 3]})
+    assert cache.get("EndpointA", {"Season": "2023-24"}) == {"data": [1, 2, 3]}
+    assert cache.get("EndpointA", {"Season": "2024-25"}) is None
+
+
+def test_sqlite_param_order_and_force_refresh(tmp_path):
+    cache = SQLiteCache(path=tmp_path / "c.sqlite3")
+    cache.set("EndpointA", {"a": 1, "b": 2}, {"data": 1})
+    assert cache.get("EndpointA", {"b": 2, "a": 1}) == {"data": 1}
+    assert cache.get("EndpointA", {"a": 1, "b": 2}, force_refresh=True) is None
+
+
+def test_sqlite_ttl_expiry(tmp_path):
+    cache = SQLiteCache(path=tmp_path / "c.sqlite3", ttl_seconds=0.05)
+    cache.set("EndpointA", {}, {"data": 1})
+    assert cache.get("EndpointA", {}) == {"data": 1}
+    time.sleep(0.1)
+    assert cache.get("EndpointA", {}) is None
+
+
+def test_sqlite_evicts_least_recently_read_over_budget(tmp_path):
+    payload = {"data": "x" * 2000}  # compresses to a few dozen bytes
+    cache = SQLiteCache(path=tmp_path / "c.sqlite3")
+    cache.set("EndpointA", {"n": 0}, payload)
+    entry_size = cache.stats()["bytes"]
+
+    cache = SQLiteCache(path=tmp_path / "c.sqlite3", max_bytes=entry_size * 2)
+    cache.set("EndpointA", {"n": 1}, payload)
+    time.sleep(0.01)
+    cache.get("EndpointA", {"n": 0})  # n=0 is now more recently read than n=1
+    time.sleep(0.01)
+    cache.set("EndpointA", {"n": 2}, payload)
+
+    assert cache.get("EndpointA", {"n": 1}) is None
+    assert cache.get("EndpointA", {"n": 0}) == payload
+    assert cache.get("EndpointA", {"n": 2}) == payload
+    assert cache.stats()["entries"] == 2
+
+
+def test_sqlite_never_evicts_the_entry_just_written(tmp_path):
+    cache = SQLiteCache(path=tmp_path / "c.sqlite3", max_bytes=1)
+    cache.set("EndpointA", {}, {"data": 1})
+    assert cache.get("EndpointA", {}) == {"data": 1}
+
+
+def test_sqlite_stats_report_hits_and_misses(tmp_path):
+    cache = SQLiteCache(path=tmp_path / "c.sqlite3")
+    cache.get("EndpointA", {})
+    cache.set("EndpointA", {}, {"data": 1})
+    cache.get("EndpointA", {})
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_sqlite_two_instances_share_one_file(tmp_path):
+    """Stand-in for the API process and a refresh process opening the same
+    database: a write through one is visible through the other."""
+    writer = SQLiteCache(path=tmp_path / "c.sqlite3")
+    reader = SQLiteCache(path=tmp_path / "c.sqlite3")
+    writer.set("EndpointA", {}, {"data": 1})
+    assert reader.get("EndpointA", {}) == {"data": 1}
+
+
+def test_default_cache_follows_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "DEFAULT_SQLITE_PATH", tmp_path / "c.sqlite3")
+    monkeypatch.setattr(cache_module, "DEFAULT_CACHE_DIR", tmp_path / "files")
+    monkeypatch.setenv("NBA_CACHE_BACKEND", "sqlite")
+    assert isinstance(default_cache(), SQLiteCache)
+    monkeypatch.setenv("NBA_CACHE_BACKEND", "files")
+    assert isinstance(default_cache(), DiskCache)
+    monkeypatch.setenv("NBA_CACHE_BACKEND", "redis")
+    with pytest.raises(ValueError):
+        default_cache()
+
+
+def test_default_cache_is_one_instance_per_configuration(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "_DEFAULT_CACHES", {})
+    monkeypatch.setenv("NBA_CACHE_DIR", str(tmp_path / "a"))
+    monkeypatch.setenv("NBA_CACHE_BACKEND", "sqlite")
+    sqlite = default_cache()
+    assert default_cache() is sqlite
+    monkeypatch.setenv("NBA_CACHE_DIR", str(tmp_path / "b"))
+    assert default_cache() is not sqlite
+    monkeypatch.setenv("NBA_CACHE_BACKEND", "files")
+    assert default_cache() is default_cache()
+
+
+# Columnar (parsed-frame) tier — needs pyarrow; both backends.
+
+
+@pytest.fixture(params=["files", "sqlite"])
+def any_cache(request, tmp_path):
+    pytest.importorskip("pyarrow")
+    if request.param == "files":
+        return DiskCache(cache_dir=tmp_path, ttl_seconds=0.2)
+    return SQLiteCache(path=tmp_path / "c.sqlite3", ttl_seconds=0.2)
+
+
+def test_frame_roundtrip_preserves_dtypes(any_cache):
+    df = pd.DataFrame({"PLAYER_ID": [1, 2], "PTS": [10.5, 20.0], "NAME": ["a", "b"]})
+    any_cache.set("EndpointA", {}, {"data": 1})
+    any_cache.set_frame("EndpointA", {}, df)
+    got = any_cache.get_frame("EndpointA", {})
+    pd.testing.assert_frame_equal(got, df)
+
+
+def test_frame_miss_without_frame_or_after_raw_rewrite(any_cache):
+    df = pd.DataFrame({"A": [1]})
+    any_cache.set("EndpointA", {}, {"data": 1})
+    assert any_cache.get_frame("EndpointA", {}) is None
+    any_cache.set_frame("EndpointA", {}, df)
+    # A new raw payload makes the old frame stale.
+    any_cache.set("EndpointA", {}, {"data": 2})
+    assert any_cache.get_frame("EndpointA", {}) is None
+
+
+def test_frame_built_from_a_replaced_raw_entry_is_not_stored(any_cache):
+    version = any_cache.set("EndpointA", {}, {"data": 1})
+    assert any_cache.raw_version("EndpointA", {}) == version
+    any_cache.set("EndpointA", {}, {"data": 2})  # another writer, before the lazy frame write
+    any_cache.set_frame("EndpointA", {}, pd.DataFrame({"A": [1]}), raw_version=version)
+    assert any_cache.get_frame("EndpointA", {}) is None
+
+    current = any_cache.raw_version("EndpointA", {})
+    any_cache.set_frame("EndpointA", {}, pd.DataFrame({"A": [2]}), raw_version=current)
+    assert any_cache.get_frame("EndpointA", {})["A"].tolist() == [2]
+
+
+def test_frame_follows_raw_ttl_and_force_refresh(any_cache):
+    any_cache.set("EndpointA", {}, {"data": 1})
+    any_cache.set_frame("EndpointA", {}, pd.DataFrame({"A": [1]}))
+    assert any_cache.get_frame("EndpointA", {}, force_refresh=True) is None
+    time.sleep(0.3)
+    assert any_cache.get_frame("EndpointA", {}) is None
+
+
+@pytest.mark.parametrize("make_cache", [
+    lambda tmp_path: DiskCache(cache_dir=tmp_path, ttl_seconds=0.2),
+    lambda tmp_path: SQLiteCache(path=tmp_path / "c.sqlite3", ttl_seconds=0.2),
+])
+def test_validators_outlive_the_ttl_and_touch_restarts_it(tmp_path, make_cache):
+    cache = make_cache(tmp_path)
+    assert cache.get_validators("EndpointA", {}) == {}
+    assert cache.touch("EndpointA", {}) is False  # nothing to touch
+
+    cache.set("EndpointA", {}, {"data": 1})
+    cache.set_validators("EndpointA", {}, {"ETag": '"abc"'})
+    time.sleep(0.3)
+    assert cache.get("EndpointA", {}) is None
+    assert cache.get_validators("EndpointA", {}) == {"ETag": '"abc"'}
+
+    assert cache.touch("EndpointA", {}) is True
+    assert cache.get("EndpointA", {}) == {"data": 1}
+    # A new body comes with its own validators (or none).
+    cache.set("EndpointA", {}, {"data": 2})
+    assert cache.get_validators("EndpointA", {}) == {}
+
+
+def test_memory_cache_roundtrip_and_counters():
+    cache = MemoryCache(max_entries=4, ttl_seconds=None)
+    assert cache.get("EndpointA", {"Season": "2023-24"}) is None
+    value = object()
+    cache.set("EndpointA", {"Season": "2023-24"}, value)
+    assert cache.get("EndpointA", {"Season": "2023-24"}) is value
+    assert cache.get("EndpointA", {"Season": "2023-24"}, force_refresh=True) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2, ttl_seconds=None)
+    cache.set("E", {"k": 1}, "one")
+    cache.set("E", {"k": 2}, "two")
+    cache.get("E", {"k": 1})  # 1 is now more recent than 2
+    cache.set("E", {"k": 3}, "three")
+    assert cache.get("E", {"k": 2}) is None
+    assert cache.get("E", {"k": 1}) == "one"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_memory_cache_evicts_to_its_byte_budget_and_remeasures_on_hits():
+    class _Sized:
+        def __init__(self, size):
+            self.size = size
+
+        def nbytes(self):
+            return self.size
+
+    cache = MemoryCache(max_entries=10, max_bytes=100, ttl_seconds=None)
+    grows = _Sized(30)
+    cache.set("E", {"k": 1}, grows)
+    cache.set("E", {"k": 2}, _Sized(30))
+    cache.set("E", {"k": 3}, _Sized(500))  # bigger than the whole budget
+    assert cache.get("E", {"k": 3}) is None and cache.stats()["bytes"] == 60
+
+    grows.size = 80  # e.g. its frame was built after it was stored
+    assert cache.get("E", {"k": 1}) is grows
+    assert cache.get("E", {"k": 2}) is None
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (1, 80, 2)
+
+
+def test_memory_cache_per_entry_ttl_never_exceeds_default():
+    cache = MemoryCache(ttl_seconds=0.05)
+    cache.set("E", {"k": 1}, "short", ttl_seconds=60)
+    time.sleep(0.1)
+    assert cache.get("E", {"k": 1}) is None
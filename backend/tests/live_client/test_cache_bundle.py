@@ -0,0 +1,135 @@
+import io
+import json
+import tarfile
+import time
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from live_client.cache import DiskCache
+from live_client.cache_bundle import entry_season, export_bundle, import_bundle, main
+from live_client.endpoints.stats.season_totals import PlayerSeasonTotals
+
+
+def _season_totals(season):
+    return {
+        "resource": "leaguedashplayerstats",
+        "parameters": {"Season": season, "SeasonType": "Regular Season"},
+        "resultSets": [{
+            "name": "LeagueDashPlayerStats",
+            "headers": [
+                "PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION", "GP", "MIN", "PTS", "REB",
+                "AST", "STL", "BLK", "TOV", "FG_PCT", "FG3_PCT", "FT_PCT",
+            ],
+            "rowSet": [[1, "Player One", 10, "AAA", 82, 2500, 1800, 400, 300, 80, 40, 150, 0.48, 0.38, 0.85]],
+        }],
+    }
+
+
+def _seeded_cache(path):
+    cache = DiskCache(path)
+    for season in ("2023-24", "2024-25"):
+        endpoint = PlayerSeasonTotals(season=season, cache=cache)
+        cache.set("PlayerSeasonTotals", endpoint.cache_key_params(), _season_totals(season))
+    cache.set("GamePlayByPlay", {"GameID": "0022400001"}, {"game": {"gameId": "0022400001", "actions": []}})
+    cache.set("LiveBoxScore", {"game_id": "x"}, {"meta": {}})
+    return cache
+
+
+def test_entry_season_reads_params_or_game_ids():
+    assert entry_season(json.dumps(_season_totals("2024-25")).encode()) == 2024
+    assert entry_season(b'{"parameters": {"GameID": "0022300001"}, "resultSets": []}') == 2023
+    assert entry_season(b'{"meta": {}, "game": {"gameId": "0022500001"}}') == 2025
+    assert entry_season(b'{"meta": {}}') is None
+    assert entry_season(b"<html>") is None
+
+
+def test_export_filters_by_endpoint_and_season_and_is_content_named(tmp_path):
+    cache = _seeded_cache(tmp_path / "src")
+
+    bundle = export_bundle(tmp_path / "out", cache, seasons=["2024-25"])
+    with tarfile.open(bundle) as tar:
+        manifest = json.loads(tar.extractfile("manifest.json").read())
+    assert sorted((e["endpoint"], e["season"]) for e in manifest["entries"]) == [
+        ("GamePlayByPlay", 2024), ("PlayerSeasonTotals", 2024),
+    ]
+
+    only_totals = export_bundle(tmp_path / "out", cache, endpoints=["PlayerSeasonTotals"])
+    assert only_totals != bundle
+    # Same cache state, same name (and same bytes).
+    again = export_bundle(tmp_path / "out", cache, endpoints=["PlayerSeasonTotals"])
+    assert again == only_totals
+
+
+def test_identical_payloads_are_stored_once(tmp_path):
+    cache = DiskCache(tmp_path / "src")
+    cache.set("EndpointA", {"a": 1}, {"same": True})
+    cache.set("EndpointA", {"a": 2}, {"same": True})
+    bundle = export_bundle(tmp_path / "out", cache)
+    with tarfile.open(bundle) as tar:
+        assert len([m for m in tar.getnames() if m.startswith("objects/")]) == 1
+
+
+def test_imported_cache_serves_fetches_with_no_network(tmp_path):
+    bundle = export_bundle(tmp_path / "bundle.tar.gz", _seeded_cache(tmp_path / "src"))
+    target = DiskCache(tmp_path / "dst", ttl_seconds=3600)
+    assert import_bundle(bundle, target) == 4
+
+    client = MagicMock()
+    df = PlayerSeasonTotals(season="2024-25", client=client, cache=target).fetch().to_dataframe()
+    assert df["PLAYER_NAME"].tolist() == ["Player One"]
+    client.get_via_nba_api.assert_not_called()
+    # Stamped fresh on import, not with the exporter's times.
+    path = next((tmp_path / "dst").glob("PlayerSeasonTotals__*.json"))
+    assert time.time() - path.stat().st_mtime < 60
+
+
+def test_import_replaces_an_entry_under_its_write_lock_and_drops_its_frame_and_validators(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    bundle = export_bundle(tmp_path / "bundle.tar.gz", _seeded_cache(tmp_path / "src"), endpoints=["LiveBoxScore"])
+    target = DiskCache(tmp_path / "dst")
+    target.set("LiveBoxScore", {"game_id": "x"}, {"meta": {"old": True}})
+    target.set_frame("LiveBoxScore", {"game_id": "x"}, pd.DataFrame({"A": [1]}))
+    target.set_validators("LiveBoxScore", {"game_id": "x"}, {"etag": '"old"'})
+
+    locked = []
+    write_lock = DiskCache._key_write_lock
+    monkeypatch.setattr(DiskCache, "_key_write_lock", lambda self, key: locked.append(key) or write_lock(self, key))
+    import_bundle(bundle, target, keep_timestamps=True)
+
+    assert target.get("LiveBoxScore", {"game_id": "x"}) == {"meta": {}}
+    assert target.get_frame("LiveBoxScore", {"game_id": "x"}) is None
+    assert target.get_validators("LiveBoxScore", {"game_id": "x"}) == {}
+    [path] = (tmp_path / "dst").glob("LiveBoxScore__*.json")
+    assert locked == [path.stem]
+    assert not list((tmp_path / "dst").glob("*.tmp"))
+    assert abs(path.stat().st_mtime - (tmp_path / "src" / path.name).stat().st_mtime) < 1
+
+
+def test_corrupt_bundle_is_rejected_before_anything_is_written(tmp_path):
+    bundle = export_bundle(tmp_path / "bundle.tar.gz", _seeded_cache(tmp_path / "src"))
+    with tarfile.open(bundle) as tar:
+        members = {m.name: tar.extractfile(m).read() for m in tar.getmembers()}
+    first_object = next(name for name in members if name.startswith("objects/"))
+    members[first_object] = b'{"tampered": true}'
+    tampered = tmp_path / "tampered.tar.gz"
+    with tarfile.open(tampered, "w:gz") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+    target = DiskCache(tmp_path / "dst")
+    with pytest.raises(ValueError, match="doesn't match its hash"):
+        import_bundle(tampered, target)
+    assert list((tmp_path / "dst").glob("*.json")) == []
+
+
+def test_cli_round_trip(tmp_path, capsys):
+    _seeded_cache(tmp_path / "src")
+    main(["--cache-dir", str(tmp_path / "src"), "export", str(tmp_path / "out"), "--endpoint", "LiveBoxScore"])
+    [bundle] = (tmp_path / "out").glob("nba-cache-*.tar.gz")
+    main(["--cache-dir", str(tmp_path / "dst"), "import", str(bundle)])
+    assert "Imported 1 cache entries" in capsys.readouterr().out
+    assert [p.name.split("__")[0] for p in (tmp_path / "dst").glob("*.json")] == ["LiveBoxScore"]
@@ -0,0 +1,100 @@
+import os
+import time
+from datetime import datetime, timezone
+
+from live_client import cache_policy
+from live_client.cache import DiskCache
+from live_client.cache_policy import DAILY, IMMUTABLE, LIVE, OFFLINE, OFFLINE_ENV, ROSTER, policy_for
+from live_client.endpoints.live.scoreboard import TodaysScoreboard
+from live_client.endpoints.stats.season_totals import PlayerSeasonTotals
+
+# Mid 2025-26 season.
+NOW = datetime(2026, 1, 15, tzinfo=timezone.utc)
+
+
+def test_completed_seasons_never_expire_and_the_current_one_is_daily():
+    assert policy_for("PlayerSeasonTotals", {"Season": "2024-25"}, NOW) == IMMUTABLE
+    assert policy_for("LeagueShotChart", {"Season": "2019-20", "TeamID": 0}, NOW) == IMMUTABLE
+    assert policy_for("PlayerSeasonTotals", {"Season": "2025-26"}, NOW) == DAILY
+
+
+def test_season_cutoff_is_opening_night():
+    august = datetime(2025, 8, 1, tzinfo=timezone.utc)
+    assert policy_for("PlayerAdvancedStats", {"Season": "2024-25"}, august) == DAILY
+    assert policy_for("PlayerAdvancedStats", {"Season": "2023-24"}, august) == IMMUTABLE
+
+
+def test_endpoint_specific_rules():
+    assert policy_for("TeamRoster", {"TeamID": 1, "Season": "2026-27"}, NOW) == ROSTER
+    assert policy_for("TeamRoster", {"TeamID": 1, "Season": "2022-23"}, NOW) == IMMUTABLE
+    assert policy_for("GameBoxScore", {"GameID": "0022300001"}, NOW) == IMMUTABLE
+    assert policy_for("GamePlayByPlay", {"GameID": "0022500123"}, NOW) == DAILY
+    assert policy_for("PlayerCareerStats", {"PlayerID": 2544}, NOW) == DAILY
+    assert policy_for("TodaysScoreboard", {}, NOW) == LIVE
+    assert policy_for("LiveBoxScore", {"game_id": "0022500123"}, NOW) == LIVE
+
+
+def test_unknown_or_seasonless_requests_fall_back_sensibly():
+    assert policy_for("SomethingNew", {}, NOW) == IMMUTABLE
+    assert policy_for("SomethingNew", {"Season": "not-a-season"}, NOW) == DAILY
+
+
+def test_offline_mode_never_expires_anything(tmp_path, monkeypatch):
+    monkeypatch.setenv(OFFLINE_ENV, "1")
+    monkeypatch.setattr(cache_policy, "current_season_start_year", lambda now=None: 2025)
+    assert policy_for("PlayerSeasonTotals", {"Season": "2025-26"}, NOW) == OFFLINE
+    assert policy_for("TodaysScoreboard", {}, NOW) == OFFLINE
+
+    cache = DiskCache(tmp_path)
+    cache.set("PlayerSeasonTotals", {"Season": "2025-26"}, {"resultSets": []})
+    old = 1_000_000_000
+    os.utime(next(tmp_path.glob("*.json")), (old, old))
+    monkeypatch.setattr("live_client.endpoints.base.default_cache", lambda: cache)
+    endpoint = PlayerSeasonTotals(season="2025-26")
+    assert cache.get("PlayerSeasonTotals", {"Season": "2025-26"}, **endpoint._ttl_kwargs()) is not None
+    monkeypatch.delenv(OFFLINE_ENV)
+    assert cache.get("PlayerSeasonTotals", {"Season": "2025-26"}, **endpoint._ttl_kwargs()) is None
+
+
+def test_an_entry_cached_before_its_season_completed_expires_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_policy, "current_season_start_year", lambda now=None: 2025)
+    cache = DiskCache(tmp_path)
+    monkeypatch.setattr("live_client.endpoints.base.default_cache", lambda: cache)
+    endpoint = PlayerSeasonTotals(season="2024-25")
+    endpoint.memory_cache = None
+    params = endpoint.cache_key_params()
+
+    cache.set("PlayerSeasonTotals", params, {"resultSets": []})
+    mid_season = datetime(2025, 2, 1, tzinfo=timezone.utc).timestamp()
+    os.utime(next(tmp_path.glob("*.json")), (mid_season, mid_season))
+    assert cache.get("PlayerSeasonTotals", params, **endpoint._ttl_kwargs()) is None
+
+    cache.set("PlayerSeasonTotals", params, {"resultSets": []})  # the refetch, after completion
+    assert cache.get("PlayerSeasonTotals", params, **endpoint._ttl_kwargs()) is not None
+
+
+def test_default_cache_reads_use_the_policy_ttl(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path)
+    monkeypatch.setattr("live_client.endpoints.base.default_cache", lambda: cache)
+    monkeypatch.setattr(cache_policy, "current_season_start_year", lambda now=None: 2025)
+    reads = []
+    original_get = cache.get
+
+    def _recording_get(name, params, force_refresh=False, **kwargs):
+        reads.append(kwargs)
+        return original_get(name, params, force_refresh=force_refresh, **kwargs)
+
+    cache.get = _recording_get
+    past = PlayerSeasonTotals(season="2023-24")
+    past.memory_cache = None
+    assert past.cache_policy() == IMMUTABLE
+    past._disk_cached_response(False)
+    # Exactly old enough to expire anything written before 2023-24 completed.
+    completed = datetime(2024, 10, 1, tzinfo=timezone.utc).timestamp()
+    assert abs(reads[-1]["ttl_seconds"] - (time.time() - completed)) < 60
+
+    scoreboard = TodaysScoreboard()
+    assert scoreboard.cache_key_params() == {}
+    assert scoreboard.cache_policy() == LIVE
+    # An explicit cache keeps its own TTL.
+    assert PlayerSeasonTotals(season="2025-26", cache=cache)._ttl_kwargs() == {}
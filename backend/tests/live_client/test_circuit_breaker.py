@@ -0,0 +1,158 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import requests
+
+from live_client import circuit_breaker as cb_module
+from live_client.async_client import AsyncNBAStatsClient
+from live_client.circuit_breaker import CircuitBreaker, HostCircuitBreakers
+from live_client.client import CircuitOpenError, NBAClientError, NBAStatsClient
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cb_module.time, "monotonic", clock)
+    return clock
+
+
+def test_opens_after_threshold_consecutive_failures(clock):
+    breaker = CircuitBreaker("stats.nba.com", failure_threshold=3, cooldown_seconds=60)
+    for _ in range(2):
+        breaker.record_failure(requests.ConnectionError("down"))
+    assert breaker.allow_request()
+    breaker.record_failure(requests.ConnectionError("down"))
+    assert breaker.state == "open"
+    assert not breaker.allow_request()
+    assert breaker.snapshot()["retry_in_seconds"] == 60
+
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_lets_one_probe_through_then_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=60)
+    breaker.record_failure()
+    clock.now += 61
+    assert breaker.allow_request()  # the probe
+    assert breaker.state == "half_open"
+    assert not breaker.allow_request()  # concurrent callers still fail fast
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow_request()
+
+
+def test_failed_probe_reopens_for_another_cooldown(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=60)
+    breaker.record_failure()
+    clock.now += 61
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.times_opened == 2
+    assert not breaker.allow_request()
+
+
+def test_sync_client_fails_fast_once_the_circuit_opens():
+    breakers = HostCircuitBreakers(failure_threshold=2, cooldown_seconds=60)
+    client = NBAStatsClient(max_retries=4, backoff_seconds=0, circuit_breakers=breakers)
+    with patch.object(client.session, "get", side_effect=requests.ConnectionError("boom")) as mock_get:
+        with pytest.raises(CircuitOpenError):
+            client.get_json("https://stats.nba.com/stats/x")
+        assert mock_get.call_count == 2  # not 4: the open circuit cut the retries short
+        with pytest.raises(NBAClientError):
+            client.get_json("https://stats.nba.com/stats/y")
+        assert mock_get.call_count == 2  # no network attempt at all
+    assert client.circuit_state()["stats.nba.com"]["state"] == "open"
+
+
+def test_http_errors_do_not_open_the_circuit():
+    client = NBAStatsClient(max_retries=3, backoff_seconds=0, circuit_breakers=HostCircuitBreakers(failure_threshold=1))
+    failing = MagicMock()
+    failing.raise_for_status.side_effect = requests.HTTPError("500")
+    with patch.object(client.session, "get", return_value=failing) as mock_get, \
+            pytest.raises(NBAClientError) as excinfo:
+        client.get_json("https://stats.nba.com/stats/x")
+    assert not isinstance(excinfo.value, CircuitOpenError)
+    assert mock_get.call_count == 3
+    assert client.circuit_state()["stats.nba.com"]["state"] == "closed"
+
+
+def test_hosts_trip_independently():
+    client = NBAStatsClient(max_retries=1, circuit_breakers=HostCircuitBreakers(failure_threshold=1))
+    with patch.object(client.session, "get", side_effect=requests.Timeout("slow")), \
+            pytest.raises(NBAClientError):
+        client.get_json("https://stats.nba.com/stats/x")
+    state = client.circuit_state()
+    assert state["stats.nba.com"]["state"] == "open"
+    assert client.circuit_breakers.breaker("cdn.nba.com").allow_request()
+
+
+@pytest.mark.asyncio
+async def test_async_client_fails_fast_once_the_circuit_opens():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("boom", request=request)
+
+    client = AsyncNBAStatsClient(max_retries=4, backoff_seconds=0, circuit_breakers=HostCircuitBreakers(failure_threshold=2))
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with client:
+        with pytest.raises(CircuitOpenError):
+            await client.get_json("https://cdn.nba.com/x.json")
+    assert len(calls) == 2
+
+
+def _half_open(breakers, host, clock):
+    breaker = breakers.breaker(host)
+    breaker.record_failure()
+    clock.now += 61
+    return breaker
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_probe_frees_the_slot(clock):
+    started = asyncio.Event()
+
+    async def handler(request):
+        started.set()
+        await asyncio.sleep(60)
+
+    breakers = HostCircuitBreakers(failure_threshold=1, cooldown_seconds=60)
+    breaker = _half_open(breakers, "cdn.nba.com", clock)
+    client = AsyncNBAStatsClient(max_retries=1, backoff_seconds=0, circuit_breakers=breakers)
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with client:
+        probe = asyncio.create_task(client.get_json("https://cdn.nba.com/x.json"))
+        await started.wait()
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+    assert breaker.state == "half_open"
+    assert breaker.allow_request()  # the next call gets to probe
+
+
+def test_sync_probe_ending_in_an_unexpected_error_frees_the_slot(clock):
+    breakers = HostCircuitBreakers(failure_threshold=1, cooldown_seconds=60)
+    breaker = _half_open(breakers, "stats.nba.com", clock)
+    client = NBAStatsClient(max_retries=1, backoff_seconds=0, circuit_breakers=breakers)
+    with patch.object(client.session, "get", side_effect=RuntimeError("bug")):
+        with pytest.raises(RuntimeError):
+            client.get_json("https://stats.nba.com/stats/x")
+    assert breaker.allow_request()
@@ -57,6 +57,28 @@ def test_get_json_retries_on_bad_json_body():
     assert result == {"ok": True}
 
 
+def test_get_json_if_changed_sends_validators_and_skips_the_body_on_304():
+    client = NBAStatsClient(max_retries=2)
+    not_modified = MagicMock(status_code=304, headers={"ETag": '"v1"'})
+    with patch.object(client.session, "get", return_value=not_modified) as mock_get:
+        result = client.get_json_if_changed(
+            "https://cdn.nba.com/x.json", {"ETag": '"v1"', "Last-Modified": "Tue, 01 Oct 2024 00:00:00 GMT"}
+        )
+    assert result.not_modified
+    assert result.validators["ETag"] == '"v1"'
+    assert mock_get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"v1"', "If-Modified-Since": "Tue, 01 Oct 2024 00:00:00 GMT",
+    }
+    not_modified.json.assert_not_called()
+
+    changed = _mock_response({"ok": True})
+    changed.status_code = 200
+    changed.headers = {"ETag": '"v2"'}
+    with patch.object(client.session, "get", return_value=changed):
+        result = client.get_json_if_changed("https://cdn.nba.com/x.json", {"ETag": '"v1"'})
+    assert (result.data, result.validators) == ({"ok": True}, {"ETag": '"v2"'})
+
+
 def _fake_nba_api_endpoint(dict_result=None, side_effects=None):
     """A stand-in for an nba_api Endpoint instance: get_request() does the (fake)
     network call, get_dict() returns whatever it fetched — mirrors the real
@@ -97,6 +119,28 @@ def test_get_via_nba_api_raises_after_exhausting_retries():
             client.get_via_nba_api(endpoint)
 
 
+def test_get_bytes_via_nba_api_retries_bodies_that_are_not_json_objects():
+    client = NBAStatsClient(max_retries=3, backoff_seconds=0)
+    endpoint = MagicMock()
+    bodies = iter([
+        (200, "<html>Access Denied</html>"),
+        (200, '{"resultSets": [{"name": "A", "rowSet": [[1'),  # cut off mid-transfer
+        (200, ' {"resultSets": []}\n'),
+    ])
+
+    def _send(**kwargs):
+        status, text = next(bodies)
+        nba_response = MagicMock(_status_code=status)
+        nba_response.get_response.return_value = text
+        return nba_response
+
+    with patch("live_client.client.NBAStatsHTTP") as http, patch("live_client.client.time.sleep"):
+        http.return_value.send_api_request.side_effect = _send
+        body = client.get_bytes_via_nba_api(endpoint)
+    assert body == b'{"resultSets": []}'
+    endpoint.get_request.assert_not_called()  # nba_api never parses the body
+
+
 def test_default_headers_present_and_extra_headers_merge():
     client = NBAStatsClient(extra_headers={"X-Custom": "1"})
     for key, value in DEFAULT_HEADERS.items():
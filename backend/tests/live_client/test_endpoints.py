@@ -1,10 +1,15 @@
+import os
 from unittest.mock import MagicMock
 
 import pytest
 
-from live_client.endpoints.base import SchemaValidationError
+from live_client.cache import DiskCache, MemoryCache
+from live_client.client import ConditionalResponse
+from live_client.endpoints.base import CachedRawUnavailableError, Endpoint, NBAApiEndpoint, SchemaValidationError
 from live_client.endpoints.live.scoreboard import TodaysScoreboard
+from live_client.endpoints.stats.play_by_play import GamePlayByPlay
 from live_client.endpoints.stats.season_totals import PlayerSeasonTotals
+from live_client.endpoints.stats.shot_chart import LeagueShotChart
 from live_client.endpoints.stats.shot_locations import PlayerShotLocations
 
 GOOD_SEASON_TOTALS_PAYLOAD = {
@@ -36,33 +41,26 @@ def _fake_client(payload):
     """endpoints/stats/*.py now build an nba_api endpoint object and send it
     through client.get_via_nba_api() (see backend/AGENTS.md's nba_api
     integration notes); endpoints/live/*.py still call client.get_json()
-    directly, unchanged. Wiring both to the same payload keeps this one helper
-    usable for tests of either kind of endpoint."""
+    directly (or get_json_if_changed(), for conditional ones). Wiring all of
+    them to the same payload keeps this one helper usable for tests of any
+    kind of endpoint."""
     client = MagicMock()
     client.get_via_nba_api.return_value = payload
     client.get_json.return_value = payload
+    client.get_json_if_changed.return_value = ConditionalResponse(payload, {})
     return client
 
 
-class _NullCache:
-    """A cache that always misses and discards writes — isolates a test from disk
-    state without needing a real DiskCache + tmp_path in every test."""
-    def get(self, *a, **k):
-        return None
 
-    def set(self, *a, **k):
-        pass
-
-
-def test_fetch_succeeds_with_well_formed_response():
-    endpoint = PlayerSeasonTotals(season="2023-24", client=_fake_client(GOOD_SEASON_TOTALS_PAYLOAD), cache=_NullCache())
+def test_fetch_succeeds_with_well_formed_response(null_cache):
+    endpoint = PlayerSeasonTotals(season="2023-24", client=_fake_client(GOOD_SEASON_TOTALS_PAYLOAD), cache=null_cache)
     df = endpoint.fetch().to_dataframe()
     assert len(df) == 1
     assert df.iloc[0]["PLAYER_NAME"] == "Player One"
 
 
-def test_fetch_raises_schema_validation_error_on_renamed_column():
-    endpoint = PlayerSeasonTotals(season="2023-24", client=_fake_client(BROKEN_SEASON_TOTALS_PAYLOAD), cache=_NullCache())
+def test_fetch_raises_schema_validation_error_on_renamed_column(null_cache):
+    endpoint = PlayerSeasonTotals(season="2023-24", client=_fake_client(BROKEN_SEASON_TOTALS_PAYLOAD), cache=null_cache)
     with pytest.raises(SchemaValidationError, match="PTS"):
         endpoint.fetch()
 
@@ -121,8 +119,8 @@ LIVE_SCOREBOARD_PAYLOAD = {
 }
 
 
-def test_live_endpoint_flattens_nested_json_into_dataframe():
-    endpoint = TodaysScoreboard(client=_fake_client(LIVE_SCOREBOARD_PAYLOAD), cache=_NullCache())
+def test_live_endpoint_flattens_nested_json_into_dataframe(null_cache):
+    endpoint = TodaysScoreboard(client=_fake_client(LIVE_SCOREBOARD_PAYLOAD), cache=null_cache)
     df = endpoint.fetch().to_dataframe()
     assert df.loc[0, "homeTeam.teamTricode"] == "BOS"
     assert df.loc[0, "awayTeam.score"] == 55
@@ -153,9 +151,196 @@ SHOT_LOCATIONS_PAYLOAD = {
 }
 
 
-def test_shot_locations_flattens_two_level_headers():
-    endpoint = PlayerShotLocations(season="2023-24", client=_fake_client(SHOT_LOCATIONS_PAYLOAD), cache=_NullCache())
+def test_shot_locations_flattens_two_level_headers(null_cache):
+    endpoint = PlayerShotLocations(season="2023-24", client=_fake_client(SHOT_LOCATIONS_PAYLOAD), cache=null_cache)
     df = endpoint.fetch().to_dataframe()
     assert df.loc[0, "PLAYER_NAME"] == "Player One"
     assert df.loc[0, "Restricted Area_FGA"] == 5.0
     assert df.loc[0, "Mid-Range_FG_PCT"] == 0.25
+
+
+def test_frame_cache_hit_defers_raw_load_until_to_dict():
+    pytest.importorskip("pyarrow")
+    client = _fake_client(GOOD_SEASON_TOTALS_PAYLOAD)
+    raw_store: dict = {}
+    frame_store: dict = {}
+    raw_reads = []
+
+    class _FrameCache:
+        def get(self, name, params, force_refresh=False):
+            raw_reads.append(name)
+            return None if force_refresh else raw_store.get(name)
+
+        def set(self, name, params, raw):
+            raw_store[name] = raw
+
+        def get_frame(self, name, params, force_refresh=False):
+            return None if force_refresh else frame_store.get(name)
+
+        def set_frame(self, name, params, df):
+            frame_store[name] = df
+
+    endpoint = PlayerSeasonTotals(season="2023-24", client=client, cache=_FrameCache())
+    endpoint.fetch().to_dataframe()  # the first parse fills the frame tier
+    raw_reads.clear()
+
+    response = endpoint.fetch()
+    assert response.to_dataframe().iloc[0]["PLAYER_NAME"] == "Player One"
+    assert raw_reads == []  # served from the frame tier, raw JSON untouched
+    assert response.to_dict() == GOOD_SEASON_TOTALS_PAYLOAD
+    assert raw_reads == ["PlayerSeasonTotals"]
+    assert client.get_via_nba_api.call_count == 1
+
+
+def test_frame_hit_whose_raw_entry_is_gone_raises_instead_of_refetching(tmp_path):
+    pytest.importorskip("pyarrow")
+    client = _fake_client(GOOD_SEASON_TOTALS_PAYLOAD)
+    cache = DiskCache(tmp_path)
+    endpoint = PlayerSeasonTotals(season="2023-24", client=client, cache=cache)
+    endpoint.fetch().to_dataframe()  # the first parse fills the frame tier
+
+    response = endpoint.fetch()
+    next(tmp_path.glob("*.json")).unlink()  # evicted after the frame was served
+    assert response.to_dataframe().iloc[0]["PLAYER_NAME"] == "Player One"
+    with pytest.raises(CachedRawUnavailableError):
+        response.to_dict()
+    assert client.get_via_nba_api.call_count == 1
+
+
+def test_memory_cache_is_shared_across_endpoint_instances():
+    client = _fake_client(GOOD_SEASON_TOTALS_PAYLOAD)
+    memory = MemoryCache()
+    disk = MagicMock(spec=["get", "set", "ttl_seconds"], ttl_seconds=None)
+    disk.get.return_value = None
+
+    def _endpoint():
+        endpoint = PlayerSeasonTotals(season="2023-24", client=client, cache=disk)
+        endpoint.memory_cache = memory
+        return endpoint
+
+    first = _endpoint().fetch()
+    first.to_dataframe()["EXTRA"] = 1  # callers mutating their frame must not leak into the cache
+    second = _endpoint().fetch()
+
+    assert client.get_via_nba_api.call_count == 1
+    assert disk.get.call_count == 1  # only the first instance reached the disk tier
+    assert "EXTRA" not in second.to_dataframe().columns
+    assert memory.stats()["hits"] == 1
+
+
+def test_fetch_validates_headers_without_building_the_dataframe(null_cache):
+    endpoint = PlayerSeasonTotals(
+        season="2023-24", client=_fake_client(GOOD_SEASON_TOTALS_PAYLOAD), cache=null_cache
+    )
+    response = endpoint.fetch()
+    assert response.columns()[:2] == ["PLAYER_ID", "PLAYER_NAME"]
+    assert response.to_dict() == GOOD_SEASON_TOTALS_PAYLOAD
+    # Nothing so far needed the frame; it is only built on first request.
+    assert response._dataframe is None
+
+
+def test_live_endpoint_validates_against_declared_columns(null_cache):
+    broken = {"scoreboard": {"games": [{"gameId": "1", "gameStatus": 2}]}}
+    endpoint = TodaysScoreboard(client=_fake_client(broken), cache=null_cache)
+    with pytest.raises(SchemaValidationError, match="homeTeam.teamTricode"):
+        endpoint.fetch()
+
+
+def test_stream_response_endpoint_stores_the_body_bytes_untouched(tmp_path):
+    body = (
+        b'{"resultSets": [{"name": "Shot_Chart_Detail", "headers": ["GAME_ID", "PLAYER_ID", "TEAM_ID", '
+        b'"TEAM_NAME", "LOC_X", "LOC_Y", "SHOT_ZONE_BASIC", "SHOT_MADE_FLAG"], '
+        b'"rowSet": [["001", 1, 10, "A", -5, 10, "Restricted Area", 1]]}]}'
+    )
+    client = MagicMock()
+    client.get_bytes_via_nba_api.return_value = body
+    cache = DiskCache(tmp_path)
+
+    response = LeagueShotChart(season="2023-24", client=client, cache=cache).fetch()
+    assert cache.get_bytes("LeagueShotChart", {"TeamID": 0, "PlayerID": 0, "Season": "2023-24",
+                                               "SeasonType": "Regular Season"}) == body
+    assert response.to_dataframe()["LOC_X"].tolist() == [-5]
+    client.get_via_nba_api.assert_not_called()
+
+    cached = LeagueShotChart(season="2023-24", client=client, cache=DiskCache(tmp_path)).fetch()
+    assert cached.to_dataframe()["TEAM_NAME"].tolist() == ["A"]
+    assert client.get_bytes_via_nba_api.call_count == 1
+
+
+def test_play_by_play_builds_its_frame_from_a_raw_cache_hit(tmp_path):
+    """The raw tier predates nba_api ever seeing the body, so the frame has
+    to come from the raw JSON itself (it used to come back as None here)."""
+    cache = DiskCache(tmp_path)
+    raw = {"game": {"gameId": "0022300001", "actions": [
+        {"actionNumber": 1, "clock": "PT12M00.00S", "period": 1, "teamId": 0, "personId": 0,
+         "description": "Start of 1st Period", "actionType": "period", "scoreHome": "0", "scoreAway": "0"},
+    ]}}
+    cache.set("GamePlayByPlay", {"GameID": "0022300001"}, raw)
+    client = MagicMock()
+
+    df = GamePlayByPlay("0022300001", client=client, cache=cache).fetch().to_dataframe()
+    assert df.loc[0, "gameId"] == "0022300001"
+    assert df.loc[0, "actionType"] == "period"
+    assert df["period"].dtype == "int8"
+    client.get_bytes_via_nba_api.assert_not_called()
+
+
+def test_live_endpoint_revalidates_and_a_304_only_refreshes_the_entry(tmp_path):
+    payload = {"scoreboard": {"games": [{
+        "gameId": "1", "gameStatus": 2, "gameStatusText": "Q3",
+        "homeTeam": {"teamId": 10, "teamTricode": "AAA", "score": 70},
+        "awayTeam": {"teamId": 20, "teamTricode": "BBB", "score": 68},
+    }]}}
+    client = MagicMock()
+    client.get_json_if_changed.side_effect = [
+        ConditionalResponse(payload, {"ETag": '"v1"'}),
+        ConditionalResponse(None, {"ETag": '"v1"'}),
+    ]
+    cache = DiskCache(tmp_path, ttl_seconds=60)
+
+    TodaysScoreboard(client=client, cache=cache).fetch()
+    assert cache.get_validators("TodaysScoreboard", {}) == {"ETag": '"v1"'}
+    client.get_json_if_changed.assert_called_with(
+        "https://cdn.nba.com/static/json/liveData/scoreboard/todaysScoreboard_00.json", {}
+    )
+
+    # Age the entry past its TTL: the next fetch has to ask upstream, with
+    # the stored ETag, and the 304 makes the old entry fresh again.
+    path = cache._key_path("TodaysScoreboard", {})
+    os.utime(path, (path.stat().st_atime - 120, path.stat().st_mtime - 120))
+    assert cache.get("TodaysScoreboard", {}) is None
+
+    response = TodaysScoreboard(client=client, cache=cache).fetch()
+    assert client.get_json_if_changed.call_args.args[1] == {"ETag": '"v1"'}
+    assert response.to_dataframe()["homeTeam.score"].tolist() == [70]
+    assert cache.get("TodaysScoreboard", {}) == payload
+    client.get_json.assert_not_called()
+
+
+def test_a_304_without_a_cached_entry_falls_back_to_a_full_fetch(tmp_path):
+    payload = {"scoreboard": {"games": []}}
+    client = MagicMock()
+    client.get_json_if_changed.side_effect = [
+        ConditionalResponse(None, {"ETag": '"v1"'}),
+        ConditionalResponse(payload, {"ETag": '"v2"'}),
+    ]
+    cache = DiskCache(tmp_path)
+    cache.set_validators("TodaysScoreboard", {}, {"ETag": '"v1"'})  # entry itself is gone
+
+    endpoint = TodaysScoreboard(client=client, cache=cache)
+    endpoint.expected_columns = ()
+    endpoint.fetch()
+    assert [call.args[1] for call in client.get_json_if_changed.call_args_list] == [{"ETag": '"v1"'}, {}]
+    assert cache.get_validators("TodaysScoreboard", {}) == {"ETag": '"v2"'}
+
+
+def test_an_endpoint_missing_its_request_hook_cannot_be_instantiated(null_cache):
+    class _NoHook(NBAApiEndpoint):
+        pass
+
+    class _NoRequest(Endpoint):
+        pass
+
+    for cls in (_NoHook, _NoRequest):
+        with pytest.raises(TypeError):
+            cls(client=MagicMock(), cache=null_cache)
@@ -0,0 +1,190 @@
+import asyncio
+import copy
+
+import pytest
+
+from live_client.async_client import AsyncNBAStatsClient
+from live_client.client import ConditionalResponse
+from live_client.live_games import (
+    CLOSE_GAME_INTERVAL_SECONDS,
+    FINAL,
+    HALFTIME_INTERVAL_SECONDS,
+    IN_PLAY_INTERVAL_SECONDS,
+    IN_PROGRESS,
+    PERIOD_BREAK_INTERVAL_SECONDS,
+    SCHEDULED,
+    LiveGamePoller,
+    LiveGamesState,
+    apply_boxscore,
+    apply_scoreboard_game,
+    clock_seconds,
+    poll_interval,
+)
+
+
+def _player(person_id, points, minutes="PT10M00.00S", **stats):
+    stats = {"reboundsTotal": 0, "assists": 0, **stats}
+    return {"personId": person_id, "name": f"Player {person_id}",
+            "statistics": {"minutes": minutes, "points": points, **stats}}
+
+
+def _boxscore(home_players, away_players, status=IN_PROGRESS, period=3, clock="PT06M00.00S", scores=(50, 48)):
+    return {"game": {
+        "gameId": "0022500001", "gameStatus": status, "gameStatusText": "Q3 6:00",
+        "period": period, "gameClock": clock,
+        "homeTeam": {"teamId": 10, "teamTricode": "AAA", "score": scores[0], "players": home_players},
+        "awayTeam": {"teamId": 20, "teamTricode": "BBB", "score": scores[1], "players": away_players},
+    }}
+
+
+def _scoreboard_game(status, period=3, clock="PT06M00.00S", text="Q3 6:00", scores=(50, 48)):
+    return {
+        "gameId": "0022500001", "gameStatus": status, "gameStatusText": text, "period": period,
+        "gameClock": clock,
+        "homeTeam": {"teamId": 10, "teamTricode": "AAA", "score": scores[0]},
+        "awayTeam": {"teamId": 20, "teamTricode": "BBB", "score": scores[1]},
+    }
+
+
+def test_clock_seconds_parses_the_feeds_iso_durations():
+    assert clock_seconds("PT05M12.00S") == 312.0
+    assert clock_seconds("PT00M00.00S") == 0.0
+    assert clock_seconds("") is None
+    assert clock_seconds(None) is None
+
+
+@pytest.mark.parametrize("args, expected", [
+    ((SCHEDULED, 0, None, 0), None),
+    ((FINAL, 4, 0.0, 3), None),
+    ((IN_PROGRESS, 2, 0.0, 5, "Half"), HALFTIME_INTERVAL_SECONDS),
+    ((IN_PROGRESS, 1, 0.0, 5, "End Q1"), PERIOD_BREAK_INTERVAL_SECONDS),
+    ((IN_PROGRESS, 2, 300.0, 20), IN_PLAY_INTERVAL_SECONDS),
+    ((IN_PROGRESS, 4, 120.0, -4), CLOSE_GAME_INTERVAL_SECONDS),
+    ((IN_PROGRESS, 4, 120.0, 25), IN_PLAY_INTERVAL_SECONDS),  # garbage time
+    ((IN_PROGRESS, 5, 200.0, 0), CLOSE_GAME_INTERVAL_SECONDS),  # overtime
+])
+def test_poll_interval_follows_the_game_state(args, expected):
+    assert poll_interval(*args) == expected
+
+
+def test_apply_boxscore_reports_only_what_changed_since_the_last_poll():
+    first = apply_boxscore(None, _boxscore([_player(1, 10)], [_player(2, 8)]))
+    assert first.version == 1
+    assert first.deltas[1]["points"] == 10  # first sighting counts in full
+
+    second = apply_boxscore(first, _boxscore(
+        [_player(1, 13, minutes="PT11M30.00S", assists=1)], [_player(2, 8)], scores=(53, 48),
+    ))
+    assert dict(second.deltas) == {1: {"seconds": 90.0, "points": 3, "assists": 1}}
+    assert second.players[2] is not None and 2 not in second.deltas
+    assert (second.home_score, second.margin, second.version) == (53, 5, 2)
+
+    unchanged = apply_boxscore(second, _boxscore(
+        [_player(1, 13, minutes="PT11M30.00S", assists=1)], [_player(2, 8)], scores=(53, 48),
+    ))
+    assert unchanged.deltas == {} and unchanged.version == 2
+
+
+def test_a_lagging_scoreboard_never_rolls_back_a_box_score_header():
+    boxscore = apply_boxscore(None, _boxscore([_player(1, 10)], [], period=3, clock="PT04M00.00S", scores=(55, 50)))
+
+    behind = apply_scoreboard_game(boxscore, _scoreboard_game(IN_PROGRESS, period=3, clock="PT06M00.00S"))
+    assert behind is boxscore and behind.version == 1
+
+    final = apply_scoreboard_game(boxscore, _scoreboard_game(FINAL, period=4, clock="", text="Final", scores=(99, 97)))
+    assert (final.status, final.home_score, final.version) == (FINAL, 99, 2)
+    assert final.players is boxscore.players
+
+
+def test_state_swaps_snapshots_and_serves_prebuilt_views():
+    state = LiveGamesState()
+    snapshot = apply_boxscore(None, _boxscore([_player(1, 10)], []))
+    state.replace(snapshot)
+    assert state.game("0022500001") is snapshot
+    view = state.game_view("0022500001")
+    assert view["players"][0]["points"] == 10
+    assert state.game_view("0022500001") is view  # built once, not per read
+    state.retain([])
+    assert state.game("0022500001") is None and state.game_views() == []
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FeedClient(AsyncNBAStatsClient):
+    """Stands in for AsyncNBAStatsClient (no session, no network): serves
+    whatever scoreboard/box score the test has set, counting requests per
+    feed."""
+
+    def __init__(self):
+        self.scoreboard = {"scoreboard": {"games": []}}
+        self.boxscore = {}
+        self.calls = {"scoreboard": 0, "boxscore": 0}
+
+    async def get_json_if_changed(self, url, validators=None):
+        kind = "scoreboard" if "scoreboard" in url else "boxscore"
+        self.calls[kind] += 1
+        return ConditionalResponse(copy.deepcopy(getattr(self, kind)), {})
+
+
+
+@pytest.mark.asyncio
+async def test_poller_polls_live_games_on_their_interval_and_stops_after_the_final(null_cache):
+    feed, clock, state = _FeedClient(), _FakeClock(), LiveGamesState()
+    poller = LiveGamePoller(client=feed, state=state, cache=null_cache, clock=clock)
+
+    feed.scoreboard = {"scoreboard": {"games": [_scoreboard_game(SCHEDULED, period=0, clock="", text="7:30 pm ET")]}}
+    await poller.poll_once()
+    assert feed.calls == {"scoreboard": 1, "boxscore": 0}  # nothing to poll before tip
+    assert state.game("0022500001").status == SCHEDULED
+
+    clock.now += 30
+    feed.scoreboard = {"scoreboard": {"games": [_scoreboard_game(IN_PROGRESS)]}}
+    feed.boxscore = _boxscore([_player(1, 10)], [_player(2, 8)])
+    delay = await poller.poll_once()
+    assert feed.calls["boxscore"] == 1
+    assert delay == IN_PLAY_INTERVAL_SECONDS
+    assert state.game("0022500001").players[1].stats[1] == 10
+
+    clock.now += IN_PLAY_INTERVAL_SECONDS
+    feed.boxscore = _boxscore([_player(1, 12)], [_player(2, 8)], scores=(52, 48))
+    await poller.poll_once()
+    assert dict(state.game("0022500001").deltas) == {1: {"points": 2}}
+
+    clock.now += 30
+    feed.scoreboard = {"scoreboard": {"games": [_scoreboard_game(FINAL, 4, "PT00M00.00S", "Final", (101, 99))]}}
+    feed.boxscore = _boxscore([_player(1, 30)], [_player(2, 20)], FINAL, 4, "PT00M00.00S", (101, 99))
+    await poller.poll_once()
+    assert state.game("0022500001").status == FINAL
+    assert state.game("0022500001").players[1].stats[1] == 30  # the one final box score
+
+    polls_at_final = feed.calls["boxscore"]
+    clock.now += 60
+    await poller.poll_once()
+    assert feed.calls["boxscore"] == polls_at_final
+
+
+
+@pytest.mark.asyncio
+async def test_run_closes_the_client_only_when_the_poller_built_it(monkeypatch, null_cache):
+    closed = []
+
+    async def _aclose(self):
+        closed.append(self)
+
+    async def _stop_after_one_poll(self):
+        self.stopper.set()
+        return 0.0
+
+    monkeypatch.setattr(AsyncNBAStatsClient, "aclose", _aclose)
+    monkeypatch.setattr(LiveGamePoller, "poll_once", _stop_after_one_poll)
+    owned, borrowed = LiveGamePoller(cache=null_cache), LiveGamePoller(client=_FeedClient(), cache=null_cache)
+    for poller in (owned, borrowed):
+        poller.stopper = asyncio.Event()
+        await poller.run(poller.stopper)
+    assert closed == [owned.client]
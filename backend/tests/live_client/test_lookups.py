@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+
+from live_client.lookups import loader
+from live_client.lookups.loader import (
+    load_players,
+    load_teams,
+    lookup_index,
+    normalize_name,
+    player_id_for_name,
+    player_ids_for_names,
+    team_id_for_abbreviation,
+    team_ids_for_abbreviations,
+    team_name_for_id,
+    team_names_for_ids,
+)
+
+CELTICS_ID = 1610612738
+
+
+def test_single_lookups_match_the_static_tables():
+    teams = load_teams()
+    for row in teams.itertuples():
+        assert team_name_for_id(row.team_id) == row.full_name
+        assert team_id_for_abbreviation(row.abbreviation) == row.team_id
+    with pytest.raises(KeyError):
+        team_name_for_id(1)
+    with pytest.raises(KeyError):
+        team_id_for_abbreviation("XXX")
+
+
+def test_duplicate_player_names_resolve_to_the_first_listed():
+    players = load_players()
+    duplicated = players[players["full_name"].duplicated(keep=False)]
+    name = duplicated["full_name"].iloc[0]
+    assert player_id_for_name(name) == duplicated.loc[duplicated["full_name"] == name, "player_id"].iloc[0]
+
+
+def test_player_names_fall_back_to_the_normalized_form():
+    jokic = player_id_for_name("Nikola Jokić")
+    assert player_id_for_name("nikola jokic") == jokic
+    assert normalize_name("Shaquille O'Neal") == "shaquille oneal"
+    with pytest.raises(KeyError):
+        player_id_for_name("Not A Player")
+
+
+def test_the_index_is_built_once_per_process(monkeypatch):
+    calls = []
+    original = loader._nba_api_teams.get_teams
+    monkeypatch.setattr(loader._nba_api_teams, "get_teams", lambda: calls.append(1) or original())
+    lookup_index.cache_clear()
+    loader._bulk_index.cache_clear()
+    try:
+        for _ in range(50):
+            team_name_for_id(CELTICS_ID)
+        team_names_for_ids(pd.Series([CELTICS_ID] * 100))
+        assert len(calls) == 1
+    finally:
+        lookup_index.cache_clear()
+        loader._bulk_index.cache_clear()
+
+
+def test_bulk_helpers_match_the_single_lookups_and_keep_the_index():
+    teams = load_teams()
+    ids = pd.Series(list(teams["team_id"]) * 3, index=range(100, 190), name="homeTeam_teamId")
+    names = team_names_for_ids(ids)
+    assert names.tolist() == [team_name_for_id(i) for i in ids]
+    assert names.index.equals(ids.index) and names.name == "homeTeam_teamId"
+
+    assert team_ids_for_abbreviations(pd.Series(["BOS", "MIA"])).tolist() == [
+        team_id_for_abbreviation("BOS"), team_id_for_abbreviation("MIA"),
+    ]
+    assert player_ids_for_names(pd.Series(["LeBron James", "nikola jokic"])).tolist() == [
+        player_id_for_name("LeBron James"), player_id_for_name("Nikola Jokić"),
+    ]
+    assert team_names_for_ids(pd.Series([], dtype="int64")).empty
+
+
+def test_bulk_helpers_name_every_unknown_key():
+    with pytest.raises(KeyError, match="1, 2"):
+        team_names_for_ids(pd.Series([CELTICS_ID, 1, 2, 1]))
+    with pytest.raises(KeyError, match="Not A Player"):
+        player_ids_for_names(pd.Series(["LeBron James", "Not A Player"]))
@@ -0,0 +1,94 @@
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from live_client.cache import DiskCache
+from live_client.play_by_play_store import PlayByPlayStore
+
+
+def _action(number, period=1, points=0, action_type="2pt"):
+    return {
+        "actionNumber": number, "clock": "PT11M00.00S", "period": period, "teamId": 10, "teamTricode": "AAA",
+        "personId": 1, "description": f"action {number}", "actionType": action_type,
+        "scoreHome": str(points), "scoreAway": "0", "xLegacy": number, "yLegacy": 0,
+    }
+
+
+def _body(actions):
+    return json.dumps({"game": {"gameId": "0022500001", "actions": actions}}).encode()
+
+
+def _store(tmp_path, *bodies):
+    client = MagicMock()
+    client.get_bytes_via_nba_api.side_effect = list(bodies)
+    return PlayByPlayStore(tmp_path / "pbp", client=client, cache=DiskCache(tmp_path / "cache")), client
+
+
+def test_update_appends_only_actions_past_the_high_water_mark(tmp_path):
+    first = [_action(1), _action(2, points=2)]
+    second = [*first, _action(4, period=2, points=4, action_type="3pt")]
+    store, client = _store(tmp_path, _body(first), _body(second), _body(second))
+
+    assert store.update("0022500001") == 2
+    assert store.max_action_number("0022500001") == 2
+
+    assert store.update("0022500001") == 1
+    assert store.max_action_number("0022500001") == 4
+    # The second request started from the stored period, not the tip.
+    assert client.get_bytes_via_nba_api.call_args.args[0].parameters["StartPeriod"] == "1"
+
+    assert store.update("0022500001") == 0  # nothing new: nothing written
+    frame = store.frame("0022500001")
+    assert frame["actionNumber"].tolist() == [1, 2, 4]
+    assert frame["actionType"].tolist() == ["2pt", "2pt", "3pt"]
+    assert frame["period"].dtype == "int8"
+
+
+def test_events_are_memory_mapped_and_columns_zero_copy(tmp_path):
+    store, _ = _store(tmp_path, _body([_action(1), _action(2)]))
+    store.update("0022500001")
+
+    table = store.events("0022500001")
+    assert table.num_rows == 2
+    x = store.column("0022500001", "xLegacy")
+    assert x.tolist() == [1, 2]
+    assert not x.flags.owndata  # a view into the mapped file, not a copy
+    assert np.issubdtype(x.dtype, np.integer)
+
+
+def test_reads_and_updates_close_every_mapped_file(tmp_path, monkeypatch):
+    bodies = [_body([_action(n) for n in range(1, k + 2)]) for k in range(3)]
+    store, _ = _store(tmp_path, *bodies)
+    sources = []
+    memory_map = pa.memory_map
+
+    def _recording_memory_map(*args, **kwargs):
+        sources.append(memory_map(*args, **kwargs))
+        return sources[-1]
+
+    monkeypatch.setattr(pa, "memory_map", _recording_memory_map)
+    tables = []  # callers holding on to what they read
+    for _ in range(3):
+        store.update("0022500001")
+        tables.append(store.events("0022500001"))
+    assert tables[-1].column("xLegacy").to_pylist() == [1, 2, 3]
+    assert sources and all(source.closed for source in sources)
+
+
+def test_unknown_game_has_nothing_stored(tmp_path):
+    store, _ = _store(tmp_path)
+    assert store.max_action_number("0022500009") == 0
+    assert store.events("0022500009") is None
+    assert store.frame("0022500009") is None
+
+
+def test_rebuild_reingests_from_scratch(tmp_path):
+    corrected = [_action(1), _action(2, action_type="freethrow")]
+    store, _ = _store(tmp_path, _body([_action(1), _action(2)]), _body(corrected))
+    store.update("0022500001")
+    assert store.update("0022500001", rebuild=True) == 2
+    assert store.frame("0022500001")["actionType"].tolist() == ["2pt", "freethrow"]
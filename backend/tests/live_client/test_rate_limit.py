@@ -0,0 +1,136 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from live_client.client import NBAStatsClient
+from live_client.rate_limit import (
+    AdaptiveRateLimiter,
+    HostRateLimiter,
+    TokenBucket,
+    host_of,
+    is_throttle,
+    parse_retry_after,
+)
+
+
+def test_first_token_is_free_then_waits_are_spaced_by_rate():
+    bucket = TokenBucket(rate_per_second=10.0, burst=1.0)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    # A third concurrent reservation queues behind the second, not alongside it.
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_burst_allows_back_to_back_requests():
+    bucket = TokenBucket(rate_per_second=1.0, burst=3.0)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() > 0
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate_per_second=0)
+
+
+def test_hosts_get_independent_buckets():
+    limiter = HostRateLimiter(rate_per_second=1.0)
+    assert limiter.bucket("stats.nba.com") is limiter.bucket("stats.nba.com")
+    assert limiter.bucket("stats.nba.com") is not limiter.bucket("cdn.nba.com")
+
+
+def test_host_of_accepts_urls_and_bare_hosts():
+    assert host_of("https://stats.nba.com/stats/leaguedashplayerstats") == "stats.nba.com"
+    assert host_of("cdn.nba.com") == "cdn.nba.com"
+
+
+def test_client_takes_a_token_per_attempt_including_retries():
+    limiter = MagicMock()
+    client = NBAStatsClient(max_retries=2, backoff_seconds=0, rate_limiter=limiter)
+    good = MagicMock()
+    good.json.return_value = {"ok": True}
+    with patch.object(client.session, "get", side_effect=[requests.exceptions.ConnectionError("x"), good]), \
+         patch("live_client.client.time.sleep"):
+        client.get_json("https://cdn.nba.com/static/json/liveData/x.json")
+    assert limiter.acquire.call_count == 2
+    limiter.acquire.assert_called_with("cdn.nba.com")
+
+
+def test_pause_delays_the_next_token():
+    bucket = TokenBucket(rate_per_second=100.0)
+    bucket.pause(0.5)
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.01)
+
+
+def test_adaptive_rate_rises_on_success_and_halves_on_throttle():
+    limiter = AdaptiveRateLimiter(rate_per_second=1.0, increase_per_success=0.1, state_path=None)
+    for _ in range(5):
+        limiter.record_success("stats.nba.com")
+    assert limiter.rate("stats.nba.com") == pytest.approx(1.5)
+    limiter.record_throttle("stats.nba.com")
+    assert limiter.rate("stats.nba.com") == pytest.approx(0.75)
+    # A second signal within the same request interval is the same event.
+    limiter.record_throttle("stats.nba.com")
+    assert limiter.rate("stats.nba.com") == pytest.approx(0.75)
+    assert limiter.rate("cdn.nba.com") == pytest.approx(1.0)
+
+
+def test_adaptive_rate_stays_within_bounds():
+    limiter = AdaptiveRateLimiter(
+        rate_per_second=1.0, min_rate_per_second=0.8, max_rate_per_second=1.2,
+        increase_per_success=1.0, state_path=None,
+    )
+    limiter.record_success("h")
+    assert limiter.rate("h") == 1.2
+    limiter.record_throttle("h")
+    assert limiter.rate("h") == 0.8
+
+
+def test_retry_after_pauses_the_host():
+    limiter = AdaptiveRateLimiter(rate_per_second=100.0, state_path=None)
+    limiter.record_throttle("stats.nba.com", retry_after=0.5)
+    assert limiter.bucket("stats.nba.com").reserve() == pytest.approx(0.5, abs=0.05)
+
+
+def test_learned_rate_persists_between_instances(tmp_path):
+    state = tmp_path / "pacing.json"
+    first = AdaptiveRateLimiter(rate_per_second=2.0, state_path=state)
+    first.record_throttle("stats.nba.com")
+    second = AdaptiveRateLimiter(rate_per_second=2.0, state_path=state)
+    assert second.rate("stats.nba.com") == pytest.approx(1.0)
+    assert second.rate("cdn.nba.com") == pytest.approx(2.0)
+
+
+def test_corrupt_state_file_is_ignored(tmp_path):
+    state = tmp_path / "pacing.json"
+    state.write_text("{not json")
+    assert AdaptiveRateLimiter(rate_per_second=2.0, state_path=state).rate("h") == 2.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # in the past
+
+
+def test_throttle_signals():
+    assert is_throttle(429, requests.HTTPError("429"), (requests.ReadTimeout,))
+    assert is_throttle(403, requests.HTTPError("403"), (requests.ReadTimeout,))
+    assert is_throttle(None, requests.ReadTimeout("slow"), (requests.ReadTimeout,))
+    assert is_throttle(200, ValueError("html page"), (requests.ReadTimeout,))
+    assert not is_throttle(500, requests.HTTPError("500"), (requests.ReadTimeout,))
+    assert not is_throttle(None, requests.ConnectionError("down"), (requests.ReadTimeout,))
+
+
+def test_client_reports_throttle_with_retry_after_and_success():
+    limiter = MagicMock(spec=AdaptiveRateLimiter)
+    client = NBAStatsClient(max_retries=2, backoff_seconds=0, rate_limiter=limiter)
+    throttled = MagicMock(status_code=429, headers={"Retry-After": "3"})
+    throttled.raise_for_status.side_effect = requests.HTTPError("429")
+    good = MagicMock(status_code=200)
+    good.json.return_value = {"ok": True}
+    with patch.object(client.session, "get", side_effect=[throttled, good]):
+        assert client.get_json("https://stats.nba.com/stats/x") == {"ok": True}
+    limiter.record_throttle.assert_called_once_with("https://stats.nba.com/stats/x", 3.0)
+    limiter.record_success.assert_called_once_with("https://stats.nba.com/stats/x")
@@ -0,0 +1,97 @@
+import pytest
+from nba_api.stats.endpoints import LeagueDashPlayerStats
+
+from live_client.async_client import AsyncNBAStatsClient
+from live_client.cache import DiskCache
+from live_client.client import LIVE_BASE_URL, STATS_BASE_URL, BaseURLs, NBAClientError, NBAStatsClient
+from live_client.endpoints.live.scoreboard import URL as SCOREBOARD_URL
+from live_client.endpoints.stats.season_totals import PlayerSeasonTotals
+from live_client.replay_server import FaultConfig, ReplayServer
+
+
+def _season_totals(season, points):
+    return {
+        "resource": "leaguedashplayerstats",
+        "parameters": {"Season": season, "SeasonType": "Regular Season", "MeasureType": "Base"},
+        "resultSets": [{
+            "name": "LeagueDashPlayerStats",
+            "headers": [
+                "PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION", "GP", "MIN", "PTS", "REB",
+                "AST", "STL", "BLK", "TOV", "FG_PCT", "FG3_PCT", "FT_PCT",
+            ],
+            "rowSet": [[1, "Player One", 10, "AAA", 82, 2500, points, 400, 300, 80, 40, 150, 0.48, 0.38, 0.85]],
+        }],
+    }
+
+
+SCOREBOARD = {"meta": {}, "scoreboard": {"gameDate": "2025-01-01", "games": []}}
+
+
+@pytest.fixture
+def recordings(tmp_path):
+    cache = DiskCache(tmp_path / "recorded")
+    cache.set("PlayerSeasonTotals", {"season": "2023-24"}, _season_totals("2023-24", 1800))
+    cache.set("PlayerSeasonTotals", {"season": "2024-25"}, _season_totals("2024-25", 2100))
+    cache.set("TodaysScoreboard", {}, SCOREBOARD)
+    return cache.cache_dir
+
+
+def _client(server, **kwargs):
+    return NBAStatsClient(
+        backoff_seconds=0, stats_base_url=server.stats_base_url, live_base_url=server.live_base_url, **kwargs
+    )
+
+
+def test_base_urls_rewrite_only_the_overridden_prefix(monkeypatch):
+    monkeypatch.setenv("NBA_LIVE_BASE_URL", "http://localhost:1/static/json/liveData/")
+    urls = BaseURLs()
+    assert urls.rewrite(f"{LIVE_BASE_URL}/scoreboard/x.json") == "http://localhost:1/static/json/liveData/scoreboard/x.json"
+    assert urls.rewrite(f"{STATS_BASE_URL}/leaguedashplayerstats") == f"{STATS_BASE_URL}/leaguedashplayerstats"
+    assert BaseURLs(stats_base_url="http://a/stats").stats == "http://a/stats"  # explicit beats env
+
+
+def test_replays_recorded_responses_matched_on_their_params(recordings, tmp_path):
+    with ReplayServer(recordings) as server, _client(server) as client:
+        assert client.get_json(SCOREBOARD_URL) == SCOREBOARD
+        raw = client.get_via_nba_api(LeagueDashPlayerStats(season="2024-25", get_request=False))
+        assert raw["resultSets"][0]["rowSet"][0][6] == 2100
+
+        # End to end through an Endpoint (streamed bytes path), into a fresh cache.
+        frame = PlayerSeasonTotals(season="2023-24", client=client, cache=DiskCache(tmp_path / "cold")).fetch().to_dataframe()
+        assert frame["PTS"].tolist() == [1800]
+        assert server.stats()["served"] == 3
+
+
+def test_unrecorded_requests_are_404s_the_client_retries(recordings):
+    with ReplayServer(recordings) as server, _client(server, max_retries=2) as client:
+        with pytest.raises(NBAClientError):
+            client.get_via_nba_api(LeagueDashPlayerStats(season="1999-00", get_request=False))
+        assert server.stats()["misses"] == 2
+
+
+def test_injected_faults_are_retried_and_counted(recordings):
+    faults = FaultConfig(throttle_rate=0.3, error_rate=0.3, seed=7)
+    with ReplayServer(recordings, faults) as server, _client(server, max_retries=20) as client:
+        for _ in range(5):
+            assert client.get_json(SCOREBOARD_URL) == SCOREBOARD
+        stats = server.stats()
+    assert stats["served"] == 5 and stats["distinct_urls"] == 1
+    assert stats["throttles"] + stats["errors"] == stats["requests"] - 5 > 0
+
+
+def test_hangs_are_dropped_connections(recordings):
+    faults = FaultConfig(hang_rate=1.0, hang_seconds=0.0)
+    with ReplayServer(recordings, faults) as server, _client(server, max_retries=1) as client:
+        with pytest.raises(NBAClientError):
+            client.get_json(SCOREBOARD_URL)
+        assert server.stats()["hangs"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_revalidates_against_the_replayed_etag(recordings):
+    with ReplayServer(recordings) as server:
+        async with AsyncNBAStatsClient(live_base_url=server.live_base_url, backoff_seconds=0) as client:
+            first = await client.get_json_if_changed(SCOREBOARD_URL)
+            second = await client.get_json_if_changed(SCOREBOARD_URL, first.validators)
+        assert first.data == SCOREBOARD and second.not_modified
+        assert server.stats()["not_modified"] == 1
@@ -1,7 +1,7 @@
 import pandas as pd
 import pytest
 
-from live_client.response import NBAResponse
+from live_client.response import NBAResponse, frame_from_rows, json_normalize_columns
 
 RESULT_SETS_PAYLOAD = {
     "resultSets": [
@@ -65,3 +65,128 @@ def test_pre_built_dataframe_is_used_as_is_for_live_endpoints():
 def test_requires_dataframe_or_result_set_name():
     with pytest.raises(ValueError):
         NBAResponse({"anything": True})
+
+
+def test_columns_come_from_headers_without_parsing_rows():
+    response = NBAResponse(RESULT_SETS_PAYLOAD, result_set_name="LeagueDashPlayerStats")
+    assert response.columns()[0] == "PLAYER_ID"
+    assert response._dataframe is None
+
+
+def test_dataframe_builder_runs_once_and_on_demand():
+    calls = []
+
+    def _build():
+        calls.append(1)
+        return pd.DataFrame({"a": [1]})
+
+    response = NBAResponse({"x": 1}, dataframe_builder=_build, columns=["a"])
+    assert response.columns() == ["a"]
+    assert calls == []
+    response.to_dataframe()
+    response.to_dataframe()
+    assert calls == [1]
+
+
+def test_copy_is_lazy_and_isolates_column_additions():
+    response = NBAResponse(RESULT_SETS_PAYLOAD, result_set_name="LeagueDashPlayerStats")
+    first, second = response.copy(), response.copy()
+    assert response._dataframe is None
+    first.to_dataframe()["EXTRA"] = 1
+    assert "EXTRA" not in second.to_dataframe().columns
+    assert "EXTRA" not in response.to_dataframe().columns
+
+
+def test_dtypes_type_the_result_set_parse():
+    payload = {"resultSets": [{
+        "name": "Shots", "headers": ["LOC_X", "SHOT_MADE_FLAG", "SHOT_ZONE_BASIC", "PCT", "GAME_ID"],
+        "rowSet": [[-12, 1, "Restricted Area", 0.5, "0022300001"], [230, 0, "Above the Break 3", 0.25, "0022300001"]],
+    }]}
+    dtypes = {"LOC_X": "int16", "SHOT_MADE_FLAG": "bool", "SHOT_ZONE_BASIC": "category", "PCT": "float32"}
+    df = NBAResponse(payload, result_set_name="Shots", dtypes=dtypes).to_dataframe()
+
+    assert list(df.columns) == ["LOC_X", "SHOT_MADE_FLAG", "SHOT_ZONE_BASIC", "PCT", "GAME_ID"]
+    assert df["LOC_X"].dtype == "int16" and df["LOC_X"].tolist() == [-12, 230]
+    assert df["SHOT_MADE_FLAG"].tolist() == [True, False]
+    assert isinstance(df["SHOT_ZONE_BASIC"].dtype, pd.CategoricalDtype)
+    assert df["PCT"].dtype == "float32"
+    # Undeclared columns are inferred exactly as the untyped parse would.
+    untyped = NBAResponse(payload, result_set_name="Shots").to_dataframe()
+    assert df["GAME_ID"].dtype == untyped["GAME_ID"].dtype
+
+
+def test_declared_dtype_the_data_does_not_fit_falls_back_to_inference():
+    df = frame_from_rows(
+        [[1, None, 70000], [0, 3, 1]],
+        ["FLAG", "N", "BIG"],
+        {"FLAG": "bool", "N": "int16", "BIG": "int16"},
+    )
+    assert df["FLAG"].dtype == bool
+    assert df["N"].isna().tolist() == [True, False]
+    assert df["BIG"].tolist() == [70000, 1]
+
+
+def test_bytes_body_parses_without_ever_building_the_dict():
+    import json
+
+    body = json.dumps(RESULT_SETS_PAYLOAD).encode()
+    response = NBAResponse(body, result_set_name="LeagueDashPlayerStats", dtypes={"PTS": "float32"})
+    assert response.columns() == ["PLAYER_ID", "PLAYER_NAME", "PTS"]
+    df = response.to_dataframe()
+    assert df["PLAYER_NAME"].tolist() == ["A Player", "B Player"]
+    assert df["PTS"].dtype == "float32"
+    assert response._raw is None
+    assert response.to_dict() == RESULT_SETS_PAYLOAD
+
+
+def test_bytes_body_is_decoded_once_for_validation_and_parse():
+    import json
+
+    decodes = []
+
+    class _CountingBytes(bytes):
+        def decode(self, *args, **kwargs):
+            decodes.append(1)
+            return super().decode(*args, **kwargs)
+
+    response = NBAResponse(_CountingBytes(json.dumps(RESULT_SETS_PAYLOAD).encode()), result_set_name="Other")
+    response.columns()
+    response.columns()
+    assert response.to_dataframe()["X"].tolist() == [1]
+    assert len(decodes) == 1
+
+
+def test_decoded_text_is_counted_while_held_and_dropped_after_the_parse():
+    import json
+
+    body = json.dumps(RESULT_SETS_PAYLOAD).encode()
+    response = NBAResponse(body, result_set_name="LeagueDashPlayerStats")
+    assert response.nbytes() == len(body)
+    response.columns()
+    assert response.nbytes() == 2 * len(body)
+    df = response.to_dataframe()
+    assert response._raw_text is None
+    assert response.nbytes() == len(body) + int(df.memory_usage(index=True, deep=False).sum())
+
+
+def test_frame_from_rows_keeps_columns_and_dtypes_for_an_empty_row_set():
+    df = frame_from_rows([], ["LOC_X", "TEAM_NAME"], {"LOC_X": "int16"})
+    assert list(df.columns) == ["LOC_X", "TEAM_NAME"]
+    assert len(df) == 0 and df["LOC_X"].dtype == "int16"
+
+
+@pytest.mark.parametrize("bad_row", [[3], [3, "C Player", 1.0, "extra"]])
+def test_frame_from_rows_rejects_a_short_or_long_row(bad_row):
+    rows = [[1, "A Player", 20.5], bad_row]
+    with pytest.raises(ValueError, match="row 1"):
+        frame_from_rows(rows, ["PLAYER_ID", "PLAYER_NAME", "PTS"], {"PTS": "float32"})
+
+
+def test_json_normalize_columns_matches_pandas():
+    records = [{"a": 1, "b": {"c": 2, "d": {"e": 3}}}, {"a": 2, "f": [1, 2]}]
+    assert set(json_normalize_columns(records)) == set(pd.json_normalize(records).columns)
+
+
+def test_json_normalize_columns_drops_empty_dicts_like_pandas():
+    records = [{"a": {}, "b": 1, "c": {"d": {}, "e": 2}}, {"a": {"x": 1}}, {"g": {"h": {}}}]
+    assert json_normalize_columns(records) == list(pd.json_normalize(records).columns)
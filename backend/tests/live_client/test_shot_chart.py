@@ -0,0 +1,65 @@
+import pandas as pd
+
+from live_client.endpoints.stats.shot_chart import LeagueShotChart, partition_by_team
+
+BOS, LAL, MIA = 1610612738, 1610612747, 1610612748
+
+
+def _league_shots() -> pd.DataFrame:
+    # Two games: BOS vs LAL, and LAL vs MIA.
+    rows = [
+        ("g1", BOS, 0, 10, 1), ("g1", BOS, 50, 100, 0), ("g1", LAL, -20, 5, 1),
+        ("g2", LAL, 0, 250, 0), ("g2", MIA, 30, 30, 1), ("g2", MIA, -30, 30, 1),
+    ]
+    return pd.DataFrame(rows, columns=["GAME_ID", "TEAM_ID", "LOC_X", "LOC_Y", "SHOT_MADE_FLAG"])
+
+
+def test_partition_splits_offense_by_team_and_defense_by_opponent():
+    partitions = partition_by_team(_league_shots())
+    assert set(partitions) == {BOS, LAL, MIA}
+    assert len(partitions[BOS]["offense"]) == 2
+    assert partitions[BOS]["defense"]["TEAM_ID"].tolist() == [LAL]
+    # LAL's defense is every shot taken against it, across both games.
+    assert sorted(partitions[LAL]["defense"]["TEAM_ID"].tolist()) == [BOS, BOS, MIA, MIA]
+    assert partitions[MIA]["defense"]["LOC_Y"].tolist() == [250]
+
+
+def test_partition_covers_every_shot_exactly_once_per_side():
+    shots = _league_shots()
+    partitions = partition_by_team(shots)
+    assert sum(len(p["offense"]) for p in partitions.values()) == len(shots)
+    assert sum(len(p["defense"]) for p in partitions.values()) == len(shots)
+
+
+def test_partition_skips_defense_for_games_with_one_team_only():
+    shots = pd.concat([_league_shots(), pd.DataFrame(
+        [("g3", BOS, 0, 0, 1)], columns=["GAME_ID", "TEAM_ID", "LOC_X", "LOC_Y", "SHOT_MADE_FLAG"],
+    )])
+    partitions = partition_by_team(shots)
+    assert len(partitions[BOS]["offense"]) == 3
+    assert sum(len(p["defense"]) for p in partitions.values()) == len(shots) - 1
+
+
+def test_league_shot_chart_requests_every_team_and_player():
+    endpoint = LeagueShotChart(season="2023-24", cache=object())
+    nba_api_endpoint = endpoint._nba_api_endpoint()
+    assert nba_api_endpoint.parameters["TeamID"] == 0
+    assert nba_api_endpoint.parameters["PlayerID"] == 0
+    assert nba_api_endpoint.parameters["Season"] == "2023-24"
+
+
+def test_league_shot_chart_parses_compact_dtypes_that_still_partition():
+    headers = ["GAME_ID", "PLAYER_ID", "TEAM_ID", "TEAM_NAME", "LOC_X", "LOC_Y", "SHOT_ZONE_BASIC", "SHOT_MADE_FLAG"]
+    rows = [
+        ["0022300001", 1, 1610612737, "Atlanta Hawks", -5, 10, "Restricted Area", 1],
+        ["0022300001", 2, 1610612738, "Boston Celtics", 220, 60, "Corner 3", 0],
+    ]
+    raw = {"resultSets": [{"name": "Shot_Chart_Detail", "headers": headers, "rowSet": rows}]}
+    shots = LeagueShotChart(season="2023-24", cache=object())._build_response(raw).to_dataframe()
+
+    assert shots["LOC_X"].dtype == "int16" and shots["LOC_Y"].dtype == "int16"
+    assert shots["SHOT_MADE_FLAG"].dtype == bool
+    assert isinstance(shots["TEAM_NAME"].dtype, pd.CategoricalDtype)
+    assert shots["TEAM_ID"].dtype == "int64"
+    partitions = partition_by_team(shots)
+    assert partitions[1610612737]["defense"]["TEAM_NAME"].tolist() == ["Boston Celtics"]
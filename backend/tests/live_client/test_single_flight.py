@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from live_client.cache import DiskCache
+from live_client.endpoints.stats.season_totals import PlayerSeasonTotals
+from live_client.single_flight import FileLock, SingleFlight
+
+SEASON_TOTALS_PAYLOAD = {
+    "resultSets": [{
+        "name": "LeagueDashPlayerStats",
+        "headers": [
+            "PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION",
+            "GP", "MIN", "PTS", "REB", "AST", "STL", "BLK", "TOV",
+            "FG_PCT", "FG3_PCT", "FT_PCT",
+        ],
+        "rowSet": [
+            [1, "Player One", 1610612738, "BOS", 82, 2500, 1800, 400, 300, 80, 40, 150, 0.48, 0.38, 0.85],
+        ],
+    }]
+}
+
+
+def _slow_client(delay=0.2):
+    client = MagicMock()
+
+    def _get_via_nba_api(endpoint):
+        time.sleep(delay)
+        return SEASON_TOTALS_PAYLOAD
+
+    client.get_via_nba_api.side_effect = _get_via_nba_api
+    return client
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def _work():
+        calls.append(1)
+        release.wait(2)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(flight.do, "key", _work) for _ in range(4)]
+        time.sleep(0.1)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == ["value"] * 4
+    assert len(calls) == 1
+    assert flight.shared_calls == 3
+
+
+def test_waiters_see_the_leaders_exception():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def _fail():
+        release.wait(2)
+        raise RuntimeError("upstream down")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(flight.do, "key", _fail) for _ in range(2)]
+        time.sleep(0.1)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError, match="upstream down"):
+                future.result()
+
+
+@pytest.mark.asyncio
+async def test_async_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    async def _work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "value"
+
+    results = await asyncio.gather(*(flight.ado("key", _work) for _ in range(3)))
+    assert results == ["value"] * 3
+    assert len(calls) == 1
+
+
+def test_file_lock_excludes_a_second_holder(tmp_path):
+    held = FileLock(tmp_path / "k.lock")
+    with held:
+        assert FileLock(tmp_path / "k.lock").acquire(blocking=False) is False
+    other = FileLock(tmp_path / "k.lock")
+    assert other.acquire(blocking=False) is True
+    other.release()
+
+
+def test_concurrent_endpoint_fetches_make_one_request(tmp_path):
+    client = _slow_client()
+    cache = DiskCache(cache_dir=tmp_path)
+
+    def _fetch(_):
+        return PlayerSeasonTotals(season="2023-24", client=client, cache=cache).fetch()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        responses = list(pool.map(_fetch, range(4)))
+
+    assert client.get_via_nba_api.call_count == 1
+    assert all(r.to_dataframe().iloc[0]["PLAYER_NAME"] == "Player One" for r in responses)
+    assert len({id(r.to_dataframe()) for r in responses}) == 4  # each caller got its own frame
+
+
+def test_fetch_rechecks_cache_after_waiting_on_another_process(tmp_path):
+    client = _slow_client(delay=0)
+    cache = DiskCache(cache_dir=tmp_path)
+    endpoint = PlayerSeasonTotals(season="2023-24", client=client, cache=cache)
+
+    # Stand-in for another process mid-fetch: it holds the key's lock, then
+    # stores the entry and releases.
+    other_process = cache.lock("PlayerSeasonTotals", endpoint.cache_key_params())
+    other_process.acquire()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(endpoint.fetch)
+        time.sleep(0.1)
+        cache.set("PlayerSeasonTotals", endpoint.cache_key_params(), SEASON_TOTALS_PAYLOAD)
+        other_process.release()
+        response = pending.result(timeout=5)
+
+    assert client.get_via_nba_api.call_count == 0
+    assert len(response.to_dataframe()) == 1
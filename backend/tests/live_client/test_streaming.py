@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from live_client.streaming import iter_array, read_columns, read_record_columns, stream_result_set
+
+SHOTS_BODY = json.dumps({
+    "resource": "shotchartdetail",
+    "parameters": {"Season": "2023-24", "ContextFilter": [1, {"nested": None}]},
+    "resultSets": [
+        {"name": "Other", "headers": ["X"], "rowSet": [[1], [2]]},
+        {"name": "Shot_Chart_Detail", "headers": ["GAME_ID", "LOC_X"], "rowSet": [["001", -5], ["001", 230]]},
+    ],
+}, indent=2)
+
+
+def test_stream_result_set_returns_headers_before_decoding_any_row():
+    headers, rows = stream_result_set(SHOTS_BODY, "Shot_Chart_Detail")
+    assert headers == ["GAME_ID", "LOC_X"]
+    assert next(rows) == ["001", -5]
+    assert list(rows) == [["001", 230]]
+
+
+def test_stream_result_set_handles_singular_key_and_unusual_member_order():
+    body = json.dumps({"resultSet": {"rowSet": [[82]], "headers": ["GP"], "name": "SeasonTotals"}})
+    headers, rows = stream_result_set(body, "SeasonTotals")
+    assert headers == ["GP"]
+    assert list(rows) == [[82]]
+
+
+def test_stream_result_set_errors_match_the_dict_lookup():
+    with pytest.raises(ValueError, match="No resultSet named 'Missing'.*'Other', 'Shot_Chart_Detail'"):
+        stream_result_set(SHOTS_BODY, "Missing")
+    with pytest.raises(ValueError, match="neither 'resultSets' nor 'resultSet'"):
+        stream_result_set(json.dumps({"game": {}}), "Missing")
+
+
+def test_malformed_body_raises_value_error():
+    with pytest.raises(ValueError):
+        list(stream_result_set('{"resultSets": [{"name": "A", "headers": ["X"], "rowSet": [[1] [2]]}]}', "A")[1])
+
+
+def test_iter_array_walks_a_key_path():
+    body = json.dumps({"meta": {"version": 1}, "game": {"gameId": "001", "actions": [{"n": 1}, {"n": 2}]}})
+    assert list(iter_array(body, ("game", "actions"))) == [{"n": 1}, {"n": 2}]
+    assert list(iter_array(body, ("game", "missing"))) == []
+    assert list(iter_array(body, ("meta", "version", "deeper"))) == []
+
+
+def test_read_columns_and_record_columns():
+    assert read_columns(iter([[1, "a"], [2, "b"]]), 2) == [[1, 2], ["a", "b"]]
+    columns = read_record_columns(iter([{"a": 1}, {"a": 2, "b": True}, {"b": False}]))
+    assert columns == {"a": [1, 2, None], "b": [None, True, False]}
+
+
+def test_read_columns_rejects_a_row_of_the_wrong_width():
+    with pytest.raises(ValueError, match="row 1 has 1 values for 2 headers"):
+        read_columns(iter([[1, "a"], [2]]), 2)
@@ -0,0 +1,63 @@
+import sys
+import types
+
+from backend.live_client.cache import DiskCache
+from backend.live_client.client import NBAStatsClient
+from backend.live_client.endpoints.live.scoreboard import TodaysScoreboard
+from backend.live_client.rate_limit import default_pacer
+from backend.live_client.replay_server import FaultConfig
+from ratings import benchmark_refreshes
+from ratings.benchmark_refreshes import run_benchmark
+
+
+SCOREBOARD = {"meta": {}, "scoreboard": {"gameDate": "2025-01-01", "games": [{
+    "gameId": "0022400001", "gameStatus": 1, "gameStatusText": "7:30 pm ET", "period": 0, "gameClock": "",
+    "homeTeam": {"teamId": 10, "teamTricode": "AAA", "score": 0},
+    "awayTeam": {"teamId": 20, "teamTricode": "BBB", "score": 0},
+}]}}
+
+
+def _fake_job_module(pacers=None):
+    """A refresh job that builds its own client and default-cached Endpoint,
+    like the real ones — so only the env overrides can redirect it."""
+    module = types.ModuleType("fake_refresh_job")
+
+    def run_refresh(write_output=True):
+        if pacers is not None:
+            pacers.append(default_pacer())
+        with NBAStatsClient(backoff_seconds=0, max_retries=10) as client:
+            TodaysScoreboard(client=client).fetch()
+
+    module.run_refresh = run_refresh
+    return module
+
+
+def test_runs_each_job_against_the_replay_with_a_cold_cache(tmp_path, monkeypatch):
+    recordings = DiskCache(tmp_path / "recorded")
+    recordings.set("TodaysScoreboard", {}, SCOREBOARD)
+    monkeypatch.setitem(sys.modules, "fake_refresh_job", _fake_job_module())
+    monkeypatch.setattr(benchmark_refreshes, "JOBS", {"fake": "fake_refresh_job"})
+
+    results = run_benchmark(recordings=recordings.cache_dir, faults=FaultConfig(error_rate=0.5, seed=3))
+    results += run_benchmark(recordings=recordings.cache_dir)
+
+    for row in results:
+        assert row["job"] == "fake" and row["error"] is None
+        assert row["served"] == 1  # the recorded cache itself never answered it
+        assert row["retries"] == row["requests"] - 1 == row["errors"]
+    assert results[0]["retries"] > 0 and results[1]["retries"] == 0
+
+
+def test_each_job_paces_through_its_own_scratch_pacer(tmp_path, monkeypatch):
+    recordings = DiskCache(tmp_path / "recorded")
+    recordings.set("TodaysScoreboard", {}, SCOREBOARD)
+    pacers = []
+    monkeypatch.setitem(sys.modules, "fake_refresh_job", _fake_job_module(pacers))
+    monkeypatch.setattr(benchmark_refreshes, "JOBS", {"a": "fake_refresh_job", "b": "fake_refresh_job"})
+    production = default_pacer()
+
+    run_benchmark(recordings=recordings.cache_dir)
+
+    assert len(pacers) == 2 and pacers[0] is not pacers[1]
+    assert all(p.state_path is None and p is not production for p in pacers)
+    assert default_pacer() is production
@@ -64,3 +64,23 @@ def test_current_nba_season_known_dates(monkeypatch):
 
     monkeypatch.setattr(refresh_player_ratings, "datetime", _FixedDatetimeOffseason)
     assert refresh_player_ratings.current_nba_season() == "2025-26"
+
+
+@pytest.mark.asyncio
+async def test_arun_refresh_builds_the_payload_off_the_event_loop(monkeypatch):
+    import threading
+
+    class _Response:
+        def to_dataframe(self):
+            return None
+
+    async def _afetch_all(endpoints):
+        return [_Response(), _Response()]
+
+    built_on = []
+    monkeypatch.setattr(refresh_player_ratings, "afetch_all", _afetch_all)
+    monkeypatch.setattr(
+        refresh_player_ratings, "_build_payload", lambda *args: built_on.append(threading.current_thread()) or {},
+    )
+    await refresh_player_ratings.arun_refresh(season="2025-26", write_output=False)
+    assert built_on and built_on[0] is not threading.current_thread()
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from ratings import refresh_shot_heatmaps
+
+BOS, LAL, NYK = 1610612738, 1610612747, 1610612752
+
+
+@pytest.fixture(autouse=True)
+def _isolated_output_file(tmp_path, monkeypatch):
+    """Keeps the real backend/outputs/shot_heatmaps.json untouched."""
+    monkeypatch.setattr(refresh_shot_heatmaps, "OUTPUT_FILE", tmp_path / "shot_heatmaps.json")
+
+
+def _season_result(ok=True):
+    shots = pd.DataFrame(
+        [("g1", BOS, 0, 10, 1), ("g1", BOS, 50, 100, 0), ("g1", LAL, -20, 5, 1)],
+        columns=["GAME_ID", "TEAM_ID", "LOC_X", "LOC_Y", "SHOT_MADE_FLAG"],
+    )
+    response = SimpleNamespace(to_dataframe=lambda: shots)
+    return SimpleNamespace(ok=ok, response=response if ok else None)
+
+
+def test_one_league_wide_call_per_season_builds_every_team_side(monkeypatch):
+    calls = []
+
+    def _fake_fetch_many(endpoints, max_workers):
+        calls.append([e.season for e in endpoints])
+        return [_season_result(ok=(e.season != "2017-18")) for e in endpoints]
+
+    monkeypatch.setattr(refresh_shot_heatmaps, "fetch_many", _fake_fetch_many)
+    monkeypatch.setattr(refresh_shot_heatmaps, "load_teams", lambda: pd.DataFrame(
+        {"full_name": ["Boston Celtics", "Los Angeles Lakers", "New York Knicks"], "team_id": [BOS, LAL, NYK]}
+    ))
+
+    payload = refresh_shot_heatmaps.run_refresh(start_years=[2016, 2017], write_output=False)
+
+    assert calls == [["2016-17", "2017-18"]]  # one request per season, all in one batch
+    assert payload["seasons_covered"] == [2016]  # the failed season is skipped, not fatal
+    by_key = {(h["team"], h["side"]): h["n_shots"] for h in payload["heatmaps"]}
+    assert by_key == {
+        ("Boston Celtics", "offense"): 2,
+        ("Boston Celtics", "defense"): 1,
+        ("Los Angeles Lakers", "offense"): 1,
+        ("Los Angeles Lakers", "defense"): 2,
+        # No shots in the season's frame: still an (empty) entry per side.
+        ("New York Knicks", "offense"): 0,
+        ("New York Knicks", "defense"): 0,
+    }
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from win_model.fold_store import FoldModelStore
+from win_model.model import (
+    FoldTransformCache,
+    bootstrap_residual_interval,
+    build_knn,
+    build_preprocessor,
+    search_fit_counts,
+    walk_forward_oof,
+)
+from win_model.validation import SeasonWalkForwardSplit
+
+FEATURES = ["WIN%", "PLUS_MINUS", "Payroll"]
+
+
+def _table(n_seasons=6, teams=20, seed=0):
+    rng = np.random.default_rng(seed)
+    seasons = np.repeat(np.arange(2016, 2016 + n_seasons), teams)
+    X = pd.DataFrame(rng.normal(size=(len(seasons), len(FEATURES))), columns=FEATURES)
+    X.loc[::5, "Payroll"] = np.nan
+    y = pd.Series(41 + 8 * X["WIN%"] + rng.normal(scale=3, size=len(seasons)))
+    return X, y, pd.Series(seasons)
+
+
+def test_fold_fits_are_loaded_the_second_time(tmp_path):
+    X, y, groups = _table()
+    splitter = SeasonWalkForwardSplit()
+    search = build_knn(build_preprocessor(FEATURES), X, y, groups, splitter)
+    store = FoldModelStore(tmp_path)
+
+    first = walk_forward_oof(search.best_estimator_, X, y, groups, splitter, store)
+    assert (store.hits, store.misses) == (0, 5)
+    second = walk_forward_oof(search.best_estimator_, X, y, groups, splitter, FoldModelStore(tmp_path))
+    for (_, _, a), (_, _, b), (_, _, plain) in zip(first, second, walk_forward_oof(search.best_estimator_, X, y, groups, splitter)):
+        np.testing.assert_array_equal(a, b)
+        np.testing.assert_allclose(a, plain)
+
+    train_idx, test_idx, preds = first[-1]
+    model = store.fold_model(search.best_estimator_, X, y, groups, train_idx, test_idx)
+    np.testing.assert_allclose(model.predict(X.iloc[test_idx]), preds)
+
+
+def test_key_covers_data_features_params_and_fold_but_survives_an_appended_season(tmp_path):
+    X, y, groups = _table()
+    store = FoldModelStore(tmp_path)
+    splits = list(SeasonWalkForwardSplit().split(X, y, groups))
+    train_idx, test_idx = splits[1]
+    base = store.fold_key(X, y, groups, train_idx, test_idx)
+
+    assert store.fold_key(X[FEATURES[::-1]], y, groups, train_idx, test_idx) != base
+    assert store.fold_key(X, y + 1, groups, train_idx, test_idx) != base
+    assert store.fold_key(X, y, groups, *splits[2]) != base
+    assert store.fold_key(X, y, groups, train_idx, test_idx, {"w": np.ones(len(X))}) != base
+    assert store.params_hash(build_preprocessor(FEATURES)) != store.params_hash(build_preprocessor(FEATURES[:2]))
+
+    new_X, new_y, new_groups = _table(n_seasons=1, seed=1)
+    X7 = pd.concat([X, new_X], ignore_index=True)
+    y7 = pd.concat([y, new_y], ignore_index=True)
+    groups7 = pd.concat([groups, new_groups + 6], ignore_index=True)
+    train7, test7 = list(SeasonWalkForwardSplit().split(X7, y7, groups7))[1]
+    assert store.fold_key(X7, y7, groups7, train7, test7) == base
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_store_backed_search_matches_grid_search_and_reruns_as_loads(tmp_path, cached):
+    X, y, groups = _table()
+    splitter = SeasonWalkForwardSplit()
+    preprocessor = build_preprocessor(FEATURES)
+    fold_cache = FoldTransformCache(preprocessor, X, y, groups, splitter) if cached else None
+
+    plain = build_knn(preprocessor, X, y, groups, splitter)
+    store = FoldModelStore(tmp_path)
+    stored = build_knn(preprocessor, X, y, groups, splitter, fold_cache, store=store)
+    assert stored.best_params_ == plain.best_params_
+    np.testing.assert_allclose(stored.cv_results_["mean_test_score"], plain.cv_results_["mean_test_score"])
+    assert (store.hits, store.misses) == (0, 100)
+
+    assert search_fit_counts(stored) == {"fits": 100, "evaluations": 100, "full_grid_fits": 100, "fits_saved": 0}
+
+    again = build_knn(preprocessor, X, y, groups, splitter, store=store)
+    assert again.best_params_ == plain.best_params_ and store.hits == 100
+    # Every score loaded: the same evaluations, no fits.
+    assert search_fit_counts(again) == {"fits": 0, "evaluations": 100, "full_grid_fits": 100, "fits_saved": 100}
+    # The winner's OOF fold fits (train.py, ensemble_experiment, the bootstrap interval) are the same keys.
+    bootstrap_residual_interval(again, X, y, groups, splitter, X.head(3), n_bootstrap=10, store=store)
+    assert store.misses == 100
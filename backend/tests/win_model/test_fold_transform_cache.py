@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from win_model.model import (
+    FoldTransformCache,
+    build_knn,
+    build_preprocessor,
+    gbm_pipeline,
+    recency_sample_weight,
+    search_fit_counts,
+    walk_forward_search,
+)
+from win_model.validation import SeasonWalkForwardSplit
+
+FEATURES = ["WIN%", "PLUS_MINUS", "Payroll"]
+
+
+def _table(n_seasons=6, teams=20, seed=0):
+    rng = np.random.default_rng(seed)
+    seasons = np.repeat(np.arange(2016, 2016 + n_seasons), teams)
+    X = pd.DataFrame(rng.normal(size=(len(seasons), len(FEATURES))), columns=FEATURES)
+    X.loc[::5, "Payroll"] = np.nan  # gives the imputer something to do
+    y = pd.Series(41 + 8 * X["WIN%"] + rng.normal(scale=3, size=len(seasons)))
+    return X, y, pd.Series(seasons)
+
+
+def test_cached_knn_search_matches_the_uncached_one():
+    X, y, groups = _table()
+    splitter = SeasonWalkForwardSplit()
+    preprocessor = build_preprocessor(FEATURES)
+
+    plain = build_knn(preprocessor, X, y, groups, splitter)
+    cache = FoldTransformCache(preprocessor, X, y, groups, splitter)
+    cached = build_knn(preprocessor, X, y, groups, splitter, cache)
+
+    np.testing.assert_allclose(cached.cv_results_["mean_test_score"], plain.cv_results_["mean_test_score"])
+    assert cached.best_params_ == plain.best_params_
+    np.testing.assert_allclose(cached.best_estimator_.predict(X), plain.best_estimator_.predict(X))
+
+
+def test_one_cache_serves_every_decay_rate_with_weights_sliced_per_fold():
+    X, y, groups = _table()
+    splitter = SeasonWalkForwardSplit()
+    preprocessor = build_preprocessor(FEATURES)
+    pipeline = gbm_pipeline(preprocessor, FEATURES)
+    grid = {"histgradientboostingregressor__max_leaf_nodes": [7, 15], "histgradientboostingregressor__max_iter": [20]}
+    weight = recency_sample_weight(groups, 0.8)
+
+    plain = walk_forward_search(pipeline, grid, X, y, groups, splitter,
+                                histgradientboostingregressor__sample_weight=weight)
+    cache = FoldTransformCache(preprocessor, X, y, groups, splitter)
+    for _ in range(2):
+        cached = walk_forward_search(pipeline, grid, X, y, groups, splitter, cache,
+                                     histgradientboostingregressor__sample_weight=weight)
+        np.testing.assert_allclose(cached.cv_results_["mean_test_score"], plain.cv_results_["mean_test_score"])
+
+    report = cache.report()
+    assert report["n_folds"] == 5 and report["candidates_searched"] == 4
+    assert (report["preprocessor_fits"], report["preprocessor_fits_uncached"]) == (5, 20)
+
+
+def test_cache_refuses_a_pipeline_with_a_different_preprocessor():
+    X, y, groups = _table()
+    splitter = SeasonWalkForwardSplit()
+    cache = FoldTransformCache(build_preprocessor(FEATURES), X, y, groups, splitter)
+    with pytest.raises(ValueError):
+        build_knn(build_preprocessor(FEATURES), X, y, groups, splitter, cache)
+
+
+def test_halving_scores_its_winner_on_every_fold_with_fewer_fits():
+    X, y, groups = _table(n_seasons=9)
+    splitter = SeasonWalkForwardSplit()
+    preprocessor = build_preprocessor(FEATURES)
+
+    grid = build_knn(preprocessor, X, y, groups, splitter)
+    cache = FoldTransformCache(preprocessor, X, y, groups, splitter)
+    halving = build_knn(preprocessor, X, y, groups, splitter, cache, search="halving")
+
+    # 20 candidates on the 2 newest folds, 7 on the next 4, 3 on the last 2.
+    assert [r["n_candidates"] for r in halving.rungs] == [20, 7, 3]
+    assert halving.rungs[0]["seasons_scored"] == [2023, 2024]
+    counts = search_fit_counts(halving)
+    assert counts == {"fits": 74, "evaluations": 74, "full_grid_fits": 160, "fits_saved": 86}
+    assert cache.report()["preprocessor_fits_uncached"] == 74
+
+    # The winner's score is its full walk-forward MAE, the same number the grid computed for it.
+    winner = grid.cv_results_["params"].index(halving.best_params_)
+    assert halving.best_score_ == pytest.approx(grid.cv_results_["mean_test_score"][winner])
+    assert halving.best_score_ <= grid.best_score_ + 1e-12
+    assert len(halving.cv_results_["split7_test_score"]) == 3
+
+
+def test_a_categorical_with_categories_new_in_later_folds_runs_uncached():
+    X, y, groups = _table()
+    X["Conference"] = np.where(groups < 2019, "East", np.where(np.arange(len(X)) % 2, "East", "West"))
+    splitter = SeasonWalkForwardSplit()
+    preprocessor = build_preprocessor(FEATURES, ["Conference"])
+
+    with pytest.raises(ValueError, match="widths"):
+        FoldTransformCache(preprocessor, X, y, groups, splitter)
+    cache = FoldTransformCache.build(preprocessor, X, y, groups, splitter)
+    assert cache is None
+
+    search = build_knn(preprocessor, X, y, groups, splitter, cache)
+    assert np.isfinite(search.best_score_)
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from win_model import incremental, model
+from win_model.fold_store import FoldModelStore
+from win_model.incremental import (
+    TrainingState,
+    incremental_comparison,
+    plan_incremental,
+    season_fingerprint,
+    walk_forward_test_seasons,
+)
+from win_model.model import compare_models_walk_forward
+from win_model.validation import SeasonWalkForwardSplit
+
+FEATURES = ["WIN%", "PLUS_MINUS", "Payroll"]
+SMALL_GBM_GRID = {
+    "histgradientboostingregressor__max_leaf_nodes": [7, 15],
+    "histgradientboostingregressor__learning_rate": [0.1, 0.2],
+    "histgradientboostingregressor__max_iter": [20],
+}
+
+
+@pytest.fixture(autouse=True)
+def small_gbm_grid(monkeypatch):
+    monkeypatch.setattr(model, "GBM_PARAM_GRID", SMALL_GBM_GRID)
+    monkeypatch.setattr(incremental, "GBM_PARAM_GRID", SMALL_GBM_GRID)
+
+
+def _table(n_seasons, teams=20):
+    rng = np.random.default_rng(0)
+    season = np.repeat(np.arange(2016, 2016 + n_seasons), teams)
+    table = pd.DataFrame(rng.normal(size=(len(season), len(FEATURES))), columns=FEATURES)
+    table["Season"] = season
+    table["Team"] = np.tile([f"T{i:02d}" for i in range(teams)], n_seasons)
+    table["W"] = 41 + 8 * table["WIN%"] + rng.normal(scale=3, size=len(season))
+    return table
+
+
+def _fit_state(table, store):
+    X, y, groups = table[FEATURES], table["W"], table["Season"]
+    comparison = compare_models_walk_forward(X, y, groups, FEATURES, store=store)
+    test_seasons = walk_forward_test_seasons(X, y, groups, SeasonWalkForwardSplit())
+    fingerprint = season_fingerprint(table, FEATURES + ["W"])
+    return TrainingState.from_comparison(comparison, fingerprint, FEATURES, test_seasons)
+
+
+def test_appended_season_is_only_fit_on_its_own_fold(tmp_path):
+    full = _table(8)
+    store = FoldModelStore(tmp_path)
+    state = _fit_state(full[full["Season"] < 2023], store)
+    assert [len(state.candidates[f]) for f in ("knn", "gbm")] == [3, 3]
+
+    assert plan_incremental(state, season_fingerprint(full, FEATURES + ["W"]), FEATURES, "grid") is None
+    misses = store.misses
+    comparison, report = incremental_comparison(full[FEATURES], full["W"], full["Season"], FEATURES, None, state, store)
+    assert store.misses - misses == 6  # 3 stored candidates x 2 families x 1 new fold
+    assert report["new_seasons"] == [2023] and not any(f["re_searched"] for f in report["families"].values())
+    assert comparison.search_fits()["fits"] == 6
+
+    # Same walk-forward scores a from-scratch search gives those candidates on the grown table.
+    scratch = compare_models_walk_forward(full[FEATURES], full["W"], full["Season"], FEATURES)
+    for search, fresh in ((comparison.knn_search, scratch.knn_search), (comparison.gbm_search, scratch.gbm_search)):
+        for params, score in zip(search.cv_results_["params"], search.cv_results_["mean_test_score"]):
+            assert score == pytest.approx(fresh.cv_results_["mean_test_score"][fresh.cv_results_["params"].index(params)])
+
+
+def test_a_ranking_shift_past_the_tolerance_re_searches_the_family(tmp_path):
+    full = _table(8)
+    store = FoldModelStore(tmp_path)
+    state = _fit_state(full[full["Season"] < 2023], store)
+    comparison, report = incremental_comparison(
+        full[FEATURES], full["W"], full["Season"], FEATURES, None, state, store, tolerance=-1.0,
+    )
+    assert all(f["re_searched"] for f in report["families"].values())
+    scratch = compare_models_walk_forward(full[FEATURES], full["W"], full["Season"], FEATURES)
+    assert comparison.knn_search.best_params_ == scratch.knn_search.best_params_
+
+
+def test_changed_history_forces_a_full_run(tmp_path):
+    table = _table(6)
+    state = _fit_state(table, FoldModelStore(tmp_path))
+    revised = table.copy()
+    revised.loc[revised["Season"] == 2017, "Payroll"] += 1.0
+    fingerprint = season_fingerprint(revised, FEATURES + ["W"])
+    assert "2017" in plan_incremental(state, fingerprint, FEATURES, "grid")
+    assert plan_incremental(state, fingerprint, FEATURES, "halving") is not None
+    assert plan_incremental(None, fingerprint, FEATURES, "grid") == "no stored training state"
+
+    state.save(tmp_path / "state.json")
+    assert TrainingState.load(tmp_path / "state.json") == state
+
+
+def test_a_season_backfilled_before_the_last_trained_one_forces_a_full_run():
+    table = _table(6)
+    fingerprint = season_fingerprint(table, FEATURES + ["W"])
+    gap = {s: h for s, h in fingerprint.items() if s != "2018"}
+    state = TrainingState(gap, FEATURES, "grid", {})
+    assert "2018" in plan_incremental(state, fingerprint, FEATURES, "grid")
+
+    earlier = TrainingState({s: h for s, h in fingerprint.items() if s != "2021"}, FEATURES, "grid", {})
+    assert plan_incremental(earlier, fingerprint, FEATURES, "grid") is None
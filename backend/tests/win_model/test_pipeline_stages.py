@@ -0,0 +1,77 @@
+import pytest
+
+from win_model.pipeline_stages import Stage, StageCache, run_stages
+
+CALLS = []
+
+
+def _load(data_file):
+    CALLS.append("load")
+    return [int(v) for v in data_file.read_text().split()]
+
+
+def _scale(load, factor):
+    CALLS.append("scale")
+    return [v * factor for v in load]
+
+
+def _total(load):
+    CALLS.append("total")
+    return sum(load)
+
+
+def _report(scale, total, label):
+    CALLS.append("report")
+    return f"{label}: {scale} / {total}"
+
+
+STAGES = [
+    Stage("load", _load, inputs=("data_file",), files=("data_file",)),
+    Stage("scale", _scale, inputs=("load", "factor")),
+    Stage("total", _total, inputs=("load",)),
+    Stage("report", _report, inputs=("scale", "total", "label")),
+]
+
+
+def _run(tmp_path, stages=STAGES, **overrides):
+    CALLS.clear()
+    params = {"data_file": tmp_path / "data.txt", "factor": 2, "label": "run", **overrides}
+    outputs, timing = run_stages(stages, params, StageCache(tmp_path / "cache"))
+    assert [t["stage"] for t in timing] == [s.name for s in stages]
+    return outputs, {t["stage"] for t in timing if not t["cached"]}
+
+
+def test_rerun_loads_every_stage_and_recomputes_only_downstream_of_a_change(tmp_path):
+    (tmp_path / "data.txt").write_text("1 2 3")
+    outputs, computed = _run(tmp_path)
+    assert outputs["report"] == "run: [2, 4, 6] / 6" and computed == {"load", "scale", "total", "report"}
+
+    outputs, computed = _run(tmp_path)
+    assert outputs["report"] == "run: [2, 4, 6] / 6" and computed == set() and CALLS == []
+
+    assert _run(tmp_path, label="again")[1] == {"report"}
+    assert _run(tmp_path, factor=3)[1] == {"scale", "report"}
+
+    # A file input is keyed by its content, not its path.
+    (tmp_path / "moved.txt").write_text("1 2 3")
+    assert _run(tmp_path, data_file=tmp_path / "moved.txt")[1] == set()
+    (tmp_path / "data.txt").write_text("1 2 3 4")
+    outputs, computed = _run(tmp_path)
+    assert outputs["report"] == "run: [2, 4, 6, 8] / 10" and computed == {"load", "scale", "total", "report"}
+
+
+def test_a_stage_reruns_when_its_code_changes(tmp_path):
+    (tmp_path / "data.txt").write_text("1 2 3")
+    _run(tmp_path)
+
+    def _total(load):
+        return sum(load) + 1
+
+    changed = [s if s.name != "total" else Stage("total", _total, inputs=("load",)) for s in STAGES]
+    outputs, computed = _run(tmp_path, stages=changed)
+    assert computed == {"total", "report"} and outputs["report"] == "run: [2, 4, 6] / 7"
+
+
+def test_undeclared_input_is_an_error(tmp_path):
+    with pytest.raises(ValueError, match="missing"):
+        run_stages([Stage("total", _total, inputs=("missing",))], {}, StageCache(tmp_path))
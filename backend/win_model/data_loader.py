@@ -32,6 +32,8 @@ MASTER_DF_FILE    = MASTER_STATS_DIR / "master_df.csv"
 # Streamlit app assets
 RESULTS_FILE      = MASTER_STATS_DIR / "test_results.csv"
 METADATA_FILE     = MASTER_STATS_DIR / "model_metadata.json"
+# What the last train.py run trained on, for --incremental (see incremental.py)
+TRAINING_STATE_FILE = MASTER_STATS_DIR / "training_state.json"
 HEADSHOT_PATH     = DATA_PROCESSED / "fa25-headshot.JPG"
 LOGO_PATH         = DATA_PROCESSED / "logo.png"
 
@@ -44,6 +44,7 @@ import pandas as pd
 
 from .data_loader import MASTER_DF_FILE
 from .features import CATEGORICAL_FEATURES, NUMERIC_FEATURES, TARGET_COLUMN, prepare_model_table
+from .fold_store import default_fold_store
 from .model import compare_models_walk_forward
 
 try:
@@ -164,8 +165,13 @@ def run_experiment(master_df_path=None) -> dict:
     augmented_numeric = NUMERIC_FEATURES + [DEFENSE_COMPOSITE_COLUMN]
     augmented_X = merged[augmented_numeric + CATEGORICAL_FEATURES]
 
-    baseline = compare_models_walk_forward(baseline_X, y, groups, NUMERIC_FEATURES, CATEGORICAL_FEATURES)
-    augmented = compare_models_walk_forward(augmented_X, y, groups, augmented_numeric, CATEGORICAL_FEATURES)
+    store = default_fold_store()
+    baseline = compare_models_walk_forward(
+        baseline_X, y, groups, NUMERIC_FEATURES, CATEGORICAL_FEATURES, store=store
+    )
+    augmented = compare_models_walk_forward(
+        augmented_X, y, groups, augmented_numeric, CATEGORICAL_FEATURES, store=store
+    )
 
     baseline_mae = min(baseline.knn_walk_forward_mae, baseline.gbm_walk_forward_mae)
     augmented_mae = min(augmented.knn_walk_forward_mae, augmented.gbm_walk_forward_mae)
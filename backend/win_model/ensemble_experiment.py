@@ -21,11 +21,11 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
-from sklearn.base import clone
 
 from .data_loader import MASTER_DF_FILE
 from .features import CATEGORICAL_FEATURES, NUMERIC_FEATURES, TARGET_COLUMN, prepare_model_table
-from .model import compare_models_walk_forward
+from .fold_store import default_fold_store
+from .model import compare_models_walk_forward, walk_forward_oof
 from .validation import SeasonWalkForwardSplit
 
 EXTENDED_NUMERIC_FEATURES = NUMERIC_FEATURES
@@ -45,18 +45,21 @@ def run_experiment(master_df_path=None) -> dict:
     # walk-forward-tuned hyperparameters (best_estimator_) -- the ensemble
     # comparison below refits both at those fixed hyperparameters per fold,
     # same walk-forward splitter, so this is an apples-to-apples comparison
-    # against the single-model numbers already reported elsewhere.
-    comparison = compare_models_walk_forward(X, y, groups, EXTENDED_NUMERIC_FEATURES, CATEGORICAL_FEATURES)
+    # against the single-model numbers already reported elsewhere. Those
+    # per-fold refits are the same fits the searches just scored, so with the
+    # shared store they're loads.
+    store = default_fold_store()
+    comparison = compare_models_walk_forward(
+        X, y, groups, EXTENDED_NUMERIC_FEATURES, CATEGORICAL_FEATURES, store=store
+    )
     splitter = SeasonWalkForwardSplit()
 
+    gbm_folds = walk_forward_oof(comparison.gbm_search.best_estimator_, X, y, groups, splitter, store)
+    knn_folds = walk_forward_oof(comparison.knn_search.best_estimator_, X, y, groups, splitter, store)
     gbm_preds, knn_preds, actuals = [], [], []
-    for train_idx, test_idx in splitter.split(X, y, groups):
-        gbm_fold = clone(comparison.gbm_search.best_estimator_)
-        knn_fold = clone(comparison.knn_search.best_estimator_)
-        gbm_fold.fit(X.iloc[train_idx], y.iloc[train_idx])
-        knn_fold.fit(X.iloc[train_idx], y.iloc[train_idx])
-        gbm_preds.extend(gbm_fold.predict(X.iloc[test_idx]))
-        knn_preds.extend(knn_fold.predict(X.iloc[test_idx]))
+    for (_, test_idx, gbm_fold_preds), (_, _, knn_fold_preds) in zip(gbm_folds, knn_folds):
+        gbm_preds.extend(gbm_fold_preds)
+        knn_preds.extend(knn_fold_preds)
         actuals.extend(y.iloc[test_idx].to_numpy())
 
     gbm_preds = np.array(gbm_preds)
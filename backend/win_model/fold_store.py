@@ -0,0 +1,153 @@
+"""backend/win_model/fold_store.py
+
+On-disk store of walk-forward fold fits: a fold's out-of-fold predictions
+(and, for the fold loops, the fitted fold model itself), keyed by content,
+so a fold fit that's already been done -- earlier in this run or in an
+earlier one, by train.py or by any of the *_features / ensemble experiments
+-- is a load instead of a refit.
+
+train.py alone used to fit the winning pipeline on every fold twice (its
+OOF loop, then bootstrap_residual_interval collecting the very same
+residuals), and every experiment re-ran the same baseline searches over the
+same folds. All of those are now store lookups first.
+
+The key is a sha256 over:
+  - the fold's data: its training rows (X and y) and its test rows (X);
+  - the feature list (X's column names, in order);
+  - the estimator's params (joblib.hash of an unfitted clone -- which also
+    pickles the sklearn version, so an upgrade refits rather than trusting
+    models fitted by a different library);
+  - the fold (its test season);
+  - any fit params (e.g. sample weights), sliced to the training rows.
+A fold's key depends only on that fold's own rows, so appending a new
+season leaves every earlier fold's key -- and its stored fit -- intact.
+
+Files: predictions/<key>.npy and models/<key>.joblib under the store's
+root (win_model/.fold_store/, or $WIN_MODEL_FOLD_STORE_DIR), each written
+to a temp file and renamed into place, so a concurrent reader never sees a
+partial one. Delete the directory to force every fit to rerun.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+
+DEFAULT_STORE_DIR = Path(__file__).resolve().parent / ".fold_store"
+STORE_DIR_ENV = "WIN_MODEL_FOLD_STORE_DIR"
+
+
+def atomic_write(path: Path, write) -> None:
+    """`write(fileobj)` into a temp file beside `path`, then rename it over `path`."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def rows_hash(frame) -> str:
+    """Content hash of a DataFrame/Series's values, row order included, index ignored."""
+    return hashlib.sha256(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes()).hexdigest()
+
+
+class FoldModelStore:
+    """Stored fold fits under `root`; `hits`/`misses` count lookups."""
+
+    def __init__(self, root: Path | str = DEFAULT_STORE_DIR):
+        self.root = Path(root)
+        (self.root / "predictions").mkdir(parents=True, exist_ok=True)
+        (self.root / "models").mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    # ---- keys ----
+    def fold_key(self, X: pd.DataFrame, y, groups, train_idx, test_idx, fit_params: dict | None = None) -> str:
+        """Everything in the key except the estimator: computed once per fold
+        and combined with each candidate's params by key()."""
+        fit_params = fit_params or {}
+        parts = {
+            "train": rows_hash(X.iloc[train_idx]),
+            "target": rows_hash(pd.Series(np.asarray(y)[train_idx])),
+            "test": rows_hash(X.iloc[test_idx]),
+            "features": list(map(str, X.columns)),
+            "fold": str(np.asarray(groups)[test_idx[0]]),
+            "fit_params": {k: joblib.hash(np.asarray(v)[train_idx]) for k, v in sorted(fit_params.items())},
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+    @staticmethod
+    def params_hash(estimator) -> str:
+        return joblib.hash(clone(estimator))
+
+    @staticmethod
+    def key(fold_key: str, params_hash: str) -> str:
+        return hashlib.sha256(f"{fold_key}:{params_hash}".encode()).hexdigest()
+
+    # ---- raw get/put ----
+    def get_predictions(self, key: str) -> np.ndarray | None:
+        try:
+            predictions = np.load(self.root / "predictions" / f"{key}.npy")
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return predictions
+
+    def get_model(self, key: str):
+        try:
+            return joblib.load(self.root / "models" / f"{key}.joblib")
+        except (OSError, EOFError, ValueError):
+            return None
+
+    def put(self, key: str, predictions, model=None) -> None:
+        if model is not None:
+            atomic_write(self.root / "models" / f"{key}.joblib", lambda f: joblib.dump(model, f))
+        buffer = io.BytesIO()
+        np.save(buffer, np.asarray(predictions))
+        atomic_write(self.root / "predictions" / f"{key}.npy", lambda f: f.write(buffer.getvalue()))
+
+    # ---- fold loops ----
+    def fold_predictions(self, estimator, X: pd.DataFrame, y, groups, train_idx, test_idx) -> np.ndarray:
+        """`clone(estimator)` fit on the fold's training rows, predicted on its
+        test rows -- loaded if this exact fit is stored, else fit and stored
+        (model and predictions)."""
+        key = self.key(self.fold_key(X, y, groups, train_idx, test_idx), self.params_hash(estimator))
+        predictions = self.get_predictions(key)
+        if predictions is None:
+            _, predictions = self._fit(key, estimator, X, y, train_idx, test_idx)
+        return predictions
+
+    def fold_model(self, estimator, X: pd.DataFrame, y, groups, train_idx, test_idx):
+        """The fitted fold model itself, fitting (and storing) it if needed --
+        including when only its predictions were stored, by a search."""
+        key = self.key(self.fold_key(X, y, groups, train_idx, test_idx), self.params_hash(estimator))
+        model = self.get_model(key)
+        return model if model is not None else self._fit(key, estimator, X, y, train_idx, test_idx)[0]
+
+    def _fit(self, key: str, estimator, X: pd.DataFrame, y, train_idx, test_idx):
+        model = clone(estimator).fit(X.iloc[train_idx], np.asarray(y)[train_idx])
+        predictions = model.predict(X.iloc[test_idx])
+        self.put(key, predictions, model)
+        return model, predictions
+
+    def stats(self) -> dict:
+        return {"root": str(self.root), "hits": self.hits, "misses": self.misses}
+
+
+def default_fold_store() -> FoldModelStore:
+    """The store train.py and the experiments share; $WIN_MODEL_FOLD_STORE_DIR
+    moves it off win_model/.fold_store."""
+    return FoldModelStore(os.environ.get(STORE_DIR_ENV) or DEFAULT_STORE_DIR)
@@ -0,0 +1,215 @@
+"""backend/win_model/incremental.py
+
+Incremental retraining for train.py (`--incremental`): when master_df has
+grown by one or more completed seasons since the last run, redo only the
+part of the model comparison the new seasons can change.
+
+Almost all of a full run's cost is fold fits. Every earlier walk-forward
+fold's fits are already in the fold store (fold_store.py). Their keys depend
+only on that fold's own rows, and appending a season doesn't touch them. So
+the new work is only the fold(s) that test on the new season(s). This module
+decides how much of the hyperparameter search has to run on them.
+
+Every train.py run that writes outputs also saves a TrainingState
+(TRAINING_STATE_FILE):
+  - a fingerprint per season of the trainable table (feature columns +
+    target);
+  - the feature columns and search mode the run used;
+  - each family's TOP_CANDIDATES best hyperparameter combinations, best
+    first, with their walk-forward score on every fold (by test season).
+
+An incremental run:
+  1. Fingerprints the current table (plan_incremental). If any season it
+     has already trained on changed, a season was added before the last
+     trained one (it would join every later fold's training rows), or the
+     feature set or search mode changed, reusing stored scores would be
+     wrong. It falls back to a full run and
+     says why.
+  2. Otherwise it scores each family's stored candidates on the new folds
+     only (one fit per candidate per new season) and appends those scores
+     to the stored ones.
+  3. If a runner-up now beats the stored winner by more than
+     RANKING_TOLERANCE_WINS of walk-forward MAE, that family's ranking has
+     really moved, and its full grid is searched again. That is still cheap
+     with the store: only the new fold is fit. Otherwise the best of the
+     re-scored candidates stands.
+Everything after the comparison -- the OOF loop, the pooled bootstrap
+residuals, calibration, importance, the output files -- is train.py's
+normal path. Its fold fits hit the store the same way, so there too only
+the new fold is fit, and the outputs have exactly the shape of a full run.
+
+What the tolerance accepts: a candidate outside the stored top few could
+in principle overtake them on the new season alone without any of them
+moving. A full run is always one flag away.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import ParameterGrid
+
+from .fold_store import FoldModelStore, rows_hash
+from .model import (
+    GBM_PARAM_GRID,
+    KNN_PARAM_GRID,
+    ModelComparison,
+    WalkForwardSearchResult,
+    build_gbm,
+    build_knn,
+    build_preprocessor,
+    gbm_pipeline,
+    knn_pipeline,
+    score_candidates_on_folds,
+)
+from .validation import SeasonWalkForwardSplit
+
+RANKING_TOLERANCE_WINS = 0.05
+TOP_CANDIDATES = 3
+FAMILIES = ("knn", "gbm")
+
+
+def season_fingerprint(trainable: pd.DataFrame, columns: list[str]) -> dict[str, str]:
+    """Season -> content hash of that season's rows (sorted by Team) over `columns`."""
+    return {
+        str(season): rows_hash(rows.sort_values("Team")[columns])
+        for season, rows in trainable.groupby("Season")
+    }
+
+
+def walk_forward_test_seasons(X, y, groups, splitter: SeasonWalkForwardSplit) -> list[int]:
+    return [int(np.asarray(groups)[test_idx[0]]) for _, test_idx in splitter.split(X, y, groups)]
+
+
+@dataclass
+class TrainingState:
+    fingerprint: dict[str, str]
+    feature_columns: list[str]
+    search: str
+    # family -> [{"params": {...}, "fold_scores": {test season: neg-MAE}}], best first
+    candidates: dict[str, list[dict]]
+
+    @classmethod
+    def from_comparison(
+        cls, comparison: ModelComparison, fingerprint: dict[str, str], feature_columns: list[str],
+        test_seasons: list[int],
+    ) -> TrainingState:
+        candidates = {}
+        for family, search in (("knn", comparison.knn_search), ("gbm", comparison.gbm_search)):
+            cv_results = search.cv_results_
+            mean = np.asarray(cv_results["mean_test_score"])
+            runners_up = [i for i in np.argsort(-mean, kind="stable") if i != search.best_index_]
+            candidates[family] = [
+                {
+                    "params": cv_results["params"][i],
+                    "fold_scores": {
+                        str(season): float(cv_results[f"split{j}_test_score"][i])
+                        for j, season in enumerate(test_seasons)
+                    },
+                }
+                for i in [search.best_index_, *runners_up][:TOP_CANDIDATES]
+            ]
+        return cls(fingerprint, list(feature_columns), comparison.search_mode, candidates)
+
+    def save(self, path: Path) -> None:
+        Path(path).write_text(json.dumps(asdict(self), indent=2))
+
+    @classmethod
+    def load(cls, path: Path) -> TrainingState | None:
+        try:
+            return cls(**json.loads(Path(path).read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+
+
+def plan_incremental(
+    state: TrainingState | None, fingerprint: dict[str, str], feature_columns: list[str], search: str,
+) -> str | None:
+    """None if an incremental run can build on `state`; otherwise the reason
+    it can't (and train.py does a full run)."""
+    if state is None:
+        return "no stored training state"
+    if state.feature_columns != list(feature_columns):
+        return "feature columns changed"
+    if state.search != search:
+        return f"search mode changed ({state.search} -> {search})"
+    changed = sorted(s for s, h in state.fingerprint.items() if fingerprint.get(s) != h)
+    if changed:
+        return f"previously trained seasons changed: {', '.join(changed)}"
+    # A season slotted in before or between stored ones joins the training
+    # rows of every later fold, so those folds' stored scores no longer hold.
+    latest = max(map(int, state.fingerprint))
+    backfilled = sorted(s for s in map(int, fingerprint) if str(s) not in state.fingerprint and s < latest)
+    if backfilled:
+        return f"seasons added before the last trained season ({latest}): {', '.join(map(str, backfilled))}"
+    return None
+
+
+def incremental_comparison(
+    X: pd.DataFrame,
+    y: pd.Series,
+    groups: pd.Series,
+    numeric_features: list[str],
+    categorical_features: list[str] | None,
+    state: TrainingState,
+    store: FoldModelStore | None = None,
+    tolerance: float = RANKING_TOLERANCE_WINS,
+) -> tuple[ModelComparison, dict]:
+    """compare_models_walk_forward(), updated from `state` rather than
+    searched from scratch (see the module docstring). Returns the comparison
+    and a report of what was re-scored / re-searched, per family."""
+    splitter = SeasonWalkForwardSplit()
+    test_seasons = walk_forward_test_seasons(X, y, groups, splitter)
+    preprocessor = build_preprocessor(numeric_features, categorical_features)
+    pipelines = {"knn": knn_pipeline(preprocessor), "gbm": gbm_pipeline(preprocessor, numeric_features)}
+    grid_sizes = {"knn": len(ParameterGrid(KNN_PARAM_GRID)), "gbm": len(ParameterGrid(GBM_PARAM_GRID))}
+    new_seasons = sorted(set(map(int, groups.unique())) - set(map(int, state.fingerprint)))
+
+    searches, families = {}, {}
+    for family in FAMILIES:
+        stored = state.candidates[family]
+        candidates = [c["params"] for c in stored]
+        unscored = [s for s in test_seasons if str(s) not in stored[0]["fold_scores"]]
+        new_scores, n_fits = score_candidates_on_folds(
+            pipelines[family], candidates, X, y, groups, splitter, unscored, store,
+        ) if unscored else (np.empty((len(candidates), 0)), 0)
+        scores = np.column_stack([
+            new_scores[:, unscored.index(s)] if s in unscored else [c["fold_scores"][str(s)] for c in stored]
+            for s in test_seasons
+        ])
+        mean = scores.mean(axis=1)
+        re_search = bool(mean.max() - mean[0] > tolerance)
+        if re_search:
+            searches[family] = (
+                build_knn(preprocessor, X, y, groups, splitter, None, state.search, store) if family == "knn"
+                else build_gbm(preprocessor, X, y, groups, splitter, numeric_features, None, state.search, store)
+            )
+        else:
+            searches[family] = WalkForwardSearchResult.from_scores(
+                pipelines[family], candidates, scores, X, y,
+                rungs=[{"n_candidates": len(candidates), "seasons_scored": unscored,
+                        "evaluations": len(candidates) * len(unscored), "fits": n_fits}],
+                n_fits_full_grid=grid_sizes[family] * len(test_seasons),
+            )
+        previous = -np.mean(list(stored[0]["fold_scores"].values()))
+        families[family] = {
+            "previous_walk_forward_mae": round(float(previous), 3),
+            "incumbent_walk_forward_mae": round(float(-mean[0]), 3),
+            "best_rescored_walk_forward_mae": round(float(-mean.max()), 3),
+            "re_searched": re_search,
+        }
+
+    knn_mae, gbm_mae = -searches["knn"].best_score_, -searches["gbm"].best_score_
+    comparison = ModelComparison(
+        winner="knn" if knn_mae <= gbm_mae else "gbm",
+        knn_search=searches["knn"],
+        gbm_search=searches["gbm"],
+        knn_walk_forward_mae=knn_mae,
+        gbm_walk_forward_mae=gbm_mae,
+        search_mode=state.search,
+    )
+    return comparison, {"mode": "incremental", "reason": None, "new_seasons": new_seasons, "families": families}
@@ -12,26 +12,44 @@ to keep "ElasticNet picks features -> KNN uses them" without re-selecting featur
 inside every fold, which is a lot of added complexity for a mechanism already
 flagged as theoretically shaky. Feature selection is left to whichever model wins
 (GBM does this natively via split gain; KNN uses the full feature set).
+
+Every search here runs through walk_forward_search(), normally with a
+FoldTransformCache: each walk-forward fold's preprocessor is fit (and its
+train/test rows transformed) once, and every candidate of every search --
+KNN, GBM, each recency decay rate -- fits on those same matrices, instead of
+GridSearchCV refitting the identical imputer+scaler per candidate per fold.
+With search="halving" it also stops fitting every candidate on every fold:
+candidates are scored on the most recent seasons first and only the best
+third go on to the older ones (halving_walk_forward_search). And given a
+FoldModelStore (fold_store.py), any candidate/fold fit -- or OOF fold fit,
+walk_forward_oof() -- that's been done before is loaded, not refit.
 """
 
 from __future__ import annotations
 
+import logging
+import time
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
+from joblib import Parallel, delayed
 from sklearn.base import clone
 from sklearn.compose import make_column_transformer
 from sklearn.ensemble import HistGradientBoostingRegressor
 from sklearn.impute import SimpleImputer
 from sklearn.inspection import permutation_importance
-from sklearn.model_selection import GridSearchCV
+from sklearn.model_selection import GridSearchCV, ParameterGrid
 from sklearn.neighbors import KNeighborsRegressor
-from sklearn.pipeline import make_pipeline
+from sklearn.pipeline import Pipeline, make_pipeline
 from sklearn.preprocessing import OneHotEncoder, RobustScaler
 
+from .fold_store import FoldModelStore
 from .validation import SeasonWalkForwardSplit
 
+logger = logging.getLogger("basketball_predictions.win_model.model")
+
 # Features where a higher value should never translate into a *lower* predicted
 # win total, all else equal. Guards the GBM against learning a locally spurious
 # inverse relationship out of a small (~270-row), noisy dataset.
@@ -70,40 +88,418 @@ def _monotonic_constraints(numeric_features):
 
 
 # ===========================
-#   CANDIDATE MODELS
+#   FOLD-LEVEL TRANSFORM CACHE
 # ===========================
-def build_knn(preprocessor, X, y, groups, splitter):
-    """Grid-search a KNN regressor, tuned via walk-forward CV (not random folds)."""
-    pipeline = make_pipeline(preprocessor, KNeighborsRegressor())
-    param_grid = {
-        "kneighborsregressor__n_neighbors": [3, 5, 7, 10, 15],
-        "kneighborsregressor__weights": ["uniform", "distance"],
-        "kneighborsregressor__metric": ["euclidean", "manhattan"],
-    }
+class FoldTransformCache:
+    """Every walk-forward fold's preprocessor, fit once on that fold's
+    training rows, and the fold's train/test rows already transformed by it.
+
+    A plain GridSearchCV over make_pipeline(preprocessor, model) refits the
+    preprocessor for every (candidate, fold) pair -- and the preprocessor has
+    no searched params, so every one of those refits on a given fold is
+    identical. Here the folds' transformed matrices are stacked into one
+    array, `Z`, with `cv` indexing each fold's train/test block in it, so a
+    search over the model step alone (walk_forward_search) sees exactly the
+    inputs the full pipeline would have produced, fold by fold.
+
+    `report()` is the timing summary: preprocessing time actually spent vs.
+    what the uncached searches would have spent (each fold's measured cost,
+    once per candidate fit on it).
+
+    Stacking needs every fold's matrix to be the same width, which a
+    one-hot-encoded categorical breaks as soon as a later fold's training
+    rows carry a category an earlier fold's didn't. The constructor raises
+    ValueError then; build() is the caller-facing way in, returning None so
+    the search runs uncached, refitting the preprocessor per candidate.
+    """
+
+    def __init__(self, preprocessor, X: pd.DataFrame, y: pd.Series, groups, splitter: SeasonWalkForwardSplit):
+        self.preprocessor = preprocessor
+        self.fold_seconds: list[float] = []
+        self.candidates_searched = 0
+        self.fold_fits: list[int] = []  # candidate fits per fold, what the uncached searches would refit
+        blocks, rows, self.cv = [], [], []
+        offset = 0
+        for train_idx, test_idx in splitter.split(X, y, groups):
+            started = time.perf_counter()
+            fold_preprocessor = clone(preprocessor).fit(X.iloc[train_idx], y.iloc[train_idx])
+            blocks += [fold_preprocessor.transform(X.iloc[train_idx]), fold_preprocessor.transform(X.iloc[test_idx])]
+            self.fold_seconds.append(time.perf_counter() - started)
+            self.fold_fits.append(0)
+            rows += [train_idx, test_idx]
+            n_train, n_test = len(train_idx), len(test_idx)
+            self.cv.append((np.arange(offset, offset + n_train), np.arange(offset + n_train, offset + n_train + n_test)))
+            offset += n_train + n_test
+        widths = sorted({b.shape[1] for b in blocks})
+        if len(widths) > 1:
+            raise ValueError(f"fold preprocessors produced matrices of differing widths {widths}")
+        self.Z = sp.vstack(blocks, format="csr") if any(sp.issparse(b) for b in blocks) else np.vstack(blocks)
+        self._rows = np.concatenate(rows)
+        self.y = self.stack(y)
+
+    @classmethod
+    def build(cls, preprocessor, X: pd.DataFrame, y: pd.Series, groups, splitter: SeasonWalkForwardSplit):
+        """A FoldTransformCache over these folds, or None if their transformed
+        widths differ (see the class docstring) and the search must run
+        uncached."""
+        try:
+            return cls(preprocessor, X, y, groups, splitter)
+        except ValueError as exc:
+            logger.info("Not caching fold transforms: %s", exc)
+            return None
+
+    def stack(self, values) -> np.ndarray:
+        """A per-row array aligned to X (targets, sample weights) laid out
+        like Z: each fold's train rows, then its test rows."""
+        return np.asarray(values)[self._rows]
+
+    def report(self) -> dict:
+        return {
+            "n_folds": len(self.fold_seconds),
+            "candidates_searched": self.candidates_searched,
+            "preprocessor_fits": len(self.fold_seconds),
+            "preprocessor_fits_uncached": sum(self.fold_fits),
+            "preprocess_seconds": round(sum(self.fold_seconds), 3),
+            "preprocess_seconds_uncached": round(
+                sum(s * n for s, n in zip(self.fold_seconds, self.fold_fits)), 3
+            ),
+        }
+
+
+def walk_forward_search(
+    pipeline: Pipeline, param_grid, X, y, groups, splitter, fold_cache: FoldTransformCache | None = None,
+    search: str = "grid", store: FoldModelStore | None = None, **fit_params,
+) -> GridSearchCV | WalkForwardSearchResult:
+    """GridSearchCV(pipeline, param_grid, cv=splitter) on X, y -- MAE-scored,
+    refit on everything.
+
+    With a `fold_cache` (built from this same pipeline's first step), only
+    the model steps are searched, on the cache's per-fold matrices; the
+    searched param names (and `fit_params`, e.g. a step-prefixed
+    sample_weight) are unchanged, since the model steps keep their names.
+    cv_results_/best_params_/best_score_ come out the same as the uncached
+    search, and best_estimator_ is still the full pipeline refit on all of
+    X, y, exactly as refit=True would have produced.
+
+    `search="halving"` runs halving_walk_forward_search() instead of the
+    exhaustive grid (see SEARCH_MODES). With a `store`, every (candidate,
+    fold) fit is looked up in it first and only the missing ones are fit
+    (see fold_store.py); the result is then a WalkForwardSearchResult, since
+    GridSearchCV has no way to skip a fit it's been asked for.
+    """
+    if search not in SEARCH_MODES:
+        raise ValueError(f"search must be one of {SEARCH_MODES}, got {search!r}")
+    if fold_cache is not None and pipeline.steps[0][1] is not fold_cache.preprocessor:
+        raise ValueError("fold_cache was built for a different preprocessor than this pipeline's")
+    if search == "halving":
+        return halving_walk_forward_search(
+            pipeline, param_grid, X, y, groups, splitter, fold_cache, store=store, **fit_params
+        )
+    if store is not None:
+        return _rung_search(pipeline, param_grid, X, y, groups, splitter, fold_cache, store, None, None, fit_params)
+
+    if fold_cache is None:
+        grid = GridSearchCV(pipeline, param_grid, cv=splitter, scoring="neg_mean_absolute_error", n_jobs=-1)
+        grid.fit(X, y, groups=groups, **fit_params)
+        return grid
+
+    grid = GridSearchCV(
+        Pipeline(pipeline.steps[1:]), param_grid, cv=fold_cache.cv, scoring="neg_mean_absolute_error",
+        n_jobs=-1, refit=False,
+    )
+    grid.fit(fold_cache.Z, fold_cache.y, **{k: fold_cache.stack(v) for k, v in fit_params.items()})
+    fold_cache.candidates_searched += len(grid.cv_results_["params"])
+    fold_cache.fold_fits = [n + len(grid.cv_results_["params"]) for n in fold_cache.fold_fits]
+
+    started = time.perf_counter()
+    grid.best_estimator_ = clone(pipeline).set_params(**grid.best_params_).fit(X, y, **fit_params)
+    grid.refit_time_ = time.perf_counter() - started
+    return grid
+
+
+# ===========================
+#   SUCCESSIVE-HALVING SEARCH
+# ===========================
+# "grid" scores every candidate on every walk-forward fold; "halving" scores
+# every candidate on the most recent folds only, keeps the best 1/factor, and
+# widens the survivors' evaluation further back in time, rung by rung, until
+# the last survivors have been scored on every fold.
+SEARCH_MODES = ("grid", "halving")
+HALVING_FACTOR = 3
+HALVING_MIN_FOLDS = 2
+
+
+@dataclass
+class WalkForwardSearchResult:
+    """What halving_walk_forward_search() (and a store-backed grid search)
+    returns: the attributes of a fitted GridSearchCV that the rest of
+    win_model reads, over the final survivors only (each scored on every
+    fold), plus how the search got there.
+
+    `rungs` has one entry per rung: how many candidates it scored, the test
+    seasons it newly scored them on, its evaluation count (candidate x fold
+    scores) and its fit count -- fewer than its evaluations when a
+    FoldModelStore already held some of them (a store-backed grid search is
+    a single rung over every fold).
+    """
+    cv_results_: dict
+    best_index_: int
+    best_params_: dict
+    best_score_: float
+    best_estimator_: Pipeline
+    n_splits_: int
+    rungs: list[dict]
+    n_fits: int
+    n_fits_full_grid: int
+    n_evaluations: int
+
+    @classmethod
+    def from_scores(
+        cls, pipeline: Pipeline, candidates: list[dict], scores: np.ndarray, X, y, rungs: list[dict],
+        n_fits_full_grid: int, **fit_params,
+    ) -> WalkForwardSearchResult:
+        """Result over `candidates`, each scored (neg-MAE) on every fold in
+        `scores`' rows; the best is refit on all of X, y, as refit=True would."""
+        mean = scores.mean(axis=1)
+        best_index = int(np.argmax(mean))
+        best_params = candidates[best_index]
+        return cls(
+            cv_results_={
+                "params": list(candidates),
+                **{f"split{j}_test_score": scores[:, j] for j in range(scores.shape[1])},
+                "mean_test_score": mean,
+                "std_test_score": scores.std(axis=1),
+                "rank_test_score": (np.argsort(np.argsort(-mean, kind="stable")) + 1).astype(np.int32),
+            },
+            best_index_=best_index,
+            best_params_=best_params,
+            best_score_=float(mean[best_index]),
+            best_estimator_=clone(pipeline).set_params(**best_params).fit(X, y, **fit_params),
+            n_splits_=scores.shape[1],
+            rungs=rungs,
+            n_fits=sum(r["fits"] for r in rungs),
+            n_fits_full_grid=n_fits_full_grid,
+            n_evaluations=sum(r["evaluations"] for r in rungs),
+        )
+
+
+def search_fit_counts(search) -> dict:
+    """Candidate fits (one model fit on one fold) a walk_forward_search()
+    result took, against what the exhaustive grid takes. `evaluations` is
+    how many candidate x fold scores the search used; with a FoldModelStore
+    some of those were loaded rather than fit."""
+    if isinstance(search, WalkForwardSearchResult):
+        fits, evaluations, full = search.n_fits, search.n_evaluations, search.n_fits_full_grid
+    else:
+        fits = evaluations = full = len(search.cv_results_["params"]) * search.n_splits_
+    return {"fits": fits, "evaluations": evaluations, "full_grid_fits": full, "fits_saved": full - fits}
+
+
+def _score_candidates(estimator, candidates: list[dict], Z, y, folds: list, fit_params: dict) -> np.ndarray:
+    """neg-MAE of every candidate on every one of `folds`, shape
+    (len(candidates), len(folds))."""
     search = GridSearchCV(
-        pipeline, param_grid, cv=splitter, scoring="neg_mean_absolute_error", n_jobs=-1,
+        estimator, [{k: [v] for k, v in c.items()} for c in candidates], cv=folds,
+        scoring="neg_mean_absolute_error", n_jobs=-1, refit=False,
+    )
+    search.fit(Z, y, **fit_params)
+    return np.column_stack([search.cv_results_[f"split{j}_test_score"] for j in range(len(folds))])
+
+
+def _take(Z, idx):
+    return Z.iloc[idx] if isinstance(Z, pd.DataFrame) else Z[idx]
+
+
+def _fit_predict(model, Z, y, fold, fit_params: dict) -> np.ndarray:
+    train_idx, test_idx = fold
+    model.fit(_take(Z, train_idx), y[train_idx], **{k: np.asarray(v)[train_idx] for k, v in fit_params.items()})
+    return model.predict(_take(Z, test_idx))
+
+
+def _score_candidates_stored(
+    store: FoldModelStore, pipeline, estimator, candidates: list[dict], Z, y, folds: list, fold_keys: list[str],
+    fit_params: dict,
+) -> tuple[np.ndarray, list[int]]:
+    """_score_candidates(), but each (candidate, fold)'s test predictions are
+    loaded from `store` when present; only the rest are fit (in parallel, as
+    GridSearchCV would) and stored. Keys are the full pipeline's params, so
+    a hit doesn't depend on whether the fit ran on a FoldTransformCache's
+    matrices or on X. Also returns how many fits each fold actually took."""
+    y = np.asarray(y)
+    scores = np.empty((len(candidates), len(folds)))
+    keys = []
+    missing = []
+    for i, candidate in enumerate(candidates):
+        params_hash = store.params_hash(clone(pipeline).set_params(**candidate))
+        keys.append([store.key(fold_key, params_hash) for fold_key in fold_keys])
+        for j, (_, test_idx) in enumerate(folds):
+            predictions = store.get_predictions(keys[i][j])
+            if predictions is None:
+                missing.append((i, j))
+            else:
+                scores[i, j] = -np.mean(np.abs(y[test_idx] - predictions))
+    fitted = Parallel(n_jobs=-1)(
+        delayed(_fit_predict)(clone(estimator).set_params(**candidates[i]), Z, y, folds[j], fit_params)
+        for i, j in missing
+    )
+    for (i, j), predictions in zip(missing, fitted):
+        store.put(keys[i][j], predictions)
+        scores[i, j] = -np.mean(np.abs(y[folds[j][1]] - predictions))
+    return scores, [sum(1 for _, j in missing if j == fold) for fold in range(len(folds))]
+
+
+def halving_walk_forward_search(
+    pipeline: Pipeline, param_grid, X, y, groups, splitter, fold_cache: FoldTransformCache | None = None,
+    factor: int = HALVING_FACTOR, min_folds: int = HALVING_MIN_FOLDS, store: FoldModelStore | None = None,
+    **fit_params,
+) -> WalkForwardSearchResult:
+    """Successive halving over walk-forward folds, newest seasons first.
+
+    Rung 0 scores every candidate on the `min_folds` most recent folds; each
+    later rung keeps the best 1/`factor` of the candidates (by mean MAE over
+    every fold they've been scored on so far) and scores them on `factor`
+    times as many of the most recent folds -- only on the folds they haven't
+    been scored on yet -- until the survivors have every fold. Most recent
+    first because those are the seasons the deployed model is closest to: a
+    candidate that's weak on the last few seasons isn't going to win.
+
+    The winner is picked exactly as in the grid search: lowest MAE over all
+    walk-forward folds, among the candidates that reached the last rung. So
+    best_score_ is a full walk-forward score, comparable across searches;
+    what halving gives up is only the guarantee that an early-pruned
+    candidate couldn't have caught up on the older seasons.
+    """
+    result = _rung_search(pipeline, param_grid, X, y, groups, splitter, fold_cache, store, factor, min_folds, fit_params)
+    logger.info(
+        "successive halving over %d candidates x %d folds: %d evaluations, %d fits instead of %d (%d saved)",
+        result.n_fits_full_grid // result.n_splits_, result.n_splits_, result.n_evaluations, result.n_fits,
+        result.n_fits_full_grid, result.n_fits_full_grid - result.n_fits,
+    )
+    return result
+
+
+def _rung_search(
+    pipeline: Pipeline, param_grid, X, y, groups, splitter, fold_cache: FoldTransformCache | None,
+    store: FoldModelStore | None, factor: int | None, min_folds: int | None, fit_params: dict,
+) -> WalkForwardSearchResult:
+    """halving_walk_forward_search()'s rung loop; `min_folds=None` is a
+    single rung over every fold, i.e. the exhaustive grid."""
+    if fold_cache is None:
+        estimator, Z, y_fit, folds = pipeline, X, y, list(splitter.split(X, y, groups))
+        stacked_fit_params = fit_params
+    else:
+        estimator, Z, y_fit, folds = Pipeline(pipeline.steps[1:]), fold_cache.Z, fold_cache.y, fold_cache.cv
+        stacked_fit_params = {k: fold_cache.stack(v) for k, v in fit_params.items()}
+    n_folds = len(folds)
+    splits = list(splitter.split(X, y, groups))
+    test_seasons = [int(np.asarray(groups)[test_idx[0]]) for _, test_idx in splits]
+    if store is not None:
+        fold_keys = [store.fold_key(X, y, groups, train_idx, test_idx, fit_params) for train_idx, test_idx in splits]
+
+    candidates = list(ParameterGrid(param_grid))
+    scores = np.full((len(candidates), n_folds), np.nan)  # neg-MAE; NaN = never scored on that fold
+    alive = np.arange(len(candidates))
+    scored_from = n_folds  # folds[scored_from:] are the ones scored so far
+    rungs = []
+    rung = 0
+    while True:
+        start = 0 if min_folds is None else max(0, n_folds - min_folds * factor ** rung)
+        new_folds = list(range(start, scored_from))
+        rung_candidates = [candidates[i] for i in alive]
+        if store is None:
+            block = _score_candidates(
+                estimator, rung_candidates, Z, y_fit, [folds[j] for j in new_folds], stacked_fit_params,
+            )
+            fitted = [len(alive)] * len(new_folds)
+        else:
+            block, fitted = _score_candidates_stored(
+                store, pipeline, estimator, rung_candidates, Z, y_fit, [folds[j] for j in new_folds],
+                [fold_keys[j] for j in new_folds], stacked_fit_params,
+            )
+        scores[np.ix_(alive, new_folds)] = block
+        if fold_cache is not None:
+            for j, n in zip(new_folds, fitted):
+                fold_cache.fold_fits[j] += n
+        rungs.append({
+            "n_candidates": int(len(alive)),
+            "seasons_scored": [test_seasons[j] for j in new_folds],
+            "evaluations": int(len(alive) * len(new_folds)),
+            "fits": int(sum(fitted)),
+        })
+        scored_from = start
+        if start == 0:
+            break
+        n_keep = max(1, -(-len(alive) // factor))
+        alive = alive[np.argsort(-scores[alive, start:].mean(axis=1), kind="stable")[:n_keep]]
+        rung += 1
+    if fold_cache is not None:
+        fold_cache.candidates_searched += len(candidates)
+
+    return WalkForwardSearchResult.from_scores(
+        pipeline, [candidates[i] for i in alive], scores[alive], X, y, rungs, len(candidates) * n_folds, **fit_params,
     )
-    search.fit(X, y, groups=groups)
-    return search
 
 
-def build_gbm(preprocessor, X, y, groups, splitter, numeric_features):
-    """Grid-search a monotonic-constrained HistGradientBoostingRegressor via walk-forward CV."""
-    monotonic_cst = _monotonic_constraints(numeric_features)
-    pipeline = make_pipeline(
+def score_candidates_on_folds(
+    pipeline: Pipeline, candidates: list[dict], X, y, groups, splitter, test_seasons, store: FoldModelStore | None = None,
+) -> tuple[np.ndarray, int]:
+    """neg-MAE of each of `candidates` (param dicts for `pipeline`) on only
+    the walk-forward folds that test on `test_seasons`, shape
+    (len(candidates), len(test_seasons)) -- e.g. just a newly appended
+    season's fold (incremental.py) -- and how many of those scores took a
+    fit (the rest were loaded from `store`)."""
+    by_season = {int(np.asarray(groups)[test_idx[0]]): (train_idx, test_idx)
+                 for train_idx, test_idx in splitter.split(X, y, groups)}
+    folds = [by_season[int(season)] for season in test_seasons]
+    if store is None:
+        return _score_candidates(pipeline, candidates, X, y, folds, {}), len(candidates) * len(folds)
+    fold_keys = [store.fold_key(X, y, groups, train_idx, test_idx) for train_idx, test_idx in folds]
+    scores, fitted = _score_candidates_stored(store, pipeline, pipeline, candidates, X, y, folds, fold_keys, {})
+    return scores, sum(fitted)
+
+
+# ===========================
+#   CANDIDATE MODELS
+# ===========================
+KNN_PARAM_GRID = {
+    "kneighborsregressor__n_neighbors": [3, 5, 7, 10, 15],
+    "kneighborsregressor__weights": ["uniform", "distance"],
+    "kneighborsregressor__metric": ["euclidean", "manhattan"],
+}
+GBM_PARAM_GRID = {
+    "histgradientboostingregressor__max_leaf_nodes": [7, 15, 31],
+    "histgradientboostingregressor__learning_rate": [0.03, 0.1, 0.2],
+    "histgradientboostingregressor__min_samples_leaf": [5, 10, 20],
+}
+
+
+def knn_pipeline(preprocessor) -> Pipeline:
+    return make_pipeline(preprocessor, KNeighborsRegressor())
+
+
+def build_knn(
+    preprocessor, X, y, groups, splitter, fold_cache: FoldTransformCache | None = None, search: str = "grid",
+    store: FoldModelStore | None = None,
+):
+    """Grid-search a KNN regressor, tuned via walk-forward CV (not random folds)."""
+    pipeline = knn_pipeline(preprocessor)
+    return walk_forward_search(pipeline, KNN_PARAM_GRID, X, y, groups, splitter, fold_cache, search, store)
+
+
+def gbm_pipeline(preprocessor, numeric_features) -> Pipeline:
+    return make_pipeline(
         preprocessor,
-        HistGradientBoostingRegressor(monotonic_cst=monotonic_cst, random_state=42),
-    )
-    param_grid = {
-        "histgradientboostingregressor__max_leaf_nodes": [7, 15, 31],
-        "histgradientboostingregressor__learning_rate": [0.03, 0.1, 0.2],
-        "histgradientboostingregressor__min_samples_leaf": [5, 10, 20],
-    }
-    search = GridSearchCV(
-        pipeline, param_grid, cv=splitter, scoring="neg_mean_absolute_error", n_jobs=-1,
+        HistGradientBoostingRegressor(monotonic_cst=_monotonic_constraints(numeric_features), random_state=42),
     )
-    search.fit(X, y, groups=groups)
-    return search
+
+
+def build_gbm(
+    preprocessor, X, y, groups, splitter, numeric_features, fold_cache: FoldTransformCache | None = None,
+    search: str = "grid", store: FoldModelStore | None = None,
+):
+    """Grid-search a monotonic-constrained HistGradientBoostingRegressor via walk-forward CV."""
+    pipeline = gbm_pipeline(preprocessor, numeric_features)
+    return walk_forward_search(pipeline, GBM_PARAM_GRID, X, y, groups, splitter, fold_cache, search, store)
 
 
 # ===========================
@@ -149,7 +545,7 @@ def recency_sample_weight(seasons, decay_rate: float) -> np.ndarray:
 @dataclass
 class RecencyGBMResult:
     decay_rate: float
-    search: GridSearchCV
+    search: GridSearchCV | WalkForwardSearchResult
     walk_forward_mae: float
 
     def per_fold_mae(self) -> list[float]:
@@ -167,6 +563,8 @@ class RecencyGBMResult:
 
 def tune_gbm_recency(
     preprocessor, X, y, groups, splitter, numeric_features, decay_rates=DEFAULT_DECAY_RATES,
+    fold_cache: FoldTransformCache | None = None, cache_transforms: bool = True, search: str = "grid",
+    store: FoldModelStore | None = None,
 ) -> list[RecencyGBMResult]:
     """Same grid-searched GBM as build_gbm, tuned separately once per candidate
     `decay_rate` -- decay_rate itself can't be a literal GridSearchCV param
@@ -175,40 +573,51 @@ def tune_gbm_recency(
     picks between KNN and GBM: run the full walk-forward search per candidate,
     keep whichever has the best honest score. decay_rate=1.0 is included by
     default so "no weighting wins" is a real, expressible outcome.
+
+    The preprocessor takes no sample_weight, so every decay rate's search
+    shares one FoldTransformCache (`fold_cache`, or a fresh one unless
+    `cache_transforms=False`). `search` and `store` are walk_forward_search()'s,
+    applied to every decay rate's search.
     """
-    monotonic_cst = _monotonic_constraints(numeric_features)
-    pipeline = make_pipeline(
-        preprocessor,
-        HistGradientBoostingRegressor(monotonic_cst=monotonic_cst, random_state=42),
-    )
-    param_grid = {
-        "histgradientboostingregressor__max_leaf_nodes": [7, 15, 31],
-        "histgradientboostingregressor__learning_rate": [0.03, 0.1, 0.2],
-        "histgradientboostingregressor__min_samples_leaf": [5, 10, 20],
-    }
+    pipeline = gbm_pipeline(preprocessor, numeric_features)
+    if fold_cache is None and cache_transforms:
+        fold_cache = FoldTransformCache.build(preprocessor, X, y, groups, splitter)
     results = []
     for decay_rate in decay_rates:
         weight = recency_sample_weight(groups, decay_rate)
-        search = GridSearchCV(
-            clone(pipeline), param_grid, cv=splitter, scoring="neg_mean_absolute_error", n_jobs=-1,
+        result = walk_forward_search(
+            pipeline, GBM_PARAM_GRID, X, y, groups, splitter, fold_cache, search, store,
+            histgradientboostingregressor__sample_weight=weight,
         )
-        search.fit(X, y, groups=groups, histgradientboostingregressor__sample_weight=weight)
-        results.append(RecencyGBMResult(decay_rate=decay_rate, search=search, walk_forward_mae=-search.best_score_))
+        results.append(RecencyGBMResult(decay_rate=decay_rate, search=result, walk_forward_mae=-result.best_score_))
     return results
 
 
 @dataclass
 class ModelComparison:
     winner: str  # "knn" or "gbm"
-    knn_search: GridSearchCV
-    gbm_search: GridSearchCV
+    knn_search: GridSearchCV | WalkForwardSearchResult
+    gbm_search: GridSearchCV | WalkForwardSearchResult
     knn_walk_forward_mae: float
     gbm_walk_forward_mae: float
+    # FoldTransformCache.report(), or None if the searches ran uncached.
+    preprocessing: dict | None = None
+    search_mode: str = "grid"
 
     @property
-    def winning_search(self) -> GridSearchCV:
+    def winning_search(self) -> GridSearchCV | WalkForwardSearchResult:
         return self.knn_search if self.winner == "knn" else self.gbm_search
 
+    def search_fits(self) -> dict:
+        """search_fit_counts() per family and in total, under `search_mode`."""
+        knn, gbm = search_fit_counts(self.knn_search), search_fit_counts(self.gbm_search)
+        return {
+            "mode": self.search_mode,
+            "knn": knn,
+            "gbm": gbm,
+            **{k: knn[k] + gbm[k] for k in ("fits", "evaluations", "full_grid_fits", "fits_saved")},
+        }
+
 
 def compare_models_walk_forward(
     X: pd.DataFrame,
@@ -217,27 +626,64 @@ def compare_models_walk_forward(
     numeric_features: list[str],
     categorical_features: list[str] | None = None,
     min_train_seasons: int = 1,
+    cache_transforms: bool = True,
+    search: str = "grid",
+    store: FoldModelStore | None = None,
 ) -> ModelComparison:
     """Tune KNN and GBM independently via walk-forward CV, and keep whichever has the
     lower walk-forward MAE (`best_score_` from GridSearchCV, evaluated only on
-    held-out future seasons) — never in-sample fit."""
+    held-out future seasons) — never in-sample fit. Both searches share one
+    FoldTransformCache unless `cache_transforms=False`.
+
+    `search="halving"` tunes each family by successive halving over the
+    folds (halving_walk_forward_search) rather than the exhaustive grid; both
+    winners are still scored on every fold, so the KNN-vs-GBM call is made on
+    the same full walk-forward MAE either way. With a `store`, fold fits
+    already in it (e.g. the same baseline searched by another experiment)
+    are loaded rather than refit."""
     splitter = SeasonWalkForwardSplit(min_train_seasons=min_train_seasons)
     preprocessor = build_preprocessor(numeric_features, categorical_features)
+    fold_cache = FoldTransformCache.build(preprocessor, X, y, groups, splitter) if cache_transforms else None
 
-    knn_search = build_knn(preprocessor, X, y, groups, splitter)
-    gbm_search = build_gbm(preprocessor, X, y, groups, splitter, numeric_features)
+    knn_search = build_knn(preprocessor, X, y, groups, splitter, fold_cache, search, store)
+    gbm_search = build_gbm(preprocessor, X, y, groups, splitter, numeric_features, fold_cache, search, store)
 
     knn_mae = -knn_search.best_score_
     gbm_mae = -gbm_search.best_score_
     winner = "knn" if knn_mae <= gbm_mae else "gbm"
 
-    return ModelComparison(
+    comparison = ModelComparison(
         winner=winner,
         knn_search=knn_search,
         gbm_search=gbm_search,
         knn_walk_forward_mae=knn_mae,
         gbm_walk_forward_mae=gbm_mae,
+        preprocessing=fold_cache.report() if fold_cache is not None else None,
+        search_mode=search,
     )
+    fits = comparison.search_fits()
+    logger.info(
+        "%s search: %d candidate evaluations, %d fits vs. %d for the full grid (%d saved)",
+        search, fits["evaluations"], fits["fits"], fits["full_grid_fits"], fits["fits_saved"],
+    )
+    return comparison
+
+
+# ===========================
+#   OUT-OF-FOLD PREDICTIONS
+# ===========================
+def walk_forward_oof(estimator, X: pd.DataFrame, y: pd.Series, groups, splitter, store: FoldModelStore | None = None):
+    """(train_idx, test_idx, predictions) per walk-forward fold: `estimator`
+    refit (cloned) on each fold's training rows, predicting its test rows --
+    loaded from `store` when that exact fold fit is already in it."""
+    folds = []
+    for train_idx, test_idx in splitter.split(X, y, groups):
+        if store is None:
+            preds = clone(estimator).fit(X.iloc[train_idx], y.iloc[train_idx]).predict(X.iloc[test_idx])
+        else:
+            preds = store.fold_predictions(estimator, X, y, groups, train_idx, test_idx)
+        folds.append((train_idx, test_idx, preds))
+    return folds
 
 
 # ===========================
@@ -277,16 +723,16 @@ def bootstrap_residual_interval(
     n_bootstrap: int = 1000,
     alpha: float = 0.2,
     random_state: int = 42,
+    store: FoldModelStore | None = None,
 ):
     """For a model without a native quantile mode (KNN): pool out-of-fold walk-forward
     residuals across every fold, bootstrap-resample them, and add the resampled
-    residual to each point prediction to get an empirical interval."""
+    residual to each point prediction to get an empirical interval. The fold
+    fits are the same ones train.py's OOF loop makes, so with a `store` they're
+    loads, not refits."""
     rng = np.random.default_rng(random_state)
     residuals = []
-    for train_idx, test_idx in splitter.split(X, y, groups):
-        fold_model = clone(search.best_estimator_)
-        fold_model.fit(X.iloc[train_idx], y.iloc[train_idx])
-        preds = fold_model.predict(X.iloc[test_idx])
+    for train_idx, test_idx, preds in walk_forward_oof(search.best_estimator_, X, y, groups, splitter, store):
         residuals.extend((y.iloc[test_idx].to_numpy() - preds).tolist())
     residuals = np.array(residuals)
 
@@ -0,0 +1,185 @@
+"""backend/win_model/pipeline_stages.py
+
+A small content-hashed stage runner for train.py's pipeline: each step is a
+declared Stage, its output is cached on disk keyed by everything it depends
+on, and a rerun only recomputes the stages downstream of whatever actually
+changed.
+
+Before this, run_pipeline was one function, so touching anything in it --
+a FEATURE_NOTES string, the calibration step -- reran the full KNN/GBM
+searches just to rebuild the metadata. The fold store (fold_store.py)
+already makes repeated fold fits loads, but a run still hashed every fold of
+every candidate and refit the winning pipeline on all rows. With stages, an
+unchanged comparison is a single file load.
+
+A stage's key is a sha256 over:
+  - its name and its code version: the source of its function, of every
+    win_model module it declares in `modules` and every helper function in
+    `code`, and the numpy/pandas/scikit-learn versions (a pickled model
+    from another library version isn't trusted);
+  - the keys of the upstream stages it reads (so a change anywhere upstream
+    propagates down the chain, and only down it);
+  - the joblib.hash of each other run parameter it reads;
+  - for each parameter named in `files`, the content of the file or
+    directory that parameter points to -- not its path, so moving the data
+    doesn't invalidate anything, and editing it in place does.
+`resources` are passed through but never hashed (the fold store: which store
+a stage happens to use doesn't change what it computes).
+
+Files: <stage>/<key>.joblib under the cache root (win_model/.stage_cache/,
+or $WIN_MODEL_STAGE_CACHE_DIR), written to a temp file and renamed into
+place. Only the KEEP_PER_STAGE most recently used entries per stage are
+kept. Delete the directory to force every stage to rerun.
+
+What the key can't see: anything a stage reads that it doesn't declare -- a
+helper missing from `modules`/`code`, a file not routed through a `files`
+parameter. Declare them, or delete the cache after changing them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+
+from .fold_store import atomic_write
+
+logger = logging.getLogger("basketball_predictions.win_model.pipeline_stages")
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".stage_cache"
+CACHE_DIR_ENV = "WIN_MODEL_STAGE_CACHE_DIR"
+KEEP_PER_STAGE = 4
+
+_LIBRARY_VERSIONS = f"numpy={np.__version__};pandas={pd.__version__};sklearn={sklearn.__version__}"
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One pipeline step: `fn(**kwargs)` called with each name in `inputs`
+    (an earlier stage's output or a run parameter) and in `resources`."""
+
+    name: str
+    fn: Callable
+    inputs: tuple[str, ...] = ()
+    files: tuple[str, ...] = ()
+    modules: tuple[str, ...] = ()
+    code: tuple[Callable, ...] = ()
+    resources: tuple[str, ...] = ()
+
+    def code_version(self) -> str:
+        modules = [importlib.import_module(f"{__package__}.{name}") for name in self.modules]
+        sources = [inspect.getsource(obj) for obj in (self.fn, *modules, *self.code)]
+        return hashlib.sha256("\0".join([_LIBRARY_VERSIONS, *sources]).encode()).hexdigest()
+
+
+def content_hash(path) -> str:
+    """sha256 of a file's bytes, or of every file under a directory (relative
+    names included); "missing" if nothing is there -- a stage that reads an
+    optional file reruns once it appears."""
+    if path is None:
+        return "none"
+    path = Path(path)
+    if not path.exists():
+        return "missing"
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    digest = hashlib.sha256()
+    for file in files:
+        digest.update(str(file.relative_to(path)).encode() if path.is_dir() else b"")
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StageCache:
+    """Cached stage outputs under `root`."""
+
+    def __init__(self, root: Path | str = DEFAULT_CACHE_DIR):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.root / stage / f"{key}.joblib"
+
+    def get(self, stage: str, key: str):
+        """(True, output) if stored, else (False, None). An unreadable entry
+        (truncated, or pickled under the other invocation root's module
+        names) counts as a miss and is overwritten."""
+        path = self._path(stage, key)
+        try:
+            output = joblib.load(path)
+        except FileNotFoundError:
+            return False, None
+        except Exception as exc:
+            logger.warning("Ignoring unreadable cached output for stage %s (%s)", stage, exc)
+            return False, None
+        os.utime(path)  # most recently used, for pruning
+        return True, output
+
+    def put(self, stage: str, key: str, output) -> None:
+        path = self._path(stage, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, lambda f: joblib.dump(output, f))
+        entries = sorted(path.parent.glob("*.joblib"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for stale in entries[KEEP_PER_STAGE:]:
+            stale.unlink(missing_ok=True)
+
+
+def default_stage_cache() -> StageCache:
+    return StageCache(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+
+
+def stage_key(stage: Stage, params: dict, upstream_keys: dict[str, str]) -> str:
+    parts = {
+        "stage": stage.name,
+        # Pickled outputs reference classes by module path, which differs
+        # between the repo-root and backend/ invocation roots.
+        "package": __package__,
+        "code": stage.code_version(),
+        "upstream": {name: upstream_keys[name] for name in stage.inputs if name in upstream_keys},
+        "params": {
+            name: joblib.hash(params[name])
+            for name in stage.inputs if name not in upstream_keys and name not in stage.files
+        },
+        "files": {name: content_hash(params[name]) for name in stage.files},
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def run_stages(stages: list[Stage], params: dict, cache: StageCache | None = None, resources: dict | None = None):
+    """Runs `stages` in order, each either loaded from `cache` or computed and
+    stored. Returns (outputs by stage name, timing: one
+    {"stage", "seconds", "cached"} per stage)."""
+    cache = cache or default_stage_cache()
+    resources = resources or {}
+    outputs, keys, timing = {}, {}, []
+    for stage in stages:
+        unknown = [n for n in (*stage.inputs, *stage.files) if n not in outputs and n not in params]
+        unknown += [n for n in stage.resources if n not in resources]
+        if unknown:
+            raise ValueError(f"stage {stage.name!r} reads undeclared inputs: {unknown}")
+
+        started = time.perf_counter()
+        keys[stage.name] = key = stage_key(stage, params, keys)
+        cached, output = cache.get(stage.name, key)
+        if not cached:
+            kwargs = {n: outputs[n] if n in outputs else params[n] for n in stage.inputs}
+            output = stage.fn(**kwargs, **{n: resources[n] for n in stage.resources})
+            cache.put(stage.name, key, output)
+        outputs[stage.name] = output
+        seconds = time.perf_counter() - started
+        timing.append({"stage": stage.name, "seconds": round(seconds, 3), "cached": cached})
+        logger.info("Stage %s: %s in %.2fs", stage.name, "loaded" if cached else "computed", seconds)
+    return outputs, timing
@@ -30,7 +30,8 @@ import pandas as pd
 
 from .data_loader import MASTER_DF_FILE
 from .features import CATEGORICAL_FEATURES, NUMERIC_FEATURES, TARGET_COLUMN, prepare_model_table
-from .model import DEFAULT_DECAY_RATES, build_preprocessor, tune_gbm_recency
+from .fold_store import default_fold_store
+from .model import DEFAULT_DECAY_RATES, FoldTransformCache, build_preprocessor, tune_gbm_recency
 from .roster_change_features import ROSTER_CHANGE_COLUMN, build_roster_change_features
 from .validation import SeasonWalkForwardSplit
 
@@ -38,7 +39,10 @@ from .validation import SeasonWalkForwardSplit
 def _run_one(X, y, groups, numeric_features, decay_rates=DEFAULT_DECAY_RATES) -> dict:
     preprocessor = build_preprocessor(numeric_features, CATEGORICAL_FEATURES)
     splitter = SeasonWalkForwardSplit()
-    results = tune_gbm_recency(preprocessor, X, y, groups, splitter, numeric_features, decay_rates)
+    fold_cache = FoldTransformCache.build(preprocessor, X, y, groups, splitter)
+    results = tune_gbm_recency(
+        preprocessor, X, y, groups, splitter, numeric_features, decay_rates, fold_cache, store=default_fold_store()
+    )
 
     baseline = next(r for r in results if r.decay_rate == 1.0)
     best = min(results, key=lambda r: r.walk_forward_mae)
@@ -57,6 +61,7 @@ def _run_one(X, y, groups, numeric_features, decay_rates=DEFAULT_DECAY_RATES) ->
         "best_decay_rate": best.decay_rate,
         "best_walk_forward_mae": round(best.walk_forward_mae, 3),
         "improves_mae": bool(best.walk_forward_mae < baseline.walk_forward_mae),
+        "preprocessing": fold_cache.report() if fold_cache is not None else None,
     }
 
 
@@ -102,6 +107,9 @@ if __name__ == "__main__":
         print(f"  baseline (decay_rate=1.0): {section['baseline_decay_rate_1_0_mae']}")
         print(f"  best: decay_rate={section['best_decay_rate']} MAE={section['best_walk_forward_mae']}")
         print(f"  improves: {section['improves_mae']}")
+        timing = section["preprocessing"]
+        print(f"  preprocessing: {timing['preprocess_seconds']}s "
+              f"(uncached ~{timing['preprocess_seconds_uncached']}s)")
         print()
     verdict = "IMPROVES" if result["improves_mae"] else "does NOT improve"
     print(f"Recency weighting (stacked, the decisive test) {verdict} walk-forward MAE.")
@@ -28,26 +28,27 @@ Run manually: python -m backend.win_model.roster_change_features
 
 from __future__ import annotations
 
-import unicodedata
 from pathlib import Path
 
 import pandas as pd
 
 from .data_loader import MASTER_DF_FILE, PLAYER_STATS_DIR
 from .features import CATEGORICAL_FEATURES, NUMERIC_FEATURES, TARGET_COLUMN, prepare_model_table
+from .fold_store import default_fold_store
 from .model import compare_models_walk_forward
 from .utils import team_map
 
-ROSTER_CHANGE_COLUMN = "Roster_Change"
-
+# Strips accents/punctuation so Basketball-Reference and nba_api spellings of
+# the same player ('Nikola Jokić' vs 'Nikola Jokic') match as one player, not
+# a false departure+arrival pair. Shared with live_client's lookups; imported
+# relative-then-plain for the same two-invocation-roots reason as train.py's
+# ratings import.
+try:
+    from ..live_client.lookups.loader import normalize_name as _normalize_name
+except ImportError:
+    from live_client.lookups.loader import normalize_name as _normalize_name
 
-def _normalize_name(name: str) -> str:
-    """Strip accents/punctuation so Basketball-Reference and nba_api spellings
-    of the same player ('Nikola Jokić' vs 'Nikola Jokic') match as one player,
-    not a false departure+arrival pair."""
-    nfkd = unicodedata.normalize("NFKD", str(name))
-    ascii_name = "".join(c for c in nfkd if not unicodedata.combining(c))
-    return ascii_name.strip().lower().replace(".", "").replace("'", "")
+ROSTER_CHANGE_COLUMN = "Roster_Change"
 
 
 def _load_season_panel(season: int) -> pd.DataFrame:
@@ -191,8 +192,13 @@ def run_experiment(master_df_path=None) -> dict:
     augmented_numeric = NUMERIC_FEATURES + [ROSTER_CHANGE_COLUMN]
     augmented_X = merged[augmented_numeric + CATEGORICAL_FEATURES]
 
-    baseline = compare_models_walk_forward(baseline_X, y, groups, NUMERIC_FEATURES, CATEGORICAL_FEATURES)
-    augmented = compare_models_walk_forward(augmented_X, y, groups, augmented_numeric, CATEGORICAL_FEATURES)
+    store = default_fold_store()
+    baseline = compare_models_walk_forward(
+        baseline_X, y, groups, NUMERIC_FEATURES, CATEGORICAL_FEATURES, store=store
+    )
+    augmented = compare_models_walk_forward(
+        augmented_X, y, groups, augmented_numeric, CATEGORICAL_FEATURES, store=store
+    )
 
     baseline_mae = min(baseline.knn_walk_forward_mae, baseline.gbm_walk_forward_mae)
     augmented_mae = min(augmented.knn_walk_forward_mae, augmented.gbm_walk_forward_mae)
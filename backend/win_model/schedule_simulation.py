@@ -38,10 +38,10 @@ import pandas as pd
 
 try:
     from ..live_client.endpoints.stats.schedule import LeagueSchedule
-    from ..live_client.lookups.loader import team_name_for_id
+    from ..live_client.lookups.loader import team_names_for_ids
 except ImportError:
     from live_client.endpoints.stats.schedule import LeagueSchedule
-    from live_client.lookups.loader import team_name_for_id
+    from live_client.lookups.loader import team_names_for_ids
 
 
 def log5(win_pct_a: float, win_pct_b: float) -> float:
@@ -90,8 +90,8 @@ def fetch_regular_season_schedule(season: str) -> pd.DataFrame:
     raw = LeagueSchedule(season=season).fetch().to_dataframe()
     return pd.DataFrame({
         "gameId": raw["gameId"],
-        "home_team": raw["homeTeam_teamId"].map(team_name_for_id),
-        "away_team": raw["awayTeam_teamId"].map(team_name_for_id),
+        "home_team": team_names_for_ids(raw["homeTeam_teamId"]),
+        "away_team": team_names_for_ids(raw["awayTeam_teamId"]),
     })
 
 
@@ -9,17 +9,23 @@ Runs the full win-model pipeline end to end:
 Run from repo root:    python -m backend.win_model.train
 Run from backend/:      python -m win_model.train
 Both work because internal imports here are relative (see backend/AGENTS.md).
+Add `--search halving` to tune by successive halving instead of the full grid,
+and `--incremental` to update the last run for newly appended seasons.
+
+Each step runs as one of PIPELINE_STAGES, cached on disk by its inputs and
+code (pipeline_stages.py): a rerun recomputes only the stages downstream of
+what changed.
 """
 
 from __future__ import annotations
 
+import argparse
 import json
 from datetime import datetime, timezone
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from sklearn.base import clone
 
 from .calibration import (
     TOTAL_SEASON_WINS,
@@ -27,14 +33,25 @@ from .calibration import (
     historical_win_std,
     recenter_interval,
 )
-from .data_loader import MASTER_DF_FILE, METADATA_FILE, RESULTS_FILE
+from .data_loader import MASTER_DF_FILE, METADATA_FILE, PLAYER_STATS_DIR, RESULTS_FILE, TRAINING_STATE_FILE
 from .features import CATEGORICAL_FEATURES, NUMERIC_FEATURES, TARGET_COLUMN, prepare_model_table
+from .fold_store import FoldModelStore, default_fold_store
+from .incremental import (
+    TrainingState,
+    incremental_comparison,
+    plan_incremental,
+    season_fingerprint,
+    walk_forward_test_seasons,
+)
 from .model import (
+    SEARCH_MODES,
     bootstrap_residual_interval,
     compare_models_walk_forward,
     compute_feature_importance,
     gbm_quantile_interval,
+    walk_forward_oof,
 )
+from .pipeline_stages import Stage, StageCache, run_stages
 from .roster_change_features import ROSTER_CHANGE_COLUMN, build_roster_change_features, forecast_roster_change
 from .validation import SeasonWalkForwardSplit
 
@@ -133,7 +150,9 @@ FEATURE_NOTES = {
 _DEFAULT_FEATURE_NOTE = "No additional note recorded for this feature yet."
 
 
-def _apply_roster_projection(forecast_rows: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+def _apply_roster_projection(
+    forecast_rows: pd.DataFrame, projection_file: Path = ROSTER_PROJECTION_FILE,
+) -> tuple[pd.DataFrame, dict]:
     """Overrides the forecast row's avg_age/avg_pts_top10/avg_production_score
     with backend/ratings/refresh_roster_projection.py's output (real current
     rosters, projected one season forward via the empirical aging curve) —
@@ -166,15 +185,15 @@ def _apply_roster_projection(forecast_rows: pd.DataFrame) -> tuple[pd.DataFrame,
         ),
     }
 
-    if not ROSTER_PROJECTION_FILE.exists():
+    if not projection_file.exists():
         return forecast_rows, meta
 
     try:
-        payload = json.loads(ROSTER_PROJECTION_FILE.read_text())
+        payload = json.loads(projection_file.read_text())
         team_features = payload["team_features"]
     except (json.JSONDecodeError, KeyError):
         meta["note"] = (
-            f"{ROSTER_PROJECTION_FILE} exists but couldn't be read, so every team fell back "
+            f"{projection_file} exists but couldn't be read, so every team fell back "
             "to last season's carried-forward numbers instead."
         )
         return forecast_rows, meta
@@ -222,106 +241,114 @@ def _apply_roster_projection(forecast_rows: pd.DataFrame) -> tuple[pd.DataFrame,
     return forecast_rows, meta
 
 
-def run_pipeline(master_df_path=None, write_output: bool = True):
-    """Returns (results_df, metadata_dict); optionally writes both to disk."""
-    master_df = pd.read_csv(master_df_path or MASTER_DF_FILE)
-    table = prepare_model_table(master_df)
+# ---- Pipeline stages (see pipeline_stages.py) ----
+# Each stage gets everything it depends on as an argument -- run_pipeline
+# passes the module constants above in as run parameters rather than the
+# stage reading them -- so its cache key sees every one of them. The
+# metadata assembly and the output writes stay outside the stages: they're
+# cheap, and it's what lets a FEATURE_NOTES edit skip every search.
+
+
+def _new_seasons(fingerprint: dict[str, str], state: TrainingState | None) -> list[int]:
+    return sorted(set(map(int, fingerprint)) - set(map(int, state.fingerprint))) if state else []
 
-    trainable = table[table[TARGET_COLUMN].notna()].reset_index(drop=True)
-    forecast_rows = table[table[TARGET_COLUMN].isna()].reset_index(drop=True)
 
+def _stage_model_table(master_df_path) -> dict:
+    table = prepare_model_table(pd.read_csv(master_df_path))
+    return {
+        "trainable": table[table[TARGET_COLUMN].notna()].reset_index(drop=True),
+        "forecast_rows": table[table[TARGET_COLUMN].isna()].reset_index(drop=True),
+    }
+
+
+def _stage_roster_change(model_table: dict, master_df_path) -> pd.DataFrame:
     # Season-over-season roster-talent change (see roster_change_features.py) --
     # a team-season with no computable change (missing panel data) falls back
     # to 0, "no measured change", rather than dropping the row.
-    changes = build_roster_change_features(master_df_path or MASTER_DF_FILE)
-    trainable = trainable.merge(changes, on=["Season", "Team"], how="left")
+    changes = build_roster_change_features(master_df_path)
+    trainable = model_table["trainable"].merge(changes, on=["Season", "Team"], how="left")
     trainable[ROSTER_CHANGE_COLUMN] = trainable[ROSTER_CHANGE_COLUMN].fillna(0.0)
+    return trainable
+
+
+def _stage_model_comparison(
+    roster_change: pd.DataFrame, feature_columns, numeric_features, categorical_features, search: str,
+    incremental: bool, training_state_file, store: FoldModelStore,
+) -> dict:
+    trainable = roster_change
+    X, y, groups = trainable[feature_columns], trainable[TARGET_COLUMN], trainable["Season"]
+
+    fingerprint = season_fingerprint(trainable, feature_columns + [TARGET_COLUMN])
+    state = TrainingState.load(training_state_file) if incremental else None
+    reason = plan_incremental(state, fingerprint, feature_columns, search) if incremental else "full run requested"
+    if reason is None:
+        comparison, training_run = incremental_comparison(
+            X, y, groups, numeric_features, categorical_features, state, store
+        )
+    else:
+        comparison = compare_models_walk_forward(
+            X, y, groups, numeric_features, categorical_features, search=search, store=store
+        )
+        training_run = {"mode": "full", "reason": reason, "new_seasons": _new_seasons(fingerprint, state),
+                        "families": None}
+    return {"comparison": comparison, "training_run": training_run, "fingerprint": fingerprint}
 
-    X = trainable[FEATURE_COLUMNS]
-    y = trainable[TARGET_COLUMN]
-    groups = trainable["Season"]
 
-    comparison = compare_models_walk_forward(X, y, groups, EXTENDED_NUMERIC_FEATURES, CATEGORICAL_FEATURES)
-    winning_search = comparison.winning_search
-    fitted_pipeline = winning_search.best_estimator_  # GridSearchCV refits on all of X, y by default
+def _stage_importance(model_comparison: dict, roster_change: pd.DataFrame, feature_columns) -> pd.Series:
+    fitted_pipeline = model_comparison["comparison"].winning_search.best_estimator_
+    return compute_feature_importance(
+        fitted_pipeline, roster_change[feature_columns], roster_change[TARGET_COLUMN], feature_columns
+    )
 
-    splitter = SeasonWalkForwardSplit()
 
-    # Computed here (not after oof/forecast, where it used to live) so the top
-    # feature names are available to attach raw values to both result sets below.
-    importance = compute_feature_importance(fitted_pipeline, X, y, FEATURE_COLUMNS)
-    top_feature_names = list(importance.head(N_FEATURE_VALUES_TO_PERSIST).index)
+def _stage_oof_predictions(
+    model_comparison: dict, roster_change: pd.DataFrame, feature_columns, store: FoldModelStore,
+) -> list:
+    """(test_idx, raw predictions) per walk-forward fold, for the backtest display."""
+    fitted_pipeline = model_comparison["comparison"].winning_search.best_estimator_
+    X, y, groups = roster_change[feature_columns], roster_change[TARGET_COLUMN], roster_change["Season"]
+    folds = walk_forward_oof(fitted_pipeline, X, y, groups, SeasonWalkForwardSplit(), store)
+    return [(test_idx, preds_raw) for _, test_idx, preds_raw in folds]
 
-    # Target spread for calibration (see calibration.py) — one fixed number
-    # computed once from every real historical outcome, reused identically
-    # across every walk-forward fold and the live forecast below. Not
-    # recomputed per fold on an expanding window: the *spread* of real NBA
-    # seasons isn't a fitted parameter a fold could leak from seeing "the
-    # future" of, unlike a model coefficient — it's closer to a physical
-    # constant of the sport (like TOTAL_SEASON_WINS itself) than something
-    # walk-forward's no-future-leakage discipline is protecting against.
-    historical_std = historical_win_std(trainable[TARGET_COLUMN])
 
-    # ---- Out-of-fold walk-forward predictions across history, for backtest display ----
-    oof_frames = []
-    for train_idx, test_idx in splitter.split(X, y, groups):
-        fold_model = clone(fitted_pipeline)
-        fold_model.fit(X.iloc[train_idx], y.iloc[train_idx])
-        preds_raw = fold_model.predict(X.iloc[test_idx])
-        # Every row in one fold's test_idx is the same held-out season's full
-        # set of teams (SeasonWalkForwardSplit's test set is always one whole
-        # season) — exactly what calibrate_season_predictions needs to be
-        # calibrating a complete season, not a partial one.
-        preds_calibrated = calibrate_season_predictions(preds_raw, historical_std)
-        fold_df = pd.DataFrame({
-            "Season": trainable.iloc[test_idx]["Season"].to_numpy() + 1,
-            "Team": trainable.iloc[test_idx]["Team"].to_numpy(),
-            "W": trainable.iloc[test_idx][TARGET_COLUMN].to_numpy(),
-            "Pred_Wins": preds_calibrated,
-            "Pred_Wins_Raw": preds_raw,
-            "Pred_Wins_Lower": np.nan,
-            "Pred_Wins_Upper": np.nan,
-        })
-        for feat in top_feature_names:
-            fold_df[feat] = trainable.iloc[test_idx][feat].to_numpy()
-        oof_frames.append(fold_df)
-    oof = pd.concat(oof_frames, ignore_index=True)
-    # Multiple thresholds, not just +/-5: a single cutoff can look artificially
-    # bad or good depending on exactly where it falls relative to the error
-    # distribution — see ACCURACY_THRESHOLDS_WINS and metadata["backtest_accuracy"].
-    oof_abs_error = (oof["Pred_Wins"] - oof["W"]).abs()
-    for t in ACCURACY_THRESHOLDS_WINS:
-        oof[f"within_{t}"] = oof_abs_error <= t
-
-    walk_forward_mae_uncalibrated = float((oof["Pred_Wins_Raw"] - oof["W"]).abs().mean())
-    walk_forward_mae_calibrated = float((oof["Pred_Wins"] - oof["W"]).abs().mean())
-    oof = oof.drop(columns=["Pred_Wins_Raw"])  # internal-only, for the MAE comparison above
-
-    # ---- Live forecast: most recent season's completed stats, no known outcome yet ----
+def _stage_forecast_rows(model_table: dict, roster_projection_file) -> dict:
     # Talent-relevant features get overridden from the real-current-roster
     # projection where available (see _apply_roster_projection) before this
-    # row is used for anything — trainable/X/y above are untouched.
-    forecast_rows, roster_projection_meta = _apply_roster_projection(forecast_rows)
+    # row is used for anything — trainable/X/y are untouched.
+    forecast_rows, roster_projection_meta = _apply_roster_projection(
+        model_table["forecast_rows"], Path(roster_projection_file)
+    )
     # Roster_Change for the forecast row: real current roster (ratings/
     # refresh_roster_projection.py's fetch) vs. the most recently completed
     # season's real roster -- see roster_change_features.forecast_roster_change.
     # 0.0 (not NaN) whenever it can't be computed, matching trainable's fallback.
     forecast_rows[ROSTER_CHANGE_COLUMN] = [
-        forecast_roster_change(team, int(season), ROSTER_PROJECTION_FILE) or 0.0
+        forecast_roster_change(team, int(season), roster_projection_file) or 0.0
         for team, season in zip(forecast_rows["Team"], forecast_rows["Season"])
     ]
-    X_forecast = forecast_rows[FEATURE_COLUMNS]
-    forecast_point = fitted_pipeline.predict(X_forecast)
+    return {"rows": forecast_rows, "roster_projection": roster_projection_meta}
+
+
+def _stage_interval(
+    model_comparison: dict, roster_change: pd.DataFrame, forecast_rows: dict, feature_columns,
+    interval_alpha: float, store: FoldModelStore,
+) -> dict:
+    """The raw live-forecast point estimate and its (uncalibrated) interval."""
+    comparison = model_comparison["comparison"]
+    X, y, groups = roster_change[feature_columns], roster_change[TARGET_COLUMN], roster_change["Season"]
+    X_forecast = forecast_rows["rows"][feature_columns]
+    forecast_point = comparison.winning_search.best_estimator_.predict(X_forecast)
 
     if comparison.winner == "gbm":
         lower, upper = gbm_quantile_interval(
             comparison.gbm_search, X, y, X_forecast,
-            lower_q=INTERVAL_ALPHA / 2, upper_q=1 - INTERVAL_ALPHA / 2,
+            lower_q=interval_alpha / 2, upper_q=1 - interval_alpha / 2,
         )
         interval_method = "GBM native quantile regression (refits the winning model at the 10th and 90th percentiles)"
     else:
         lower, upper = bootstrap_residual_interval(
-            comparison.knn_search, X, y, groups, splitter, X_forecast, alpha=INTERVAL_ALPHA,
+            comparison.knn_search, X, y, groups, SeasonWalkForwardSplit(), X_forecast, alpha=interval_alpha,
+            store=store,
         )
         interval_method = "Bootstrap of pooled walk-forward out-of-fold residuals (1000 resamples per team)"
 
@@ -344,7 +371,62 @@ def run_pipeline(master_df_path=None, write_output: bool = True):
     # Final safety net in case mirroring itself produced a crossing.
     lower = np.minimum(lower, forecast_point)
     upper = np.maximum(upper, forecast_point)
+    return {"point": forecast_point, "lower": lower, "upper": upper, "method": interval_method}
 
+
+def _stage_calibration(
+    roster_change: pd.DataFrame, importance: pd.Series, oof_predictions: list, forecast_rows: dict,
+    interval: dict, accuracy_thresholds, n_feature_values: int,
+) -> dict:
+    """Calibrates the OOF folds and the live forecast, and assembles the
+    results table (plus the numbers metadata reports about it)."""
+    trainable = roster_change
+    top_feature_names = list(importance.head(n_feature_values).index)
+
+    # Target spread for calibration (see calibration.py) — one fixed number
+    # computed once from every real historical outcome, reused identically
+    # across every walk-forward fold and the live forecast below. Not
+    # recomputed per fold on an expanding window: the *spread* of real NBA
+    # seasons isn't a fitted parameter a fold could leak from seeing "the
+    # future" of, unlike a model coefficient — it's closer to a physical
+    # constant of the sport (like TOTAL_SEASON_WINS itself) than something
+    # walk-forward's no-future-leakage discipline is protecting against.
+    historical_std = historical_win_std(trainable[TARGET_COLUMN])
+
+    # ---- Out-of-fold walk-forward predictions across history, for backtest display ----
+    oof_frames = []
+    for test_idx, preds_raw in oof_predictions:
+        # Every row in one fold's test_idx is the same held-out season's full
+        # set of teams (SeasonWalkForwardSplit's test set is always one whole
+        # season) — exactly what calibrate_season_predictions needs to be
+        # calibrating a complete season, not a partial one.
+        preds_calibrated = calibrate_season_predictions(preds_raw, historical_std)
+        fold_df = pd.DataFrame({
+            "Season": trainable.iloc[test_idx]["Season"].to_numpy() + 1,
+            "Team": trainable.iloc[test_idx]["Team"].to_numpy(),
+            "W": trainable.iloc[test_idx][TARGET_COLUMN].to_numpy(),
+            "Pred_Wins": preds_calibrated,
+            "Pred_Wins_Raw": preds_raw,
+            "Pred_Wins_Lower": np.nan,
+            "Pred_Wins_Upper": np.nan,
+        })
+        for feat in top_feature_names:
+            fold_df[feat] = trainable.iloc[test_idx][feat].to_numpy()
+        oof_frames.append(fold_df)
+    oof = pd.concat(oof_frames, ignore_index=True)
+    # Multiple thresholds, not just +/-5: a single cutoff can look artificially
+    # bad or good depending on exactly where it falls relative to the error
+    # distribution — see ACCURACY_THRESHOLDS_WINS and metadata["backtest_accuracy"].
+    oof_abs_error = (oof["Pred_Wins"] - oof["W"]).abs()
+    for t in accuracy_thresholds:
+        oof[f"within_{t}"] = oof_abs_error <= t
+
+    walk_forward_mae_uncalibrated = float((oof["Pred_Wins_Raw"] - oof["W"]).abs().mean())
+    walk_forward_mae_calibrated = float((oof["Pred_Wins"] - oof["W"]).abs().mean())
+    oof = oof.drop(columns=["Pred_Wins_Raw"])  # internal-only, for the MAE comparison above
+
+    # ---- Live forecast: most recent season's completed stats, no known outcome yet ----
+    forecast_point, lower, upper = interval["point"], interval["lower"], interval["upper"]
     # Same calibration applied to every walk-forward fold above, applied here
     # to the live forecast row — all 30 teams' forecast-season predictions are
     # exactly "one season's full set of teams," same shape calibrate_season_predictions
@@ -356,18 +438,126 @@ def run_pipeline(master_df_path=None, write_output: bool = True):
     lower, upper = recenter_interval(forecast_point, lower, upper, forecast_point_calibrated)
 
     forecast = pd.DataFrame({
-        "Season": forecast_rows["Season"].to_numpy() + 1,
-        "Team": forecast_rows["Team"].to_numpy(),
+        "Season": forecast_rows["rows"]["Season"].to_numpy() + 1,
+        "Team": forecast_rows["rows"]["Team"].to_numpy(),
         "W": np.nan,
         "Pred_Wins": forecast_point_calibrated,
         "Pred_Wins_Lower": lower,
         "Pred_Wins_Upper": upper,
-        **{f"within_{t}": np.nan for t in ACCURACY_THRESHOLDS_WINS},
+        **{f"within_{t}": np.nan for t in accuracy_thresholds},
     })
     for feat in top_feature_names:
-        forecast[feat] = forecast_rows[feat].to_numpy()
+        forecast[feat] = forecast_rows["rows"][feat].to_numpy()
 
     results = pd.concat([oof, forecast], ignore_index=True).sort_values(["Season", "Team"]).reset_index(drop=True)
+    return {
+        "results": results,
+        "oof": oof,
+        "forecast": forecast,
+        "historical_std": historical_std,
+        "walk_forward_mae_uncalibrated": walk_forward_mae_uncalibrated,
+        "walk_forward_mae_calibrated": walk_forward_mae_calibrated,
+        "top_feature_names": top_feature_names,
+    }
+
+
+PIPELINE_STAGES = [
+    Stage("model_table", _stage_model_table, inputs=("master_df_path",), files=("master_df_path",),
+          modules=("features",)),
+    Stage("roster_change", _stage_roster_change, inputs=("model_table", "master_df_path"),
+          files=("master_df_path", "player_stats_dir"), modules=("features", "roster_change_features")),
+    Stage("model_comparison", _stage_model_comparison,
+          inputs=("roster_change", "feature_columns", "numeric_features", "categorical_features", "search",
+                  "incremental", "training_state_file"),
+          files=("training_state_file",), modules=("model", "incremental", "validation", "fold_store"),
+          code=(_new_seasons,), resources=("store",)),
+    Stage("importance", _stage_importance, inputs=("model_comparison", "roster_change", "feature_columns"),
+          modules=("model",)),
+    Stage("oof_predictions", _stage_oof_predictions,
+          inputs=("model_comparison", "roster_change", "feature_columns"), modules=("model", "validation", "fold_store"), resources=("store",)),
+    Stage("forecast_rows", _stage_forecast_rows, inputs=("model_table", "roster_projection_file"),
+          files=("roster_projection_file", "player_stats_dir"), modules=("roster_change_features",),
+          code=(_apply_roster_projection, team_talent_composite)),
+    Stage("interval", _stage_interval,
+          inputs=("model_comparison", "roster_change", "forecast_rows", "feature_columns", "interval_alpha"),
+          modules=("model", "validation", "fold_store"), resources=("store",)),
+    Stage("calibration", _stage_calibration,
+          inputs=("roster_change", "importance", "oof_predictions", "forecast_rows", "interval",
+                  "accuracy_thresholds", "n_feature_values"),
+          modules=("calibration",)),
+]
+
+
+def run_pipeline(
+    master_df_path=None, write_output: bool = True, search: str = "grid", store: FoldModelStore | None = None,
+    incremental: bool = False, stage_cache: StageCache | None = None,
+):
+    """Returns (results_df, metadata_dict); optionally writes both to disk.
+
+    `search` picks how KNN/GBM hyperparameters are tuned: "grid" (every
+    candidate on every walk-forward fold) or "halving" (successive halving,
+    newest seasons first -- see model.halving_walk_forward_search). Either
+    way the winner is judged on full walk-forward MAE.
+
+    Every fold fit -- search candidates, the OOF loop, the bootstrap
+    interval's residuals -- goes through `store` (default_fold_store() if
+    not given), so whatever an earlier run or experiment already fit is
+    loaded instead of refit.
+
+    `incremental=True` updates the last run's model comparison for whatever
+    seasons were appended since (see incremental.py) instead of searching
+    from scratch -- falling back to a full run when it can't, e.g. because
+    an already-trained season's data changed. metadata["training_run"] says
+    which happened and why.
+
+    The pipeline runs as PIPELINE_STAGES, each loaded from `stage_cache`
+    (default_stage_cache() if not given) when nothing it depends on has
+    changed -- see pipeline_stages.py. metadata["pipeline_stages"] has each
+    stage's time and whether it was loaded.
+    """
+    if store is None:
+        store = default_fold_store()
+    params = {
+        "master_df_path": Path(master_df_path or MASTER_DF_FILE),
+        "player_stats_dir": PLAYER_STATS_DIR,
+        "roster_projection_file": ROSTER_PROJECTION_FILE,
+        # Only an incremental run reads the stored state; a full run's
+        # comparison shouldn't be invalidated every time a run rewrites it.
+        "training_state_file": TRAINING_STATE_FILE if incremental else None,
+        "feature_columns": FEATURE_COLUMNS,
+        "numeric_features": EXTENDED_NUMERIC_FEATURES,
+        "categorical_features": CATEGORICAL_FEATURES,
+        "search": search,
+        "incremental": incremental,
+        "interval_alpha": INTERVAL_ALPHA,
+        "accuracy_thresholds": ACCURACY_THRESHOLDS_WINS,
+        "n_feature_values": N_FEATURE_VALUES_TO_PERSIST,
+    }
+    outputs, stage_timing = run_stages(PIPELINE_STAGES, params, stage_cache, resources={"store": store})
+
+    trainable = outputs["roster_change"]
+    X = trainable[FEATURE_COLUMNS]
+    y = trainable[TARGET_COLUMN]
+    groups = trainable["Season"]
+    splitter = SeasonWalkForwardSplit()
+
+    comparison = outputs["model_comparison"]["comparison"]
+    fingerprint = outputs["model_comparison"]["fingerprint"]
+    training_run = dict(outputs["model_comparison"]["training_run"])
+    if not incremental:
+        training_run["new_seasons"] = _new_seasons(fingerprint, TrainingState.load(TRAINING_STATE_FILE))
+    winning_search = comparison.winning_search
+    fitted_pipeline = winning_search.best_estimator_  # refit on all of X, y, in either search mode
+
+    importance = outputs["importance"]
+    roster_projection_meta = outputs["forecast_rows"]["roster_projection"]
+    interval_method = outputs["interval"]["method"]
+    calibrated = outputs["calibration"]
+    results, oof, forecast = calibrated["results"], calibrated["oof"], calibrated["forecast"]
+    historical_std = calibrated["historical_std"]
+    walk_forward_mae_uncalibrated = calibrated["walk_forward_mae_uncalibrated"]
+    walk_forward_mae_calibrated = calibrated["walk_forward_mae_calibrated"]
+    top_feature_names = calibrated["top_feature_names"]
 
     metadata = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -388,6 +578,25 @@ def run_pipeline(master_df_path=None, write_output: bool = True):
             "gbm_walk_forward_mae": round(float(comparison.gbm_walk_forward_mae), 3),
             "winner": comparison.winner,
             "n_walk_forward_folds": splitter.get_n_splits(X, y, groups),
+            # Preprocessing cost of both searches: fit once per fold (see
+            # model.FoldTransformCache) vs. once per candidate per fold.
+            "preprocessing_timing": comparison.preprocessing,
+            # Hyperparameter search mode, its candidate evaluations and the
+            # fits they actually took vs. the exhaustive grid's (see
+            # model.search_fit_counts).
+            "search": comparison.search_fits(),
+            # Fold fits loaded from / added to fold_store.FoldModelStore this run.
+            "fold_store": {k: v for k, v in store.stats().items() if k != "root"},
+        },
+        # Full search or an incremental update of the last run's (see
+        # incremental.py) -- same keys either way.
+        "training_run": training_run,
+        # Per stage of PIPELINE_STAGES: seconds taken, and whether its output
+        # was loaded from the stage cache rather than computed.
+        "pipeline_stages": {
+            "stages": stage_timing,
+            "total_seconds": round(sum(t["seconds"] for t in stage_timing), 3),
+            "n_cached": sum(t["cached"] for t in stage_timing),
         },
         "calibration": {
             "description": (
@@ -648,14 +857,45 @@ def run_pipeline(master_df_path=None, write_output: bool = True):
     if write_output:
         results.to_csv(RESULTS_FILE, index=False)
         METADATA_FILE.write_text(json.dumps(metadata, indent=2))
+        TrainingState.from_comparison(
+            comparison, fingerprint, FEATURE_COLUMNS, walk_forward_test_seasons(X, y, groups, splitter)
+        ).save(TRAINING_STATE_FILE)
 
     return results, metadata
 
 
 if __name__ == "__main__":
-    results_df, meta = run_pipeline()
+    parser = argparse.ArgumentParser(prog="python -m backend.win_model.train")
+    parser.add_argument(
+        "--search", choices=SEARCH_MODES, default="grid",
+        help="hyperparameter search: exhaustive grid, or successive halving over the walk-forward folds",
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="update the last run for newly appended seasons instead of re-searching from scratch",
+    )
+    args = parser.parse_args()
+
+    results_df, meta = run_pipeline(search=args.search, incremental=args.incremental)
     print(f"Winner: {meta['model_comparison']['winner']} "
           f"(KNN MAE={meta['model_comparison']['knn_walk_forward_mae']}, "
           f"GBM MAE={meta['model_comparison']['gbm_walk_forward_mae']})")
+    timing = meta["model_comparison"]["preprocessing_timing"]
+    if timing:
+        print(f"Preprocessing: {timing['preprocessor_fits']} fold fits in {timing['preprocess_seconds']}s "
+              f"(uncached: {timing['preprocessor_fits_uncached']} fits, ~{timing['preprocess_seconds_uncached']}s)")
+    fits = meta["model_comparison"]["search"]
+    print(f"Search ({fits['mode']}): {fits['evaluations']} candidate evaluations, {fits['fits']} fits vs. "
+          f"{fits['full_grid_fits']} for the full grid ({fits['fits_saved']} saved)")
+    run = meta["training_run"]
+    print(f"Training run: {run['mode']}" + (f" ({run['reason']})" if run["reason"] else "")
+          + (f", new seasons {run['new_seasons']}" if run["new_seasons"] else ""))
+    stored = meta["model_comparison"]["fold_store"]
+    print(f"Fold store: {stored['hits']} fold fits loaded, {stored['misses']} fit fresh")
+    stages = meta["pipeline_stages"]
+    print(f"Stages: {stages['n_cached']} of {len(stages['stages'])} loaded from cache, "
+          f"{stages['total_seconds']}s total ("
+          + ", ".join(f"{t['stage']} {t['seconds']}s" + (" cached" if t["cached"] else "") for t in stages["stages"])
+          + ")")
     print(f"Wrote {len(results_df)} rows to {RESULTS_FILE}")
     print(f"Wrote methodology to {METADATA_FILE}")